@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+import tempfile
+import configparser
+import numpy
+import netCDF4
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import egads
+from functions.utils import create_option_file
+from functions.file_functions.storage_functions import read_storage_options
+from functions.thread_functions.processing_functions import BatchFileProcessor
+
+
+# compares the batch processing of an algorithm with 3 inputs when all variables of the file are read and written
+# again with the new pipeline, which reads the inputs, copies the file and only writes the output
+# usage: python benchmarks/algorithm_processing.py [number of time steps, 1000000 by default] [number of variables, 20]
+
+
+def create_file(file_path, time_nbr, var_nbr):
+    random = numpy.random.default_rng(0)
+    with netCDF4.Dataset(file_path, 'w') as nc_file:
+        nc_file.title = 'algorithm benchmark'
+        nc_file.createDimension('time', time_nbr)
+        variable = nc_file.createVariable('time', 'f8', ('time',))
+        variable.units = 'seconds since 2020-01-01 00:00:00'
+        variable[:] = numpy.arange(time_nbr)
+        for var_name, units, mean in [('tas', 'm/s', 100.), ('alpha', 'rad', 0.05), ('beta', 'rad', 0.01)]:
+            variable = nc_file.createVariable(var_name, 'f8', ('time',), fill_value=-9999.)
+            variable.units = units
+            variable[:] = random.normal(mean, mean / 10, time_nbr)
+        for i in range(var_nbr - 3):
+            variable = nc_file.createVariable('var_' + str(i), 'f8', ('time',), fill_value=-9999.)
+            variable.units = 'K'
+            variable[:] = random.normal(280, 10, time_nbr)
+
+
+def main():
+    time_nbr = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    var_nbr = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    print('data: ' + str(time_nbr) + ' time steps, ' + str(var_nbr) + ' variables, '
+          + str(round(time_nbr * (var_nbr + 1) * 8 / 1e6, 1)) + ' MB, algorithm VelocityTasLongitudinalCnrm')
+    with tempfile.TemporaryDirectory() as folder:
+        create_option_file(folder)
+        config_dict = configparser.ConfigParser()
+        config_dict.read(os.path.join(folder, 'egads_gui.ini'))
+        file_path = os.path.join(folder, 'source.nc')
+        create_file(file_path, time_nbr, var_nbr)
+        batch_dict = {'algorithm': egads.algorithms.thermodynamics.VelocityTasLongitudinalCnrm,
+                      'processing_options': {'inputs': ['/tas', '/alpha', '/beta'], 'outputs': ['tas_longitudinal']},
+                      'out_format': 'NetCDF', 'destination_folder': folder}
+        processor = BatchFileProcessor(batch_dict, config_dict, read_storage_options(config_dict))
+        results = {}
+        for name, copy_files in [('rewrite', False), ('copy', True)]:
+            processor.copy_files = copy_files
+            new_path = os.path.join(folder, name + '.nc')
+            start = time.perf_counter()
+            processor.algorithm_processing(file_path, new_path)
+            results[name] = time.perf_counter() - start
+            with netCDF4.Dataset(new_path) as nc_file:
+                results[name + '_values'] = nc_file['tas_longitudinal'][:]
+                results[name + '_variables'] = len(nc_file.variables)
+            print(name.ljust(8) + str(round(results[name], 2)).rjust(7) + ' s, '
+                  + str(round(os.path.getsize(new_path) / 1e6, 1)).rjust(6) + ' MB, '
+                  + str(results[name + '_variables']) + ' variables')
+        print('speed-up ' + str(round(results['rewrite'] / results['copy'], 1)) + 'x, same output: '
+              + str(bool(numpy.array_equal(results['rewrite_values'], results['copy_values']))))
+
+
+if __name__ == '__main__':
+    main()
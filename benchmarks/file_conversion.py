@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+import tempfile
+import numpy
+import netCDF4
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import egads
+from functions.file_functions.storage_functions import storage_options
+from functions.file_functions.conversion_functions import netcdf_to_hdf, hdf_to_netcdf
+
+
+# compares the conversion between NetCDF and Hdf of egads, which reads each variable in an EgadsData, with the
+# conversion of the batch processing, which copies the values between the libraries in blocks, and checks that a
+# file with an unlimited dimension goes through NetCDF -> Hdf -> NetCDF unchanged
+# usage: python benchmarks/file_conversion.py [number of time steps, 1000000 by default] [compression preset, default]
+
+
+def create_file(file_path, time_nbr, preset):
+    random = numpy.random.default_rng(0)
+    options = {}
+    if preset != 'default':
+        options = {'zlib': True, 'complevel': storage_options(preset)['complevel'], 'shuffle': True}
+    with netCDF4.Dataset(file_path, 'w') as nc_file:
+        nc_file.title = 'conversion benchmark'
+        nc_file.createDimension('time', time_nbr)
+        nc_file.createDimension('bin', 30)
+        variable = nc_file.createVariable('time', 'f8', ('time',), **options)
+        variable.units = 'seconds since 2020-01-01 00:00:00'
+        variable[:] = numpy.arange(time_nbr)
+        variable = nc_file.createVariable('bin', 'f8', ('bin',))
+        variable[:] = numpy.arange(30)
+        for var_name in ['temperature', 'pressure', 'humidity', 'wind']:
+            variable = nc_file.createVariable(var_name, 'f8', ('time',), fill_value=-9999., **options)
+            variable.units = 'K'
+            variable[:] = random.normal(280, 10, time_nbr)
+        variable = nc_file.createVariable('spectrum', 'f4', ('time', 'bin'), fill_value=-9999., **options)
+        variable.units = '#/cm3'
+        for start in range(0, time_nbr, 100000):
+            stop = min(start + 100000, time_nbr)
+            variable[start:stop] = random.gamma(2, 10, (stop - start, 30)).astype('float32')
+
+
+def check_round_trip(folder, storage):
+    # the chunks of an unlimited dimension are longer than its values, the Hdf dataset is resizable
+    nc_path, h5_path, nc_back_path = [os.path.join(folder, 'unlimited' + ext) for ext in ['.nc', '.h5', '_back.nc']]
+    with netCDF4.Dataset(nc_path, 'w') as nc_file:
+        nc_file.createDimension('time', None)
+        variable = nc_file.createVariable('time', 'f8', ('time',))
+        variable[:] = numpy.arange(100)
+        variable = nc_file.createVariable('temperature', 'f4', ('time',), fill_value=-9999.)
+        variable[:] = numpy.linspace(250, 300, 100)
+    netcdf_to_hdf(nc_path, h5_path, 'benchmark', storage)
+    hdf_to_netcdf(h5_path, nc_back_path, 'benchmark', storage)
+    with netCDF4.Dataset(nc_path, 'r') as nc_file, netCDF4.Dataset(nc_back_path, 'r') as nc_back_file:
+        if not nc_back_file.dimensions['time'].isunlimited():
+            print('round trip: the time dimension is no longer unlimited')
+        for var_name in ['time', 'temperature']:
+            if not numpy.array_equal(nc_file[var_name][:], nc_back_file[var_name][:]):
+                print('round trip: different values for ' + var_name)
+
+
+def egads_conversion(nc_path, h5_path, nc_back_path):
+    start = time.perf_counter()
+    egads_file = egads.input.EgadsNetCdf(nc_path, 'r')
+    egads_file.convert_to_hdf(h5_path)
+    egads_file.close()
+    middle = time.perf_counter()
+    egads_file = egads.input.EgadsHdf(h5_path, 'r')
+    egads_file.convert_to_netcdf(nc_back_path)
+    egads_file.close()
+    return middle - start, time.perf_counter() - middle
+
+
+def direct_conversion(nc_path, h5_path, nc_back_path, storage):
+    start = time.perf_counter()
+    netcdf_to_hdf(nc_path, h5_path, 'benchmark', storage)
+    middle = time.perf_counter()
+    hdf_to_netcdf(h5_path, nc_back_path, 'benchmark', storage)
+    return middle - start, time.perf_counter() - middle
+
+
+def main():
+    time_nbr = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    preset = sys.argv[2] if len(sys.argv) > 2 else 'default'
+    data_size = time_nbr * (5 * 8 + 30 * 4) / 1e6
+    print('data: ' + str(time_nbr) + ' time steps, ' + str(round(data_size, 1)) + ' MB, compression ' + preset)
+    with tempfile.TemporaryDirectory() as folder:
+        nc_path = os.path.join(folder, 'source.nc')
+        create_file(nc_path, time_nbr, preset)
+        for name in ['egads', 'direct']:
+            h5_path = os.path.join(folder, name + '.h5')
+            nc_back_path = os.path.join(folder, name + '.nc')
+            if name == 'egads':
+                to_hdf, to_netcdf = egads_conversion(nc_path, h5_path, nc_back_path)
+            else:
+                to_hdf, to_netcdf = direct_conversion(nc_path, h5_path, nc_back_path,
+                                                      storage_options('default', write_memory='256'))
+            print(name.ljust(6) + ' NetCDF -> Hdf ' + str(round(data_size / to_hdf, 1)).rjust(7) + ' MB/s, '
+                  + str(round(os.path.getsize(h5_path) / 1e6, 1)).rjust(6) + ' MB, Hdf -> NetCDF '
+                  + str(round(data_size / to_netcdf, 1)).rjust(7) + ' MB/s, '
+                  + str(round(os.path.getsize(nc_back_path) / 1e6, 1)).rjust(6) + ' MB')
+        check_round_trip(folder, storage_options('default', write_memory='256'))
+
+
+if __name__ == '__main__':
+    main()
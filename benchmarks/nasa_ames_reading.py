@@ -0,0 +1,70 @@
+import os
+import sys
+import time
+import tempfile
+import numpy
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import egads
+from functions.file_functions.nasa_ames_functions import EgadsNasaAmesReader
+
+
+# compares the reading of a FFI 1001 NASA Ames file by egads and by the vectorized reader of the gui, the values are
+# multiplied by VSCAL but VMISS is compared to the values as written in the file: the missing values of a scaled
+# variable stay equal to VMISS, and are replaced by NaN, egads scales them too
+# usage: python benchmarks/nasa_ames_reading.py [number of lines, 1000000 by default]
+
+
+def create_file(file_path, line_nbr):
+    header = ['1001', 'Doe, John', 'Organisation', 'Source', 'Mission', '1    1', '2020 1 1    2020 1 1', '1.0',
+              'Time (s)', '4', '1    0.1    1    1', '-9999    -99.9    99999    -1', 'Temperature (K)',
+              'Pressure (hPa)', 'Counts', 'Flag', '0', '0']
+    header[0] = str(len(header)) + '    1001'
+    random = numpy.random.default_rng(0)
+    data = numpy.column_stack([numpy.arange(line_nbr) + 0.5, random.random(line_nbr) * 300,
+                               random.random(line_nbr) * 10000, random.integers(-1000, 1000, line_nbr),
+                               random.integers(-1, 5, line_nbr)])
+    data[::50, 1] = -9999
+    data[::40, 2] = -99.9
+    with open(file_path, 'w') as na_file:
+        na_file.write('\n'.join(header) + '\n')
+        numpy.savetxt(na_file, data, fmt=['%.1f', '%.3f', '%.2f', '%d', '%d'], delimiter='    ')
+
+
+def read_file(reader, file_path):
+    start = time.perf_counter()
+    na_file = reader(file_path, 'r')
+    variables = {}
+    for var in na_file.get_variable_list() + na_file.get_variable_list(vartype='independant'):
+        variables[var] = na_file.read_variable(var, read_as_float=True, replace_fill_value=True)
+    # VMISS and VSCAL of the dependent variables
+    scaling = {var: (na_file.na_dict['VMISS'][i], na_file.na_dict['VSCAL'][i])
+               for i, var in enumerate(na_file.get_variable_list())}
+    na_file.close()
+    return time.perf_counter() - start, variables, scaling
+
+
+def main():
+    line_nbr = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    with tempfile.TemporaryDirectory() as folder:
+        file_path = os.path.join(folder, 'benchmark.na')
+        create_file(file_path, line_nbr)
+        print('file: ' + str(line_nbr) + ' lines, ' + str(round(os.path.getsize(file_path) / 1e6, 1)) + ' MB')
+        egads_time, egads_variables, scaling = read_file(egads.input.EgadsNasaAmes, file_path)
+        print('egads reader:      ' + str(round(egads_time, 2)) + ' s')
+        gui_time, gui_variables, _ = read_file(EgadsNasaAmesReader, file_path)
+        print('vectorized reader: ' + str(round(gui_time, 2)) + ' s (x' + str(round(egads_time / gui_time, 1)) + ')')
+        for var, data in egads_variables.items():
+            expected = data.value
+            miss, scale = scaling.get(var, (None, 1))
+            if scale != 1:
+                expected = numpy.where(expected == miss * scale, numpy.nan, expected)
+            if (expected.dtype != gui_variables[var].value.dtype
+                    or not numpy.array_equal(expected, gui_variables[var].value, equal_nan=True)):
+                print('different values for ' + var)
+                sys.exit(1)
+        missing = numpy.isnan(gui_variables['Pressure'].value).sum()
+        print('values are identical, ' + str(missing) + ' missing values of the scaled variable')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+import os
+import sys
+import time
+import tempfile
+import numpy
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import egads
+from functions.file_functions.nasa_ames_functions import (save_ffi1001_file, write_na_variable,
+                                                          EgadsNasaAmesReader)
+
+
+# compares the writing of the data block of a NASA Ames FFI 1001 file by egads, line by line, with the writer of the
+# gui, column by column with numpy, and checks the values read back from the file of the gui
+# usage: python benchmarks/nasa_ames_writer.py [number of lines, 1000000 by default]
+
+
+variables = ['temperature', 'pressure', 'humidity', 'concentration', 'wind', 'altitude', 'flag']
+
+
+def create_na_dict(line_nbr):
+    random = numpy.random.default_rng(0)
+    na_file = egads.input.EgadsNasaAmes()
+    na_dict = na_file.create_na_dict()
+    for key, value in [('ONAME', 'benchmark'), ('ORG', 'egads gui'), ('SNAME', 'random values'),
+                       ('MNAME', 'nasa ames writer'), ('DATE', [2020, 1, 1]), ('NIV', 1), ('SCOM', ['benchmark']),
+                       ('NCOM', ['benchmark']), ('NSCOML', 1), ('NNCOML', 1)]:
+        na_file.write_attribute_value(key, value, na_dict=na_dict)
+    seconds = numpy.arange(line_nbr, dtype='float64')
+    write_na_variable(na_file, egads.EgadsData(seconds, units='s', long_name='time'), vartype='independant',
+                      na_dict=na_dict)
+    values = {'temperature': numpy.round(280 + random.normal(0, 10, line_nbr), 2),
+              'pressure': numpy.round(1013 - seconds / line_nbr * 700, 1),
+              'humidity': random.uniform(0, 100, line_nbr).astype('float32'),
+              'concentration': random.gamma(2, 10, line_nbr).astype('float32'),
+              'wind': random.normal(0, 5, line_nbr),
+              'altitude': 10000 * numpy.sin(seconds / line_nbr * numpy.pi),
+              'flag': random.integers(0, 3, line_nbr)}
+    values['temperature'][::1000] = numpy.nan
+    for var_name in variables:
+        scale = 0.01 if var_name == 'pressure' else 1
+        write_na_variable(na_file, egads.EgadsData(values[var_name], units='', long_name=var_name, _FillValue=-9999,
+                                                   scale_factor=scale), vartype='main', na_dict=na_dict)
+    return na_file, na_dict
+
+
+def read_values(file_path):
+    na_file = EgadsNasaAmesReader(file_path, 'r')
+    values = {var_name: numpy.asarray(na_file.read_variable(var_name).value, dtype='float64')
+              for var_name in na_file.get_variable_list()}
+    na_file.close()
+    return values
+
+
+def main():
+    line_nbr = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    na_file, na_dict = create_na_dict(line_nbr)
+    print('data: ' + str(line_nbr) + ' lines, ' + str(na_dict['NV']) + ' variables')
+    with tempfile.TemporaryDirectory() as folder:
+        egads_path, gui_path = os.path.join(folder, 'egads.na'), os.path.join(folder, 'gui.na')
+        start = time.perf_counter()
+        na_file.save_na_file(egads_path, na_dict)
+        middle = time.perf_counter()
+        save_ffi1001_file(na_file, gui_path, na_dict)
+        end = time.perf_counter()
+        for name, file_path, write_time in [('egads', egads_path, middle - start), ('gui', gui_path, end - middle)]:
+            print(name.ljust(6) + ' write ' + str(round(write_time, 2)).rjust(7) + ' s, '
+                  + str(round(line_nbr / write_time / 1e3, 1)).rjust(8) + ' klines/s, '
+                  + str(round(os.path.getsize(file_path) / 1e6, 1)).rjust(6) + ' MB')
+        gui_values = read_values(gui_path)
+        for i, var_name in enumerate(variables):
+            # the values are read back exactly, float32 values in their precision, the values written are divided by
+            # VSCAL and multiplied again when read, missing values stay equal to VMISS
+            value, gui_value = numpy.asarray(na_dict['V'][i]), gui_values[var_name]
+            scale, miss = na_dict['VSCAL'][i], na_dict['VMISS'][i]
+            if scale != 1:
+                value = numpy.where(value == miss, miss, value / scale * scale)
+            if not numpy.array_equal(gui_value.astype(value.dtype), value):
+                print('different values for ' + var_name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+import os
+import sys
+import time
+import tempfile
+import numpy
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import egads
+from functions.file_functions.storage_functions import (storage_presets, storage_options, write_egads_variable,
+                                                        add_egads_dim)
+
+
+# compares the storage presets of the gui when a NetCDF or Hdf file is saved: write throughput, file size and time
+# to read a whole variable or a time window of 10 minutes
+# usage: python benchmarks/storage_presets.py [number of time steps, 1000000 by default] [chunk length, auto]
+
+
+def create_variables(time_nbr):
+    random = numpy.random.default_rng(0)
+    seconds = numpy.arange(time_nbr, dtype='float64')
+    variables = {'time': egads.EgadsData(seconds, units='seconds since 2020-01-01 00:00:00'),
+                 'temperature': egads.EgadsData(280 + 10 * numpy.sin(seconds / 3600) + random.normal(0, 0.1, time_nbr),
+                                                units='K', _FillValue=-9999.),
+                 'pressure': egads.EgadsData(1013 - seconds / time_nbr * 700 + random.normal(0, 0.5, time_nbr),
+                                             units='hPa', _FillValue=-9999.),
+                 'flag': egads.EgadsData(random.integers(0, 3, time_nbr).astype('int32'), units=''),
+                 'spectrum': egads.EgadsData(random.gamma(2, 10, (time_nbr // 10, 30)).astype('float32'),
+                                             units='#/cm3', _FillValue=-9999.),
+                 'time_10s': egads.EgadsData(seconds[::10].copy(), units='seconds since 2020-01-01 00:00:00'),
+                 'bin': egads.EgadsData(numpy.arange(30, dtype='float64'), units='')}
+    formats = {'time': 'double', 'temperature': 'double', 'pressure': 'double', 'flag': 'int', 'spectrum': 'float',
+               'time_10s': 'double', 'bin': 'double'}
+    return variables, formats
+
+
+def write_file(file_class, file_path, variables, formats, storage):
+    start = time.perf_counter()
+    new_file = file_class(file_path, 'w')
+    if file_class is egads.input.EgadsNetCdf:
+        new_file.add_dim('time', len(variables['time']))
+        new_file.add_dim('time_10s', len(variables['spectrum']))
+        new_file.add_dim('bin', variables['spectrum'].shape[1])
+    else:
+        add_egads_dim(new_file, 'time', variables['time'], storage)
+        add_egads_dim(new_file, 'time_10s', variables['time_10s'], storage)
+        add_egads_dim(new_file, 'bin', variables['bin'], storage)
+    for var_name, data in variables.items():
+        if var_name == 'spectrum':
+            dim_tuple = ('time_10s', 'bin')
+        else:
+            dim_tuple = (var_name if var_name in ['time_10s', 'bin'] else 'time',)
+        if var_name not in ['time', 'time_10s', 'bin'] or file_class is egads.input.EgadsNetCdf:
+            write_egads_variable(new_file, data, var_name, dim_tuple, formats[var_name], storage)
+    new_file.close()
+    return time.perf_counter() - start
+
+
+def read_file(file_class, file_path, window_start=None):
+    start = time.perf_counter()
+    egads_file = file_class(file_path, 'r')
+    for var_name in ['temperature', 'pressure', 'flag']:
+        time_window = None
+        if window_start is not None:
+            time_window = [window_start, window_start + 600]
+        egads_file.read_variable(var_name, input_range=time_window)
+    time_window = None
+    if window_start is not None:
+        time_window = [window_start // 10, window_start // 10 + 60]
+    egads_file.read_variable('spectrum', input_range=time_window)
+    egads_file.close()
+    return time.perf_counter() - start
+
+
+def main():
+    time_nbr = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    chunk_length = sys.argv[2] if len(sys.argv) > 2 else 'auto'
+    variables, formats = create_variables(time_nbr)
+    data_size = sum(data.value.nbytes for data in variables.values()) / 1e6
+    print('data: ' + str(time_nbr) + ' time steps, ' + str(round(data_size, 1)) + ' MB, chunk length ' + chunk_length)
+    with tempfile.TemporaryDirectory() as folder:
+        for file_class, ext in [(egads.input.EgadsNetCdf, '.nc'), (egads.input.EgadsHdf, '.h5')]:
+            for preset in storage_presets:
+                file_path = os.path.join(folder, preset + ext)
+                write_time = write_file(file_class, file_path, variables, formats,
+                                        storage_options(preset, chunk_length))
+                read_time = read_file(file_class, file_path)
+                window_time = read_file(file_class, file_path, time_nbr // 2)
+                print(ext + ' ' + preset.ljust(8) + ' write ' + str(round(data_size / write_time, 1)).rjust(7)
+                      + ' MB/s, size ' + str(round(os.path.getsize(file_path) / 1e6, 1)).rjust(6) + ' MB, read '
+                      + str(round(read_time, 3)).rjust(6) + ' s, read 10 min ' + str(round(window_time, 4)) + ' s')
+
+
+if __name__ == '__main__':
+    main()
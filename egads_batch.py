@@ -0,0 +1,170 @@
+import argparse
+import configparser
+import datetime
+import glob
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import pathlib
+import sys
+from functions.utils import create_option_file, update_config_file, humansize
+from functions.thread_functions.processing_functions import BatchProcessingThread, conversion_methods
+from functions.thread_functions.estimate_functions import estimate_batch, report_lines
+
+
+# batch processing without the gui, the job is a json file with the keys of the batch processing of the gui:
+# python egads_batch.py job.json (or python egads_gui.py --batch job.json)
+# {"process": "conversion", "file_list": ["/data/flight_*.nc"], "destination_folder": "/data/hdf",
+#  "processing_options": "NetCDF -> HDF5", "options": {"batch_processes": "auto"}}
+# a chain of algorithms is given by "steps": [{"algorithm": ..., "inputs": [...], "outputs": [...]}, ...] with
+# "process": "algorithm", the outputs of a step can be inputs of the other ones, "drop_intermediate": true doesn't
+# write them
+# the exit code is 0 if all files have been processed, 1 if the processing failed or files have been skipped because
+# of an error, 2 if the job can't be read
+# --dry-run reads the headers of the files and processes the first one in a temporary folder, the bytes to read and
+# write, the variables affected, the files which will fail and the duration of the job are printed
+
+
+process_names = {'concatenation': 1, 'conversion': 2, 'delete_metadata': 3, 'delete_variable': 4, 'algorithm': 5}
+out_formats = ['NetCDF', 'HDF5', 'NASA Ames']
+
+
+def read_algorithm(algorithm):
+    # algorithms are given by their full name, egads.algorithms.thermodynamics.TempVirtualCnrm for example
+    if algorithm is None:
+        return None
+    module_name, _, class_name = str(algorithm).rpartition('.')
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError, ValueError):
+        raise ValueError('the algorithm ' + str(algorithm) + ' can\'t be found')
+
+
+def read_steps(steps):
+    # chain of algorithms, each step has the keys algorithm, inputs and outputs, an input can be an output of
+    # another step
+    if not steps:
+        return None
+    read_list = []
+    for step in steps:
+        for key in ['algorithm', 'inputs', 'outputs']:
+            if key not in step:
+                raise ValueError('the key ' + key + ' is missing in a step of the job')
+        read_list.append({'algorithm': read_algorithm(step['algorithm']), 'inputs': step['inputs'],
+                          'outputs': step['outputs']})
+    return read_list
+
+
+def read_file_list(file_list):
+    # paths can contain wildcards, each pattern is sorted
+    paths = []
+    for pattern in file_list:
+        matches = sorted(glob.glob(os.path.expanduser(pattern)))
+        if not matches and not glob.has_magic(pattern):
+            matches = [os.path.expanduser(pattern)]
+        paths += [os.path.abspath(path) for path in matches]
+    return paths
+
+
+def read_job(job_path):
+    logging.debug('gui - egads_batch.py - read_job - job_path ' + str(job_path))
+    with open(job_path, 'r', encoding='utf-8') as job_file:
+        job = json.load(job_file)
+    for key in ['process', 'file_list', 'destination_folder']:
+        if key not in job:
+            raise ValueError('the key ' + key + ' is missing in the job')
+    process = process_names.get(job['process'], job['process'])
+    if process not in process_names.values():
+        raise ValueError('the process ' + str(job['process']) + ' doesn\'t exist, processes are '
+                         + ', '.join(process_names))
+    steps = read_steps(job.get('steps'))
+    if process == 2 and job.get('processing_options') not in conversion_methods:
+        raise ValueError('the conversion ' + str(job.get('processing_options')) + ' doesn\'t exist, conversions are '
+                         + ', '.join(conversion_methods))
+    if process == 5 and job.get('algorithm') is None and not steps:
+        raise ValueError('the key algorithm or steps is missing in the job')
+    out_format = job.get('out_format')
+    if out_format is not None and out_format not in out_formats:
+        raise ValueError('the output format ' + str(out_format) + ' doesn\'t exist, formats are '
+                         + ', '.join(out_formats))
+    file_list = read_file_list(job['file_list'])
+    if not file_list:
+        raise ValueError('no file matches the file list of the job')
+    destination_folder = os.path.abspath(os.path.expanduser(job['destination_folder']))
+    if not os.path.isdir(destination_folder):
+        raise ValueError('the destination folder ' + destination_folder + ' doesn\'t exist')
+    batch_dict = {'process': process, 'algorithm': read_algorithm(job.get('algorithm')), 'file_list': file_list,
+                  'destination_folder': destination_folder, 'filename_options': job.get('filename_options'),
+                  'processing_options': job.get('processing_options'),
+                  'stop_processing': job.get('stop_processing', True), 'out_format': out_format,
+                  'storage': job.get('storage'), 'concatenation': job.get('concatenation'), 'steps': steps,
+                  'drop_intermediate': job.get('drop_intermediate', False)}
+    return batch_dict, job.get('options')
+
+
+def read_options(user_path, options=None):
+    # options of the gui, those of the job replace them for this job only
+    if not pathlib.Path(user_path).joinpath('egads_gui.ini').is_file():
+        if not pathlib.Path(user_path).is_dir():
+            pathlib.Path(user_path).mkdir()
+        create_option_file(user_path)
+    update_config_file(user_path)
+    config_dict = configparser.ConfigParser()
+    config_dict.read(str(pathlib.Path(user_path).joinpath('egads_gui.ini')))
+    for key, value in (options or {}).items():
+        config_dict.set('SYSTEM', key, str(value))
+    return config_dict
+
+
+def print_progress(val):
+    print(datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S') + ' [' + str(val[1]).rjust(3) + '%] ' + str(val[0]),
+          flush=True)
+
+
+def run_batch_job(job_path, user_path, dry_run=False):
+    # the thread of the gui is run in this thread, without QApplication, its signals are received directly
+    try:
+        batch_dict, options = read_job(job_path)
+        config_dict = read_options(user_path, options)
+    except (OSError, ValueError) as e:
+        print('egads_batch: invalid job ' + str(job_path) + ': ' + str(e), file=sys.stderr)
+        return 2
+    if dry_run:
+        print('\n'.join(report_lines(estimate_batch(batch_dict, config_dict), humansize, max_lines=None)), flush=True)
+        return 0
+    errors = []
+    batch_thread = BatchProcessingThread(batch_dict, config_dict)
+    batch_thread.progress.connect(print_progress)
+    batch_thread.error.connect(errors.append)
+    batch_thread.run()
+    if errors:
+        print('egads_batch: the processing stopped: ' + errors[0][0] + ': ' + errors[0][1], file=sys.stderr)
+        return 1
+    if batch_thread.failed_files:
+        print('egads_batch: ' + str(len(batch_thread.failed_files)) + ' files failed: '
+              + ', '.join(batch_thread.failed_files), file=sys.stderr)
+        return 1
+    print_progress(['finished', 100])
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='egads_batch', description='Batch processing of EGADS Lineage GUI '
+                                                                      'without the graphical interface.')
+    parser.add_argument('job', help='json file of the job, with the keys of the batch processing')
+    parser.add_argument('--user-path', default=str(pathlib.Path.home().joinpath('.egads_lineage_gui')),
+                        help='folder of the options of the gui (default: %(default)s)')
+    parser.add_argument('--log-level', default='WARNING', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help='level of the messages of the log written on stderr (default: %(default)s)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='print an estimation of the job without processing the files')
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=args.log_level, format='%(asctime)s %(levelname)s : %(message)s')
+    return run_batch_job(args.job, args.user_path, args.dry_run)
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -1,12 +1,13 @@
 import logging
+import multiprocessing
 import platform
 import sys
 import os
 import pathlib
 from PyQt5 import QtWidgets, QtGui, QtCore
-from ui.mainwindow import MainWindow
 from ui._version import _gui_version
 from functions.utils import create_option_file, create_logging_handlers, update_config_file
+from egads_batch import main as batch_main
 import configparser
 from PyQt5.QtCore import QT_VERSION_STR as qt_version
 from matplotlib import __version__ as mpl_version
@@ -22,6 +23,8 @@ except ImportError:
 
 
 def launch_egads_gui(gui_path, user_path):
+    # the windows are imported here, the batch processing and its processes don't need a display
+    from ui.mainwindow import MainWindow
     app = QtWidgets.QApplication(sys.argv)
     splash_pix = QtGui.QPixmap('icons/egads_gui_splashscreen.png')
     splash = QtWidgets.QSplashScreen(splash_pix, QtCore.Qt.WindowStaysOnTopHint)
@@ -82,6 +85,10 @@ sys.excepthook = handle_exception
 
 
 if __name__ == '__main__':
+    # the processes of the batch processing start the frozen executable again
+    multiprocessing.freeze_support()
+    if sys.argv[1:2] == ['--batch']:
+        sys.exit(batch_main(sys.argv[2:]))
     user_path = str(pathlib.Path.home().joinpath('.egads_lineage_gui'))
     main_path = os.path.abspath(os.path.dirname(__file__))
     launch_egads_gui(main_path, user_path)
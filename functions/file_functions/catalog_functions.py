@@ -0,0 +1,263 @@
+import logging
+import os
+import sys
+import pathlib
+import pickle
+import datetime
+import threading
+import h5py
+import netCDF4
+from functions.file_functions.concatenation_functions import netcdf_time_dimension, hdf_time_dimension
+
+
+# catalog of the files of the batch processing: the header of each file (format, size, variables, global attributes,
+# time coverage) is read once and kept in the user folder, a file is read again only if it has been modified, the
+# files of a folder can then be filtered without opening them
+
+
+CATALOG_FILE = 'file_catalog.pickle'
+CATALOG_VERSION = 1
+file_formats = {'.nc': 'NetCDF', '.cdf': 'NetCDF', '.h5': 'HDF5', '.hdf5': 'HDF5', '.he5': 'HDF5', '.na': 'NASA Ames'}
+
+
+def group_variable(group_path, var_name):
+    if group_path == '/':
+        return '/' + var_name
+    return group_path + '/' + var_name
+
+
+def time_coverage(time_values, units, calendar='standard'):
+    # first and last time of a time coordinate, None if its units aren't units of time
+    if isinstance(units, bytes):
+        units = units.decode('utf-8', errors='replace')
+    if len(time_values) == 0 or ' since ' not in str(units):
+        return None, None
+    dates = netCDF4.num2date([time_values[0], time_values[-1]], str(units), calendar,
+                             only_use_cftime_datetimes=False, only_use_python_datetimes=True)
+    return dates[0], dates[-1]
+
+
+def netcdf_header(file_path, header):
+    with netCDF4.Dataset(file_path, 'r') as nc_file:
+        groups = [nc_file]
+        while groups:
+            group = groups.pop(0)
+            groups += list(group.groups.values())
+            for var_name, variable in group.variables.items():
+                itemsize = variable.dtype.itemsize if hasattr(variable.dtype, 'itemsize') else 8
+                header['variables'][group_variable(group.path, var_name)] = (variable.shape, itemsize)
+        header['attributes'] = list(nc_file.ncattrs())
+        try:
+            time_variable = nc_file.variables[netcdf_time_dimension(nc_file)]
+        except Exception:
+            return
+        header['time_dimension'] = True
+        try:
+            header['start'], header['end'] = time_coverage(time_variable[:], getattr(time_variable, 'units', ''),
+                                                           getattr(time_variable, 'calendar', 'standard'))
+        except Exception:
+            logging.exception('gui - catalog_functions.py - netcdf_header : the time coverage of ' + file_path
+                              + ' can\'t be read')
+
+
+def hdf_header(file_path, header):
+    with h5py.File(file_path, 'r') as h5_file:
+        def add_dataset(name, item):
+            if isinstance(item, h5py.Dataset):
+                header['variables']['/' + name] = (item.shape, item.dtype.itemsize)
+
+        h5_file.visititems(add_dataset)
+        header['attributes'] = list(h5_file.attrs.keys())
+        try:
+            time_dataset = h5_file[hdf_time_dimension(h5_file)]
+        except Exception:
+            return
+        header['time_dimension'] = True
+        try:
+            header['start'], header['end'] = time_coverage(time_dataset[()], time_dataset.attrs.get('units', ''),
+                                                           time_dataset.attrs.get('calendar', 'standard'))
+        except Exception:
+            logging.exception('gui - catalog_functions.py - hdf_header : the time coverage of ' + file_path
+                              + ' can\'t be read')
+
+
+def nasa_ames_header(file_path, header):
+    # the first digit of the format (FFI) is the number of independent variables, only the header of the FFI 1001
+    # is read to list the variables, each line of the data block being one value of each variable
+    with open(file_path, 'r', errors='replace') as na_file:
+        lines = na_file.readlines()
+    nlhead, ffi = [int(value) for value in lines[0].split()[:2]]
+    header['dimensions'] = ffi // 1000
+    header['attributes'] = []
+    date = datetime.datetime(*[int(value) for value in lines[6].split()[:3]])
+    header['start'], header['end'] = date, date
+    if ffi != 1001:
+        return
+    var_nbr = int(lines[9].split()[0])
+    rows = [line for line in lines[nlhead:] if line.strip()]
+    header['variables'][lines[8].strip()] = ((len(rows),), 8)
+    for line in lines[12:12 + var_nbr]:
+        header['variables'][line.strip()] = ((len(rows),), 8)
+    # the independent variable of files of a flight is usually the time in seconds from the date of the file
+    if rows and ('second' in lines[8].lower() or '(s)' in lines[8].lower()):
+        header['start'] = date + datetime.timedelta(seconds=float(rows[0].split()[0]))
+        header['end'] = date + datetime.timedelta(seconds=float(rows[-1].split()[0]))
+
+
+def first_line(text):
+    # exceptions of numpy can list every line of a file
+    return text.strip().split('\n')[0] if text.strip() else text
+
+
+def file_header(file_path):
+    # format, size, variables (shape and size of their values), global attributes and time coverage of a file,
+    # without its values
+    header = {'path': file_path, 'format': file_formats.get(pathlib.Path(file_path).suffix.lower()), 'size': 0,
+              'mtime': 0, 'variables': {}, 'attributes': [], 'dimensions': 1, 'time_dimension': False,
+              'start': None, 'end': None, 'error': None}
+    try:
+        file_stat = os.stat(file_path)
+        header['size'], header['mtime'] = file_stat.st_size, file_stat.st_mtime_ns
+        if header['format'] == 'NetCDF':
+            netcdf_header(file_path, header)
+        elif header['format'] == 'HDF5':
+            hdf_header(file_path, header)
+        elif header['format'] == 'NASA Ames':
+            nasa_ames_header(file_path, header)
+        else:
+            header['error'] = 'the format of the file is unknown'
+    except Exception:
+        etype, evalue, _ = sys.exc_info()
+        header['error'] = 'the file can\'t be read (' + etype.__name__ + ': ' + first_line(str(evalue)) + ')'
+    # a single string of the names of the variables is searched faster than each name
+    header['variable_index'] = '\n'.join(header['variables']).lower()
+    return header
+
+
+def catalog_paths(folder, recursive=True):
+    # files of the known formats of a folder, and of its subfolders, sorted by folder and name
+    paths = []
+    for root, folders, files in os.walk(folder):
+        folders.sort()
+        paths += [os.path.join(root, name) for name in sorted(files)
+                  if pathlib.Path(name).suffix.lower() in file_formats]
+        if not recursive:
+            break
+    return paths
+
+
+def catalog_date(text, end=False):
+    # dates of the filters, a day without time is the whole day for the end of a time range
+    text = text.strip()
+    if not text:
+        return None
+    date = datetime.datetime.fromisoformat(text)
+    if end and len(text) <= 10:
+        date += datetime.timedelta(days=1) - datetime.timedelta(microseconds=1)
+    return date
+
+
+def filter_entries(entries, formats=None, variable='', start=None, end=None):
+    # files of a format, containing a variable whose name contains the text of variable, and covering a part of the
+    # time range, the files without time coverage are removed by a time range
+    variable = variable.strip().lower()
+    filtered = []
+    for entry in entries:
+        if formats is not None and entry['format'] not in formats:
+            continue
+        if variable and variable not in entry['variable_index']:
+            continue
+        if start is not None or end is not None:
+            if entry['start'] is None:
+                continue
+            if start is not None and entry['end'] < start:
+                continue
+            if end is not None and entry['start'] > end:
+                continue
+        filtered.append(entry)
+    return filtered
+
+
+class FileCatalog(object):
+    # headers of the files indexed by their path, loaded from the user folder the first time they are needed, the
+    # entries are read by the gui while a thread scans a folder, they are changed and saved under a lock
+    def __init__(self, user_path):
+        logging.debug('gui - catalog_functions.py - FileCatalog - __init__')
+        self.catalog_path = pathlib.Path(user_path).joinpath(CATALOG_FILE)
+        self.entries = None
+        self.modified = False
+        self.lock = threading.RLock()
+
+    def load(self):
+        logging.debug('gui - catalog_functions.py - FileCatalog - load')
+        with self.lock:
+            self.entries = {}
+            if not self.catalog_path.is_file():
+                return
+            try:
+                with open(str(self.catalog_path), 'rb') as catalog_file:
+                    version, entries = pickle.load(catalog_file)
+            except Exception:
+                logging.exception('gui - catalog_functions.py - FileCatalog - load : the catalog can\'t be read, it '
+                                  'will be created again')
+                return
+            if version == CATALOG_VERSION:
+                self.entries = entries
+
+    def save(self):
+        logging.debug('gui - catalog_functions.py - FileCatalog - save')
+        with self.lock:
+            if not self.modified:
+                return
+            if not self.catalog_path.parent.is_dir():
+                self.catalog_path.parent.mkdir(parents=True)
+            temp_path = self.catalog_path.with_suffix('.tmp')
+            with open(str(temp_path), 'wb') as catalog_file:
+                pickle.dump((CATALOG_VERSION, self.entries), catalog_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(str(temp_path), str(self.catalog_path))
+            self.modified = False
+
+    def entry(self, file_path):
+        # header of a file, read again if the file has been modified since it was indexed, the hdf5 library can't read
+        # files in two threads, the file is read under the lock too
+        file_path = os.path.abspath(file_path)
+        with self.lock:
+            if self.entries is None:
+                self.load()
+            entry = self.entries.get(file_path)
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                file_stat = None
+            if entry is None or file_stat is None or (entry['size'], entry['mtime']) != (file_stat.st_size,
+                                                                                        file_stat.st_mtime_ns):
+                entry = file_header(file_path)
+                self.entries[file_path] = entry
+                self.modified = True
+            return entry
+
+    def scan(self, folder, recursive=True, progress=None, stopped=None):
+        logging.debug('gui - catalog_functions.py - FileCatalog - scan - folder ' + str(folder) + ', recursive '
+                      + str(recursive))
+        with self.lock:
+            if self.entries is None:
+                self.load()
+        folder = os.path.abspath(folder)
+        paths = catalog_paths(folder, recursive)
+        entries = []
+        for i, file_path in enumerate(paths):
+            if stopped is not None and stopped():
+                return None
+            entries.append(self.entry(file_path))
+            if progress is not None:
+                progress(i + 1, len(paths))
+        # the files removed from the folder are removed from the catalog
+        path_set = set(paths)
+        with self.lock:
+            for file_path in list(self.entries):
+                in_folder = (file_path.startswith(os.path.join(folder, '')) if recursive
+                             else os.path.dirname(file_path) == folder)
+                if in_folder and file_path not in path_set:
+                    del self.entries[file_path]
+                    self.modified = True
+        return entries
@@ -0,0 +1,123 @@
+import logging
+import os
+import copy
+import weakref
+import numpy
+import netCDF4
+from functions.file_functions.lazy_loading_functions import is_variable
+
+
+def same_value(value_1, value_2):
+    if type(value_1) is not type(value_2):
+        return False
+    if isinstance(value_1, (numpy.ndarray, list, tuple)):
+        value_1, value_2 = numpy.asarray(value_1), numpy.asarray(value_2)
+        if value_1.shape != value_2.shape or value_1.dtype != value_2.dtype:
+            return False
+        if value_1.dtype.kind in 'fc':
+            return bool(numpy.array_equal(value_1, value_2, equal_nan=True))
+        return bool(numpy.array_equal(value_1, value_2))
+    try:
+        return bool(value_1 == value_2) or (value_1 != value_1 and value_2 != value_2)
+    except (TypeError, ValueError):
+        return False
+
+
+def attribute_changes(old_attributes, new_attributes):
+    set_attributes = {key: value for key, value in new_attributes.items()
+                      if key not in old_attributes or not same_value(old_attributes[key], value)}
+    deleted_attributes = [key for key in old_attributes if key not in new_attributes]
+    return set_attributes, deleted_attributes
+
+
+def item_attributes(sublist):
+    if is_variable(sublist[0]):
+        return dict(sublist[0].metadata)
+    return dict(sublist[0])
+
+
+def item_dimensions(sublist):
+    if sublist[1] is None:
+        return None
+    return list(sublist[1].items())
+
+
+def file_state(file_name):
+    file_stat = os.stat(file_name)
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+class WorkspaceSnapshot(object):
+    # state of the workspace when the file has been opened or saved, the workspace is compared to it at the next save
+    # to find the attributes, groups and variables modified by the user
+    def __init__(self, file_name, file_ext, glob_attr, var_dict):
+        logging.debug('gui - change_tracking_functions.py - WorkspaceSnapshot - __init__ - file_name ' + file_name)
+        self.file_name = os.path.abspath(file_name)
+        self.file_ext = file_ext
+        self.file_state = file_state(file_name)
+        self.glob_attr = copy.deepcopy(dict(glob_attr))
+        self.items = {}
+        for path, sublist in var_dict.items():
+            data = None
+            if is_variable(sublist[0]):
+                data = weakref.ref(sublist[0])
+            self.items[path] = {'data': data, 'attributes': copy.deepcopy(item_attributes(sublist)),
+                                'dimensions': item_dimensions(sublist), 'is_dim': sublist[2]}
+
+    def changes(self, file_name, file_ext, glob_attr, var_dict):
+        # modified attributes, new groups and new variables, None if the file has to be written again entirely
+        logging.debug('gui - change_tracking_functions.py - WorkspaceSnapshot - changes - file_name ' + file_name)
+        reason = self.rewrite_reason(file_name, file_ext, var_dict)
+        if reason is not None:
+            logging.debug('gui - change_tracking_functions.py - WorkspaceSnapshot - changes : the file will be '
+                          'written again, ' + reason)
+            return None
+        changes = {'global_attributes': attribute_changes(self.glob_attr, glob_attr), 'attributes': {},
+                   'groups': [], 'variables': []}
+        for path, sublist in var_dict.items():
+            if path not in self.items:
+                if is_variable(sublist[0]):
+                    changes['variables'].append(path)
+                else:
+                    changes['groups'].append(path)
+                continue
+            set_attributes, deleted_attributes = attribute_changes(self.items[path]['attributes'],
+                                                                   item_attributes(sublist))
+            if set_attributes or deleted_attributes:
+                changes['attributes'][path] = (set_attributes, deleted_attributes)
+        return changes
+
+    def rewrite_reason(self, file_name, file_ext, var_dict):
+        if os.path.abspath(file_name) != self.file_name or file_ext != self.file_ext:
+            return 'the file is not the file of the workspace'
+        if not os.path.exists(file_name) or file_state(file_name) != self.file_state:
+            return 'the file has been modified outside of the GUI'
+        if file_ext == 'NetCDF Files (*.nc *.cdf)':
+            with netCDF4.Dataset(file_name, 'r') as netcdf_file:
+                if netcdf_file.data_model != 'NETCDF4':
+                    return 'only NetCDF4 files can be updated in place'
+        elif file_ext != 'Hdf Files (*.h5 *.hdf5 *.he5)':
+            return 'only NetCDF and Hdf files can be updated in place'
+        for path in self.items:
+            if path not in var_dict:
+                return path + ' has been deleted, renamed or moved'
+        for path, sublist in var_dict.items():
+            state = self.items.get(path)
+            if state is None:
+                if sublist[2]:
+                    return 'the dimension ' + path + ' has been created'
+                if is_variable(sublist[0]) and sublist[1] is not None:
+                    for dim in sublist[1]:
+                        if dim in var_dict and dim not in self.items:
+                            return 'the dimension ' + dim + ' has been created'
+                continue
+            if (state['data'] is None) == is_variable(sublist[0]) or state['is_dim'] != sublist[2]:
+                return path + ' has been replaced'
+            if state['data'] is not None and state['data']() is not sublist[0]:
+                return 'the values of ' + path + ' have been modified'
+            if state['dimensions'] != item_dimensions(sublist):
+                return 'the dimensions of ' + path + ' have been modified'
+            set_attributes, deleted_attributes = attribute_changes(state['attributes'], item_attributes(sublist))
+            if '_FillValue' in set_attributes or '_FillValue' in deleted_attributes:
+                return 'the fill value of ' + path + ' has been modified'
+        return None
@@ -0,0 +1,49 @@
+import logging
+import zlib
+import numpy
+
+
+H5Z_FILTER_DEFLATE = 1
+H5Z_FILTER_SHUFFLE = 2
+
+
+def deflate_dataset_filters(dataset):
+    # chunks can be decompressed outside of the hdf5 library only if deflate and shuffle are the only filters
+    if dataset.chunks is None or dataset.dtype.kind not in 'biuf':
+        return None
+    plist = dataset.id.get_create_plist()
+    filters = [plist.get_filter(i)[0] for i in range(plist.get_nfilters())]
+    if H5Z_FILTER_DEFLATE not in filters:
+        return None
+    for filter_id in filters:
+        if filter_id not in [H5Z_FILTER_DEFLATE, H5Z_FILTER_SHUFFLE]:
+            return None
+    return filters
+
+
+def read_deflate_dataset(dataset, filters, lock):
+    # raw chunks are read with the lock, the hdf5 library can't be used by two threads at the same time, but
+    # zlib releases the GIL, chunks of different variables are then decompressed in parallel
+    logging.debug('gui - chunk_reading_functions.py - read_deflate_dataset - dataset ' + str(dataset.name))
+    with lock:
+        shape = dataset.shape
+        chunks = dataset.chunks
+        dtype = dataset.dtype
+        fill_value = dataset.fillvalue
+        chunk_offsets = [dataset.id.get_chunk_info(i).chunk_offset for i in range(dataset.id.get_num_chunks())]
+    value = numpy.full(shape, fill_value, dtype=dtype)
+    for chunk_offset in chunk_offsets:
+        with lock:
+            filter_mask, data = dataset.id.read_direct_chunk(chunk_offset)
+        for i in reversed(range(len(filters))):
+            if filter_mask & (1 << i):
+                continue
+            if filters[i] == H5Z_FILTER_DEFLATE:
+                data = zlib.decompress(data)
+            elif filters[i] == H5Z_FILTER_SHUFFLE:
+                data = numpy.frombuffer(data, dtype=numpy.uint8).reshape(dtype.itemsize, -1).T.tobytes()
+        chunk = numpy.frombuffer(data, dtype=dtype).reshape(chunks)
+        region = tuple(slice(offset, min(offset + size, length))
+                       for offset, size, length in zip(chunk_offset, chunks, shape))
+        value[region] = chunk[tuple(slice(0, item.stop - item.start) for item in region)]
+    return value
@@ -0,0 +1,389 @@
+import logging
+import os
+import numpy
+import h5py
+import netCDF4
+from functions.file_functions.storage_functions import chunk_shape
+from functions.file_functions.conversion_functions import (hdf_dimension_attributes, attribute_value, is_text,
+                                                            text_values, copy_blocks, walk_netcdf_groups, new_layout,
+                                                            copy_history)
+
+
+def is_time_coordinate(units):
+    return 'since' in str(attribute_value(units))
+
+
+def netcdf_time_dimension(nc_file):
+    # like for segments, the unlimited dimension with a coordinate variable, or a time coordinate
+    for dim_name, dimension in nc_file.dimensions.items():
+        if dimension.isunlimited() and dim_name in nc_file.variables:
+            return dim_name
+    for var_name, variable in nc_file.variables.items():
+        if variable.dimensions == (var_name,) and is_time_coordinate(getattr(variable, 'units', '')):
+            return var_name
+    raise Exception('the file ' + nc_file.filepath() + ' doesn\'t contain a time or unlimited dimension')
+
+
+def hdf_time_dimension(h5_file):
+    datasets = [item for item in h5_file.values() if isinstance(item, h5py.Dataset) and item.ndim == 1]
+    for dataset in datasets:
+        if dataset.is_scale and dataset.maxshape[0] is None:
+            return os.path.basename(dataset.name)
+    for dataset in datasets:
+        if is_time_coordinate(dataset.attrs.get('units', '')):
+            return os.path.basename(dataset.name)
+    raise Exception('the file ' + h5_file.filename + ' doesn\'t contain a time or unlimited dimension')
+
+
+def netcdf_time_axis(variable, time_name):
+    if time_name in variable.dimensions:
+        return variable.dimensions.index(time_name)
+    return None
+
+
+def hdf_time_axis(dataset, time_name):
+    if os.path.basename(dataset.name) == time_name and dataset.parent.name == '/':
+        return 0
+    for i, dim in enumerate(dataset.dims):
+        if dim.label == time_name or any(scale.name == '/' + time_name for scale in dim.values()):
+            return i
+    return None
+
+
+def first_time_value(file_path, netcdf):
+    # used to order the segments, a file which can't be read is put at the end and fails when it is appended
+    try:
+        if netcdf:
+            with netCDF4.Dataset(file_path, 'r') as nc_file:
+                time = nc_file.variables[netcdf_time_dimension(nc_file)]
+                return float(time[0]) if time.shape[0] else numpy.inf
+        with h5py.File(file_path, 'r') as h5_file:
+            time = h5_file[hdf_time_dimension(h5_file)]
+            return float(time[0]) if time.shape[0] else numpy.inf
+    except Exception:
+        return numpy.inf
+
+
+def sort_time_segments(file_list, netcdf):
+    first_values = [first_time_value(file_path, netcdf) for file_path in file_list]
+    return [file_path for _, file_path in sorted(zip(first_values, file_list), key=lambda item: item[0])]
+
+
+def append_blocks(read_block, write_block, shape, axis, offset, itemsize, storage, chunks=None):
+    # values of a segment are copied in blocks along their first dimension, the block is written after the values
+    # already in the file along the time axis
+    def write_appended(block, value):
+        if block is Ellipsis:
+            block = slice(0, shape[0])
+        index = [block] + [slice(None)] * (len(shape) - 1)
+        if axis == 0:
+            index[0] = slice(block.start + offset, block.stop + offset)
+        else:
+            index[axis] = slice(offset, offset + shape[axis])
+        write_block(tuple(index), value)
+
+    if 0 in shape:
+        return 0
+    return copy_blocks(read_block, write_appended, shape, itemsize, storage, chunks)
+
+
+class TimeConcatenation(object):
+    # segments of a flight are appended one after the other along the time dimension of the first segment, only one
+    # block of values is in memory at a time, each segment is checked before anything is written, if the writing
+    # fails, the new file can't be used anymore and broken is True
+    def __init__(self, file_path, storage):
+        logging.debug('gui - concatenation_functions.py - TimeConcatenation - __init__ - file_path ' + str(file_path))
+        self.file_path = file_path
+        self.storage = storage
+        self.new_file = None
+        self.time_name = None
+        self.units = None
+        self.length = 0
+        self.last_time = None
+        self.variables = {}
+        self.global_attributes = None
+        self.broken = False
+
+    def check_time(self, time_values, units, file_path):
+        if self.units is not None and units != self.units:
+            raise Exception('the units of ' + self.time_name + ' in ' + file_path + ' (' + str(units) + ') are '
+                            'different from those of the other segments (' + str(self.units) + ')')
+        time_values = numpy.asarray(time_values, dtype='float64')
+        if numpy.any(numpy.diff(time_values) <= 0):
+            raise Exception('the time of ' + file_path + ' isn\'t strictly increasing')
+        if time_values.size and self.last_time is not None and time_values[0] <= self.last_time:
+            raise Exception('the time of ' + file_path + ' starts before the end of the previous segment')
+
+    def check_variables(self, segment_variables, file_path):
+        # variables along time must be in all segments, with the same shape along the other dimensions
+        for var_path, (axis, shape, dtype) in self.variables.items():
+            if axis is None:
+                continue
+            if var_path not in segment_variables:
+                raise Exception('the variable ' + var_path + ' is missing in ' + file_path)
+            segment_axis, segment_shape, segment_dtype = segment_variables[var_path]
+            if segment_axis != axis or len(segment_shape) != len(shape) or any(
+                    segment_shape[i] != shape[i] for i in range(len(shape)) if i != axis):
+                raise Exception('the shape of ' + var_path + ' in ' + file_path + ' doesn\'t match the shape of '
+                                'the other segments')
+            if not is_text(dtype) and not numpy.can_cast(segment_dtype, dtype, 'same_kind'):
+                raise Exception('the type of ' + var_path + ' in ' + file_path + ' doesn\'t match the type of the '
+                                'other segments')
+        for var_path in segment_variables:
+            if var_path not in self.variables:
+                logging.warning('gui - concatenation_functions.py - TimeConcatenation - check_variables - '
+                                + var_path + ' of ' + file_path + ' isn\'t in the first segment, skipping variable')
+
+    def add_attributes(self, attributes, global_option):
+        # like the other concatenation: attributes of the first segment, of all segments or no attribute
+        attributes = {key: value for key, value in attributes.items() if key not in hdf_dimension_attributes}
+        if global_option == 0 and self.global_attributes is None:
+            self.global_attributes = attributes
+        elif global_option == 1:
+            self.global_attributes = {**(self.global_attributes or {}), **attributes}
+
+    def append(self, segment_path, global_option):
+        logging.debug('gui - concatenation_functions.py - TimeConcatenation - append - segment_path '
+                      + str(segment_path))
+        segment_variables, time_values = self.read_segment(segment_path)
+        if self.new_file is not None:
+            self.check_variables(segment_variables, segment_path)
+        try:
+            if self.new_file is None:
+                self.create_file(segment_path)
+            length = self.append_segment(segment_path, global_option)
+        except Exception:
+            self.broken = True
+            raise
+        self.length += length
+        if len(time_values):
+            self.last_time = float(time_values[-1])
+
+    def close(self, history=None):
+        logging.debug('gui - concatenation_functions.py - TimeConcatenation - close')
+        if self.new_file is None:
+            return
+        if not self.broken and self.global_attributes is not None:
+            if history is not None:
+                self.global_attributes = copy_history(self.global_attributes, history)
+            self.write_global_attributes()
+        self.new_file.close()
+
+
+class NetcdfTimeConcatenation(TimeConcatenation):
+    def read_segment(self, segment_path):
+        with netCDF4.Dataset(segment_path, 'r') as nc_file:
+            nc_file.set_auto_maskandscale(False)
+            if self.time_name is None:
+                self.time_name = netcdf_time_dimension(nc_file)
+            if self.time_name not in nc_file.variables:
+                raise Exception('the file ' + segment_path + ' doesn\'t contain the dimension ' + self.time_name)
+            time = nc_file.variables[self.time_name]
+            units = attribute_value(getattr(time, 'units', ''))
+            time_values = time[:]
+            self.check_time(time_values, units, segment_path)
+            self.units = units
+            segment_variables = {}
+            for nc_group in walk_netcdf_groups(nc_file):
+                for variable in nc_group.variables.values():
+                    segment_variables[group_path(nc_group) + variable.name] = (
+                        netcdf_time_axis(variable, self.time_name), variable.shape, variable.dtype)
+        return segment_variables, time_values
+
+    def create_file(self, segment_path):
+        # groups, dimensions and variables are created from the first segment, the time dimension is unlimited
+        self.new_file = netCDF4.Dataset(self.file_path, 'w')
+        with netCDF4.Dataset(segment_path, 'r') as nc_file:
+            nc_file.set_auto_maskandscale(False)
+            for nc_group in walk_netcdf_groups(nc_file):
+                new_group = self.new_file
+                if nc_group.path != '/':
+                    new_group = self.new_file.createGroup(nc_group.path)
+                    for key in nc_group.ncattrs():
+                        new_group.setncattr(key, attribute_value(nc_group.getncattr(key)))
+                for dim_name, dimension in nc_group.dimensions.items():
+                    if dim_name == self.time_name and nc_group.path == '/':
+                        new_group.createDimension(dim_name, None)
+                    else:
+                        new_group.createDimension(dim_name, len(dimension))
+                for variable in nc_group.variables.values():
+                    self.create_variable(variable, new_group, group_path(nc_group) + variable.name)
+
+    def create_variable(self, variable, new_group, var_path):
+        axis = netcdf_time_axis(variable, self.time_name)
+        dtype = str if is_text(variable.dtype) else variable.dtype
+        attributes = {key: variable.getncattr(key) for key in variable.ncattrs()}
+        fill_value = None if dtype is str else attributes.pop('_FillValue', None)
+        attributes.pop('_FillValue', None)
+        options = new_layout(variable.shape, dtype, self.storage, netcdf_variable_layout(variable), True)
+        new_variable = new_group.createVariable(variable.name, dtype, variable.dimensions, fill_value=fill_value,
+                                                **options)
+        new_variable.set_auto_maskandscale(False)
+        for key, value in attributes.items():
+            new_variable.setncattr(key, attribute_value(value))
+        self.variables[var_path] = (axis, variable.shape, dtype)
+
+    def append_segment(self, segment_path, global_option):
+        with netCDF4.Dataset(segment_path, 'r') as nc_file:
+            nc_file.set_auto_maskandscale(False)
+            self.add_attributes({key: nc_file.getncattr(key) for key in nc_file.ncattrs()}, global_option)
+            for var_path, (axis, _, dtype) in self.variables.items():
+                if axis is None and self.length:
+                    continue
+                variable = nc_file[var_path]
+                new_variable = self.new_file[var_path]
+                if is_text(dtype):
+                    def read_block(block, variable=variable):
+                        return text_values(variable[block])
+                else:
+                    def read_block(block, variable=variable):
+                        return variable[block]
+
+                def write_block(index, value, new_variable=new_variable):
+                    new_variable[index] = value
+
+                append_blocks(read_block, write_block, variable.shape, 0 if axis is None else axis,
+                              0 if axis is None else self.length, numpy.dtype(variable.dtype).itemsize, self.storage,
+                              netcdf_variable_layout(variable).get('chunksizes'))
+            return len(nc_file.dimensions[self.time_name])
+
+    def write_global_attributes(self):
+        for key, value in self.global_attributes.items():
+            self.new_file.setncattr(key, attribute_value(value))
+
+
+class HdfTimeConcatenation(TimeConcatenation):
+    def read_segment(self, segment_path):
+        with h5py.File(segment_path, 'r') as h5_file:
+            if self.time_name is None:
+                self.time_name = hdf_time_dimension(h5_file)
+            if self.time_name not in h5_file:
+                raise Exception('the file ' + segment_path + ' doesn\'t contain the dimension ' + self.time_name)
+            time = h5_file[self.time_name]
+            units = attribute_value(time.attrs.get('units', ''))
+            time_values = time[()]
+            self.check_time(time_values, units, segment_path)
+            self.units = units
+            segment_variables = {}
+            for dataset in hdf_datasets(h5_file):
+                segment_variables[dataset.name] = (hdf_time_axis(dataset, self.time_name), dataset.shape,
+                                                   dataset.dtype)
+        return segment_variables, time_values
+
+    def create_file(self, segment_path):
+        # datasets along time can be resized along the time axis, dimension scales are attached like in the segment
+        self.new_file = h5py.File(self.file_path, 'w')
+        with h5py.File(segment_path, 'r') as h5_file:
+            groups = []
+            h5_file.visititems(lambda name, item: groups.append(item) if isinstance(item, h5py.Group) else None)
+            for h5_group in groups:
+                new_group = self.new_file.require_group(h5_group.name)
+                for key, value in h5_group.attrs.items():
+                    if key not in hdf_dimension_attributes:
+                        new_group.attrs.create(key, attribute_value(value))
+            datasets = hdf_datasets(h5_file)
+            for dataset in datasets:
+                self.create_dataset(dataset)
+            for dataset in datasets:
+                if dataset.is_scale:
+                    self.new_file[dataset.name].make_scale(os.path.basename(dataset.name))
+            for dataset in datasets:
+                new_dataset = self.new_file[dataset.name]
+                for i, dim in enumerate(dataset.dims):
+                    for scale in dim.values():
+                        if scale.name != dataset.name and scale.name in self.new_file:
+                            new_dataset.dims[i].attach_scale(self.new_file[scale.name])
+                    if dim.label:
+                        new_dataset.dims[i].label = dim.label
+
+    def create_dataset(self, dataset):
+        axis = hdf_time_axis(dataset, self.time_name)
+        dtype = h5py.string_dtype() if is_text(dataset.dtype) else dataset.dtype
+        options = new_layout(dataset.shape, dtype, self.storage, hdf_dataset_layout(dataset), False)
+        shape = dataset.shape
+        if axis is not None:
+            shape = tuple(0 if i == axis else size for i, size in enumerate(dataset.shape))
+            options['maxshape'] = tuple(None if i == axis else size for i, size in enumerate(dataset.shape))
+            if options.get('chunks') is None:
+                # a dataset which can be resized needs chunks
+                chunk_dims = (dataset.shape[axis],) + tuple(size for i, size in enumerate(dataset.shape)
+                                                            if i != axis)
+                chunks = chunk_shape(tuple(max(size, 1) for size in chunk_dims),
+                                     numpy.dtype(dtype).itemsize, self.storage['chunk_length'])
+                options['chunks'] = chunks[1:axis + 1] + chunks[:1] + chunks[axis + 1:]
+        if dataset.fillvalue is not None and not is_text(dtype):
+            options['fillvalue'] = dataset.fillvalue
+        new_dataset = self.new_file.create_dataset(dataset.name, shape=shape, dtype=dtype, **options)
+        for key, value in dataset.attrs.items():
+            if key not in hdf_dimension_attributes:
+                new_dataset.attrs.create(key, attribute_value(value))
+        self.variables[dataset.name] = (axis, dataset.shape, dtype)
+
+    def append_segment(self, segment_path, global_option):
+        with h5py.File(segment_path, 'r') as h5_file:
+            self.add_attributes(dict(h5_file.attrs.items()), global_option)
+            length = h5_file[self.time_name].shape[0]
+            for var_path, (axis, _, dtype) in self.variables.items():
+                if axis is None and self.length:
+                    continue
+                dataset = h5_file[var_path]
+                new_dataset = self.new_file[var_path]
+                if axis is not None:
+                    new_dataset.resize(self.length + dataset.shape[axis], axis=axis)
+                if is_text(dtype):
+                    def read_block(block, dataset=dataset):
+                        return text_values(dataset[block])
+                else:
+                    def read_block(block, dataset=dataset):
+                        return dataset[block]
+
+                def write_block(index, value, new_dataset=new_dataset):
+                    new_dataset[index] = value
+
+                append_blocks(read_block, write_block, dataset.shape, 0 if axis is None else axis,
+                              0 if axis is None else self.length, dataset.dtype.itemsize, self.storage,
+                              dataset.chunks)
+            return length
+
+    def write_global_attributes(self):
+        for key, value in self.global_attributes.items():
+            self.new_file.attrs.create(key, attribute_value(value))
+
+
+def group_path(nc_group):
+    return nc_group.path.rstrip('/') + '/'
+
+
+def netcdf_variable_layout(variable):
+    # compression and chunks of a NetCDF variable given as netCDF4 options
+    options = {}
+    filters = variable.filters() or {}
+    chunking = variable.chunking()
+    if chunking != 'contiguous' and chunking is not None:
+        options['chunksizes'] = tuple(chunking)
+    if filters.get('zlib'):
+        options.update({'zlib': True, 'complevel': filters.get('complevel', 4)})
+    if filters.get('shuffle'):
+        options['shuffle'] = True
+    if filters.get('fletcher32'):
+        options['fletcher32'] = True
+    return options
+
+
+def hdf_dataset_layout(dataset):
+    options = {}
+    if dataset.chunks is not None:
+        options['chunks'] = dataset.chunks
+    if dataset.compression is not None:
+        options.update({'compression': dataset.compression, 'compression_opts': dataset.compression_opts})
+    if dataset.shuffle:
+        options['shuffle'] = True
+    if dataset.fletcher32:
+        options['fletcher32'] = True
+    return options
+
+
+def hdf_datasets(h5_file):
+    datasets = []
+    h5_file.visititems(lambda name, item: datasets.append(item) if isinstance(item, h5py.Dataset) else None)
+    return datasets
@@ -0,0 +1,295 @@
+import logging
+import os
+import time
+import numpy
+import h5py
+import netCDF4
+from functions.file_functions.storage_functions import compressed, chunk_shape, block_length
+
+
+# attributes written by the libraries to link dimensions and variables, they are rebuilt in the new file
+hdf_dimension_attributes = ['CLASS', 'NAME', 'REFERENCE_LIST', 'DIMENSION_LIST', 'DIMENSION_LABELS',
+                            '_Netcdf4Dimid', '_Netcdf4Coordinates', '_NCProperties']
+
+
+def attribute_value(value):
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace')
+    if isinstance(value, numpy.ndarray) and value.dtype.kind in 'SO':
+        value = [item.decode('utf-8', 'replace') if isinstance(item, bytes) else str(item) for item in value.flat]
+        return ', '.join(value)
+    return value
+
+
+def is_text(dtype):
+    # characters are kept as they are, other strings are written as variable length strings in both formats
+    if dtype is str:
+        return True
+    dtype = numpy.dtype(dtype)
+    return dtype.kind in 'OU' or (dtype.kind == 'S' and dtype.itemsize > 1)
+
+
+def text_values(value):
+    value = numpy.asarray(value, dtype=object)
+    for index, item in numpy.ndenumerate(value):
+        if isinstance(item, bytes):
+            value[index] = item.decode('utf-8', 'replace')
+    return value
+
+
+def copy_blocks(read_block, write_block, shape, itemsize, storage, chunks=None):
+    # values are copied along the first dimension in blocks aligned on the chunks of the new variable, the number of
+    # bytes copied is returned to compute the throughput
+    if not shape or 0 in shape:
+        value = read_block(Ellipsis)
+        write_block(Ellipsis, value)
+        return numpy.asarray(value).nbytes
+    length = block_length(shape, itemsize, storage, chunks)
+    copied = 0
+    for start in range(0, shape[0], length):
+        block = slice(start, min(start + length, shape[0]))
+        value = read_block(block)
+        write_block(block, value)
+        copied += numpy.asarray(value).nbytes
+    return copied
+
+
+def netcdf_layout(variable):
+    # compression and chunks of a NetCDF variable given as h5py options
+    options = {}
+    filters = variable.filters() or {}
+    chunking = variable.chunking()
+    if chunking != 'contiguous' and chunking is not None:
+        options['chunks'] = tuple(chunking)
+    if filters.get('zlib'):
+        options.update({'compression': 'gzip', 'compression_opts': filters.get('complevel', 4)})
+    if filters.get('shuffle'):
+        options['shuffle'] = True
+    if filters.get('fletcher32'):
+        options['fletcher32'] = True
+    return options
+
+
+def hdf_layout(dataset):
+    # compression and chunks of a Hdf dataset given as netCDF4 options, only deflate exists in both formats
+    options = {}
+    if dataset.chunks is not None:
+        options.update({'contiguous': False, 'chunksizes': dataset.chunks})
+    if dataset.compression == 'gzip':
+        options.update({'zlib': True, 'complevel': dataset.compression_opts})
+    if dataset.shuffle:
+        options['shuffle'] = True
+    if dataset.fletcher32:
+        options['fletcher32'] = True
+    return options
+
+
+def storage_layout(shape, itemsize, storage, netcdf):
+    # the compression of the batch processing replaces the one of the original file
+    chunks = chunk_shape(shape, itemsize, storage['chunk_length'])
+    if netcdf:
+        return {'zlib': True, 'complevel': storage['complevel'], 'shuffle': storage['shuffle'], 'chunksizes': chunks}
+    return {'compression': 'gzip', 'compression_opts': storage['complevel'], 'shuffle': storage['shuffle'],
+            'chunks': chunks}
+
+
+def variable_chunks(options):
+    return options.get('chunks', options.get('chunksizes'))
+
+
+def new_layout(shape, dtype, storage, source_layout, netcdf):
+    if not shape or 0 in shape or is_text(dtype):
+        return {}
+    if compressed(storage):
+        return storage_layout(shape, numpy.dtype(dtype).itemsize, storage, netcdf)
+    return source_layout
+
+
+def copy_history(attributes, history):
+    if 'history' in attributes:
+        attributes['history'] = str(attribute_value(attributes['history'])) + ' ; ' + history
+    else:
+        attributes['history'] = history
+    return attributes
+
+
+def netcdf_to_hdf(nc_path, h5_path, history, storage):
+    # groups, dimensions, attributes and values are copied between the libraries, without EgadsData, dimensions are
+    # written as dimension scales like egads does
+    logging.debug('gui - conversion_functions.py - netcdf_to_hdf - nc_path ' + str(nc_path))
+    copied = 0
+    with netCDF4.Dataset(nc_path, 'r') as nc_file, h5py.File(h5_path, 'w') as h5_file:
+        nc_file.set_auto_maskandscale(False)
+        attributes = copy_history({key: nc_file.getncattr(key) for key in nc_file.ncattrs()}, history)
+        for key, value in attributes.items():
+            h5_file.attrs.create(key, attribute_value(value))
+        for nc_group in walk_netcdf_groups(nc_file):
+            h5_group = h5_file.require_group(nc_group.path)
+            for key in nc_group.ncattrs():
+                h5_group.attrs.create(key, attribute_value(nc_group.getncattr(key)))
+            for dim_name, dimension in nc_group.dimensions.items():
+                if dim_name in nc_group.variables:
+                    copied += netcdf_variable_to_hdf(nc_group.variables[dim_name], h5_group, storage)
+                else:
+                    # a dimension without coordinate variable is written as an index
+                    h5_group.create_dataset(dim_name, data=numpy.arange(len(dimension), dtype='float64'))
+                h5_group[dim_name].make_scale(dim_name)
+                h5_group[dim_name].dims[0].label = dim_name
+            for var_name, variable in nc_group.variables.items():
+                if var_name not in nc_group.dimensions:
+                    copied += netcdf_variable_to_hdf(variable, h5_group, storage)
+                    for i, dim_name in enumerate(variable.dimensions):
+                        scale = netcdf_dimension_scale(variable.group(), dim_name, h5_file)
+                        h5_group[var_name].dims[i].attach_scale(scale)
+                        h5_group[var_name].dims[i].label = dim_name
+    return copied
+
+
+def walk_netcdf_groups(nc_group):
+    yield nc_group
+    for group in nc_group.groups.values():
+        for subgroup in walk_netcdf_groups(group):
+            yield subgroup
+
+
+def netcdf_dimension_scale(nc_group, dim_name, h5_file):
+    # like in NetCDF, a dimension can be defined in a parent group
+    while nc_group is not None:
+        if dim_name in nc_group.dimensions:
+            return h5_file[nc_group.path.rstrip('/') + '/' + dim_name]
+        nc_group = nc_group.parent
+    raise KeyError('The following dimension \'' + dim_name + '\' can\'t be found in the NetCDF file')
+
+
+def netcdf_variable_to_hdf(variable, h5_group, storage):
+    dtype = variable.dtype
+    if is_text(dtype):
+        dtype = h5py.string_dtype()
+    options = new_layout(variable.shape, dtype, storage, netcdf_layout(variable), False)
+    unlimited = [dimension.isunlimited() for dimension in variable.get_dims()]
+    if any(unlimited) and variable.shape and 0 not in variable.shape:
+        # unlimited dimensions can be extended in Hdf too, their chunks can be longer than the values
+        options['maxshape'] = tuple(None if unlimited[i] else size for i, size in enumerate(variable.shape))
+    attributes = {key: variable.getncattr(key) for key in variable.ncattrs()}
+    if '_FillValue' in attributes and not is_text(dtype):
+        options['fillvalue'] = attributes['_FillValue']
+    dataset = h5_group.create_dataset(variable.name, shape=variable.shape, dtype=dtype, **options)
+    for key, value in attributes.items():
+        dataset.attrs.create(key, attribute_value(value))
+    if is_text(dtype):
+        def read_block(block):
+            return text_values(variable[block])
+    else:
+        def read_block(block):
+            return variable[block]
+
+    def write_block(block, value):
+        dataset[block] = value
+
+    return copy_blocks(read_block, write_block, variable.shape, numpy.dtype(dtype).itemsize, storage,
+                       variable_chunks(options))
+
+
+def hdf_to_netcdf(h5_path, nc_path, history, storage):
+    logging.debug('gui - conversion_functions.py - hdf_to_netcdf - h5_path ' + str(h5_path))
+    copied = 0
+    with h5py.File(h5_path, 'r') as h5_file, netCDF4.Dataset(nc_path, 'w') as nc_file:
+        attributes = copy_history({key: value for key, value in h5_file.attrs.items()
+                                   if key not in hdf_dimension_attributes}, history)
+        for key, value in attributes.items():
+            nc_file.setncattr(key, attribute_value(value))
+        groups = [h5_file]
+        h5_file.visititems(lambda name, item: groups.append(item) if isinstance(item, h5py.Group) else None)
+        for h5_group in groups:
+            nc_group = nc_file
+            if h5_group.name != '/':
+                nc_group = nc_file.createGroup(h5_group.name)
+                for key, value in h5_group.attrs.items():
+                    if key not in hdf_dimension_attributes:
+                        nc_group.setncattr(key, attribute_value(value))
+            datasets = [item for item in h5_group.values() if isinstance(item, h5py.Dataset)]
+            for dataset in datasets:
+                if dataset.is_scale:
+                    # resizable datasets, like the ones written from unlimited dimensions, give unlimited dimensions
+                    size = None if dataset.maxshape[0] is None else dataset.shape[0]
+                    nc_group.createDimension(os.path.basename(dataset.name), size)
+            for dataset in datasets:
+                copied += hdf_dataset_to_netcdf(dataset, nc_group, storage)
+    return copied
+
+
+def hdf_dimension_names(dataset, nc_group):
+    # dimensions are the labels of the dimension scales, datasets without scales get a dimension for each size
+    dim_names = []
+    for i, dim in enumerate(dataset.dims):
+        label = dim.label
+        if not label and dataset.is_scale:
+            label = os.path.basename(dataset.name)
+        if not label:
+            label = 'phony_dim_' + str(dataset.shape[i])
+            if label not in nc_group.dimensions:
+                nc_group.createDimension(label, dataset.shape[i])
+        dim_names.append(label)
+    return tuple(dim_names)
+
+
+def netcdf_dimension(nc_group, dim_name):
+    # like in NetCDF, a dimension can be defined in a parent group
+    while nc_group is not None:
+        if dim_name in nc_group.dimensions:
+            return nc_group.dimensions[dim_name]
+        nc_group = nc_group.parent
+    raise KeyError('The following dimension \'' + dim_name + '\' can\'t be found in the NetCDF file')
+
+
+def hdf_dataset_to_netcdf(dataset, nc_group, storage):
+    dtype = dataset.dtype
+    text = is_text(dtype)
+    if text:
+        dtype = str
+    else:
+        # values are written in the byte order of the machine
+        dtype = dtype.newbyteorder('=')
+    dim_names = hdf_dimension_names(dataset, nc_group)
+    options = new_layout(dataset.shape, dtype, storage, hdf_layout(dataset), True)
+    if 'chunksizes' in options:
+        # the chunks of a resizable dataset can be longer than its values, they can't be longer than a fixed
+        # NetCDF dimension
+        options['chunksizes'] = tuple(chunk if netcdf_dimension(nc_group, dim_names[i]).isunlimited()
+                                      else max(1, min(chunk, dataset.shape[i]))
+                                      for i, chunk in enumerate(options['chunksizes']))
+    attributes = {key: value for key, value in dataset.attrs.items() if key not in hdf_dimension_attributes}
+    fill_value = attributes.pop('_FillValue', None)
+    if fill_value is None:
+        fill_value = attributes.get('missing_value')
+    if text:
+        fill_value = None
+    elif fill_value is not None:
+        fill_value = numpy.asarray(fill_value).astype(dtype).item()
+    variable = nc_group.createVariable(os.path.basename(dataset.name), dtype, dim_names, fill_value=fill_value,
+                                       **options)
+    variable.set_auto_maskandscale(False)
+    for key, value in attributes.items():
+        variable.setncattr(key, attribute_value(value))
+
+    def read_block(block):
+        value = dataset[block]
+        if text:
+            return text_values(value)
+        # like egads, NaN are replaced by the fill value in NetCDF files
+        if fill_value is not None and value.dtype.kind == 'f':
+            nan_values = numpy.isnan(value)
+            if nan_values.any():
+                value[nan_values] = fill_value
+        return value
+
+    def write_block(block, value):
+        variable[block] = value
+
+    return copy_blocks(read_block, write_block, dataset.shape, dataset.dtype.itemsize, storage,
+                       variable_chunks(options))
+
+
+def conversion_rate(nbytes, start_time):
+    # throughput of a conversion in MB/s
+    return nbytes / 1e6 / max(time.perf_counter() - start_time, 1e-9)
@@ -0,0 +1,88 @@
+import logging
+import collections
+import egads
+
+
+class DimensionIndex(object):
+    # dimensions of a file and of all its variables, the structure of the file is walked only once instead of once
+    # per variable, keys and sizes are the same than those given by egads
+    def __init__(self, egads_file):
+        logging.debug('gui - dimension_index_functions.py - DimensionIndex - __init__')
+        self.egads_file = egads_file
+        self.file_dimensions = {}
+        self.variables = None
+        self.shapes = {}
+
+    def dimensions(self, details=True):
+        if details not in self.file_dimensions:
+            if isinstance(self.egads_file, egads.input.NasaAmes):
+                dim_list = self.egads_file.get_dimension_list()
+            else:
+                dim_list = self.egads_file.get_dimension_list(group_walk=True, details=details)
+            self.file_dimensions[details] = dim_list
+        return collections.OrderedDict(self.file_dimensions[details])
+
+    def variable_dimensions(self, var_name, details=True):
+        if self.variables is None:
+            self.index_variables()
+        try:
+            dim_list = self.variables[var_name][details]
+        except KeyError:
+            if isinstance(self.egads_file, egads.input.NasaAmes):
+                return self.dimensions()
+            # variables which can't be indexed are left to egads, to get the same result or the same error
+            return self.egads_file.get_dimension_list(str(var_name), details=details)
+        return collections.OrderedDict(dim_list)
+
+    def shape(self, var_name):
+        if self.variables is None:
+            self.index_variables()
+        return self.shapes[var_name]
+
+    def index_variables(self):
+        logging.debug('gui - dimension_index_functions.py - DimensionIndex - index_variables')
+        self.variables = {}
+        if isinstance(self.egads_file, egads.input.NasaAmes):
+            var_list = (self.egads_file.get_variable_list()
+                        + self.egads_file.get_variable_list(vartype='independant'))
+            dim_list = self.egads_file.get_dimension_list()
+            for var_name in var_list:
+                self.variables[var_name] = {True: dim_list, False: dim_list}
+                self.shapes[var_name] = tuple(dim_list.values())
+            return
+        for var_name in self.egads_file.get_variable_list(group_walk=True, details=True):
+            try:
+                variable = self.egads_file.f[var_name]
+                self.shapes[var_name] = variable.shape
+                if isinstance(self.egads_file, egads.input.NetCdf):
+                    dim_lists = self.netcdf_variable_dimensions(variable)
+                else:
+                    dim_lists = self.hdf_variable_dimensions(variable)
+            except Exception:
+                logging.exception('gui - dimension_index_functions.py - DimensionIndex - index_variables : '
+                                  'impossible to index the dimensions of ' + var_name)
+                continue
+            if dim_lists is not None:
+                self.variables[var_name] = dim_lists
+
+    @staticmethod
+    def netcdf_variable_dimensions(variable):
+        # like egads, dimensions are only searched in the group of the variable
+        group = variable.group()
+        group_path = group.path.rstrip('/')
+        dim_list, detail_list = collections.OrderedDict(), collections.OrderedDict()
+        for dim_name in variable.dimensions:
+            if dim_name not in group.dimensions:
+                return None
+            dim_list[dim_name] = len(group.dimensions[dim_name])
+            detail_list[group_path + '/' + dim_name] = len(group.dimensions[dim_name])
+        return {True: detail_list, False: dim_list}
+
+    @staticmethod
+    def hdf_variable_dimensions(variable):
+        parent = variable.parent.name.rstrip('/')
+        dim_list, detail_list = collections.OrderedDict(), collections.OrderedDict()
+        for i, dim in enumerate(variable.dims):
+            dim_list[dim.label] = variable.shape[i]
+            detail_list[parent + '/' + dim.label] = variable.shape[i]
+        return {True: detail_list, False: dim_list}
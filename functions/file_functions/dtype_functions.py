@@ -0,0 +1,52 @@
+import numpy
+import egads
+
+
+read_dtypes = ['native', 'float32', 'float64']
+
+# integer types of NetCDF4 and Hdf files which are not in the type dictionaries of egads
+native_write_types = {'int64': 'i8', 'uint8': 'u1', 'uint16': 'u2', 'uint32': 'u4', 'uint64': 'u8'}
+native_write_formats = {name: name for name in native_write_types}
+
+
+def read_dtype(config_dict):
+    dtype = config_dict['SYSTEM'].get('read_dtype', 'native')
+    if dtype not in read_dtypes:
+        return 'native'
+    return dtype
+
+
+def target_dtype(dtype, read_policy):
+    # with float32, integers are promoted to float32 and floats are kept as they are, with float64 all numbers are
+    # converted to float64 like egads does with read_as_float
+    dtype = numpy.dtype(dtype)
+    if read_policy == 'native' or dtype.kind not in 'biuf':
+        return dtype
+    if read_policy == 'float32' and dtype.kind == 'f' and dtype.itemsize >= 4:
+        return dtype
+    return numpy.dtype(read_policy)
+
+
+def convert_value(value, read_policy):
+    if isinstance(value, list) and read_policy != 'native':
+        value = numpy.asarray(value)
+    if not isinstance(value, numpy.ndarray):
+        return value
+    return value.astype(target_dtype(value.dtype, read_policy), copy=False)
+
+
+def convert_egads_data(egads_instance, read_policy):
+    if not isinstance(egads_instance, egads.EgadsData):
+        return convert_value(egads_instance, read_policy)
+    dtype = target_dtype(egads_instance.dtype, read_policy)
+    if dtype == egads_instance.dtype:
+        return egads_instance
+    new_instance = egads.EgadsData(egads_instance.value.astype(dtype), variable_metadata=egads_instance.metadata)
+    if hasattr(egads_instance, 'compound_data'):
+        new_instance.compound_data = egads_instance.compound_data
+    return new_instance
+
+
+def add_write_types(egads_file):
+    # the dictionary is only extended for the opened file, egads itself isn't modified
+    egads_file.TYPE_DICT = dict(egads_file.TYPE_DICT, **native_write_types)
@@ -0,0 +1,58 @@
+import logging
+import numpy
+import egads
+from functions.file_functions.dtype_functions import convert_egads_data
+
+
+def variable_fill_value(metadata_dict, file_ext):
+    # same attributes and same order than egads
+    fill_attributes = ['_FillValue', 'missing_value']
+    if file_ext == 'Hdf Files (*.h5 *.hdf5 *.he5)':
+        fill_attributes.append('fill_value')
+    for attr in fill_attributes:
+        if attr in metadata_dict.keys():
+            return metadata_dict[attr]
+    return None
+
+
+def replace_fill_values(value, fill_value, switch_fill_value):
+    # fill values are replaced in place by NaN in float arrays, integer arrays can't hold NaN, their fill values are
+    # kept as they are if the user allows it, an error is raised only if a fill value is really found in the data
+    if fill_value is None or value.dtype.kind not in 'biufc':
+        return value
+    try:
+        mask = numpy.asarray(value == fill_value)
+    except (TypeError, ValueError):
+        return value
+    if mask.shape != value.shape or not mask.any():
+        return value
+    if value.dtype.kind in 'fc':
+        value[mask] = numpy.nan
+    elif not switch_fill_value:
+        raise ValueError('cannot convert float NaN to integer')
+    return value
+
+
+def read_egads_variable(egads_file, var_name, file_ext, read_policy, replace_fill_value, switch_fill_value,
+                        input_range=None):
+    # the variable is decoded once by egads, in its type in the file, it is converted to the type asked by the user
+    # and fill values are replaced afterward in memory, a variable of integers doesn't have to be read a second time
+    # if its fill values can't be replaced
+    logging.debug('gui - fill_value_functions.py - read_egads_variable - var_name ' + var_name)
+    if file_ext == 'NASA Ames Files (*.na)':
+        egads_instance = egads_file.read_variable(var_name, read_as_float=False, replace_fill_value=False)
+    else:
+        egads_instance = egads_file.read_variable(var_name, input_range=input_range, read_as_float=False,
+                                                  replace_fill_value=False)
+    egads_instance = convert_egads_data(egads_instance, read_policy)
+    if replace_fill_value:
+        if isinstance(egads_instance, egads.EgadsData):
+            value, fill_value = egads_instance.value, variable_fill_value(egads_instance.metadata, file_ext)
+        else:
+            # egads.input.NasaAmes returns the values alone, the independent variable has no fill value
+            value, fill_value = egads_instance, None
+            if var_name in egads_file.get_variable_list():
+                fill_value = egads_file.get_attribute_value('_FillValue', var_name)
+        if isinstance(value, numpy.ndarray):
+            replace_fill_values(value, fill_value, switch_fill_value)
+    return egads_instance
@@ -0,0 +1,68 @@
+import logging
+import os
+import pathlib
+import pickle
+import hashlib
+
+
+HEADER_CACHE_FOLDER = 'header_cache'
+HEADER_CACHE_SIZE = 20
+HEADER_CACHE_VERSION = 1
+
+
+def header_cache_key(file_path):
+    # a cached header is only valid for the same file, with the same size and the same modification time
+    file_stat = os.stat(file_path)
+    return os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size
+
+
+def header_cache_path(user_path, file_path):
+    file_hash = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+    return pathlib.Path(user_path).joinpath(HEADER_CACHE_FOLDER, file_hash + '.pickle')
+
+
+def read_header_cache(user_path, file_path):
+    logging.debug('gui - header_cache_functions.py - read_header_cache - file_path ' + file_path)
+    cache_path = header_cache_path(user_path, file_path)
+    if not cache_path.is_file():
+        return None
+    try:
+        with open(str(cache_path), 'rb') as cache_file:
+            version, key, header = pickle.load(cache_file)
+    except Exception:
+        logging.exception('gui - header_cache_functions.py - read_header_cache : the cache file of ' + file_path
+                          + ' can\'t be read, it will be removed')
+        cache_path.unlink()
+        return None
+    if version != HEADER_CACHE_VERSION or key != header_cache_key(file_path):
+        logging.debug('gui - header_cache_functions.py - read_header_cache - file_path ' + file_path
+                      + ' -> outdated header')
+        return None
+    # the access time is used to remove the oldest headers
+    os.utime(str(cache_path))
+    logging.debug('gui - header_cache_functions.py - read_header_cache - file_path ' + file_path + ' -> header '
+                  'read OK')
+    return header
+
+
+def write_header_cache(user_path, file_path, header):
+    logging.debug('gui - header_cache_functions.py - write_header_cache - file_path ' + file_path)
+    cache_path = header_cache_path(user_path, file_path)
+    if not cache_path.parent.is_dir():
+        cache_path.parent.mkdir(parents=True)
+    temp_path = cache_path.with_suffix('.tmp')
+    with open(str(temp_path), 'wb') as cache_file:
+        pickle.dump((HEADER_CACHE_VERSION, header_cache_key(file_path), header), cache_file,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(str(temp_path), str(cache_path))
+    cache_list = sorted(cache_path.parent.glob('*.pickle'), key=lambda item: item.stat().st_mtime, reverse=True)
+    for old_path in cache_list[HEADER_CACHE_SIZE:]:
+        old_path.unlink()
+
+
+def clear_header_cache(user_path):
+    logging.debug('gui - header_cache_functions.py - clear_header_cache')
+    cache_folder = pathlib.Path(user_path).joinpath(HEADER_CACHE_FOLDER)
+    if cache_folder.is_dir():
+        for cache_path in cache_folder.iterdir():
+            cache_path.unlink()
@@ -0,0 +1,348 @@
+import logging
+import os
+import threading
+import numpy
+import h5py
+import egads
+from egads.core.metadata import VariableMetadata
+from functions.file_functions.memory_mapping_functions import (read_netcdf3_layout, hdf5_dataset_layout, memory_map,
+                                                               is_mapped)
+from functions.file_functions.chunk_reading_functions import deflate_dataset_filters, read_deflate_dataset
+from functions.file_functions.subset_functions import subset_input_range, subset_shape
+from functions.file_functions.fill_value_functions import variable_fill_value, replace_fill_values
+from functions.file_functions.dimension_index_functions import DimensionIndex
+from functions.file_functions.dtype_functions import read_dtype, target_dtype, convert_egads_data
+
+
+def is_variable(egads_object):
+    return isinstance(egads_object, (egads.EgadsData, LazyEgadsData))
+
+
+def load_egads_data(egads_object):
+    if isinstance(egads_object, LazyEgadsData):
+        return egads_object.load()
+    return egads_object
+
+
+def variable_template(metadata_dict, file_metadata, dtype):
+    # an empty EgadsData is built to get the same units and metadata handling than a full read
+    variable_metadata = VariableMetadata(metadata_dict, file_metadata)
+    return egads.EgadsData(numpy.empty(0, dtype=dtype), variable_metadata=variable_metadata)
+
+
+class LazyFileSource(object):
+    def __init__(self, egads_file, file_path, file_ext, config_dict, subset=None):
+        logging.debug('gui - lazy_loading_functions.py - LazyFileSource - __init__ - file_path ' + file_path)
+        self.egads_file = egads_file
+        self.file_path = file_path
+        self.file_paths = [file_path]
+        self.file_ext = file_ext
+        self.read_dtype = read_dtype(config_dict)
+        self.replace_fill_value = config_dict['SYSTEM'].getboolean('replace_fill_value')
+        self.switch_fill_value = config_dict['SYSTEM'].getboolean('switch_fill_value')
+        self.lazy_loading = config_dict['SYSTEM'].getboolean('lazy_loading')
+        self.memory_mapping = config_dict['SYSTEM'].getboolean('memory_mapping')
+        self.reading_threads = config_dict['SYSTEM'].getint('reading_threads')
+        self.subset = subset
+        self.variables = []
+        self.dimensions = {}
+        self.dimension_index = None
+        self.closed = False
+        self.lock = threading.Lock()
+        self.h5_file = None
+        self.netcdf3_layout = None
+
+    def read_attributes(self, var_name):
+        metadata_dict = self.egads_file.get_attribute_list(var_name)
+        if self.file_ext == 'Hdf Files (*.h5 *.hdf5 *.he5)':
+            for attr in ['DIMENSION_LABELS', 'NAME', 'CLASS', 'REFERENCE_LIST', 'DIMENSION_LIST']:
+                if attr in metadata_dict.keys():
+                    del metadata_dict[attr]
+        return metadata_dict
+
+    def read_header(self, var_name):
+        dataset = self.egads_file.f[var_name]
+        return {'metadata': self.read_attributes(var_name), 'dtype': dataset.dtype, 'shape': dataset.shape}
+
+    def read_metadata(self, var_name, header=None):
+        logging.debug('gui - lazy_loading_functions.py - LazyFileSource - read_metadata - var_name ' + var_name)
+        if header is None:
+            header = self.read_header(var_name)
+        dtype = target_dtype(header['dtype'], self.read_dtype)
+        shape = header['shape']
+        if self.subset is not None:
+            shape = subset_shape(shape, subset_input_range(shape, self.read_dimensions(var_name), self.subset))
+        template = variable_template(header['metadata'], self.egads_file.file_metadata, dtype)
+        variable = LazyEgadsData(self, var_name, template, shape)
+        self.variables.append(variable)
+        return variable
+
+    def read_dimensions(self, var_name):
+        with self.lock:
+            if var_name not in self.dimensions:
+                if self.dimension_index is None:
+                    self.dimension_index = DimensionIndex(self.egads_file)
+                self.dimensions[var_name] = self.dimension_index.variable_dimensions(var_name)
+            return self.dimensions[var_name]
+
+    def variable_range(self, var_name):
+        # input_range of the variable if only a subset of the file has to be read
+        if self.subset is None or self.closed:
+            return None
+        dim_list = self.read_dimensions(var_name)
+        with self.lock:
+            shape = self.egads_file.f[var_name].shape
+        return subset_input_range(shape, dim_list, self.subset)
+
+    def read_variable(self, var_name, input_range=None):
+        logging.debug('gui - lazy_loading_functions.py - LazyFileSource - read_variable - var_name ' + var_name)
+        if input_range is None:
+            input_range = self.variable_range(var_name)
+        with self.lock:
+            if self.closed:
+                raise IOError('the file ' + self.file_path + ' has been closed, variable ' + var_name
+                              + ' can\'t be read')
+            egads_instance = None
+            filters = None
+            if self.memory_mapping:
+                egads_instance = self.map_variable(var_name, input_range)
+            if egads_instance is None and self.reading_threads > 1 and input_range is None:
+                filters = self.variable_filters(var_name)
+        if egads_instance is None and filters is not None:
+            egads_instance = self.decode_variable(var_name, filters)
+        if egads_instance is None:
+            with self.lock:
+                egads_instance = self.egads_file.read_variable(var_name, input_range=input_range,
+                                                               read_as_float=False, replace_fill_value=False)
+            egads_instance = convert_egads_data(egads_instance, self.read_dtype)
+            if self.replace_fill_value:
+                self.replace_variable_fill_values(var_name, egads_instance.value, egads_instance.metadata)
+        return egads_instance
+
+    def replace_variable_fill_values(self, var_name, value, metadata_dict):
+        # the fill values of an integer variable can't be replaced by NaN, like when a file is read at once the
+        # variable can't be read, the error is raised the first time the variable is used
+        try:
+            replace_fill_values(value, variable_fill_value(metadata_dict, self.file_ext), self.switch_fill_value)
+        except ValueError as e:
+            if 'cannot convert float NaN to integer' in str(e):
+                raise ValueError('the variable ' + var_name + ' can\'t be read, integer can\'t be converted to NaN in '
+                                 'INT-type variable (' + str(e) + ')')
+            raise
+
+    def read_rows(self, var_name, start, stop):
+        input_range = self.variable_range(var_name)
+        if input_range is None:
+            with self.lock:
+                input_range = [bound for size in self.egads_file.f[var_name].shape for bound in (0, size)]
+        input_range = list(input_range)
+        input_range[0:2] = [input_range[0] + start, input_range[0] + stop]
+        return self.read_variable(var_name, input_range)
+
+    def h5_dataset(self, var_name):
+        # NetCDF4 files are Hdf files, their variables can be reached with h5py, NetCDF3 files can't
+        if self.file_ext == 'Hdf Files (*.h5 *.hdf5 *.he5)':
+            return self.egads_file.f[var_name]
+        if self.egads_file.f.data_model.startswith('NETCDF3'):
+            return None
+        if self.h5_file is None:
+            self.h5_file = h5py.File(self.file_path, 'r')
+        return self.h5_file[var_name]
+
+    def variable_layout(self, var_name):
+        if self.file_ext == 'NetCDF Files (*.nc *.cdf)' and self.egads_file.f.data_model.startswith('NETCDF3'):
+            if self.netcdf3_layout is None:
+                self.netcdf3_layout = read_netcdf3_layout(self.file_path)
+            return self.netcdf3_layout.get(var_name)
+        return hdf5_dataset_layout(self.h5_dataset(var_name))
+
+    def raw_values_allowed(self, metadata_dict):
+        # values read outside of the netCDF4 library are not scaled or converted
+        if self.file_ext == 'NetCDF Files (*.nc *.cdf)':
+            for attr in ['scale_factor', 'add_offset', '_Unsigned']:
+                if attr in metadata_dict.keys():
+                    return False
+        return True
+
+    def map_variable(self, var_name, input_range=None):
+        # values of uncompressed and contiguous variables are paged in from the file by the system
+        metadata_dict = self.read_attributes(var_name)
+        if not self.raw_values_allowed(metadata_dict):
+            return None
+        try:
+            value = memory_map(self.file_path, self.variable_layout(var_name))
+        except Exception:
+            logging.exception('gui - lazy_loading_functions.py - LazyFileSource - map_variable : impossible to '
+                              'map the variable ' + var_name + ', it will be read')
+            return None
+        if value is None:
+            return None
+        if input_range is not None:
+            value = value[tuple(slice(input_range[i], input_range[i + 1]) for i in range(0, len(input_range), 2))]
+        # a mapped variable is kept only if it doesn't have to be converted, a conversion would copy it
+        if target_dtype(value.dtype, self.read_dtype) != value.dtype:
+            return None
+        logging.debug('gui - lazy_loading_functions.py - LazyFileSource - map_variable - var_name ' + var_name
+                      + ' -> data mapped OK')
+        return self.create_egads_data(var_name, value, metadata_dict)
+
+    def variable_filters(self, var_name):
+        try:
+            if not self.raw_values_allowed(self.read_attributes(var_name)):
+                return None
+            dataset = self.h5_dataset(var_name)
+            if dataset is None:
+                return None
+            return deflate_dataset_filters(dataset)
+        except Exception:
+            logging.exception('gui - lazy_loading_functions.py - LazyFileSource - variable_filters : impossible to '
+                              'get the filters of the variable ' + var_name)
+            return None
+
+    def decode_variable(self, var_name, filters):
+        with self.lock:
+            metadata_dict = self.read_attributes(var_name)
+            dataset = self.h5_dataset(var_name)
+        value = read_deflate_dataset(dataset, filters, self.lock)
+        logging.debug('gui - lazy_loading_functions.py - LazyFileSource - decode_variable - var_name ' + var_name
+                      + ' -> data decoded OK')
+        return self.create_egads_data(var_name, value, metadata_dict)
+
+    def create_egads_data(self, var_name, value, metadata_dict):
+        value = value.astype(target_dtype(value.dtype, self.read_dtype), copy=False)
+        if self.replace_fill_value:
+            self.replace_variable_fill_values(var_name, value, metadata_dict)
+        egads_instance = egads.EgadsData(value, variable_metadata=VariableMetadata(metadata_dict,
+                                                                                   self.egads_file.file_metadata))
+        if self.file_ext == 'Hdf Files (*.h5 *.hdf5 *.he5)':
+            egads_instance.compound_data = False
+        return egads_instance
+
+    def release(self):
+        logging.debug('gui - lazy_loading_functions.py - LazyFileSource - release')
+        for variable in self.variables:
+            variable.load()
+        self.close()
+
+    def reopen(self):
+        # after an update of the file in place, variables not read yet are read from the updated file, the values of
+        # existing variables don't move in the file and mapped variables stay valid
+        logging.debug('gui - lazy_loading_functions.py - LazyFileSource - reopen')
+        with self.lock:
+            if self.closed:
+                self.egads_file = self.egads_file.__class__(self.file_path, 'r')
+                self.dimension_index = None
+                self.h5_file = None
+                self.netcdf3_layout = None
+                self.closed = False
+
+    def close(self):
+        logging.debug('gui - lazy_loading_functions.py - LazyFileSource - close')
+        with self.lock:
+            if not self.closed:
+                self.egads_file.close()
+                if self.h5_file is not None:
+                    self.h5_file.close()
+                self.closed = True
+
+
+class LazyEgadsData(object):
+    def __init__(self, source, var_name, template, shape):
+        self.source = source
+        self.var_name = var_name
+        self.metadata = template.metadata
+        self.units = template.units
+        self.dtype = template.dtype
+        self.shape = tuple(shape)
+        self.ndim = len(self.shape)
+        self.size = int(numpy.prod(self.shape))
+        self.data = None
+
+    @property
+    def loaded(self):
+        return self.data is not None
+
+    @property
+    def value(self):
+        return self.load().value
+
+    def load(self):
+        if self.data is None:
+            logging.debug('gui - lazy_loading_functions.py - LazyEgadsData - load - var_name ' + self.var_name)
+            data = self.source.read_variable(self.var_name)
+            # metadata could have been modified by the user before the first access
+            data.metadata = self.metadata
+            self.data = data
+        return self.data
+
+    def read(self):
+        # values read for a single use, the variable stays unloaded and the memory is freed after the use
+        if self.data is not None:
+            return self.data
+        data = self.source.read_variable(self.var_name)
+        data.metadata = self.metadata
+        return data
+
+    def read_rows(self, start, stop):
+        # values between start and stop along the first dimension, read without loading the variable
+        if self.data is not None:
+            return self.data.value[start:stop]
+        return self.source.read_rows(self.var_name, start, stop).value
+
+    def copy(self):
+        return self.load().copy()
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, item):
+        return self.load()[item]
+
+    def __getattr__(self, name):
+        # only the attributes of EgadsData, which need the values, read the variable
+        if name.startswith('__') or name == 'data':
+            raise AttributeError(name)
+        if self.data is None and not hasattr(egads.EgadsData, name):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+
+def raw_file_source(egads_file, file_path, config_dict):
+    # source used to copy the variables of a file in batch processing, values are read as they are stored
+    file_ext = 'Hdf Files (*.h5 *.hdf5 *.he5)'
+    if isinstance(egads_file, egads.input.NetCdf):
+        file_ext = 'NetCDF Files (*.nc *.cdf)'
+    source = LazyFileSource(egads_file, str(file_path), file_ext, config_dict)
+    source.read_dtype = 'native'
+    source.replace_fill_value = False
+    source.reading_threads = 1
+    return source
+
+
+def file_sources(var_dict, file_name):
+    # sources still reading variables from the file
+    sources = []
+    for sublist in var_dict.values():
+        if isinstance(sublist[0], LazyEgadsData) and sublist[0].source not in sources:
+            sources.append(sublist[0].source)
+    return [source for source in sources if not source.closed and
+            os.path.abspath(file_name) in [os.path.abspath(path) for path in source.file_paths]]
+
+
+def release_lazy_sources(var_dict, file_name):
+    # a file can't be overwritten while its variables are still read or mapped from it
+    for source in file_sources(var_dict, file_name):
+        source.release()
+    for sublist in var_dict.values():
+        if isinstance(sublist[0], LazyEgadsData):
+            if sublist[0].loaded and is_mapped(sublist[0].data.value, file_name):
+                sublist[0].data = detach_egads_data(sublist[0].data)
+        elif isinstance(sublist[0], egads.EgadsData):
+            if is_mapped(sublist[0].value, file_name):
+                sublist[0] = detach_egads_data(sublist[0])
+
+
+def detach_egads_data(egads_data):
+    data_copy = egads_data.copy()
+    data_copy.metadata = egads_data.metadata
+    return data_copy
@@ -0,0 +1,106 @@
+import logging
+import os
+import json
+import hashlib
+from functions.file_functions.dtype_functions import read_dtype
+from functions.file_functions.storage_functions import read_storage_preset, read_chunk_length
+
+
+MANIFEST_NAME = 'egads_batch_manifest_{}.jsonl'
+MANIFEST_VERSION = 1
+
+
+def algorithm_name(algorithm):
+    if algorithm is None:
+        return None
+    return algorithm.__module__ + '.' + algorithm.__name__
+
+
+def batch_job(batch_dict, config_dict):
+    # options which define the files written by a batch job, a manifest written by another job isn't used, the
+    # options of the gui changing the values read or their storage are part of the job
+    storage = batch_dict.get('storage')
+    if storage is None:
+        storage = read_storage_preset(config_dict)
+    job = {'version': MANIFEST_VERSION, 'process': batch_dict['process'],
+           'algorithm': algorithm_name(batch_dict.get('algorithm')),
+           'processing_options': batch_dict['processing_options'], 'out_format': batch_dict['out_format'],
+           'filename_options': batch_dict['filename_options'], 'storage': storage,
+           'chunk_length': read_chunk_length(config_dict), 'read_dtype': read_dtype(config_dict),
+           'replace_fill_value': config_dict['SYSTEM'].getboolean('replace_fill_value', False),
+           'switch_fill_value': config_dict['SYSTEM'].getboolean('switch_fill_value', False)}
+    if batch_dict.get('steps'):
+        job['steps'] = [{'algorithm': algorithm_name(step['algorithm']), 'inputs': step['inputs'],
+                         'outputs': step['outputs']} for step in batch_dict['steps']]
+        job['drop_intermediate'] = bool(batch_dict.get('drop_intermediate'))
+    return json.loads(json.dumps(job, default=str))
+
+
+def file_record(file_path, status, output_path, duration, error=None):
+    size, mtime = None, None
+    if os.path.isfile(file_path):
+        file_stat = os.stat(file_path)
+        size, mtime = file_stat.st_size, file_stat.st_mtime_ns
+    return {'path': os.path.abspath(file_path), 'size': size, 'mtime': mtime, 'status': status,
+            'output': output_path, 'duration': duration, 'error': error}
+
+
+class BatchManifest(object):
+    # record of the files of a batch job in its destination folder, one line of json is appended each time a file is
+    # finished, a job launched again after a crash skips the files already done and tries again the other ones, each
+    # job has its own manifest named after the hash of its options, jobs writing in the same folder don't replace the
+    # manifest of each other
+    def __init__(self, folder, job):
+        logging.debug('gui - manifest_functions.py - BatchManifest - __init__ - folder ' + str(folder))
+        job_hash = hashlib.sha1(json.dumps(job, sort_keys=True).encode('utf-8')).hexdigest()
+        self.path = os.path.join(folder, MANIFEST_NAME.format(job_hash))
+        self.job = job
+        self.records = self.read_records()
+        # the manifest is written again with the last record of each file, then lines are appended
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as manifest_file:
+            manifest_file.write(json.dumps({'job': self.job}) + '\n')
+            for record in self.records.values():
+                manifest_file.write(json.dumps(record) + '\n')
+        os.replace(temp_path, self.path)
+        self.manifest_file = open(self.path, 'a', encoding='utf-8')
+
+    def read_records(self):
+        records = {}
+        if not os.path.isfile(self.path):
+            return records
+        with open(self.path, 'r', encoding='utf-8') as manifest_file:
+            lines = manifest_file.readlines()
+        try:
+            if json.loads(lines[0]).get('job') != self.job:
+                logging.info('gui - manifest_functions.py - BatchManifest - read_records - manifest of another '
+                             'job, it will be replaced')
+                return records
+        except (IndexError, ValueError):
+            return records
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # last line cut by a crash
+                continue
+            records[record['path']] = record
+        return records
+
+    def completed(self, file_path):
+        # a file is done if it hasn't been modified since and its new file still exists
+        record = self.records.get(os.path.abspath(file_path))
+        if record is None or record['status'] != 'done' or not os.path.isfile(record['output']):
+            return False
+        new_record = file_record(file_path, None, None, None)
+        return new_record['size'] == record['size'] and new_record['mtime'] == record['mtime']
+
+    def add(self, file_path, status, output_path, duration, error=None):
+        record = file_record(file_path, status, output_path, duration, error)
+        self.records[record['path']] = record
+        self.manifest_file.write(json.dumps(record) + '\n')
+        self.manifest_file.flush()
+        os.fsync(self.manifest_file.fileno())
+
+    def close(self):
+        self.manifest_file.close()
@@ -0,0 +1,89 @@
+import logging
+import os
+import struct
+import numpy
+
+
+NC3_TYPES = {1: 'i1', 2: 'S1', 3: 'i2', 4: 'i4', 5: 'f4', 6: 'f8', 7: 'u1', 8: 'u2', 9: 'u4', 10: 'i8', 11: 'u8'}
+
+
+def read_netcdf3_layout(file_path):
+    # parses the header of a NetCDF3 file (classic, 64-bit offset or 64-bit data format) to get the type, the
+    # shape and the position in the file of each fixed size variable, record variables are interleaved and ignored
+    logging.debug('gui - memory_mapping_functions.py - read_netcdf3_layout - file_path ' + file_path)
+    layout = {}
+    with open(file_path, 'rb') as nc_file:
+        magic = nc_file.read(4)
+        if magic[:3] != b'CDF' or magic[3] not in (1, 2, 5):
+            return layout
+        size_format = '>q' if magic[3] == 5 else '>i'
+        offset_format = '>i' if magic[3] == 1 else '>q'
+
+        def read_value(value_format):
+            return struct.unpack(value_format, nc_file.read(struct.calcsize(value_format)))[0]
+
+        def read_name():
+            length = read_value(size_format)
+            name = nc_file.read(length).decode('utf-8')
+            nc_file.seek(-length % 4, 1)
+            return name
+
+        def skip_attributes():
+            read_value('>i')
+            for _ in range(read_value(size_format)):
+                read_name()
+                nc_type = read_value('>i')
+                length = read_value(size_format) * numpy.dtype(NC3_TYPES[nc_type]).itemsize
+                nc_file.seek(length + (-length % 4), 1)
+
+        read_value(size_format)
+        dimensions = []
+        read_value('>i')
+        for _ in range(read_value(size_format)):
+            read_name()
+            dimensions.append(read_value(size_format))
+        skip_attributes()
+        read_value('>i')
+        for _ in range(read_value(size_format)):
+            name = read_name()
+            dim_ids = [read_value(size_format) for _ in range(read_value(size_format))]
+            skip_attributes()
+            nc_type = read_value('>i')
+            read_value(size_format)
+            begin = read_value(offset_format)
+            shape = tuple(dimensions[dim_id] for dim_id in dim_ids)
+            if shape and shape[0] == 0:
+                continue
+            layout['/' + name] = (numpy.dtype('>' + NC3_TYPES[nc_type]), shape, begin)
+    return layout
+
+
+def hdf5_dataset_layout(dataset):
+    # only uncompressed and contiguous datasets are stored as a single block of bytes in the file
+    if dataset.chunks is not None or dataset.compression is not None:
+        return None
+    if dataset.id.get_create_plist().get_nfilters():
+        return None
+    offset = dataset.id.get_offset()
+    if offset is None:
+        return None
+    return dataset.dtype, dataset.shape, offset
+
+
+def memory_map(file_path, layout):
+    if layout is None:
+        return None
+    dtype, shape, offset = layout
+    if dtype.kind not in 'biuf' or not shape or 0 in shape:
+        return None
+    # copy-on-write, values can be modified in memory without touching the file
+    return numpy.memmap(file_path, dtype=dtype, mode='c', offset=offset, shape=shape)
+
+
+def is_mapped(value, file_path=None):
+    base = value
+    while base is not None:
+        if isinstance(base, numpy.memmap):
+            return file_path is None or base.filename == os.path.abspath(file_path)
+        base = getattr(base, 'base', None)
+    return False
@@ -0,0 +1,236 @@
+import logging
+import os
+import warnings
+import numpy
+import egads
+
+
+SEPARATOR_BYTES = b' \t\r\n'
+INTEGER_BYTES = b'0123456789+-'
+
+# number of lines formatted at once by the writer of the data block
+WRITING_BLOCK_LENGTH = 65536
+
+def byte_table(byte_list):
+    table = numpy.zeros(256, dtype=bool)
+    table[numpy.frombuffer(byte_list, dtype=numpy.uint8)] = True
+    return table
+
+
+def read_ffi1001_data(file_path, na_dict, delimiter):
+    # the data block of a FFI 1001 file is a table of NV + 1 columns, it starts after the NLHEAD lines of the
+    # header and is parsed in one call, returns None if the block can't be parsed that way
+    logging.debug('gui - nasa_ames_functions.py - read_ffi1001_data - file_path ' + file_path)
+    if int(na_dict['FFI']) != 1001:
+        return None
+    column_nbr = int(na_dict['NV']) + 1
+    with open(file_path, 'rb') as na_file:
+        text = na_file.read()
+    position = 0
+    for _ in range(int(na_dict['NLHEAD'])):
+        position = text.find(b'\n', position) + 1
+        if position == 0:
+            return None
+    text = text[position:]
+    if delimiter is not None and delimiter.strip():
+        text = text.replace(delimiter.strip().encode('utf-8'), b' ')
+    if not text.strip():
+        return None
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        try:
+            values = numpy.fromstring(text, sep=' ')
+        except (ValueError, DeprecationWarning):
+            return None
+    characters = numpy.frombuffer(text, dtype=numpy.uint8)
+    is_separator = byte_table(SEPARATOR_BYTES)[characters]
+    token_start = ~is_separator
+    token_start[1:] &= is_separator[:-1]
+    token_positions = numpy.flatnonzero(token_start)
+    if token_positions.size != values.size or token_positions.size % column_nbr:
+        return None
+    line_index = numpy.searchsorted(numpy.flatnonzero(characters == ord('\n')), token_positions)
+    tokens_per_line = numpy.bincount(line_index)
+    if numpy.any(tokens_per_line[tokens_per_line > 0] != column_nbr):
+        return None
+    # like numpy.genfromtxt, a column is read as integers if none of its values has a decimal point, an exponent
+    # or anything else than digits and signs
+    float_positions = numpy.flatnonzero(~is_separator & ~byte_table(INTEGER_BYTES)[characters])
+    token_index = numpy.searchsorted(token_positions, float_positions, side='right') - 1
+    float_columns = numpy.bincount(token_index % column_nbr, minlength=column_nbr) > 0
+    values = values.reshape(-1, column_nbr)
+    columns = []
+    for i in range(column_nbr):
+        column = values[:, i]
+        if not float_columns[i]:
+            if column.size and numpy.abs(column).max() > 2 ** 53:
+                return None
+            column = column.astype(numpy.int64)
+        columns.append(column)
+    x = columns[0].tolist()
+    v = []
+    for i in range(column_nbr - 1):
+        # VMISS is compared to the values as written in the file, missing values aren't scaled and stay equal to
+        # VMISS, the _FillValue of the variable
+        column = columns[i + 1]
+        scale = float(na_dict['VSCAL'][i])
+        if scale != 1:
+            column = numpy.where(column == float(na_dict['VMISS'][i]), column, column * scale)
+        v.append(column.tolist())
+    logging.debug('gui - nasa_ames_functions.py - read_ffi1001_data - file_path ' + file_path + ' -> '
+                  + str(len(x)) + ' lines read OK')
+    return x, v
+
+
+class NasaAmesReader(egads.input.NasaAmes):
+    def _get_variables(self, filename):
+        return read_nasa_ames_variables(self, filename)
+
+
+class EgadsNasaAmesReader(egads.input.EgadsNasaAmes):
+    def _get_variables(self, filename):
+        return read_nasa_ames_variables(self, filename)
+
+
+def read_nasa_ames_variables(na_file, filename):
+    # the delimiter found by egads in the first line of the header is a private attribute of egads.input.NasaAmes
+    try:
+        data = read_ffi1001_data(filename, na_file.na_dict, getattr(na_file, '_NasaAmes__delimiter', None))
+    except Exception:
+        logging.exception('gui - nasa_ames_functions.py - read_nasa_ames_variables : impossible to parse the data '
+                          'block of ' + filename + ' in one call, it will be read by egads')
+        data = None
+    if data is None:
+        x, v = egads.input.NasaAmes._get_variables(na_file, filename)
+        # egads scales the missing values too
+        for i, values in enumerate(v):
+            miss, scale = na_file.na_dict['VMISS'][i], na_file.na_dict['VSCAL'][i]
+            if float(scale) != 1:
+                v[i] = [miss if value == miss * scale else value for value in values]
+        data = x, v
+    return data
+
+
+def write_na_variable(na_file, data, vartype='main', varname=None, na_dict=None):
+    # egads keeps the values of a variable as a list of python floats, the values of float32 variables are put back
+    # in a float32 array to be written in their precision by save_ffi1001_file
+    if na_dict is None:
+        na_dict = na_file.na_dict
+    if vartype == 'main':
+        var_list = na_file.get_variable_list(na_dict=na_dict)
+        index = var_list.index(varname) if varname in var_list else len(var_list)
+    na_file.write_variable(data, varname=varname, vartype=vartype, na_dict=na_dict)
+    if numpy.asarray(data.value).dtype == numpy.float32:
+        if vartype == 'main':
+            na_dict['V'][index] = numpy.asarray(na_dict['V'][index], dtype=numpy.float32)
+        else:
+            na_dict['X'] = numpy.asarray(na_dict['X'], dtype=numpy.float32)
+
+
+def written_column(values, scale=1, miss=None):
+    # values as written in the file: divided by VSCAL, NaN and missing values replaced by VMISS, float32 values are
+    # kept in float32 to be written in their precision
+    values = numpy.asarray(values)
+    if values.dtype.kind == 'b':
+        values = values.astype(numpy.int64)
+    elif values.dtype.kind not in 'iuf' or values.dtype == numpy.float16:
+        values = values.astype(numpy.float64)
+    missing = numpy.zeros(values.shape, dtype=bool)
+    if miss is not None:
+        missing = values == miss
+    if values.dtype.kind == 'f':
+        missing |= numpy.isnan(values)
+    if float(scale) != 1:
+        values = (values / float(scale)).astype(values.dtype if values.dtype.kind == 'f' else numpy.float64)
+    if miss is not None and missing.any():
+        values = numpy.where(missing, numpy.asarray(miss).astype(values.dtype), values)
+    return values
+
+
+class WrittenColumn(object):
+    # a column of the data block, values are written without padding to be read with the delimiter only, integers as
+    # they are, floats like python writes them, with the fewest digits giving them back exactly, or with float_format
+    # like egads
+    def __init__(self, values, float_format=None, scale=1, miss=None):
+        self.values = written_column(values, scale, miss)
+        self.text = None
+        if self.values.dtype.kind in 'iu':
+            if self.values.size and self.values.max() >= 2 ** 63:
+                self.text = [str(value) for value in self.values.tolist()]
+                self.width = max(len(item) for item in self.text)
+            elif self.values.size:
+                self.width = max(len(str(int(value))) for value in [self.values.min(), self.values.max()])
+            else:
+                self.width = 1
+        elif float_format is not None:
+            self.text = [float_format % value for value in self.values.tolist()]
+            self.width = max([len(item) for item in self.text] + [1])
+        else:
+            # the shortest representation of a float64 has 17 digits, a sign, a decimal point and an exponent of
+            # three digits at most, numpy writes it like python
+            self.width = 24
+
+    def write(self, rows, start, stop):
+        # characters of the lines start to stop in rows, a view of the data block transposed to have each character
+        # position contiguous, of shape (width, lines), unused characters are left to zero and removed before writing
+        values = self.values[start:stop]
+        rows[:] = 0
+        if self.text is not None:
+            text = numpy.array(self.text[start:stop], dtype='S' + str(self.width))
+        elif values.dtype.kind == 'f':
+            text = values.astype('S' + str(self.width))
+        else:
+            self.write_integers(rows, values)
+            return
+        rows[:] = text.view(numpy.uint8).reshape(-1, self.width).T
+
+    def write_integers(self, rows, values):
+        # digits from the last one, the sign is written before the first one
+        position = self.width - 1
+        digits = numpy.abs(values.astype(numpy.int64))
+        digits, rows[position] = numpy.divmod(digits, 10)
+        rows[position] += ord('0')
+        int_digits = numpy.ones(len(values), dtype=numpy.int64)
+        for i in range(1, position + 1):
+            used = digits > 0
+            if not used.any():
+                break
+            digits, digit = numpy.divmod(digits, 10)
+            rows[position - i] = numpy.where(used, ord('0') + digit, 0)
+            int_digits += used
+        negative = numpy.flatnonzero(values < 0)
+        rows[position - int_digits[negative], negative] = ord('-')
+
+
+def save_ffi1001_file(na_file, filename, na_dict, float_format=None, delimiter='    ', no_header=False):
+    # the header is written by egads, the data block is formatted column by column with numpy and written in
+    # blocks of lines, egads writes it value by value, files with another FFI are written by egads
+    logging.debug('gui - nasa_ames_functions.py - save_ffi1001_file - filename ' + filename)
+    if int(na_dict['FFI']) != 1001:
+        na_file.save_na_file(filename, na_dict, float_format=float_format, delimiter=delimiter, no_header=no_header)
+        return
+    na_file.save_na_file(filename, dict(na_dict, X=[], V=[]), float_format=float_format, delimiter=delimiter,
+                         no_header=no_header)
+    columns = [WrittenColumn(na_dict['X'], float_format)]
+    for i, values in enumerate(na_dict['V']):
+        columns.append(WrittenColumn(values, float_format, na_dict['VSCAL'][i], na_dict['VMISS'][i]))
+    line_nbr = len(columns[0].values)
+    delimiter = numpy.frombuffer(delimiter.encode('utf-8'), dtype=numpy.uint8)
+    line_end = numpy.frombuffer(os.linesep.encode('utf-8'), dtype=numpy.uint8)
+    line_width = sum(column.width for column in columns) + len(delimiter) * (len(columns) - 1) + len(line_end)
+    with open(filename, 'ab') as data_file:
+        for start in range(0, line_nbr, WRITING_BLOCK_LENGTH):
+            stop = min(start + WRITING_BLOCK_LENGTH, line_nbr)
+            block = numpy.empty((line_width, stop - start), dtype=numpy.uint8)
+            position = 0
+            for i, column in enumerate(columns):
+                if i:
+                    block[position:position + len(delimiter)] = delimiter[:, numpy.newaxis]
+                    position += len(delimiter)
+                column.write(block[position:position + column.width], start, stop)
+                position += column.width
+            block[position:] = line_end[:, numpy.newaxis]
+            block = block.T.ravel()
+            data_file.write(block[block != 0].tobytes())
+    logging.debug('gui - nasa_ames_functions.py - save_ffi1001_file - filename ' + filename + ' -> ' + str(line_nbr)
+                  + ' lines written OK')
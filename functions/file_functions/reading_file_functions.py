@@ -4,18 +4,27 @@ from PyQt5 import QtWidgets, QtGui
 from functions.utils import clear_layout
 from ui.Ui_waitbatchwindow import Ui_waitBatchWindow
 from functions.gui_functions.gui_widgets import QtWaitingSpinner
-from functions.thread_functions.file_functions import ReadFileThread
+from functions.thread_functions.file_functions import ReadFileThread, ReadSegmentsThread, RestoreSessionThread
 from functions.window_functions.other_windows_functions import MyInfo
 from functions.gui_functions.gui_netcdf_functions import (netcdf_gui_initialization, update_nc_global_attribute_gui,
-                                                          populate_netcdf_tree_widget)
+                                                          populate_netcdf_tree_widget, nc_tree_var_reading)
 from functions.gui_functions.gui_nasaames_functions import (nasaames_gui_initialization, update_na_global_attribute_gui,
-                                                            populate_na_tree_widget)
+                                                            populate_na_tree_widget, na_tree_var_reading)
 from functions.gui_functions.gui_global_functions import status_bar_update, update_icons_state
+from functions.file_functions.lazy_loading_functions import LazyFileSource
+from functions.file_functions.segment_functions import SegmentedFileSource
+from functions.file_functions.change_tracking_functions import WorkspaceSnapshot
+from functions.file_functions.session_functions import apply_tree_state
 
 
 def reading_file(self):
     logging.debug('gui - file_functions.py - reading_file - file_name ' + self.file_name)
-    self.reading_window = MyWaitReading(self.file_name, self.file_ext, self.config_dict)
+    if self.file_segments is not None:
+        read_thread = ReadSegmentsThread(self.file_segments, self.file_ext, self.config_dict)
+    else:
+        read_thread = ReadFileThread(self.file_name, self.file_ext, self.config_dict, self.user_path,
+                                     self.file_subset)
+    self.reading_window = MyWaitReading(read_thread)
     self.reading_window.exec_()
     if self.reading_window.error_occurred:
         exc_type = self.reading_window.error_reason[0]
@@ -31,33 +40,91 @@ def reading_file(self):
         self.list_of_global_attributes = self.reading_window.final_dict['glob_attr_list']
         self.list_of_variables_and_attributes = self.reading_window.final_dict['var_attr_list']
         self.list_of_unread_variables = self.reading_window.final_dict['unread_var']
-        self.opened_file.close()
-        clear_layout(self.gridLayout)
-        if self.file_ext == 'NetCDF Files (*.nc *.cdf)' or self.file_ext == 'Hdf Files (*.h5 *.hdf5 *.he5)':
-            netcdf_gui_initialization(self)
-            update_nc_global_attribute_gui(self)
-            populate_netcdf_tree_widget(self)
-        elif self.file_ext == 'NASA Ames Files (*.na)':
-            nasaames_gui_initialization(self)
-            update_na_global_attribute_gui(self)
-            populate_na_tree_widget(self)
-        self.file_is_opened = True
-        update_icons_state(self)
-        status_bar_update(self)
-        self.start_status_bar_msg_thread('The file ' + pathlib.PurePath(self.file_name).name + ' has been opened...')
+        self.workspace_snapshot = None
+        if (self.file_subset is None and self.file_segments is None and
+                self.file_ext in ['NetCDF Files (*.nc *.cdf)', 'Hdf Files (*.h5 *.hdf5 *.he5)']):
+            self.workspace_snapshot = WorkspaceSnapshot(self.file_name, self.file_ext, self.list_of_global_attributes,
+                                                        self.list_of_variables_and_attributes)
+        if (not isinstance(self.opened_file, (LazyFileSource, SegmentedFileSource)) or
+                not self.opened_file.lazy_loading):
+            self.opened_file.close()
+        workspace_gui_initialization(self)
+        if self.file_segments is not None:
+            self.start_status_bar_msg_thread(str(len(self.file_segments)) + ' segments, starting with the file '
+                                             + pathlib.PurePath(self.file_name).name + ', have been opened...')
+        elif self.file_subset is not None:
+            self.start_status_bar_msg_thread('A subset of the file ' + pathlib.PurePath(self.file_name).name
+                                             + ' has been opened...')
+        else:
+            self.start_status_bar_msg_thread('The file ' + pathlib.PurePath(self.file_name).name
+                                             + ' has been opened...')
         logging.info('gui - old_reading_functions.py - reading_file: file loaded, file_ext ' + self.file_ext)
 
 
+def restoring_session(self, session_name):
+    logging.debug('gui - reading_file_functions.py - restoring_session - session_name ' + session_name)
+    self.reading_window = MyWaitReading(RestoreSessionThread(session_name), 'Restoring the session...')
+    self.reading_window.exec_()
+    if self.reading_window.error_occurred:
+        info_str = ('An exception occurred during the restoration of the session. Thus the GUI decided to stop the '
+                    'process. Please read the log file to have more details about the exception. Contact the '
+                    'developer if the same exception occurs again.<br><br>Exception type: ' +
+                    self.reading_window.error_reason[0] + '<br><br>Exception value: ' +
+                    self.reading_window.error_reason[1])
+        self.info_window = MyInfo(info_str)
+        self.info_window.exec_()
+    if self.reading_window.success:
+        final_dict = self.reading_window.final_dict
+        self.opened_file = final_dict['opened_file']
+        self.file_name = final_dict['file_name']
+        self.file_ext = final_dict['file_ext']
+        self.file_subset = None
+        self.file_segments = None
+        self.workspace_snapshot = None
+        self.list_of_global_attributes = final_dict['glob_attr_list']
+        self.list_of_variables_and_attributes = final_dict['var_attr_list']
+        self.list_of_unread_variables = final_dict['unread_var']
+        self.modified = final_dict['modified']
+        workspace_gui_initialization(self)
+        apply_tree_state(self.variable_list, final_dict['tree_state'])
+        if len(self.variable_list.selectedItems()) == 1:
+            if self.file_ext == 'NASA Ames Files (*.na)':
+                na_tree_var_reading(self)
+            else:
+                nc_tree_var_reading(self)
+            update_icons_state(self)
+        self.make_window_title()
+        self.start_status_bar_msg_thread('The session ' + pathlib.PurePath(session_name).name
+                                         + ' has been restored...')
+        logging.info('gui - reading_file_functions.py - restoring_session: session restored, file_ext '
+                     + self.file_ext)
+
+
+def workspace_gui_initialization(self):
+    clear_layout(self.gridLayout)
+    if self.file_ext == 'NetCDF Files (*.nc *.cdf)' or self.file_ext == 'Hdf Files (*.h5 *.hdf5 *.he5)':
+        netcdf_gui_initialization(self)
+        update_nc_global_attribute_gui(self)
+        populate_netcdf_tree_widget(self)
+    elif self.file_ext == 'NASA Ames Files (*.na)':
+        nasaames_gui_initialization(self)
+        update_na_global_attribute_gui(self)
+        populate_na_tree_widget(self)
+    self.file_is_opened = True
+    update_icons_state(self)
+    status_bar_update(self)
+
+
 class MyWaitReading(QtWidgets.QDialog, Ui_waitBatchWindow):
-    def __init__(self, file_name, file_ext, config_dict):
+    # waiting window of the threads reading a file or segments, saving or restoring a session
+    def __init__(self, read_thread, title=None):
         logging.debug('gui - old_reading_functions.py - MyWaitReading - __init__')
         QtWidgets.QWidget.__init__(self)
         self.setupUi(self)
-        self.file_name = file_name
-        self.file_ext = file_ext
-        self.config_dict = config_dict
+        if title is not None:
+            self.setWindowTitle(title)
         self.spinner = None
-        self.read_thread = None
+        self.read_thread = read_thread
         self.error_occurred = False
         self.success = True
         self.final_dict = None
@@ -69,19 +136,18 @@ class MyWaitReading(QtWidgets.QDialog, Ui_waitBatchWindow):
     def update_progress(self, val):
         progress_str, progress_nbr = val[0], val[1]
         if len(progress_str) > 65:
-            progress_str = progress_str[:32] + '...' + progress_str[-32:0]
+            progress_str = progress_str[:32] + '...' + progress_str[-32:]
         self.progress_label.setText(progress_str)
         self.progress_bar.setValue(progress_nbr)
 
     def launch_reading_thread(self):
         logging.debug('gui - old_reading_functions.py - MyWaitReading - launch_reading_thread')
-        self.read_thread = ReadFileThread(self.file_name, self.file_ext, self.config_dict)
-        self.read_thread.start()
         self.read_thread.progress.connect(self.update_progress)
         self.read_thread.finished.connect(self.reading_finished)
         self.read_thread.error.connect(self.reading_failed)
+        self.read_thread.start()
 
-    def reading_finished(self, final_dict):
+    def reading_finished(self, final_dict=None):
         logging.debug('gui - old_reading_functions.py - MyWaitReading - reading_finished')
         self.final_dict = final_dict
         self.close()
@@ -3,14 +3,27 @@ import pathlib
 from PyQt5 import QtWidgets, QtGui
 from ui.Ui_waitbatchwindow import Ui_waitBatchWindow
 from functions.gui_functions.gui_widgets import QtWaitingSpinner
-from functions.thread_functions.file_functions import SaveFileThread
+from functions.thread_functions.file_functions import SaveFileThread, SaveSessionThread
 from functions.window_functions.other_windows_functions import MyInfo
+from functions.file_functions.change_tracking_functions import WorkspaceSnapshot
+from functions.file_functions.storage_functions import read_storage_options
+from functions.file_functions.session_functions import tree_state
+from functions.file_functions.reading_file_functions import MyWaitReading
 
 
 def saving_file(self, save_file_name, save_file_ext, open_file_ext):
     logging.debug('gui - saving_file_functions.py - saving_file - save_file_name ' + save_file_name)
+    changes = None
+    if self.workspace_snapshot is not None:
+        try:
+            changes = self.workspace_snapshot.changes(save_file_name, save_file_ext, self.list_of_global_attributes,
+                                                      self.list_of_variables_and_attributes)
+        except Exception:
+            logging.exception('gui - saving_file_functions.py - saving_file : an error occured during the search '
+                              'of modifications, the file will be written again')
     self.saving_window = MyWaitSaving(save_file_name, save_file_ext, open_file_ext, self.list_of_global_attributes,
-                                      self.list_of_variables_and_attributes)
+                                      self.list_of_variables_and_attributes, changes,
+                                      read_storage_options(self.config_dict))
     self.saving_window.exec_()
     if self.saving_window.error_occurred:
         if self.saving_window.error_reason:
@@ -26,6 +39,11 @@ def saving_file(self, save_file_name, save_file_ext, open_file_ext):
         self.info_window = MyInfo(info_str)
         self.info_window.exec_()
     if self.saving_window.success:
+        self.workspace_snapshot = None
+        if (save_file_ext in ['NetCDF Files (*.nc *.cdf)', 'Hdf Files (*.h5 *.hdf5 *.he5)'] and
+                open_file_ext in ['NetCDF Files (*.nc *.cdf)', 'Hdf Files (*.h5 *.hdf5 *.he5)']):
+            self.workspace_snapshot = WorkspaceSnapshot(save_file_name, save_file_ext, self.list_of_global_attributes,
+                                                        self.list_of_variables_and_attributes)
         self.modified = False
         self.make_window_title()
         self.start_status_bar_msg_thread('The file ' + pathlib.PurePath(save_file_name).name + ' has been saved...')
@@ -33,8 +51,32 @@ def saving_file(self, save_file_name, save_file_ext, open_file_ext):
                      save_file_name)
 
 
+def saving_session(self, session_name):
+    logging.debug('gui - saving_file_functions.py - saving_session - session_name ' + session_name)
+    workspace = {'file_name': self.file_name, 'file_ext': self.file_ext, 'modified': self.modified,
+                 'glob_attr_list': self.list_of_global_attributes, 'unread_var': self.list_of_unread_variables,
+                 'tree_state': tree_state(self.variable_list)}
+    self.saving_window = MyWaitReading(SaveSessionThread(session_name, workspace,
+                                                         self.list_of_variables_and_attributes,
+                                                         read_storage_options(self.config_dict)),
+                                       'Saving the session...')
+    self.saving_window.exec_()
+    if self.saving_window.error_occurred:
+        info_str = ('An exception occurred during the saving of the session. Thus the GUI decided to stop the '
+                    'process. Please read the log file to have more details about the exception. Contact the '
+                    'developer if the same exception occurs again.<br><br>Exception type: ' +
+                    self.saving_window.error_reason[0] + '<br><br>Exception value: ' +
+                    self.saving_window.error_reason[1])
+        self.info_window = MyInfo(info_str)
+        self.info_window.exec_()
+    if self.saving_window.success:
+        self.start_status_bar_msg_thread('The session ' + pathlib.PurePath(session_name).name + ' has been saved...')
+        logging.info('gui - saving_file_functions.py - saving_session - the session has been saved - session_name '
+                     + session_name)
+
+
 class MyWaitSaving(QtWidgets.QDialog, Ui_waitBatchWindow):
-    def __init__(self, file_name, file_ext, open_file_ext, glob_attr, var_dict):
+    def __init__(self, file_name, file_ext, open_file_ext, glob_attr, var_dict, changes=None, storage=None):
         logging.debug('gui - saving_file_functions.py - MyWaitSaving - __init__')
         QtWidgets.QWidget.__init__(self)
         self.setupUi(self)
@@ -43,6 +85,8 @@ class MyWaitSaving(QtWidgets.QDialog, Ui_waitBatchWindow):
         self.open_file_ext = open_file_ext
         self.glob_attr = glob_attr
         self.var_dict = var_dict
+        self.changes = changes
+        self.storage = storage
         self.spinner = None
         self.save_thread = None
         self.error_occurred = False
@@ -63,7 +107,7 @@ class MyWaitSaving(QtWidgets.QDialog, Ui_waitBatchWindow):
     def launch_saving_thread(self):
         logging.debug('gui - saving_file_functions.py - MyWaitSaving - launch_saving_thread')
         self.save_thread = SaveFileThread(self.file_name, self.file_ext, self.open_file_ext, self.glob_attr,
-                                          self.var_dict)
+                                          self.var_dict, self.changes, self.storage)
         self.save_thread.start()
         self.save_thread.progress.connect(self.update_progress)
         self.save_thread.finished.connect(self.saving_finished)
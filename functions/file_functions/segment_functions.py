@@ -0,0 +1,171 @@
+import logging
+import numpy
+import egads
+from functions.file_functions.lazy_loading_functions import LazyEgadsData, variable_template
+from functions.file_functions.dtype_functions import target_dtype
+
+
+def segment_dimension(egads_file):
+    # the segments are concatenated along the unlimited dimension of the first file, or along its time coordinate
+    # if no dimension is unlimited
+    logging.debug('gui - segment_functions.py - segment_dimension')
+    if isinstance(egads_file, egads.input.NetCdf):
+        for dim_name, dim_object in egads_file.f.dimensions.items():
+            if dim_object.isunlimited() and dim_name in egads_file.f.variables:
+                return '/' + dim_name
+    for var_name in egads_file.get_variable_list():
+        dim_list = egads_file.get_dimension_list(str(var_name), details=True)
+        if list(dim_list.keys()) == ['/' + var_name]:
+            if 'since' in str(egads_file.get_attribute_list(var_name).get('units', '')):
+                return '/' + var_name
+    return None
+
+
+def sort_segments(sources, dimension):
+    # segments are ordered by the first value of their time coordinate, which must have the same units in all files
+    logging.debug('gui - segment_functions.py - sort_segments - dimension ' + dimension)
+    first_values = []
+    units = None
+    for source in sources:
+        if dimension not in source.egads_file.get_variable_list(group_walk=True, details=True):
+            raise Exception('the file ' + source.file_path + ' doesn\'t contain the dimension ' + dimension)
+        source_units = source.read_attributes(dimension).get('units', '')
+        if units is None:
+            units = source_units
+        elif source_units != units:
+            raise Exception('the units of ' + dimension + ' in ' + source.file_path + ' (' + str(source_units)
+                            + ') are different from those of the other segments (' + str(units) + ')')
+        coordinate = source.egads_file.f[dimension]
+        first_values.append(coordinate[0] if coordinate.shape[0] else numpy.inf)
+    return [source for _, source in sorted(zip(first_values, sources), key=lambda item: item[0])]
+
+
+class SegmentedFileSource(object):
+    def __init__(self, sources, dimension):
+        logging.debug('gui - segment_functions.py - SegmentedFileSource - __init__ - dimension ' + dimension)
+        self.sources = sources
+        self.dimension = dimension
+        self.file_path = sources[0].file_path
+        self.file_paths = [source.file_path for source in sources]
+        self.file_ext = sources[0].file_ext
+        self.read_dtype = sources[0].read_dtype
+        # segments are always read on demand, whatever the lazy loading option
+        self.lazy_loading = True
+        self.variables = []
+        self.sizes = [source.read_header(dimension)['shape'][0] for source in sources]
+        self.offsets = numpy.cumsum([0] + self.sizes).tolist()
+        self.closed = False
+
+    def variable_axis(self, var_name):
+        dim_list = list(self.sources[0].read_dimensions(var_name).keys())
+        if self.dimension in dim_list:
+            return dim_list.index(self.dimension)
+        return None
+
+    def read_header(self, var_name):
+        header = self.sources[0].read_header(var_name)
+        axis = self.variable_axis(var_name)
+        if axis is not None:
+            shape = list(header['shape'])
+            for i, source in enumerate(self.sources[1:]):
+                segment_shape = source.read_header(var_name)['shape']
+                if (len(segment_shape) != len(shape) or segment_shape[axis] != self.sizes[i + 1] or
+                        any(segment_shape[j] != shape[j] for j in range(len(shape)) if j != axis)):
+                    raise Exception('the shape of ' + var_name + ' in ' + source.file_path + ' doesn\'t match the '
+                                    'shape of the other segments')
+            shape[axis] = self.offsets[-1]
+            header['shape'] = tuple(shape)
+        return header
+
+    def read_metadata(self, var_name, header=None):
+        logging.debug('gui - segment_functions.py - SegmentedFileSource - read_metadata - var_name ' + var_name)
+        if header is None:
+            header = self.read_header(var_name)
+        dtype = target_dtype(header['dtype'], self.read_dtype)
+        template = variable_template(header['metadata'], self.sources[0].egads_file.file_metadata, dtype)
+        variable = SegmentedEgadsData(self, var_name, template, header['shape'])
+        self.variables.append(variable)
+        return variable
+
+    def read_dimensions(self, var_name):
+        dim_list = self.sources[0].read_dimensions(var_name).copy()
+        if self.dimension in dim_list:
+            dim_list[self.dimension] = self.offsets[-1]
+        return dim_list
+
+    def read_variable(self, var_name, start=None, stop=None):
+        # only the segments overlapping [start, stop) along the concatenation dimension are read
+        logging.debug('gui - segment_functions.py - SegmentedFileSource - read_variable - var_name ' + var_name
+                      + ', start ' + str(start) + ', stop ' + str(stop))
+        axis = self.variable_axis(var_name)
+        if axis is None:
+            return self.sources[0].read_variable(var_name)
+        if start is None:
+            start = 0
+        if stop is None:
+            stop = self.offsets[-1]
+        shape = self.sources[0].read_header(var_name)['shape']
+        parts = []
+        for i, source in enumerate(self.sources):
+            segment_start = min(max(start - self.offsets[i], 0), self.sizes[i])
+            segment_stop = max(min(stop - self.offsets[i], self.sizes[i]), segment_start)
+            # an empty range is still read in the last segment to get an empty variable
+            if segment_start == segment_stop and (parts or i < len(self.sources) - 1):
+                continue
+            input_range = None
+            if segment_start > 0 or segment_stop < self.sizes[i]:
+                input_range = []
+                for j, size in enumerate(shape):
+                    if j == axis:
+                        input_range += [segment_start, segment_stop]
+                    else:
+                        input_range += [0, size]
+            parts.append(source.read_variable(var_name, input_range))
+        egads_instance = egads.EgadsData(numpy.concatenate([part.value for part in parts], axis=axis),
+                                         variable_metadata=parts[0].metadata)
+        if self.file_ext == 'Hdf Files (*.h5 *.hdf5 *.he5)':
+            egads_instance.compound_data = False
+        return egads_instance
+
+    def read_rows(self, var_name, start, stop):
+        if self.variable_axis(var_name) == 0:
+            return self.read_variable(var_name, start, stop)
+        return self.sources[0].read_rows(var_name, start, stop)
+
+    def release(self):
+        logging.debug('gui - segment_functions.py - SegmentedFileSource - release')
+        for variable in self.variables:
+            variable.load()
+        self.close()
+
+    def close(self):
+        logging.debug('gui - segment_functions.py - SegmentedFileSource - close')
+        for source in self.sources:
+            source.close()
+        self.closed = True
+
+
+class SegmentedEgadsData(LazyEgadsData):
+    def __getitem__(self, item):
+        # a slice along the first axis, the time axis of the segments, doesn't need to read all segments
+        first_item = item[0] if isinstance(item, tuple) and item else item
+        if (self.data is None and isinstance(first_item, (slice, int, numpy.integer)) and
+                self.source.variable_axis(self.var_name) == 0):
+            if isinstance(first_item, slice):
+                start, stop, step = first_item.indices(self.shape[0])
+                if step != 1:
+                    return self.load()[item]
+                new_first_item = slice(None)
+            else:
+                if not -self.shape[0] <= first_item < self.shape[0]:
+                    raise IndexError('index ' + str(first_item) + ' is out of bounds for axis 0 with size '
+                                     + str(self.shape[0]))
+                start = int(first_item) % self.shape[0]
+                stop = start + 1
+                new_first_item = 0
+            data = self.source.read_variable(self.var_name, start, stop)
+            data.metadata = self.metadata
+            if isinstance(item, tuple):
+                return data[(new_first_item,) + item[1:]]
+            return data[new_first_item]
+        return self.load()[item]
@@ -0,0 +1,175 @@
+import logging
+import os
+import json
+import collections
+import numpy
+import h5py
+import egads
+from egads.core.metadata import VariableMetadata
+from PyQt5 import QtWidgets
+from functions.utils import full_path_name_from_treewidget, treewidget_item_from_path
+from functions.file_functions.lazy_loading_functions import is_variable, LazyEgadsData
+from functions.file_functions.memory_mapping_functions import hdf5_dataset_layout, memory_map
+from functions.file_functions.storage_functions import storable, block_length, written_data
+
+
+session_ext = 'EGADS Session Files (*.egs)'
+session_version = 2
+
+
+class SessionFile(object):
+    # opened file of a restored workspace, the values are mapped from the session file and don't need it to be open
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.file_paths = [file_path]
+        self.lazy_loading = False
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def tree_state(variable_list):
+    # expanded and selected items of the tree widget, saved by path to be applied to the new tree
+    expanded, selected = [], []
+    iterator = QtWidgets.QTreeWidgetItemIterator(variable_list)
+    while iterator.value():
+        item = iterator.value()
+        if item.isExpanded():
+            expanded.append(full_path_name_from_treewidget(parent=item)[0])
+        if item.isSelected():
+            selected.append(full_path_name_from_treewidget(parent=item)[0])
+        iterator += 1
+    return {'expanded': expanded, 'selected': selected}
+
+
+def apply_tree_state(variable_list, state):
+    for path in state['expanded']:
+        item = treewidget_item_from_path(variable_list, path)
+        if item is not None:
+            item.setExpanded(True)
+    for path in state['selected']:
+        item = treewidget_item_from_path(variable_list, path)
+        if item is not None:
+            item.setSelected(True)
+            variable_list.scrollToItem(item)
+
+
+def json_value(value):
+    # attributes and metadata are stored as json, the types which json doesn't have are tagged to be restored,
+    # dictionaries are lists of pairs to keep keys which aren't strings
+    if isinstance(value, dict):
+        return {'__dict__': [[json_value(key), json_value(item)] for key, item in value.items()],
+                'ordered': isinstance(value, collections.OrderedDict)}
+    if isinstance(value, numpy.ndarray):
+        if value.dtype.kind in 'biuf':
+            items = value.ravel().tolist()
+        elif value.dtype.kind in 'cSUO':
+            items = [json_value(item) for item in value.ravel().tolist()]
+        else:
+            raise TypeError('values of type ' + str(value.dtype) + ' can\'t be saved in a session')
+        return {'__ndarray__': items, 'dtype': value.dtype.str, 'shape': list(value.shape)}
+    if isinstance(value, numpy.generic):
+        return {'__numpy__': json_value(value.item()), 'dtype': value.dtype.str}
+    if isinstance(value, (list, tuple)):
+        items = [json_value(item) for item in value]
+        return {'__tuple__': items} if isinstance(value, tuple) else items
+    if isinstance(value, bytes):
+        return {'__bytes__': value.decode('latin-1')}
+    if isinstance(value, complex):
+        return {'__complex__': [value.real, value.imag]}
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    raise TypeError('values of type ' + type(value).__name__ + ' can\'t be saved in a session')
+
+
+def restored_value(value):
+    if isinstance(value, list):
+        return [restored_value(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if '__dict__' in value:
+        items = [(restored_value(key), restored_value(item)) for key, item in value['__dict__']]
+        return collections.OrderedDict(items) if value['ordered'] else dict(items)
+    if '__ndarray__' in value:
+        array = numpy.empty(len(value['__ndarray__']), dtype=numpy.dtype(value['dtype']))
+        for i, item in enumerate(value['__ndarray__']):
+            array[i] = restored_value(item)
+        return array.reshape(value['shape'])
+    if '__numpy__' in value:
+        return numpy.dtype(value['dtype']).type(restored_value(value['__numpy__']))
+    if '__tuple__' in value:
+        return tuple(restored_value(item) for item in value['__tuple__'])
+    if '__bytes__' in value:
+        return value['__bytes__'].encode('latin-1')
+    return complex(*value['__complex__'])
+
+
+def write_session_variable(values, dataset_name, data, storage):
+    # values are stored uncompressed and contiguous to be mapped at the restoration, variables still in their file are
+    # copied in blocks
+    if not isinstance(data, LazyEgadsData) or data.loaded:
+        values.create_dataset(dataset_name, data=numpy.asarray(data.value))
+        return
+    dataset = values.create_dataset(dataset_name, shape=data.shape, dtype=data.dtype)
+    length = block_length(data.shape, data.dtype.itemsize, storage)
+    for start in range(0, data.shape[0], length):
+        value = data.read_rows(start, min(start + length, data.shape[0]))
+        dataset[start:start + len(value)] = value.astype(data.dtype, copy=False)
+
+
+def write_session(file_path, workspace, var_dict, storage, progress=None):
+    # the workspace and the metadata of each item are stored as json, nothing is executed when a session is restored,
+    # the values of numeric variables are stored as datasets
+    logging.debug('gui - session_functions.py - write_session - file_path ' + file_path)
+    items = {}
+    with h5py.File(file_path, 'w') as h5_file:
+        values = h5_file.create_group('values')
+        for i, (path, sublist) in enumerate(var_dict.items()):
+            if progress is not None:
+                progress(path, i)
+            if not is_variable(sublist[0]):
+                items[path] = {'attributes': sublist[0], 'dimensions': sublist[1], 'is_dim': sublist[2]}
+                continue
+            data = sublist[0]
+            item = {'metadata': dict(data.metadata), 'conventions': getattr(data.metadata, '_conventions', None),
+                    'dimensions': sublist[1], 'is_dim': sublist[2], 'dataset': None, 'value': None,
+                    'compound_data': vars(data).get('compound_data')}
+            if storable(data.shape, data.dtype):
+                item['dataset'] = str(i)
+                write_session_variable(values, item['dataset'], data, storage)
+            else:
+                item['value'] = numpy.asarray(written_data(data).value)
+            items[path] = item
+        workspace = dict(workspace, version=session_version, items=items)
+        h5_file.create_dataset('workspace', data=json.dumps(json_value(workspace)), dtype=h5py.string_dtype())
+
+
+def read_session(file_path):
+    logging.debug('gui - session_functions.py - read_session - file_path ' + file_path)
+    file_path = os.path.abspath(file_path)
+    with h5py.File(file_path, 'r') as h5_file:
+        if h5_file['workspace'].dtype.kind != 'O':
+            raise ValueError('the session file has been written by another version of the gui')
+        workspace = restored_value(json.loads(h5_file['workspace'].asstr()[()]))
+        if workspace.get('version') != session_version:
+            raise ValueError('the session file has been written by another version of the gui')
+        var_dict = {}
+        for path, item in workspace.pop('items').items():
+            if 'metadata' not in item:
+                var_dict[path] = [item['attributes'], item['dimensions'], item['is_dim']]
+                continue
+            value = item['value']
+            if item['dataset'] is not None:
+                dataset = h5_file['values'][item['dataset']]
+                value = memory_map(file_path, hdf5_dataset_layout(dataset))
+                if value is None:
+                    value = dataset[()]
+            data = egads.EgadsData(value, variable_metadata=VariableMetadata(item['metadata'],
+                                                                                conventions=item['conventions']))
+            if item['compound_data'] is not None:
+                data.compound_data = item['compound_data']
+            var_dict[path] = [data, item['dimensions'], item['is_dim']]
+    workspace['var_attr_list'] = var_dict
+    workspace['opened_file'] = SessionFile(file_path)
+    return workspace
@@ -0,0 +1,201 @@
+import logging
+import numpy
+import egads
+from functions.file_functions.lazy_loading_functions import LazyEgadsData
+
+
+storage_presets = ['default', 'fast', 'compact', 'archive']
+compression_levels = {'fast': 1, 'compact': 4, 'archive': 9}
+chunk_lengths = ['auto', '1024', '4096', '16384', '65536']
+write_memory_sizes = ['64', '256', '1024', '4096']
+
+# chunks of about 1 MiB, the size of the chunk cache of the HDF5 library for each dataset
+chunk_bytes = 2 ** 20
+
+
+def storage_options(preset, chunk_length='auto', write_memory=None):
+    # complevel is None if files have to be written with the default layout of egads, contiguous and not compressed,
+    # memory_budget is the size in bytes above which a variable still in its file is written in blocks
+    memory_budget = None
+    if write_memory is not None:
+        memory_budget = int(write_memory) * 2 ** 20
+    return {'complevel': compression_levels.get(preset), 'shuffle': preset in compression_levels,
+            'chunk_length': chunk_length, 'memory_budget': memory_budget}
+
+
+def read_storage_preset(config_dict):
+    preset = config_dict['SYSTEM'].get('storage_preset', 'default')
+    if preset not in storage_presets:
+        return 'default'
+    return preset
+
+
+def read_chunk_length(config_dict):
+    chunk_length = config_dict['SYSTEM'].get('chunk_length', 'auto')
+    if chunk_length not in chunk_lengths:
+        return 'auto'
+    return chunk_length
+
+
+def read_write_memory(config_dict):
+    write_memory = config_dict['SYSTEM'].get('write_memory', '256')
+    if write_memory not in write_memory_sizes:
+        return '256'
+    return write_memory
+
+
+def read_storage_options(config_dict, preset=None):
+    # the preset of a batch processing replaces the one of the options
+    if preset is None:
+        preset = read_storage_preset(config_dict)
+    return storage_options(preset, read_chunk_length(config_dict), read_write_memory(config_dict))
+
+
+def chunk_shape(shape, itemsize, chunk_length='auto'):
+    # variables are chunked along their first dimension, the time dimension, and kept whole along the others, the
+    # GUI reads variables entirely or along a time window, in automatic mode a chunk is about chunk_bytes
+    row_size = itemsize * int(numpy.prod(shape[1:]))
+    if chunk_length == 'auto':
+        length = max(1, chunk_bytes // max(row_size, 1))
+    else:
+        length = int(chunk_length)
+    return (min(length, shape[0]),) + tuple(shape[1:])
+
+
+def storable(shape, dtype):
+    # scalars, empty variables and strings are written with the default layout
+    return len(shape) > 0 and 0 not in shape and numpy.dtype(dtype).kind in 'biuf'
+
+
+def compressed(storage):
+    return storage is not None and storage['complevel'] is not None
+
+
+def compression_options(storage, chunks):
+    return {'compression': 'gzip', 'compression_opts': storage['complevel'], 'shuffle': storage['shuffle'],
+            'chunks': chunks}
+
+
+def block_length(shape, itemsize, storage, chunks=None):
+    # number of rows along the first dimension written at once, a multiple of the chunk length if possible
+    if storage is None or storage['memory_budget'] is None:
+        return shape[0]
+    length = max(1, storage['memory_budget'] // max(itemsize * int(numpy.prod(shape[1:])), 1))
+    if chunks is not None and length > chunks[0]:
+        length -= length % chunks[0]
+    return min(length, shape[0])
+
+
+def streamed(data, storage, itemsize):
+    # only variables still in their file are written in blocks, the others are already in memory
+    return (isinstance(data, LazyEgadsData) and not data.loaded and storable(data.shape, data.dtype) and
+            block_length(data.shape, itemsize, storage) < data.shape[0])
+
+
+def written_data(data):
+    if isinstance(data, LazyEgadsData):
+        return data.read()
+    return data
+
+
+def write_netcdf_variable(new_file, data, var_name, dim_tuple, dtype, storage):
+    # same group walk, fill value and attributes than egads
+    group = new_file.f
+    for group_name in var_name.strip('/').split('/')[:-1]:
+        group = group.groups[group_name]
+    fill_value = data.metadata.get('_FillValue')
+    if fill_value is None:
+        fill_value = data.metadata.get('missing_value')
+    options = {}
+    chunks = None
+    if compressed(storage):
+        chunks = chunk_shape(data.shape, dtype.itemsize, storage['chunk_length'])
+        options = {'zlib': True, 'complevel': storage['complevel'], 'shuffle': storage['shuffle'],
+                   'chunksizes': chunks}
+    variable = group.createVariable(var_name.strip('/').split('/')[-1], dtype, dim_tuple, fill_value=fill_value,
+                                    **options)
+    for key, val in data.metadata.items():
+        if key != '_FillValue':
+            if isinstance(val, list):
+                val = ', '.join(str(item) for item in val)
+            setattr(variable, str(key), val)
+    if isinstance(data, LazyEgadsData) and not data.loaded:
+        read_rows = data.read_rows
+    else:
+        read_rows = lambda start, stop: data.value[start:stop]
+    length = block_length(data.shape, dtype.itemsize, storage, chunks)
+    for start in range(0, data.shape[0], length):
+        value = read_rows(start, min(start + length, data.shape[0]))
+        if fill_value is not None and value.dtype.kind == 'f':
+            value = numpy.where(numpy.isnan(value), fill_value, value)
+        variable[start:start + len(value)] = value
+
+
+def write_hdf_variable(new_file, data, var_name, dim_tuple, var_format, dtype, storage):
+    options = {}
+    chunks = None
+    if compressed(storage):
+        chunks = chunk_shape(data.shape, dtype.itemsize, storage['chunk_length'])
+        options = compression_options(storage, chunks)
+    length = block_length(data.shape, dtype.itemsize, storage, chunks)
+    # egads creates the dataset, its dimension scales and its attributes from the first block, the dataset has its
+    # full shape and the next blocks are written after
+    first_block = egads.EgadsData(data.read_rows(0, length), variable_metadata=data.metadata)
+    with HdfDatasetOptions(new_file, options, data.shape):
+        new_file.write_variable(first_block, var_name, dim_tuple, var_format)
+    dataset = new_file.f[var_name]
+    for start in range(length, data.shape[0], length):
+        value = data.read_rows(start, min(start + length, data.shape[0]))
+        dataset[start:start + len(value)] = value
+
+
+def write_egads_variable(new_file, data, var_name, dim_tuple, var_format, storage=None):
+    dtype = numpy.dtype(new_file.TYPE_DICT[var_format])
+    stream = streamed(data, storage, dtype.itemsize)
+    if not stream and (not compressed(storage) or not storable(data.shape, data.dtype)):
+        new_file.write_variable(written_data(data), var_name, dim_tuple, var_format)
+        return
+    logging.debug('gui - storage_functions.py - write_egads_variable - var_name ' + var_name + ', streamed '
+                  + str(stream) + ', compressed ' + str(compressed(storage)))
+    if isinstance(new_file, egads.input.NetCdf):
+        write_netcdf_variable(new_file, data, var_name, dim_tuple, dtype, storage)
+    elif stream:
+        write_hdf_variable(new_file, data, var_name, dim_tuple, var_format, dtype, storage)
+    else:
+        options = compression_options(storage, chunk_shape(data.shape, dtype.itemsize, storage['chunk_length']))
+        with HdfDatasetOptions(new_file, options):
+            new_file.write_variable(written_data(data), var_name, dim_tuple, var_format)
+
+
+def add_egads_dim(new_file, dim_name, data, storage=None):
+    # dimensions of Hdf files are datasets written like the other variables
+    data = written_data(data)
+    if not compressed(storage) or not storable(data.shape, data.dtype):
+        new_file.add_dim(dim_name, data)
+        return
+    chunks = chunk_shape(data.shape, numpy.dtype(new_file.TYPE_DICT['double']).itemsize, storage['chunk_length'])
+    with HdfDatasetOptions(new_file, compression_options(storage, chunks)):
+        new_file.add_dim(dim_name, data)
+
+
+class HdfDatasetOptions(object):
+    # egads creates Hdf datasets with the default layout, the options are added to its calls for the opened file only,
+    # with a shape the dataset is created with this shape and the data given by egads are its first rows
+    def __init__(self, new_file, options, shape=None):
+        self.h5_file = new_file.f
+        self.options = options
+        self.shape = shape
+
+    def create_dataset(self, name, data=None, dtype=None):
+        if self.shape is None:
+            return self.h5_file.__class__.create_dataset(self.h5_file, name, data=data, dtype=dtype, **self.options)
+        dataset = self.h5_file.__class__.create_dataset(self.h5_file, name, shape=self.shape, dtype=dtype,
+                                                        **self.options)
+        dataset[:len(data)] = data
+        return dataset
+
+    def __enter__(self):
+        self.h5_file.create_dataset = self.create_dataset
+
+    def __exit__(self, *args):
+        del self.h5_file.create_dataset
@@ -0,0 +1,99 @@
+import logging
+import collections
+import numpy
+import egads
+
+
+def read_file_dimensions(file_path, file_ext):
+    # only the header of the file is read, to list the dimensions which can be used to open a subset of the file
+    logging.debug('gui - subset_functions.py - read_file_dimensions - file_path ' + file_path)
+    if file_ext == 'NetCDF Files (*.nc *.cdf)':
+        f = egads.input.EgadsNetCdf(file_path, 'r')
+    else:
+        f = egads.input.EgadsHdf(file_path, 'r')
+    var_list, var_dim_dict, dim_dict, coordinate_dict = [], {}, collections.OrderedDict(), {}
+    try:
+        var_list = f.get_variable_list(group_walk=True, details=True)
+        for var in var_list:
+            try:
+                var_dim_list = f.get_dimension_list(str(var), details=True)
+            except Exception:
+                logging.exception('gui - subset_functions.py - read_file_dimensions : impossible to get the '
+                                  'dimensions of the variable ' + var)
+                continue
+            var_dim_dict[var] = var_dim_list
+            if len(var_dim_list) != len(f.f[var].shape):
+                continue
+            for dim, size in var_dim_list.items():
+                if not dim.endswith('/'):
+                    dim_dict[dim] = size
+            if list(var_dim_list.keys()) == [var]:
+                coordinate_dict[var] = f.get_attribute_list(var).get('units', '')
+    finally:
+        f.close()
+    return var_list, var_dim_dict, dim_dict, coordinate_dict
+
+
+def read_coordinate_bounds(file_path, file_ext, dim):
+    logging.debug('gui - subset_functions.py - read_coordinate_bounds - dim ' + dim)
+    if file_ext == 'NetCDF Files (*.nc *.cdf)':
+        f = egads.input.EgadsNetCdf(file_path, 'r')
+    else:
+        f = egads.input.EgadsHdf(file_path, 'r')
+    try:
+        variable = f.f[dim]
+        return variable[0], variable[-1]
+    finally:
+        f.close()
+
+
+def coordinate_index_range(file_path, file_ext, dim, start_value, stop_value):
+    # the coordinate is read alone to convert a window of values (ex: a time window) into an index range, values
+    # are expected to be sorted in increasing order, like a time coordinate
+    logging.debug('gui - subset_functions.py - coordinate_index_range - dim ' + dim + ', start_value '
+                  + str(start_value) + ', stop_value ' + str(stop_value))
+    if file_ext == 'NetCDF Files (*.nc *.cdf)':
+        f = egads.input.EgadsNetCdf(file_path, 'r')
+    else:
+        f = egads.input.EgadsHdf(file_path, 'r')
+    try:
+        values = numpy.asarray(f.f[dim][:])
+    finally:
+        f.close()
+    start = int(numpy.searchsorted(values, start_value, side='left'))
+    stop = int(numpy.searchsorted(values, stop_value, side='right'))
+    return start, stop
+
+
+def subset_input_range(shape, dim_list, subset):
+    # returns the input_range used by egads to read only the subset of a variable, None if the variable doesn't
+    # depend on the dimension of the subset
+    if subset is None or dim_list is None or len(dim_list) != len(shape):
+        return None
+    dim_names = list(dim_list.keys())
+    if subset['dimension'] not in dim_names:
+        return None
+    input_range = []
+    for i, size in enumerate(shape):
+        if dim_names[i] == subset['dimension']:
+            input_range += [subset['start'], subset['stop']]
+        else:
+            input_range += [0, size]
+    return input_range
+
+
+def subset_shape(shape, input_range):
+    if input_range is None:
+        return tuple(shape)
+    return tuple(input_range[i + 1] - input_range[i] for i in range(0, len(input_range), 2))
+
+
+def subset_dimension_list(dim_list, subset):
+    if dim_list is None:
+        return None
+    new_dim_list = collections.OrderedDict()
+    for dim, size in dim_list.items():
+        if subset is not None and dim == subset['dimension']:
+            size = subset['stop'] - subset['start']
+        new_dim_list[dim] = size
+    return new_dim_list
@@ -2,7 +2,8 @@ import logging
 import pathlib
 import xml
 import os
-from egads import EgadsData
+from functions.file_functions.lazy_loading_functions import is_variable
+from functions.file_functions.header_cache_functions import clear_header_cache
 from PyQt5 import QtWidgets, QtCore, QtGui
 from functions.utils import (font_creation_function, stylesheet_creation_function, humansize, icon_creation_function,
                              clear_layout, full_path_name_from_treewidget, replace_old_path_by_new_path,
@@ -133,7 +134,7 @@ def file_drop_layout(self):
 def populate_tree_widget(variable_list, variable_dict):
     variable_list.clear()
     for item in sorted(list(variable_dict.keys())):
-        if isinstance(variable_dict[item][0], EgadsData):
+        if is_variable(variable_dict[item][0]):
             if variable_dict[item][2]:
                 item_type = 'dimension'
             else:
@@ -182,7 +183,7 @@ def populate_tree_widget(variable_list, variable_dict):
 
 def update_tree_widget(variable_list, variable_dict):
     for var_name, var_dict in variable_dict.items():
-        if isinstance(var_dict[0], EgadsData) and not var_dict[2]:
+        if is_variable(var_dict[0]) and not var_dict[2]:
             if var_dict[1] is None:
                 icon = icon_creation_function('small_warning_icon.svg')
             else:
@@ -204,7 +205,7 @@ def update_tree_widget(variable_list, variable_dict):
                 var_name = var_name[1:]
             item.setToolTip(0, 'dataset: ' + var_name)
 
-        elif isinstance(var_dict[0], EgadsData) and var_dict[2]:
+        elif is_variable(var_dict[0]) and var_dict[2]:
             item = treewidget_item_from_path(variable_list, var_name)
             item.setIcon(0, icon_creation_function('variable_dimension_icon.svg'))
             if var_name[0] == '/':
@@ -308,7 +309,7 @@ def modify_attribute_gui_var(self, click):
     else:
         path, _ = full_path_name_from_treewidget(self.variable_list)
         if click == 'left':
-            if isinstance(self.list_of_variables_and_attributes[path][0], EgadsData):
+            if is_variable(self.list_of_variables_and_attributes[path][0]):
                 object_type = 'Variable'
             else:
                 object_type = 'Group'
@@ -322,7 +323,7 @@ def modify_attribute_gui_var(self, click):
                     for var, value in self.list_of_variables_and_attributes.items():
                         dim_dict = value[1]
                         modified = False
-                        if isinstance(value[0], EgadsData) and not value[2]:
+                        if is_variable(value[0]) and not value[2]:
                             for dim_path in dim_dict:
                                 if dim_path == path:
                                     dim_dict[new_path] = dim_dict.pop(path)
@@ -410,6 +411,7 @@ def update_icons_state(self):
         self.actionUpdate.setVisible(False)
         self.actionOpenBar.setEnabled(True)
         self.actionSaveAsBar.setEnabled(False)
+        self.actionSaveSession.setEnabled(False)
         self.actionCloseBar.setEnabled(False)
         self.actionAlgorithmsBar.setEnabled(False)
         self.actionCreatealgorithmBar.setEnabled(True)
@@ -422,6 +424,7 @@ def update_icons_state(self):
         self.actionCreate_group.setEnabled(False)
     else:
         self.actionSaveAsBar.setEnabled(True)
+        self.actionSaveSession.setEnabled(True)
         self.actionCloseBar.setEnabled(True)
         self.actionExport.setEnabled(True)
         self.actionAlgorithmsBar.setEnabled(True)
@@ -602,6 +605,11 @@ def create_recent_file_menu(self):
 
 def clear_file_list_in_menu(self):
     self.opened_file_list.clear()
+    try:
+        clear_header_cache(self.user_path)
+    except Exception:
+        logging.exception('gui - gui_global_functions.py - clear_file_list_in_menu : an exception occurred during '
+                          'the removal of the header cache')
     create_recent_file_menu(self)
 
 
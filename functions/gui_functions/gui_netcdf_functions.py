@@ -1,6 +1,6 @@
 import logging
 import os
-from egads import EgadsData
+from functions.file_functions.lazy_loading_functions import is_variable
 from PyQt5 import QtWidgets, QtCore
 from functions.utils import (font_creation_function, clear_layout, icon_creation_function, stylesheet_creation_function,
                              full_path_name_from_treewidget)
@@ -32,7 +32,7 @@ def nc_tree_var_reading(self):
         except KeyError:
             var_object = self.list_of_variables_and_attributes[path[1:]]
         clear_layout(self.metadata_container)
-        if isinstance(var_object[0], EgadsData):
+        if is_variable(var_object[0]):
             add_netcdf_variable_metadata_widgets(self)
         else:
             add_netcdf_group_metadata_widgets(self)
@@ -542,7 +542,7 @@ def update_nc_variable_attribute_gui(self):
     except KeyError:
         sublist = self.list_of_variables_and_attributes[path[1:]]
     dimensions_str = ''
-    if isinstance(sublist[0], EgadsData):
+    if is_variable(sublist[0]):
         self.var_dimensions_lb.setStyleSheet(stylesheet_creation_function('qlabel'))
         self.var_dimensions_lb.setToolTip('')
         if sublist[2]:
@@ -1,4 +1,5 @@
 import math
+import os
 from PyQt5 import QtCore, QtWidgets, QtGui
 from functions.utils import full_path_name_from_treewidget
 from collections import OrderedDict
@@ -188,6 +189,69 @@ class ListWidgetRight(QtWidgets.QListWidget):
             self.rightClick.emit()
 
 
+class FileListModel(QtCore.QAbstractListModel):
+    # files of the batch processing, entries of the file catalog, the name is displayed and the path is the tooltip,
+    # rows can be moved with drag and drop
+    def __init__(self, parent=None):
+        QtCore.QAbstractListModel.__init__(self, parent)
+        self.entries = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.entries)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return os.path.basename(entry['path'])
+        elif role == QtCore.Qt.ToolTipRole:
+            return entry['path']
+        return None
+
+    def flags(self, index):
+        if index.isValid():
+            return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsDragEnabled
+        return QtCore.Qt.ItemIsDropEnabled
+
+    def supportedDropActions(self):
+        return QtCore.Qt.MoveAction
+
+    def moveRows(self, source_parent, source_row, count, destination_parent, destination_child):
+        if destination_child in range(source_row, source_row + count + 1):
+            return False
+        self.beginMoveRows(source_parent, source_row, source_row + count - 1, destination_parent,
+                           destination_child)
+        moved = self.entries[source_row:source_row + count]
+        del self.entries[source_row:source_row + count]
+        if destination_child > source_row:
+            destination_child -= count
+        self.entries[destination_child:destination_child] = moved
+        self.endMoveRows()
+        return True
+
+    def set_entries(self, entries):
+        self.beginResetModel()
+        self.entries = list(entries)
+        self.endResetModel()
+
+    def append_entry(self, entry):
+        self.beginInsertRows(QtCore.QModelIndex(), len(self.entries), len(self.entries))
+        self.entries.append(entry)
+        self.endInsertRows()
+
+    def remove_rows(self, rows):
+        for row in sorted(rows, reverse=True):
+            self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+            del self.entries[row]
+            self.endRemoveRows()
+
+    def file_paths(self):
+        return [entry['path'] for entry in self.entries]
+
+
 class VerticalLabel(QtWidgets.QLabel):
 
     def __init__(self, *args):
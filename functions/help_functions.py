@@ -11,17 +11,19 @@ def option_information_text():
                  'info_button_10': 'This option allows the GUI to check for an update online at '
                                   'startup automatically. The user has the possibility to check '
                                   'manually by clicking on the left button.',
-                 'info_button_1': 'It is possible in EGADS to read the values of a variable '
-                                  'stored in a NASA Ames/NetCDF file as floats. Selecting this '
-                                  'option will ask EGADS to do so. Please read the documentation '
-                                  'of EGADS to have more details.',
+                 'info_button_1': 'Values of a variable are read by default in the type used in the '
+                                  'file (native type). Float 32 bits converts variables of integers '
+                                  'to floats on 4 bytes, variables of floats keep their precision. '
+                                  'Float 64 bits converts all numeric variables to floats on 8 '
+                                  'bytes, as EGADS does when it reads variables as float. The type '
+                                  'of a variable is kept when it is saved in a NetCDF or Hdf file.',
                  'info_button_2': 'By checking this option, EGADS will automatically replace '
                                   'missing values in data by Numpy NaN.',
                  'info_button_3': 'Numpy NaN is for float array only, thus it is not possible to '
                                   'replace missing values in variables composed of integer '
-                                  'values. By checking this option, the user allows EGADS to '
-                                  'switch back to the default option if the read of a variable '
-                                  'fails in this particular situation.',
+                                  'values. By checking this option, the user allows the GUI to '
+                                  'keep the missing values of those variables as they are in the '
+                                  'file.',
                  'info_button_6': 'The user can change the verbose level of the logging system. '
                                   'If an issue is noticed, it is a good idea to change the level '
                                   'to DEBUG and send the log file to the developer.',
@@ -52,7 +54,39 @@ def option_information_text():
                                    'dimension.',
                  'info_button_16': 'With this option, georeferenced gridded data are considered like standard data.',
                  'info_button_17': 'When deleting a dimension, if this option is checked, a warning message will '
-                                   'be displayed.'
+                                   'be displayed.',
+                 'info_button_18': 'By checking this option, the GUI reads only the metadata of a NetCDF or Hdf '
+                                   'file when it is opened (names, shapes, types, attributes and dimensions). '
+                                   'The values of a variable are read from the file the first time they are '
+                                   'needed to display, plot, process or save the variable. It is useful to open '
+                                   'large files quickly, the file stays opened until it is closed in the GUI.',
+                 'info_button_19': 'By checking this option, the values of uncompressed and contiguous variables '
+                                   'stored in NetCDF or Hdf files are mapped from the file instead of being '
+                                   'copied in memory. The system reads the values from the disk only when they '
+                                   'are used, which makes possible the opening of files bigger than the memory. '
+                                   'Modified values are kept in memory, the original file is never modified.',
+                 'info_button_20': 'Number of threads used by the GUI to read the variables of a NetCDF or Hdf '
+                                   'file. With more than one thread, variables compressed with deflate are '
+                                   'decompressed in parallel, which reduces the time to open large compressed '
+                                   'files on a computer with several cores.',
+                 'info_button_21': 'Compression used when variables are saved in NetCDF or Hdf files. With None, '
+                                   'variables are written without compression like before. Fast, Compact and '
+                                   'Archive compress variables with deflate and the shuffle filter at levels 1, 4 '
+                                   'and 9: Fast writes quickly, Archive produces the smallest files but writes '
+                                   'slowly. Compressed variables are split in chunks.',
+                 'info_button_22': 'Number of values along the first dimension, generally the time dimension, in '
+                                   'each chunk of a compressed variable. In automatic mode, the length is computed '
+                                   'to obtain chunks of about 1 MB, which suits a reading of the whole variable or '
+                                   'of a time window. Smaller chunks speed up the reading of short periods, bigger '
+                                   'chunks the reading of the whole variable.',
+                 'info_button_23': 'Maximum memory used to write a variable which hasn\'t been loaded from its '
+                                   'file, when a file is saved or by batch processing. Bigger variables are read '
+                                   'and written in blocks along their first dimension, which makes possible the '
+                                   'saving or the conversion of files bigger than the memory of the computer.',
+                 'info_button_24': 'Number of processes used by batch processing to handle several files at the '
+                                   'same time. With 1, files are processed one after the other like before. The '
+                                   'concatenation always uses one process as all files are written in the same '
+                                   'file. Each process needs the memory to process one file.'
                  }
     return info_dict
 
@@ -132,13 +166,29 @@ def batch_processing_information_text():
                               'the selected process.',
                  'bw_proc_info_1': 'Once a category and an algorithm have been selected, the Algorithm '
                               'options tab will list the different input(s) and output(s).',
+                 'options_info_1': 'Several algorithms can be executed one after the other on each file, without '
+                                   'reading and writing the file again for each of them. Once the inputs and '
+                                   'outputs of an algorithm have been set, add it to the chain, then select the '
+                                   'next algorithm: the outputs of the chain are added to its inputs and are kept '
+                                   'in memory. The algorithm displayed when the processing is launched is the last '
+                                   'one of the chain. The outputs used as inputs by other algorithms can be '
+                                   'left out of the new files.',
                  'bw_info_3': 'In case of error with one or more files, the GUI will decide to '
                               'continue or stop the processing based on this option.',
+                 'bw_info_12': 'Compression of the NetCDF and Hdf files created by the batch processing. By '
+                               'default, the compression selected in the options is used, it can be replaced '
+                               'here for this processing only. Without compression, a conversion between '
+                               'NetCDF and Hdf keeps the compression and the chunks of the original file.',
                  'bw_info_4': 'Select here all the files to be processed. It is possible to '
                               'select a specific format by playing the radiobuttons. If the GUI '
                               'detects files in the selected folder, those files are displayed '
                               'in the list below. Furthermore, it is possible to manipulate the '
-                              'file list with the different buttons on the right of the file list.',
+                              'file list with the different buttons on the right of the file list. '
+                              'With Subfolders, the files of the subfolders are added too. The '
+                              'files can be filtered by the name of a variable they contain and by '
+                              'a time range (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS), the headers of the '
+                              'files are indexed once and kept between sessions, only new or '
+                              'modified files are read again.',
                  'bw_info_5': 'Select here the folder where to save files after the processing.',
                  'bw_info_6': 'If the previous option is selected, the GUI will handle the '
                               'filename automatically. However, if the user wants to manage '
@@ -0,0 +1,233 @@
+import logging
+import os
+import sys
+import copy
+import time
+import tempfile
+import pathlib
+import h5py
+import netCDF4
+from PyQt5 import QtCore
+from functions.file_functions.storage_functions import read_storage_options, compressed
+from functions.file_functions.catalog_functions import file_header, first_line
+from functions.thread_functions.pool_functions import batch_process_number
+from functions.thread_functions.processing_functions import (BatchFileProcessor, batch_method, algorithm_steps,
+                                                             output_path, step_input_path)
+
+
+# dry run of a batch job: the headers of the files give the bytes to read and write, the variables affected and the
+# files which will fail, the throughput measured on a sample file gives the duration of the job
+
+
+variable_types = ['vector', 'array']
+
+
+def variable_bytes(variable):
+    shape, itemsize = variable
+    nbytes = itemsize
+    for size in shape:
+        nbytes *= size
+    return nbytes
+
+
+def file_estimate(batch_dict, header, copy_files):
+    # bytes read and written, variables affected and error of the processing of a file, like the processing does it
+    data_bytes = sum(variable_bytes(variable) for variable in header['variables'].values())
+    estimate = {'path': header['path'], 'read': data_bytes, 'write': data_bytes, 'variables': [],
+                'error': header['error']}
+    if estimate['error'] is not None:
+        return estimate
+    process, file_format = batch_dict['process'], header['format']
+    if file_format == 'NASA Ames' and header['dimensions'] > 1 and process != 2:
+        estimate['error'] = 'NASA Ames files with more than 1 dimension can\'t be processed at this time'
+    elif process == 1:
+        estimate['variables'] = list(header['variables'])
+        if batch_dict.get('concatenation') == 'time' and not header['time_dimension']:
+            estimate['error'] = 'the file doesn\'t contain a time or unlimited dimension'
+    elif process == 2:
+        source_format = batch_dict['processing_options'].split(' -> ')[0]
+        estimate['variables'] = list(header['variables'])
+        if file_format != source_format:
+            estimate['error'] = 'the file isn\'t a ' + source_format + ' file'
+    elif process == 3:
+        targeted_metadata = [metadata[1] for metadata in batch_dict['processing_options']]
+        estimate['variables'] = [key for key in header['attributes'] if key in targeted_metadata]
+        if file_format == 'NASA Ames':
+            estimate['error'] = 'metadata can\'t be deleted from NASA Ames files'
+    elif process == 4:
+        targeted_variable = [variable[0] for variable in batch_dict['processing_options']]
+        estimate['variables'] = [var_path for var_path in header['variables']
+                                 if any(var_path.find(item) == 0 for item in targeted_variable)]
+        estimate['write'] -= sum(variable_bytes(header['variables'][var_path]) for var_path in estimate['variables'])
+    elif process == 5:
+        algorithm_estimate(batch_dict, header, copy_files, estimate)
+    return estimate
+
+
+def algorithm_estimate(batch_dict, header, copy_files, estimate):
+    if header['format'] != batch_dict['out_format']:
+        estimate['error'] = 'the file isn\'t a ' + batch_dict['out_format'] + ' file'
+        return
+    try:
+        steps = algorithm_steps(batch_dict)
+    except Exception as e:
+        estimate['error'] = str(e)
+        return
+    # inputs are read, outputs have the size of the first variable of the inputs in double, inputs are found like the
+    # processing does it
+    inputs, outputs, output_names, intermediates = set(), {}, {}, set()
+    for step in steps:
+        input_types = step['algorithm']().metadata['InputTypes']
+        path_out, output_shape = None, None
+        for index, item in enumerate(step['inputs']):
+            input_type = input_types[index] if index < len(input_types) else ''
+            if not isinstance(item, str) or not any(var_type in input_type for var_type in variable_types):
+                continue
+            var_path, is_output = step_input_path(item, outputs, output_names, header['variables'])
+            if is_output:
+                intermediates.add(var_path)
+                shape = outputs[var_path]
+            elif var_path is not None:
+                inputs.add(var_path)
+                shape = header['variables'][var_path][0]
+            elif 'optional' in input_type:
+                continue
+            else:
+                estimate['error'] = 'the input ' + item + ' of ' + step['algorithm'].__name__ + ' is missing'
+                return
+            if path_out is None:
+                path_out, output_shape = os.path.dirname(var_path), shape
+        for name in step['outputs']:
+            outputs[output_path(path_out, name)] = output_shape if output_shape is not None else ()
+            output_names[name] = output_path(path_out, name)
+    if batch_dict.get('drop_intermediate'):
+        for var_path in intermediates:
+            del outputs[var_path]
+    input_bytes = sum(variable_bytes(header['variables'][var_path]) for var_path in inputs)
+    output_bytes = sum(variable_bytes((shape, 8)) for shape in outputs.values())
+    if copy_files and header['format'] != 'NASA Ames':
+        # the file is copied, then the outputs are written
+        estimate['read'] = header['size'] + input_bytes
+        estimate['write'] = header['size'] + output_bytes
+    else:
+        estimate['read'] += input_bytes
+        estimate['write'] += output_bytes
+    estimate['variables'] = sorted(inputs) + list(outputs)
+
+
+def sample_throughput(batch_dict, config_dict, estimate):
+    # bytes read and written by second when the sample file is processed by the job, in a temporary folder, the
+    # concatenation is measured on the reading of the file
+    file_path = estimate['path']
+    with tempfile.TemporaryDirectory() as temp_folder:
+        start_time = time.perf_counter()
+        if batch_dict['process'] == 1:
+            if file_header(file_path)['format'] == 'NetCDF':
+                with netCDF4.Dataset(file_path, 'r') as nc_file:
+                    for variable in nc_file.variables.values():
+                        variable[:]
+            else:
+                with h5py.File(file_path, 'r') as h5_file:
+                    h5_file.visititems(lambda name, item: item[()] if isinstance(item, h5py.Dataset) else None)
+            duration = time.perf_counter() - start_time
+            return estimate['read'] / max(duration, 1e-6)
+        sample_dict = copy.copy(batch_dict)
+        sample_dict['destination_folder'] = temp_folder
+        storage = read_storage_options(config_dict, batch_dict.get('storage'))
+        method, out_ext = batch_method(batch_dict)
+        filename = 'sample' + (out_ext if out_ext is not None else pathlib.Path(file_path).suffix)
+        result = BatchFileProcessor(sample_dict, config_dict, storage).process(method, 0, file_path, filename)
+        if result[3] is not None:
+            raise Exception('the sample file ' + os.path.basename(file_path) + ' failed: ' + result[3][0] + ': '
+                            + first_line(result[3][1]))
+        return (estimate['read'] + estimate['write']) / max(result[4], 1e-6)
+
+
+def estimate_batch(batch_dict, config_dict, progress=None):
+    logging.debug('gui - estimate_functions.py - estimate_batch')
+    copy_files = not compressed(read_storage_options(config_dict, batch_dict.get('storage')))
+    file_list = batch_dict['file_list']
+    estimates = []
+    for i, file_path in enumerate(file_list):
+        estimates.append(file_estimate(batch_dict, file_header(file_path), copy_files))
+        if progress is not None:
+            progress(i + 1, len(file_list))
+    valid = [estimate for estimate in estimates if estimate['error'] is None]
+    report = {'files': len(file_list), 'failed': [(estimate['path'], estimate['error']) for estimate in estimates
+                                                   if estimate['error'] is not None],
+              'read': sum(estimate['read'] for estimate in valid), 'write': sum(estimate['write'] for estimate in valid),
+              'variables': sorted(set(var_path for estimate in valid for var_path in estimate['variables'])),
+              'processes': 1, 'throughput': None, 'duration': None, 'sample': None, 'sample_error': None}
+    if not valid:
+        return report
+    if batch_dict['process'] != 1:
+        report['processes'] = batch_process_number(config_dict, len(valid))
+    report['sample'] = valid[0]['path']
+    try:
+        report['throughput'] = sample_throughput(batch_dict, config_dict, valid[0])
+        # files are processed at the same time by the processes, the concatenation reads and writes each byte
+        report['duration'] = (report['read'] + report['write']) / report['throughput'] / report['processes']
+    except Exception:
+        etype, evalue, _ = sys.exc_info()
+        report['sample_error'] = etype.__name__ + ': ' + first_line(str(evalue))
+    return report
+
+
+def duration_text(seconds):
+    if seconds < 1:
+        return 'less than 1 s'
+    hours, rest = divmod(int(round(seconds)), 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return str(hours) + ' h ' + str(minutes).zfill(2) + ' min'
+    if minutes:
+        return str(minutes) + ' min ' + str(seconds).zfill(2) + ' s'
+    return str(seconds) + ' s'
+
+
+def report_lines(report, size_function, max_lines=20):
+    # lines of the report displayed by the gui or written by egads_batch.py, without limit if max_lines is None
+    if max_lines is None:
+        max_lines = max(len(report['variables']), len(report['failed']))
+    lines = ['Files: ' + str(report['files']) + ', ' + str(len(report['failed'])) + ' will fail',
+             'To read: ' + size_function(report['read']) + ', to write: ' + size_function(report['write']),
+             'Variables affected: ' + str(len(report['variables']))]
+    lines += ['    ' + var_path for var_path in report['variables'][:max_lines]]
+    if len(report['variables']) > max_lines:
+        lines.append('    ... and ' + str(len(report['variables']) - max_lines) + ' more')
+    if report['duration'] is not None:
+        lines.append('Estimated duration: ' + duration_text(report['duration']) + ' with ' + str(report['processes'])
+                     + (' process (' if report['processes'] == 1 else ' processes (') + size_function(report['throughput']) + '/s measured on '
+                     + os.path.basename(report['sample']) + ')')
+    elif report['sample_error'] is not None:
+        lines.append('Estimated duration: unknown, ' + report['sample_error'])
+    if report['failed']:
+        lines.append('Files which will fail:')
+        lines += ['    ' + os.path.basename(path) + ': ' + error for path, error in report['failed'][:max_lines]]
+        if len(report['failed']) > max_lines:
+            lines.append('    ... and ' + str(len(report['failed']) - max_lines) + ' more')
+    return lines
+
+
+class BatchEstimationThread(QtCore.QThread):
+    progress = QtCore.pyqtSignal(list)
+    error = QtCore.pyqtSignal(list)
+    finished = QtCore.pyqtSignal(dict)
+
+    def __init__(self, batch_dict, config_dict):
+        QtCore.QThread.__init__(self)
+        logging.debug('gui - estimate_functions.py - BatchEstimationThread - __init__')
+        self.batch_dict = batch_dict
+        self.config_dict = config_dict
+
+    def run(self):
+        logging.debug('gui - estimate_functions.py - BatchEstimationThread - run')
+        try:
+            report = estimate_batch(self.batch_dict, self.config_dict,
+                                    lambda done, total: self.progress.emit([str(done) + '/' + str(total), done]))
+        except Exception:
+            logging.exception('gui - estimate_functions.py - BatchEstimationThread - run - an exception occurred')
+            etype, evalue, _ = sys.exc_info()
+            self.error.emit([etype.__name__, str(evalue)])
+            return
+        self.finished.emit(report)
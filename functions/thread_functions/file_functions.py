@@ -10,9 +10,21 @@ import zipfile
 import tempfile
 import sys
 import collections
+import concurrent.futures
 from PyQt5 import QtCore
 import matplotlib as mpl
 from functions.material_functions import transparency_hexa_dict_function
+from functions.file_functions.lazy_loading_functions import (LazyFileSource, is_variable, release_lazy_sources,
+                                                              file_sources)
+from functions.file_functions.nasa_ames_functions import EgadsNasaAmesReader, save_ffi1001_file, write_na_variable
+from functions.file_functions.header_cache_functions import read_header_cache, write_header_cache
+from functions.file_functions.subset_functions import subset_dimension_list
+from functions.file_functions.fill_value_functions import read_egads_variable
+from functions.file_functions.dimension_index_functions import DimensionIndex
+from functions.file_functions.dtype_functions import read_dtype, native_write_formats, add_write_types
+from functions.file_functions.segment_functions import segment_dimension, sort_segments, SegmentedFileSource
+from functions.file_functions.storage_functions import write_egads_variable, add_egads_dim
+from functions.file_functions.session_functions import write_session, read_session
 
 
 class ReadFileThread(QtCore.QThread):
@@ -20,21 +32,31 @@ class ReadFileThread(QtCore.QThread):
     error = QtCore.pyqtSignal(list)
     finished = QtCore.pyqtSignal(dict)
 
-    def __init__(self, file_path, file_ext, config_dict):
+    def __init__(self, file_path, file_ext, config_dict, user_path=None, subset=None):
         QtCore.QThread.__init__(self)
         logging.debug('gui - file_functions.py - ReadFileThread - __init__')
         self.file_path = file_path
         self.file_ext = file_ext
         self.config_dict = config_dict
+        self.user_path = user_path
+        self.subset = subset
 
     def run(self):
         logging.debug('gui - file_functions.py - ReadFileThread - run')
         self.progress.emit(['Standby...', 0])
-        raf = self.config_dict['SYSTEM'].getboolean('read_as_float')
+        rdt = read_dtype(self.config_dict)
         rfv = self.config_dict['SYSTEM'].getboolean('replace_fill_value')
         sfv = self.config_dict['SYSTEM'].getboolean('switch_fill_value')
+        lazy = (self.config_dict['SYSTEM'].getboolean('lazy_loading') and
+                self.file_ext in ['NetCDF Files (*.nc *.cdf)', 'Hdf Files (*.h5 *.hdf5 *.he5)'])
+        reading_threads = self.config_dict['SYSTEM'].getint('reading_threads')
         f = None
-        # dim_list = []
+        source = None
+        executor = None
+        futures = []
+        header_cache = None
+        new_header = None
+        dim_list = {}
         group_list = []
         var_attr_list = {}
         var_list = []
@@ -42,35 +64,76 @@ class ReadFileThread(QtCore.QThread):
         unread_var = {}
         self.progress.emit(['Opening file...', 0])
         try:
+            if lazy and self.user_path is not None:
+                try:
+                    header_cache = read_header_cache(self.user_path, self.file_path)
+                except Exception:
+                    logging.exception('gui - file_functions.py - ReadFileThread : an error occured during the '
+                                      'reading of the header cache')
             if self.file_ext == 'NetCDF Files (*.nc *.cdf)':
                 f = egads.input.EgadsNetCdf(self.file_path, 'r')
-                var_list = f.get_variable_list(group_walk=True, details=True)
-                group_list = f.get_group_list(details=True)
-                glob_attr_list = f.get_attribute_list()
+                if header_cache is None:
+                    var_list = f.get_variable_list(group_walk=True, details=True)
+                    group_list = f.get_group_list(details=True)
+                    glob_attr_list = f.get_attribute_list()
             elif self.file_ext == 'NASA Ames Files (*.na)':
-                f = egads.input.EgadsNasaAmes(self.file_path, 'r')
+                f = EgadsNasaAmesReader(self.file_path, 'r')
                 var_list = sorted(f.get_variable_list() + f.get_variable_list(vartype='independant'))
                 for attribute in f.get_attribute_list():
                     if attribute != 'V' and attribute != 'X':
                         glob_attr_list[attribute] = f.get_attribute_value(attribute)
-                # dim_list = f.get_dimension_list()
+                dim_list = DimensionIndex(f).dimensions()
             elif self.file_ext == 'Hdf Files (*.h5 *.hdf5 *.he5)':
                 f = egads.input.EgadsHdf(self.file_path, 'r')
-                var_list = f.get_variable_list(group_walk=True, details=True)
-                group_list = f.get_group_list(details=True)
-                glob_attr_list = f.get_attribute_list()
+                if header_cache is None:
+                    var_list = f.get_variable_list(group_walk=True, details=True)
+                    group_list = f.get_group_list(details=True)
+                    glob_attr_list = f.get_attribute_list()
+            if header_cache is not None:
+                var_list = list(header_cache['var_list'])
+                group_list = header_cache['group_list']
+                glob_attr_list = header_cache['glob_attr_list']
+            elif lazy and self.user_path is not None and self.subset is None:
+                new_header = {'variables': {}, 'dimensions': {}, 'groups': {}}
+            if self.subset is not None and self.subset['variables'] is not None:
+                var_list = [var for var in var_list if var in self.subset['variables']]
+            if self.file_ext in ['NetCDF Files (*.nc *.cdf)', 'Hdf Files (*.h5 *.hdf5 *.he5)']:
+                source = LazyFileSource(f, self.file_path, self.file_ext, self.config_dict, self.subset)
+                if header_cache is not None:
+                    source.dimensions.update(header_cache['dimensions'])
+                if not lazy and reading_threads > 1:
+                    executor = concurrent.futures.ThreadPoolExecutor(max_workers=reading_threads)
+                    futures = [executor.submit(source.read_variable, var) for var in var_list]
             for i, var in enumerate(var_list):
-                text = 'Reading variable <i>' + var + '</i>...'
+                if lazy:
+                    text = 'Reading metadata of variable <i>' + var + '</i>...'
+                else:
+                    text = 'Reading variable <i>' + var + '</i>...'
                 self.progress.emit([text, math.floor(100 * float(i) / float(len(var_list)))])
                 try:
-                    egads_instance = f.read_variable(var, read_as_float=raf, replace_fill_value=rfv)
+                    if lazy:
+                        if header_cache is not None:
+                            var_header = header_cache['variables'][var]
+                        else:
+                            var_header = source.read_header(var)
+                        egads_instance = source.read_metadata(var, var_header)
+                    elif futures:
+                        egads_instance = futures[i].result()
+                    elif source is not None:
+                        egads_instance = source.read_variable(var)
+                    else:
+                        egads_instance = read_egads_variable(f, var, self.file_ext, rdt, rfv, sfv)
                     if self.file_ext == 'Hdf Files (*.h5 *.hdf5 *.he5)':
                         for attr in ['DIMENSION_LABELS', 'DIMENSION_LIST']:
                             if attr in egads_instance.metadata.keys():
                                 del egads_instance.metadata[attr]
                     is_dim = False
                     if self.file_ext in ['NetCDF Files (*.nc *.cdf)', 'Hdf Files (*.h5 *.hdf5 *.he5)']:
-                        var_dim_list = f.get_dimension_list(str(var), details=True)
+                        var_dim_list = source.read_dimensions(var)
+                        if new_header is not None:
+                            new_header['variables'][var] = var_header
+                            new_header['dimensions'][var] = var_dim_list
+                        var_dim_list = subset_dimension_list(var_dim_list, self.subset)
                         if len(var_dim_list) == 1:
                             if var == list(var_dim_list.keys())[0]:
                                 is_dim = True
@@ -79,11 +142,11 @@ class ReadFileThread(QtCore.QThread):
                         else:
                             var_attr_list[var] = [egads_instance, var_dim_list, is_dim]
                     else:
-                        if var in f.get_dimension_list():
+                        if var in dim_list:
                             var_attr_list['/' + var] = [egads_instance, None, True]
                         else:
                             var_dim_list = collections.OrderedDict()
-                            for dim, shape in f.get_dimension_list().items():
+                            for dim, shape in dim_list.items():
                                 var_dim_list['/' + dim] = shape
                             var_attr_list['/' + var] = [egads_instance, var_dim_list, False]
 
@@ -91,26 +154,7 @@ class ReadFileThread(QtCore.QThread):
                     if 'dimensionality' in str(e):
                         reason = 'unit was not handled properly by EGADS'
                     elif 'cannot convert float NaN to integer' in str(e):
-                        if sfv:
-                            egads_instance = f.read_variable(var, read_as_float=raf, replace_fill_value=False)
-                            if self.file_ext == 'Hdf Files (*.h5 *.hdf5 *.he5)':
-                                for attr in ['DIMENSION_LABELS', 'DIMENSION_LIST']:
-                                    if attr in egads_instance.metadata.keys():
-                                        del egads_instance.metadata[attr]
-                            is_dim = False
-                            if self.file_ext in ['NetCDF Files (*.nc *.cdf)', 'Hdf Files (*.h5 *.hdf5 *.he5)']:
-                                var_dim_list = f.get_dimension_list(str(var), details=True)
-                                if len(var_dim_list) == 1:
-                                    if var == list(var_dim_list.keys())[0]:
-                                        is_dim = True
-                                var_attr_list[var] = [egads_instance, var_dim_list, is_dim]
-                            else:
-                                if var in list(dim_list.keys()):
-                                    is_dim = True
-                                var_attr_list['/' + var] = [egads_instance, f.get_dimension_list(), is_dim]
-                            continue
-                        else:
-                            reason = 'integer can\'t be converted to NaN in INT-type variable'
+                        reason = 'integer can\'t be converted to NaN in INT-type variable'
                     else:
 
                         # add error type
@@ -125,9 +169,28 @@ class ReadFileThread(QtCore.QThread):
 
             if group_list:
                 for group in group_list:
-                    var_attr_list[group] = [f.get_attribute_list(group), None,
+                    if header_cache is not None:
+                        group_attr_list = header_cache['groups'][group]
+                    else:
+                        group_attr_list = f.get_attribute_list(group)
+                    if new_header is not None:
+                        new_header['groups'][group] = group_attr_list
+                    var_attr_list[group] = [group_attr_list, None,
                                             False]
 
+            if header_cache is not None:
+                unread_var = dict(header_cache['unread_var'])
+            elif new_header is not None:
+                new_header.update({'var_list': var_list, 'group_list': group_list, 'glob_attr_list': glob_attr_list,
+                                   'unread_var': unread_var})
+                try:
+                    write_header_cache(self.user_path, self.file_path, new_header)
+                except Exception:
+                    logging.exception('gui - file_functions.py - ReadFileThread : an error occured during the '
+                                      'writing of the header cache')
+
+            if source is not None:
+                f = source
             final_dict = {'unread_var': unread_var, 'opened_file': f, 'var_attr_list': var_attr_list,
                           'glob_attr_list': glob_attr_list}
             self.finished.emit(final_dict)
@@ -136,18 +199,136 @@ class ReadFileThread(QtCore.QThread):
                               'file')
             etype, evalue, _ = sys.exc_info()
             self.error.emit([etype.__name__, str(evalue)])
+        finally:
+            if executor is not None:
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=True)
 
     def stop(self):
         logging.debug('gui - file_functions.py - ReadFileThread - stop')
         self.terminate()
 
 
+class ReadSegmentsThread(QtCore.QThread):
+    progress = QtCore.pyqtSignal(list)
+    error = QtCore.pyqtSignal(list)
+    finished = QtCore.pyqtSignal(dict)
+
+    def __init__(self, file_list, file_ext, config_dict):
+        QtCore.QThread.__init__(self)
+        logging.debug('gui - file_functions.py - ReadSegmentsThread - __init__')
+        self.file_list = file_list
+        self.file_ext = file_ext
+        self.config_dict = config_dict
+
+    def run(self):
+        logging.debug('gui - file_functions.py - ReadSegmentsThread - run')
+        self.progress.emit(['Opening segments...', 0])
+        sources = []
+        var_attr_list = {}
+        unread_var = {}
+        try:
+            for i, file_path in enumerate(self.file_list):
+                self.progress.emit(['Opening segment <i>' + os.path.basename(file_path) + '</i>...',
+                                    math.floor(50 * float(i) / float(len(self.file_list)))])
+                if self.file_ext == 'NetCDF Files (*.nc *.cdf)':
+                    f = egads.input.EgadsNetCdf(file_path, 'r')
+                else:
+                    f = egads.input.EgadsHdf(file_path, 'r')
+                sources.append(LazyFileSource(f, file_path, self.file_ext, self.config_dict))
+            dimension = segment_dimension(sources[0].egads_file)
+            if dimension is None:
+                raise Exception('no unlimited dimension or time coordinate has been found in ' + self.file_list[0]
+                                + ', the segments can\'t be concatenated')
+            source = SegmentedFileSource(sort_segments(sources, dimension), dimension)
+            f = source.sources[0].egads_file
+            var_list = f.get_variable_list(group_walk=True, details=True)
+            group_list = f.get_group_list(details=True)
+            glob_attr_list = f.get_attribute_list()
+            for i, var in enumerate(var_list):
+                self.progress.emit(['Reading metadata of variable <i>' + var + '</i>...',
+                                    50 + math.floor(50 * float(i) / float(len(var_list)))])
+                try:
+                    egads_instance = source.read_metadata(var)
+                    if self.file_ext == 'Hdf Files (*.h5 *.hdf5 *.he5)':
+                        for attr in ['DIMENSION_LABELS', 'DIMENSION_LIST']:
+                            if attr in egads_instance.metadata.keys():
+                                del egads_instance.metadata[attr]
+                    var_dim_list = source.read_dimensions(var)
+                    if list(var_dim_list.keys()) == [var]:
+                        var_attr_list[var] = [egads_instance, None, True]
+                    else:
+                        var_attr_list[var] = [egads_instance, var_dim_list, False]
+                except Exception:
+                    unread_var[var] = 'variable doesn\'t match between segments'
+                    logging.exception('gui - file_functions.py - ReadSegmentsThread : an error occured during the '
+                                      'reading of a variable, variable ' + str(var))
+            for group in group_list:
+                var_attr_list[group] = [f.get_attribute_list(group), None, False]
+            final_dict = {'unread_var': unread_var, 'opened_file': source, 'var_attr_list': var_attr_list,
+                          'glob_attr_list': glob_attr_list}
+            self.finished.emit(final_dict)
+        except Exception:
+            logging.exception('gui - file_functions.py - ReadSegmentsThread : an error occured during the reading of '
+                              'segments')
+            for source in sources:
+                source.close()
+            etype, evalue, _ = sys.exc_info()
+            self.error.emit([etype.__name__, str(evalue)])
+
+    def stop(self):
+        logging.debug('gui - file_functions.py - ReadSegmentsThread - stop')
+        self.terminate()
+
+
+class CatalogScanThread(QtCore.QThread):
+    progress = QtCore.pyqtSignal(list)
+    error = QtCore.pyqtSignal(list)
+    finished = QtCore.pyqtSignal(list)
+    interrupted = QtCore.pyqtSignal()
+
+    def __init__(self, catalog, folder, recursive):
+        QtCore.QThread.__init__(self)
+        logging.debug('gui - file_functions.py - CatalogScanThread - __init__')
+        self.catalog = catalog
+        self.folder = folder
+        self.recursive = recursive
+        self.stopped = False
+
+    def run(self):
+        logging.debug('gui - file_functions.py - CatalogScanThread - run')
+        try:
+            entries = self.catalog.scan(self.folder, self.recursive, self.scan_progress, lambda: self.stopped)
+            # the files already indexed are kept when the scan is stopped
+            self.catalog.save()
+        except Exception:
+            logging.exception('gui - file_functions.py - CatalogScanThread : an error occured during the scan of '
+                              + str(self.folder))
+            etype, evalue, _ = sys.exc_info()
+            self.error.emit([etype.__name__, str(evalue)])
+            return
+        if entries is None:
+            self.interrupted.emit()
+        else:
+            self.finished.emit(entries)
+
+    def scan_progress(self, done, total):
+        # the files already indexed are read in a few microseconds, the gui isn't updated for each of them
+        if done % 20 == 0 or done == total:
+            self.progress.emit([done, total])
+
+    def stop(self):
+        logging.debug('gui - file_functions.py - CatalogScanThread - stop')
+        self.stopped = True
+
+
 class SaveFileThread(QtCore.QThread):
     progress = QtCore.pyqtSignal(list)
     error = QtCore.pyqtSignal(list)
     finished = QtCore.pyqtSignal()
 
-    def __init__(self, file_name, file_ext, open_file_ext, glob_attr, var_dict):
+    def __init__(self, file_name, file_ext, open_file_ext, glob_attr, var_dict, changes=None, storage=None):
         QtCore.QThread.__init__(self)
         logging.debug('gui - file_functions.py - SaveFileThread - __init__')
         self.file_name = file_name
@@ -155,9 +336,23 @@ class SaveFileThread(QtCore.QThread):
         self.open_file_ext = open_file_ext
         self.glob_attr = glob_attr
         self.var_dict = var_dict
+        self.changes = changes
+        self.storage = storage
 
     def run(self):
         logging.debug('gui - file_functions.py - SaveFileThread - run')
+        if self.changes is not None:
+            self.run_update()
+            return
+        try:
+            self.progress.emit(['Loading variables from the original file...', 0])
+            release_lazy_sources(self.var_dict, self.file_name)
+        except Exception:
+            logging.exception('gui - file_functions.py - SaveFileThread : an error occured during the loading of '
+                              'variables from the original file')
+            etype, evalue, _ = sys.exc_info()
+            self.error.emit([etype.__name__, str(evalue)])
+            return
         if self.file_ext == 'NetCDF Files (*.nc *.cdf)':
             self.run_netcdf()
         elif self.file_ext == 'Hdf Files (*.h5 *.hdf5 *.he5)':
@@ -165,26 +360,123 @@ class SaveFileThread(QtCore.QThread):
         elif self.file_ext == 'NASA Ames Files (*.na)':
             self.run_nasaames()
 
+    def run_update(self):
+        # only what has been modified since the file has been opened or saved is written, the file is updated in
+        # place and the values of the other variables are not read or written again
+        logging.debug('gui - file_functions.py - SaveFileThread - run_update')
+        format_dict = {'int32': 'int', 'float64': 'double', 'float32': 'float', 'int16': 'short', 'int8': 'byte',
+                       'str': 'char', 'unicode': 'char', 'str_': 'char', 'unicode_': 'char',
+                       **native_write_formats}
+        sources = []
+        new_file = None
+        error = None
+        try:
+            self.progress.emit(['Standby...', 0])
+            step_val = 100. / (4 + len(self.changes['variables']))
+            prog_val = step_val
+            sources = file_sources(self.var_dict, self.file_name)
+            for source in sources:
+                source.close()
+            if self.file_ext == 'NetCDF Files (*.nc *.cdf)':
+                new_file = egads.input.EgadsNetCdf(self.file_name, 'a')
+            else:
+                new_file = egads.input.EgadsHdf(self.file_name, 'a')
+            add_write_types(new_file)
+
+            # global attributes
+            self.progress.emit(['Updating global attributes...', int(prog_val)])
+            set_attributes, deleted_attributes = self.changes['global_attributes']
+            for key, value in set_attributes.items():
+                try:
+                    new_file.add_attribute(key, float(value))
+                except ValueError:
+                    new_file.add_attribute(key, str(value))
+            for key in deleted_attributes:
+                new_file.delete_attribute(key)
+
+            # groups
+            prog_val += step_val
+            self.progress.emit(['Adding groups...', int(prog_val)])
+            for var_name in sorted(self.changes['groups']):
+                new_file.add_group(var_name)
+                for attr_name, attr_value in self.var_dict[var_name][0].items():
+                    new_file.add_attribute(attr_name, attr_value, var_name)
+
+            # attributes of variables and groups
+            prog_val += step_val
+            self.progress.emit(['Updating attributes...', int(prog_val)])
+            for var_name, (set_attributes, deleted_attributes) in self.changes['attributes'].items():
+                for key, value in set_attributes.items():
+                    new_file.add_attribute(key, value, var_name)
+                for key in deleted_attributes:
+                    new_file.delete_attribute(key, var_name)
+
+            # new variables
+            for var_name in self.changes['variables']:
+                prog_val += step_val
+                self.progress.emit(['Adding variable ' + var_name + '...', int(prog_val)])
+                var_sublist = self.var_dict[var_name]
+                create_variable = var_sublist[1] is not None
+                if create_variable:
+                    for dim in var_sublist[1]:
+                        if 'no dimension' in dim or os.path.dirname(var_name) != os.path.dirname(dim):
+                            create_variable = False
+                if create_variable:
+                    dim_tuple = tuple([os.path.basename(key) for key in var_sublist[1]])
+                    try:
+                        var_format = format_dict[var_sublist[0].dtype.name]
+                    except KeyError:
+                        var_format = 'double'
+                    write_egads_variable(new_file, var_sublist[0], var_name, dim_tuple, var_format, self.storage)
+
+            prog_val += step_val
+            self.progress.emit(['Closing file...', int(prog_val)])
+            new_file.close()
+        except Exception:
+            logging.exception('gui - file_functions.py - SaveFileThread : an error occured during the '
+                              'update of a file')
+            etype, evalue, _ = sys.exc_info()
+            error = [etype.__name__, str(evalue)]
+        finally:
+            if new_file is not None:
+                new_file.close()
+            # variables not read yet are read again from the file before the workspace is given back to the user
+            for source in sources:
+                try:
+                    source.reopen()
+                except Exception:
+                    logging.exception('gui - file_functions.py - SaveFileThread : an error occured during the '
+                                      'reopening of the file')
+                    if error is None:
+                        etype, evalue, _ = sys.exc_info()
+                        error = [etype.__name__, str(evalue)]
+        if error is None:
+            self.finished.emit()
+        else:
+            self.error.emit(error)
+
     def run_netcdf(self):
         format_dict = {'int32': 'int', 'float64': 'double', 'float32': 'float', 'int16': 'short', 'int8': 'byte',
-                       'str': 'char', 'unicode': 'char', 'str_': 'char', 'unicode_': 'char'}
+                       'str': 'char', 'unicode': 'char', 'str_': 'char', 'unicode_': 'char',
+                       **native_write_formats}
         if self.open_file_ext in ['NetCDF Files (*.nc *.cdf)', 'Hdf Files (*.h5 *.hdf5 *.he5)']:
             try:
                 self.progress.emit(['Standby...', 0])
                 var_nbr, prog_val = 0, 0
                 for val in self.var_dict.values():
-                    if isinstance(val[0], egads.EgadsData):
+                    if is_variable(val[0]):
                         var_nbr += 1
                 step_val = 100. / (5 + var_nbr)
 
                 # file creation
                 new_file = egads.input.EgadsNetCdf(self.file_name, 'w')
+                add_write_types(new_file)
 
                 # groups
                 prog_val += step_val
                 self.progress.emit(['Adding groups...', int(prog_val)])
                 for var_name, var_sublist in sorted(self.var_dict.items()):
-                    if not isinstance(var_sublist[0], egads.EgadsData):
+                    if not is_variable(var_sublist[0]):
                         new_file.add_group(var_name)
                         for attr_name, attr_value in self.var_dict[var_name][0].items():
                             new_file.add_attribute(attr_name, attr_value, var_name)
@@ -221,7 +513,7 @@ class SaveFileThread(QtCore.QThread):
 
                 # variables
                 for var_name, var_sublist in self.var_dict.items():
-                    if isinstance(var_sublist[0], egads.EgadsData):
+                    if is_variable(var_sublist[0]):
                         prog_val += step_val
                         self.progress.emit(['Adding variable ' + var_name + '...', int(prog_val)])
                         data = var_sublist[0]
@@ -246,10 +538,10 @@ class SaveFileThread(QtCore.QThread):
 
                         if create_variable:
                             try:
-                                var_format = format_dict[str(data.value.dtype)]
+                                var_format = format_dict[data.dtype.name]
                             except KeyError:
                                 var_format = 'double'
-                            new_file.write_variable(data, var_name, dim_tuple, var_format)
+                            write_egads_variable(new_file, data, var_name, dim_tuple, var_format, self.storage)
 
                 # close file
                 prog_val += step_val
@@ -266,7 +558,7 @@ class SaveFileThread(QtCore.QThread):
                 self.progress.emit(['Standby...', 0])
                 var_nbr, prog_val = 0, 0
                 for val in self.var_dict.values():
-                    if isinstance(val[0], egads.EgadsData):
+                    if is_variable(val[0]):
                         var_nbr += 1
                 step_val = 100. / (4 + var_nbr)
                 prog_val += step_val
@@ -300,6 +592,7 @@ class SaveFileThread(QtCore.QThread):
                     if ncom[-1:] == '\n':
                         ncom = ncom[:-1]
                 new_file = egads.input.EgadsNetCdf(self.file_name, 'w')
+                add_write_types(new_file)
                 new_file.add_attribute('Conventions', 'CF-1.0')
                 new_file.add_attribute('title', title)
                 new_file.add_attribute('source', source)
@@ -344,10 +637,10 @@ class SaveFileThread(QtCore.QThread):
                             dim_tuple = tuple(dim_tuple)
                     if create_variable:
                         try:
-                            var_format = format_dict[str(var_dict[0].value.dtype)]
+                            var_format = format_dict[var_dict[0].dtype.name]
                         except KeyError:
                             var_format = 'double'
-                        new_file.write_variable(var_dict[0], var_name, dim_tuple, var_format)
+                        write_egads_variable(new_file, var_dict[0], var_name, dim_tuple, var_format, self.storage)
 
                 prog_val += step_val
                 self.progress.emit(['Closing NetCdf file...', int(prog_val)])
@@ -361,21 +654,23 @@ class SaveFileThread(QtCore.QThread):
 
     def run_hdf(self):
         format_dict = {'int32': 'int', 'float64': 'double', 'float32': 'float', 'int16': 'short', 'int8': 'byte',
-                       'str': 'char', 'unicode': 'char', 'str_': 'char', 'unicode_': 'char'}
+                       'str': 'char', 'unicode': 'char', 'str_': 'char', 'unicode_': 'char',
+                       **native_write_formats}
         if self.open_file_ext in ['NetCDF Files (*.nc *.cdf)', 'Hdf Files (*.h5 *.hdf5 *.he5)']:
             try:
                 self.progress.emit(['Standby...', 0])
                 var_nbr, prog_val = 0, 0
                 for val in self.var_dict.values():
-                    if isinstance(val[0], egads.EgadsData):
+                    if is_variable(val[0]):
                         var_nbr += 1
                 step_val = 100. / (5 + var_nbr)
                 new_file = egads.input.EgadsHdf(self.file_name, 'w')
+                add_write_types(new_file)
                 prog_val += step_val
                 self.progress.emit(['Adding groups...', int(prog_val)])
 
                 for var_name, var_sublist in sorted(self.var_dict.items()):
-                    if not isinstance(var_sublist[0], egads.EgadsData):
+                    if not is_variable(var_sublist[0]):
                         new_file.add_group(var_name)
                         for attr_name, attr_value in var_sublist[0].items():
                             new_file.add_attribute(attr_name, attr_value, var_name)
@@ -400,9 +695,9 @@ class SaveFileThread(QtCore.QThread):
                     if var_sublist[2]:
                         prog_val += step_val
                         self.progress.emit(['Adding dimensions...', int(prog_val)])
-                        new_file.add_dim(var_name, var_sublist[0])
+                        add_egads_dim(new_file, var_name, var_sublist[0], self.storage)
                 for var_name, var_sublist in self.var_dict.items():
-                    if isinstance(var_sublist[0], egads.EgadsData) and not var_sublist[2]:
+                    if is_variable(var_sublist[0]) and not var_sublist[2]:
                         prog_val += step_val
                         self.progress.emit(['Adding variable ' + var_name + '...', int(prog_val)])
 
@@ -422,10 +717,11 @@ class SaveFileThread(QtCore.QThread):
 
                             dimensions_tuple = tuple([os.path.basename(key) for key in var_sublist[1]])
                             try:
-                                var_format = format_dict[str(var_sublist[0].value.dtype)]
+                                var_format = format_dict[var_sublist[0].dtype.name]
                             except KeyError:
                                 var_format = 'double'
-                            new_file.write_variable(var_sublist[0], var_name, dimensions_tuple, var_format)
+                            write_egads_variable(new_file, var_sublist[0], var_name, dimensions_tuple, var_format,
+                                                 self.storage)
                 prog_val += step_val
                 self.progress.emit(['Closing Hdf file...', int(prog_val)])
                 new_file.close()
@@ -440,7 +736,7 @@ class SaveFileThread(QtCore.QThread):
                 self.progress.emit(['Standby...', 0])
                 var_nbr, prog_val = 0, 0
                 for val in self.var_dict.values():
-                    if isinstance(val[0], egads.EgadsData):
+                    if is_variable(val[0]):
                         var_nbr += 1
                 step_val = 100. / (4 + var_nbr)
                 prog_val += step_val
@@ -474,6 +770,7 @@ class SaveFileThread(QtCore.QThread):
                     if ncom[-1:] == '\n':
                         ncom = ncom[:-1]
                 new_file = egads.input.EgadsHdf(self.file_name, 'w')
+                add_write_types(new_file)
                 new_file.add_attribute('Conventions', 'CF-1.0')
                 new_file.add_attribute('title', title)
                 new_file.add_attribute('source', source)
@@ -487,7 +784,7 @@ class SaveFileThread(QtCore.QThread):
                 self.progress.emit(['Adding dimensions...', int(prog_val)])
                 for var, sublist in self.var_dict.items():
                     if sublist[2]:
-                        new_file.add_dim(var, sublist[0])
+                        add_egads_dim(new_file, var, sublist[0], self.storage)
                 for var, sublist in self.var_dict.items():
                     if not sublist[2]:
                         prog_val += step_val
@@ -512,10 +809,10 @@ class SaveFileThread(QtCore.QThread):
                                 dim_tuple = tuple(sublist[1].keys())
                         if create_variable:
                             try:
-                                var_format = format_dict[str(sublist[0].value.dtype)]
+                                var_format = format_dict[sublist[0].dtype.name]
                             except KeyError:
                                 var_format = 'double'
-                            new_file.write_variable(sublist[0], var, dim_tuple, var_format)
+                            write_egads_variable(new_file, sublist[0], var, dim_tuple, var_format, self.storage)
                 self.progress.emit(['Closing Hdf file...', int(prog_val)])
                 new_file.close()
                 self.finished.emit()
@@ -531,7 +828,7 @@ class SaveFileThread(QtCore.QThread):
                 self.progress.emit(['Standby...', 0])
                 var_nbr, prog_val = 0, 0
                 for val in self.var_dict.values():
-                    if isinstance(val[0], egads.EgadsData):
+                    if is_variable(val[0]):
                         var_nbr += 1
                 step_val = 100. / (6 + var_nbr)
                 new_file = egads.input.EgadsNasaAmes()
@@ -572,7 +869,7 @@ class SaveFileThread(QtCore.QThread):
                             ivar = ivar[1:]
                         name_string += ivar + '    '
                         data = sublist[0]
-                        new_file.write_variable(data, ivar, vartype='independant', na_dict=na_dict)
+                        write_na_variable(new_file, data, vartype='independant', varname=ivar, na_dict=na_dict)
                         niv += 1
                         if 'time' in ivar:
                             units = data.metadata['units']
@@ -638,7 +935,7 @@ class SaveFileThread(QtCore.QThread):
 
                             if var[0] == '/':
                                 var = var[1:]
-                            new_file.write_variable(sublist[0], var, na_dict=na_dict)
+                            write_na_variable(new_file, sublist[0], varname=var, na_dict=na_dict)
                             first_line = True
                             for metadata in sublist[0].metadata:
                                 if metadata != '_FillValue' and metadata != 'scale_factor' and metadata != \
@@ -660,7 +957,7 @@ class SaveFileThread(QtCore.QThread):
                 new_file.write_attribute_value('NCOM', ncom, na_dict=na_dict)
                 new_file.write_attribute_value('NSCOML', len(scom), na_dict=na_dict)
                 new_file.write_attribute_value('NNCOML', len(ncom), na_dict=na_dict)
-                new_file.save_na_file(self.file_name, na_dict)
+                save_ffi1001_file(new_file, self.file_name, na_dict)
                 self.progress.emit(['Closing NasaAmes file...', 100])
                 new_file.close()
                 self.finished.emit()
@@ -674,7 +971,7 @@ class SaveFileThread(QtCore.QThread):
                 self.progress.emit(['Standby...', 0])
                 var_nbr, prog_val = 0, 0
                 for val in self.var_dict.values():
-                    if isinstance(val[0], egads.EgadsData):
+                    if is_variable(val[0]):
                         var_nbr += 1
                 step_val = 100. / (3 + var_nbr)
                 new_file = egads.input.EgadsNasaAmes()
@@ -695,7 +992,7 @@ class SaveFileThread(QtCore.QThread):
                     if sublist[2]:
                         prog_val += step_val
                         self.progress.emit(['Adding dimension ' + name + '...', int(prog_val)])
-                        new_file.write_variable(sublist[0], vartype="independant", na_dict=na_dict)
+                        write_na_variable(new_file, sublist[0], vartype="independant", na_dict=na_dict)
                     else:
                         prog_val += step_val
                         self.progress.emit(['Adding variable ' + name + '...', int(prog_val)])
@@ -714,9 +1011,9 @@ class SaveFileThread(QtCore.QThread):
 
                         if create_variable:
 
-                            new_file.write_variable(sublist[0], vartype="main", na_dict=na_dict)
+                            write_na_variable(new_file, sublist[0], vartype="main", na_dict=na_dict)
                 self.progress.emit(['Closing NasaAmes file...', 100])
-                new_file.save_na_file(self.file_name, na_dict)
+                save_ffi1001_file(new_file, self.file_name, na_dict)
                 new_file.close()
                 self.finished.emit()
             except Exception:
@@ -730,6 +1027,66 @@ class SaveFileThread(QtCore.QThread):
         self.terminate()
 
 
+class SaveSessionThread(QtCore.QThread):
+    progress = QtCore.pyqtSignal(list)
+    error = QtCore.pyqtSignal(list)
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self, file_name, workspace, var_dict, storage):
+        QtCore.QThread.__init__(self)
+        logging.debug('gui - file_functions.py - SaveSessionThread - __init__')
+        self.file_name = file_name
+        self.workspace = workspace
+        self.var_dict = var_dict
+        self.storage = storage
+
+    def run(self):
+        logging.debug('gui - file_functions.py - SaveSessionThread - run')
+        try:
+            self.progress.emit(['Standby...', 0])
+            # a session file can be saved over the session it has been restored from
+            release_lazy_sources(self.var_dict, self.file_name)
+            write_session(self.file_name, self.workspace, self.var_dict, self.storage,
+                          lambda path, i: self.progress.emit(['Writing <i>' + path + '</i>...',
+                                                              math.floor(100 * float(i) / len(self.var_dict))]))
+            self.finished.emit()
+        except Exception:
+            logging.exception('gui - file_functions.py - SaveSessionThread : an error occured during the saving of '
+                              'a session')
+            etype, evalue, _ = sys.exc_info()
+            self.error.emit([etype.__name__, str(evalue)])
+
+    def stop(self):
+        logging.debug('gui - file_functions.py - SaveSessionThread - stop')
+        self.terminate()
+
+
+class RestoreSessionThread(QtCore.QThread):
+    progress = QtCore.pyqtSignal(list)
+    error = QtCore.pyqtSignal(list)
+    finished = QtCore.pyqtSignal(dict)
+
+    def __init__(self, file_name):
+        QtCore.QThread.__init__(self)
+        logging.debug('gui - file_functions.py - RestoreSessionThread - __init__')
+        self.file_name = file_name
+
+    def run(self):
+        logging.debug('gui - file_functions.py - RestoreSessionThread - run')
+        try:
+            self.progress.emit(['Restoring session...', 0])
+            self.finished.emit(read_session(self.file_name))
+        except Exception:
+            logging.exception('gui - file_functions.py - RestoreSessionThread : an error occured during the '
+                              'restoration of a session')
+            etype, evalue, _ = sys.exc_info()
+            self.error.emit([etype.__name__, str(evalue)])
+
+    def stop(self):
+        logging.debug('gui - file_functions.py - RestoreSessionThread - stop')
+        self.terminate()
+
+
 class ExportThread(QtCore.QThread):
     error = QtCore.pyqtSignal()
     finished = QtCore.pyqtSignal()
@@ -0,0 +1,50 @@
+import os
+
+
+# number of processes used by the batch processing, 'auto' uses all processors of the computer
+batch_process_counts = ['1', '2', '4', '8', '16', '32', 'auto']
+
+# processor, stop and resume events of a process of the pool, set once when the process starts
+batch_processor = None
+stop_event = None
+resume_event = None
+
+
+def read_batch_processes(config_dict):
+    processes = config_dict['SYSTEM'].get('batch_processes', '1')
+    if processes not in batch_process_counts:
+        processes = '1'
+    return processes
+
+
+def batch_process_budget(config_dict):
+    # processes of all the batch jobs running at the same time
+    processes = read_batch_processes(config_dict)
+    if processes == 'auto':
+        return os.cpu_count() or 1
+    return int(processes)
+
+
+def batch_process_number(config_dict, file_nbr, limit=None):
+    processes = batch_process_budget(config_dict)
+    if limit is not None:
+        processes = min(processes, limit)
+    return max(1, min(processes, file_nbr))
+
+
+def init_batch_worker(processor, event, resume=None):
+    global batch_processor, stop_event, resume_event
+    batch_processor = processor
+    stop_event = event
+    resume_event = resume
+
+
+def run_batch_task(task):
+    # a paused job waits before the next file, once the processing has to stop, the remaining files are returned
+    # without message and error to be skipped
+    method, file_nbr, file_path, filename = task
+    if resume_event is not None:
+        resume_event.wait()
+    if stop_event.is_set():
+        return file_nbr, file_path, None, None, None
+    return batch_processor.process(method, file_nbr, file_path, filename)
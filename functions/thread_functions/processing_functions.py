@@ -5,8 +5,25 @@ import os
 import egads
 import math
 import copy
+import shutil
 import sys
+import time
+import threading
+import traceback
+import multiprocessing
 from PyQt5 import QtCore, QtWidgets
+from functions.file_functions.lazy_loading_functions import load_egads_data, raw_file_source
+from functions.file_functions.nasa_ames_functions import NasaAmesReader, EgadsNasaAmesReader, save_ffi1001_file
+from functions.file_functions.fill_value_functions import read_egads_variable
+from functions.file_functions.dimension_index_functions import DimensionIndex
+from functions.file_functions.dtype_functions import read_dtype, native_write_formats, add_write_types
+from functions.file_functions.storage_functions import (read_storage_options, write_egads_variable, add_egads_dim,
+                                                        compressed)
+from functions.file_functions.conversion_functions import netcdf_to_hdf, hdf_to_netcdf, conversion_rate
+from functions.file_functions.manifest_functions import BatchManifest, batch_job
+from functions.file_functions.concatenation_functions import (NetcdfTimeConcatenation, HdfTimeConcatenation,
+                                                              sort_time_segments)
+from functions.thread_functions.pool_functions import batch_process_number, init_batch_worker, run_batch_task
 
 
 class VariableProcessingThread(QtCore.QThread):
@@ -36,7 +53,7 @@ class VariableProcessingThread(QtCore.QThread):
             for index, item in enumerate(self.list_combobox_input):
                 if isinstance(item, QtWidgets.QComboBox):
                     sublist = self.list_of_variables_and_attributes['/' + item.currentText()]
-                    args.append(sublist[0])
+                    args.append(load_egads_data(sublist[0]))
                     # if first_var:
                     #     dimension_out = sublist[1]
                     #     if os.path.dirname(item.currentText()) == '/':
@@ -72,646 +89,558 @@ class VariableProcessingThread(QtCore.QThread):
         self.terminate()
 
 
-class BatchProcessingThread(QtCore.QThread):
-    progress = QtCore.pyqtSignal(list)
-    error = QtCore.pyqtSignal(list)
-    finished = QtCore.pyqtSignal()
-
-    def __init__(self, batch_dict, config_dict):
-        QtCore.QThread.__init__(self)
-        logging.debug('gui - file_functions.py - BatchProcessingThread - __init__')
+class BatchFileProcessor(object):
+    # processing of one file of the batch processing, an instance is sent to each process of the pool, each method
+    # writes the new file and returns the message displayed in the progress window
+    def __init__(self, batch_dict, config_dict, storage):
         self.batch_dict = batch_dict
         self.config_dict = config_dict
+        self.storage = storage
+        # without compression, the variables which are not modified are copied with the file
+        self.copy_files = not compressed(storage)
+        self.format_dict = {'int32': 'int', 'float64': 'double', 'float32': 'float', 'int16': 'short',
+                            'int8': 'byte', 'str': 'char', 'unicode': 'char', 'str_': 'char', 'unicode_': 'char',
+                            **native_write_formats}
+
+    def process(self, method, file_nbr, file_path, filename):
+        start_time = time.perf_counter()
+        try:
+            new_path = os.path.join(self.batch_dict['destination_folder'], filename)
+            message = getattr(self, method)(file_path, new_path)
+            return file_nbr, file_path, message, None, time.perf_counter() - start_time
+        except Exception:
+            etype, evalue, _ = sys.exc_info()
+            return (file_nbr, file_path, None, [etype.__name__, str(evalue), traceback.format_exc()],
+                    time.perf_counter() - start_time)
 
-    def run(self):
-        logging.debug('gui - file_functions.py - BatchProcessingThread - run')
-        if self.batch_dict['process'] == 1:
-            self.concatenate_files()
-        elif self.batch_dict['process'] == 2:
-            self.file_conversion()
-        elif self.batch_dict['process'] == 3:
-            self.delete_metadata()
-        elif self.batch_dict['process'] == 4:
-            self.delete_variable()
-        elif self.batch_dict['process'] == 5:
-            self.algorithm_processing()
-
-    def algorithm_processing(self):
-        logging.debug('gui - file_functions.py - BatchProcessingThread - algorithm_processing')
-        self.progress.emit(['Standby...', 0])
-        read_as_float = self.config_dict['SYSTEM'].getboolean('read_as_float')
-        replace_fill_value = self.config_dict['SYSTEM'].getboolean('replace_fill_value')
-        switch_fill_value = self.config_dict['SYSTEM'].getboolean('switch_fill_value')
-        format_dict = {'int32': 'int', 'float64': 'double', 'float32': 'float', 'int16': 'short',
-                       'int8': 'byte', 'str': 'char', 'unicode': 'char', 'str_': 'char', 'unicode_': 'char'}
-        stop_processing = self.batch_dict['stop_processing']
-        dest_folder = self.batch_dict['destination_folder']
-        algorithm = self.batch_dict['algorithm']
-        input_output = self.batch_dict['processing_options']
+    def var_format(self, dtype):
+        try:
+            return self.format_dict[str(dtype)]
+        except KeyError:
+            return 'double'
+
+    def algorithm_processing(self, file_path, new_path):
         out_format = self.batch_dict['out_format']
-        error = False
-        f = None
-        filename_base, start_nbr, digit_nbr = self.set_filename_base()
-        etype, evalue = None, None
-        for i, file_path in enumerate(self.batch_dict['file_list']):
-            try:
-                self.progress.emit([os.path.split(file_path)[1],
-                                    math.floor(100 * float(i) / float(len(self.batch_dict['file_list'])))])
-                ext = pathlib.Path(file_path).suffix
-                filename = self.set_filename(file_path, ext, filename_base, start_nbr, digit_nbr)
-                if out_format in ['NetCDF', 'HDF5']:
+        steps = algorithm_steps(self.batch_dict)
+        f, new_file = None, None
+        try:
+            if out_format in ['NetCDF', 'HDF5']:
+                if out_format == 'NetCDF':
+                    f = egads.input.EgadsNetCdf(file_path, 'r')
+                    file_ext = 'NetCDF Files (*.nc *.cdf)'
+                else:
+                    f = egads.input.EgadsHdf(file_path, 'r')
+                    file_ext = 'Hdf Files (*.h5 *.hdf5 *.he5)'
+                dimension_index = DimensionIndex(f)
+                var_list = [var_path for var_path in f.get_variable_list(group_walk=True, details=True)]
+                outputs = self.run_algorithm_steps(f, file_ext, var_list, steps, dimension_index)
+                if not self.copy_files:
+                    new_file = self.rewrite_file(f, file_path, new_path, dimension_index, var_list)
+                else:
+                    # the other variables are not read, only the outputs of the algorithms are written
+                    f.close()
+                    shutil.copyfile(file_path, new_path)
                     if out_format == 'NetCDF':
-                        f = egads.input.EgadsNetCdf(file_path, 'r')
+                        new_file = egads.input.EgadsNetCdf(new_path, 'a')
                     else:
-                        f = egads.input.EgadsHdf(file_path, 'r')
-                    var_list = [var_path for var_path in f.get_variable_list(group_walk=True, details=True)]
-                    args = []
-                    dimension_out = None
-                    path_out = None
-                    first_var = True
-                    for item in input_output['inputs']:
-                        if item in var_list:
-                            try:
-                                data = f.read_variable(str(item), read_as_float=read_as_float,
-                                                       replace_fill_value=replace_fill_value)
-                                args.append(data)
-                            except ValueError as ve:
-                                if 'cannot convert float NaN to integer' in str(ve):
-                                    if switch_fill_value:
-                                        data = f.read_variable(str(item), read_as_float=read_as_float,
-                                                               replace_fill_value=False)
-                                        args.append(data)
-                                    else:
-                                        raise Exception('cannot convert float NaN to integer')
-                                else:
-                                    raise Exception('')
-                            if first_var:
-                                dimension_out = f.get_dimension_list(str(item))
-                                path_out = os.path.dirname(str(item))
-                                first_var = False
-                        else:
-                            args.append(item)
-                        output = algorithm().run(*args)
-                        if out_format == 'NetCDF':
-                            new_file = egads.input.EgadsNetCdf(str(pathlib.Path(dest_folder).joinpath(filename)), 'w')
-                        else:
-                            new_file = egads.input.EgadsHdf(str(pathlib.Path(dest_folder).joinpath(filename)), 'w')
-
-                        # global attributes
-                        for key, value in f.get_attribute_list().items():
-                            new_file.add_attribute(key, value)
-
-                        # groups
-                        for group_path in f.get_group_list(details=True):
-                            new_file.add_group(group_path)
-                            for key, val in f.get_attribute_list(group_path).items():
-                                new_file.add_attribute(key, val, group_path)
-
-                        # dimensions
-                        dim_list = []
-                        for dim_path, size in f.get_dimension_list(group_walk=True, details=True).items():
-                            if out_format == 'NetCDF':
-                                new_file.add_dim(dim_path, size)
-                            else:
-                                dim_list.append(dim_path)
-                                new_file.add_dim(dim_path, f.read_variable(dim_path))
-
-                        # variables
-                        for var_path in var_list:
-                            if var_path not in dim_list:
-                                var_data = f.read_variable(var_path)
-                                dim_tuple = tuple([key for key in f.get_dimension_list(var_path)])
-                                try:
-                                    var_format = format_dict[str(var_data.value.dtype)]
-                                except KeyError:
-                                    var_format = 'double'
-                                new_file.write_variable(var_data, var_path, dim_tuple, var_format)
-                        dim_tuple = tuple([key for key in dimension_out])
-                        if isinstance(output, tuple):
-                            for index, var in enumerate(output):
-                                if path_out != '/':
-                                    var_name = path_out + '/' + input_output['outputs'][index]
-                                else:
-                                    var_name = path_out + input_output['outputs'][index]
-                                try:
-                                    var_format = format_dict[str(var.value.dtype)]
-                                except KeyError:
-                                    var_format = 'double'
-                                new_file.write_variable(var, var_name, dim_tuple, var_format)
+                        new_file = egads.input.EgadsHdf(new_path, 'a')
+                    add_write_types(new_file)
+                for var_name, (var, dimension_out) in outputs.items():
+                    write_egads_variable(new_file, var, var_name, tuple(dimension_out),
+                                         self.var_format(var.value.dtype), self.storage)
+            else:
+                f = NasaAmesReader(file_path, 'r')
+                if len(f.get_dimension_list()) > 1:
+                    raise Exception('NASA Ames files with more than 1 dimension can\'t be processed at this time')
+                var_list = f.get_variable_list() + f.get_variable_list(vartype='independant')
+                outputs = self.run_algorithm_steps(f, 'NASA Ames Files (*.na)', var_list, steps)
+                na_dict = copy.deepcopy(f.na_dict)
+                for var_name, (var, _) in outputs.items():
+                    f.write_variable(var, varname=var_name, vartype="main", na_dict=na_dict)
+                save_ffi1001_file(f, new_path, na_dict)
+        finally:
+            close_files(f, new_file)
+        return os.path.split(file_path)[1]
+
+    def run_algorithm_steps(self, f, file_ext, var_list, steps, dimension_index=None):
+        # each input is read once from the file, the outputs of a step are kept in memory for the following steps,
+        # the outputs to write are returned with their dimensions
+        read_policy = read_dtype(self.config_dict)
+        replace_fill_value = self.config_dict['SYSTEM'].getboolean('replace_fill_value')
+        switch_fill_value = self.config_dict['SYSTEM'].getboolean('switch_fill_value')
+        inputs = {}
+        outputs = {}
+        output_names = {}
+        intermediates = set()
+        for step in steps:
+            args = []
+            dimension_out = None
+            path_out = None
+            for item in step['inputs']:
+                var_path, is_output = step_input_path(item, outputs, output_names, var_list)
+                if is_output:
+                    data, dimensions = outputs[var_path]
+                    intermediates.add(var_path)
+                elif var_path is not None:
+                    try:
+                        if item not in inputs:
+                            inputs[item] = read_egads_variable(f, str(item), file_ext, read_policy,
+                                                               replace_fill_value, switch_fill_value)
+                    except ValueError as ve:
+                        if 'cannot convert float NaN to integer' in str(ve):
+                            raise Exception('cannot convert float NaN to integer')
                         else:
-                            if path_out != '/':
-                                var_name = path_out + '/' + input_output['outputs'][0]
-                            else:
-                                var_name = path_out + input_output['outputs'][0]
-                            try:
-                                var_format = format_dict[str(output.value.dtype)]
-                            except KeyError:
-                                var_format = 'double'
-                            new_file.write_variable(output, var_name, dim_tuple, var_format)
-                        new_file.close()
-                    f.close()
+                            raise Exception('')
+                    data = inputs[item]
+                    dimensions = None
+                    if dimension_index is not None:
+                        dimensions = list(dimension_index.variable_dimensions(str(item), details=False).keys())
                 else:
-                    f = egads.input.NasaAmes(file_path, 'r')
-                    if len(f.get_dimension_list()) > 1:
-                        raise Exception('NASA Ames files with more than 1 dimension can\'t be processed at this time')
-                    var_list = f.get_variable_list() + f.get_variable_list(vartype='independant')
-                    args = []
-                    for item in input_output['inputs']:
-                        if item in var_list:
-                            try:
-                                data = f.read_variable(str(item), read_as_float=read_as_float,
-                                                       replace_fill_value=replace_fill_value)
-                                args.append(data)
-                            except ValueError as ve:
-                                if 'cannot convert float NaN to integer' in str(ve):
-                                    if switch_fill_value:
-                                        data = f.read_variable(str(item), read_as_float=read_as_float,
-                                                               replace_fill_value=False)
-                                        args.append(data)
-                                    else:
-                                        raise Exception('cannot convert float NaN to integer')
-                                else:
-                                    raise Exception('')
-                        else:
-                            args.append(item)
-                    output = algorithm().run(*args)
-                    na_dict = copy.deepcopy(f.na_dict)
-                    if isinstance(output, tuple):
-                        for index, var in enumerate(output):
-                            var_name = input_output['outputs'][index]
-                            f.write_variable(var, varname=var_name, vartype="main", na_dict=na_dict)
-                    else:
-                        var_name = input_output['outputs'][0]
-                        f.write_variable(output, varname=var_name, vartype="main", na_dict=na_dict)
-                    f.save_na_file(str(pathlib.Path(dest_folder).joinpath(filename)), na_dict)
-                    f.close()
-            except Exception:
-                logging.exception('gui - file_functions.py - BatchProcessingThread - algorithm_processing - an '
-                                  'exception occurred during concatenation - stop_processing ' + str(stop_processing))
-
-                etype, evalue, _ = sys.exc_info()
-
-                if stop_processing == 0:
-                    f.close()
+                    args.append(item)
                     continue
-                else:
-                    f.close()
-                    error = True
-                    break
-        if not error:
-            self.finished.emit()
+                args.append(data)
+                if path_out is None:
+                    dimension_out = dimensions
+                    path_out = os.path.dirname(str(var_path))
+            if path_out is None:
+                raise Exception('the algorithm ' + step['algorithm'].__name__ + ' has no variable in its inputs')
+            output = step['algorithm']().run(*args)
+            if not isinstance(output, tuple):
+                output = (output,)
+            for name, var in zip(step['outputs'], output):
+                var_path = output_path(path_out, name)
+                outputs[var_path] = (var, dimension_out)
+                output_names[name] = var_path
+        if self.batch_dict.get('drop_intermediate'):
+            for var_path in intermediates:
+                del outputs[var_path]
+        return outputs
+
+    def rewrite_file(self, f, file_path, new_path, dimension_index, var_list):
+        # with a compression, all variables are written again, in blocks for those still in the file
+        if isinstance(f, egads.input.NetCdf):
+            new_file = egads.input.EgadsNetCdf(new_path, 'w')
         else:
-            self.error.emit([etype.__name__, str(evalue)])
-
-    def delete_variable(self):
-        logging.debug('gui - file_functions.py - BatchProcessingThread - delete_variable')
-        self.progress.emit(['Standby...', 0])
-        format_dict = {'int32': 'int', 'float64': 'double', 'float32': 'float', 'int16': 'short',
-                       'int8': 'byte', 'str': 'char', 'unicode': 'char', 'str_': 'char', 'unicode_': 'char'}
-        stop_processing = self.batch_dict['stop_processing']
-        dest_folder = self.batch_dict['destination_folder']
+            new_file = egads.input.EgadsHdf(new_path, 'w')
+        add_write_types(new_file)
+        source = raw_file_source(f, file_path, self.config_dict)
+
+        # global attributes
+        for key, value in f.get_attribute_list().items():
+            new_file.add_attribute(key, value)
+
+        # groups
+        for group_path in f.get_group_list(details=True):
+            new_file.add_group(group_path)
+            for key, val in f.get_attribute_list(group_path).items():
+                new_file.add_attribute(key, val, group_path)
+
+        # dimensions
+        dim_list = []
+        for dim_path, size in dimension_index.dimensions().items():
+            if isinstance(f, egads.input.NetCdf):
+                new_file.add_dim(dim_path, size)
+            else:
+                dim_list.append(dim_path)
+                add_egads_dim(new_file, dim_path, f.read_variable(dim_path), self.storage)
+
+        # variables
+        for var_path in var_list:
+            if var_path not in dim_list:
+                var_data = source.read_metadata(var_path)
+                dim_tuple = tuple(dimension_index.variable_dimensions(var_path, details=False).keys())
+                write_egads_variable(new_file, var_data, var_path, dim_tuple, self.var_format(var_data.dtype),
+                                     self.storage)
+        return new_file
+
+    def delete_variable(self, file_path, new_path):
         targeted_variable = [variable[0] for variable in self.batch_dict['processing_options']]
-        error = False
-        f = None
-        filename_base, start_nbr, digit_nbr = self.set_filename_base()
-        etype, evalue = None, None
-        for i, file_path in enumerate(self.batch_dict['file_list']):
-            try:
-                self.progress.emit([os.path.split(file_path)[1],
-                                    math.floor(100 * float(i) / float(len(self.batch_dict['file_list'])))])
-                ext = pathlib.Path(file_path).suffix
-                filename = self.set_filename(file_path, ext, filename_base, start_nbr, digit_nbr)
-                if ext in ['.na']:
-                    f = egads.input.EgadsNasaAmes(file_path, 'r')
-                    if len(f.get_dimension_list()) > 1:
-                        raise Exception('NASA Ames files with more than 1 dimension can\'t be processed at this time')
-                    na_dict = copy.deepcopy(f.na_dict)
-                    na_dict['V'] = []
-                    na_dict['NV'] = 0
-                    na_dict['VMISS'] = []
-                    na_dict['VNAME'] = []
-                    na_dict['VSCAL'] = []
-                    for var in f.get_variable_list():
-                        if var not in targeted_variable:
-                            var_data = f.read_variable(var)
-                            f.write_variable(var_data, vartype="main", na_dict=na_dict)
-                    f.save_na_file(os.path.join(dest_folder, filename), na_dict)
-                    f.close()
-                else:
-                    if ext in ['.nc', '.cdf']:
-                        f = egads.input.EgadsNetCdf(file_path, 'r')
-                        new_file = egads.input.EgadsNetCdf(os.path.join(dest_folder, filename), 'w')
-                    else:
-                        f = egads.input.EgadsHdf(file_path, 'r')
-                        new_file = egads.input.EgadsHdf(os.path.join(dest_folder, filename), 'w')
-
-                    # global metadata
-                    for key, value in f.get_attribute_list().items():
-                        new_file.add_attribute(key, value)
-
-                    # groups and attributes
-                    group_list = f.get_group_list(details=True)
-                    del_group = []
-                    for group in group_list:
-                        for item in targeted_variable:
-                            if group.find(item) == 0:
-                                del_group.append(group)
-                    for group in group_list:
-                        if group not in del_group:
-                            new_file.add_group(group)
-                            attr = f.get_attribute_list(group)
-                            for key, value in attr.items():
-                                new_file.add_attribute(key, value, group)
-
-                    # dimensions
-                    del_dims = []
-                    for dim in list(f.get_dimension_list(group_walk=True, details=True).keys()):
-                        for item in targeted_variable:
-                            if dim.find(item) == 0:
-                                del_dims.append(dim)
-                    dim_list = []
-                    for dim_path, size in f.get_dimension_list(group_walk=True, details=True).items():
-                        if dim_path not in del_dims:
-                            if ext in ['.nc', '.cdf']:
-                                new_file.add_dim(dim_path, size)
-                            else:
-                                dim_list.append(dim_path)
-                                new_file.add_dim(dim_path, f.read_variable(dim_path))
-
-                    # variables
-                    del_vars = []
-                    for var in f.get_variable_list(group_walk=True, details=True):
-                        for item in targeted_variable:
-                            if var.find(item) == 0:
-                                del_vars.append(var)
-                    for var_path in f.get_variable_list(group_walk=True, details=True):
-                        if var_path not in del_vars and var_path not in dim_list:
-                            var_data = f.read_variable(var_path)
-                            dim_tuple = tuple([os.path.basename(key) for key in f.get_dimension_list(var_path)])
-                            try:
-                                var_format = format_dict[str(var_data.value.dtype)]
-                            except KeyError:
-                                var_format = 'double'
-                            new_file.write_variable(var_data, var_path, dim_tuple, var_format)
-
-            except Exception:
-                logging.exception('gui - file_functions.py - BatchProcessingThread - nc_to_na - an exception '
-                                  'occurred during concatenation - stop_processing ' + str(stop_processing))
-
-                etype, evalue, _ = sys.exc_info()
-
-                if stop_processing == 0:
-                    f.close()
-                    continue
-                else:
-                    f.close()
-                    error = True
-                    break
-        if not error:
-            self.finished.emit()
-        else:
-            self.error.emit([etype.__name__, str(evalue)])
-
-    def delete_metadata(self):
-        logging.debug('gui - file_functions.py - BatchProcessingThread - delete_metadata')
-        self.progress.emit(['Standby...', 0])
-        format_dict = {'int32': 'int', 'float64': 'double', 'float32': 'float', 'int16': 'short',
-                       'int8': 'byte', 'str': 'char', 'unicode': 'char', 'str_': 'char', 'unicode_': 'char'}
-        stop_processing = self.batch_dict['stop_processing']
-        dest_folder = self.batch_dict['destination_folder']
-        targeted_metadata = [metadata[1] for metadata in self.batch_dict['processing_options']]
-        error = False
-        f = None
-        filename_base, start_nbr, digit_nbr = self.set_filename_base()
-        etype, evalue = None, None
-        for i, file_path in enumerate(self.batch_dict['file_list']):
-            try:
-                self.progress.emit([os.path.split(file_path)[1],
-                                    math.floor(100 * float(i) / float(len(self.batch_dict['file_list'])))])
-                ext = pathlib.Path(file_path).suffix
-                filename = self.set_filename(file_path, ext, filename_base, start_nbr, digit_nbr)
+        ext = pathlib.Path(file_path).suffix
+        f, new_file = None, None
+        try:
+            if ext in ['.na']:
+                f = EgadsNasaAmesReader(file_path, 'r')
+                if len(f.get_dimension_list()) > 1:
+                    raise Exception('NASA Ames files with more than 1 dimension can\'t be processed at this time')
+                na_dict = copy.deepcopy(f.na_dict)
+                na_dict['V'] = []
+                na_dict['NV'] = 0
+                na_dict['VMISS'] = []
+                na_dict['VNAME'] = []
+                na_dict['VSCAL'] = []
+                for var in f.get_variable_list():
+                    if var not in targeted_variable:
+                        var_data = f.read_variable(var)
+                        f.write_variable(var_data, vartype="main", na_dict=na_dict)
+                save_ffi1001_file(f, new_path, na_dict)
+            else:
                 if ext in ['.nc', '.cdf']:
                     f = egads.input.EgadsNetCdf(file_path, 'r')
-                    new_file = egads.input.EgadsNetCdf(os.path.join(dest_folder, filename), 'w')
+                    new_file = egads.input.EgadsNetCdf(new_path, 'w')
                 else:
                     f = egads.input.EgadsHdf(file_path, 'r')
-                    new_file = egads.input.EgadsHdf(os.path.join(dest_folder, filename), 'w')
+                    new_file = egads.input.EgadsHdf(new_path, 'w')
+                add_write_types(new_file)
+                source = raw_file_source(f, file_path, self.config_dict)
 
                 # global metadata
                 for key, value in f.get_attribute_list().items():
-                    if key not in targeted_metadata:
-                        new_file.add_attribute(key, value)
+                    new_file.add_attribute(key, value)
 
                 # groups and attributes
-                for group in f.get_group_list(details=True):
-                    new_file.add_group(group)
-                    for key, value in f.get_attribute_list(group).items():
-                        new_file.add_attribute(key, value, group)
+                group_list = f.get_group_list(details=True)
+                del_group = []
+                for group in group_list:
+                    for item in targeted_variable:
+                        if group.find(item) == 0:
+                            del_group.append(group)
+                for group in group_list:
+                    if group not in del_group:
+                        new_file.add_group(group)
+                        attr = f.get_attribute_list(group)
+                        for key, value in attr.items():
+                            new_file.add_attribute(key, value, group)
 
                 # dimensions
+                dimension_index = DimensionIndex(f)
+                del_dims = []
+                for dim in list(dimension_index.dimensions().keys()):
+                    for item in targeted_variable:
+                        if dim.find(item) == 0:
+                            del_dims.append(dim)
                 dim_list = []
-                for dim_path, size in f.get_dimension_list(group_walk=True, details=True).items():
-                    if ext in ['.nc', '.cdf']:
-                        new_file.add_dim(dim_path, size)
-                    else:
-                        dim_list.append(dim_path)
-                        new_file.add_dim(dim_path, f.read_variable(dim_path))
+                for dim_path, size in dimension_index.dimensions().items():
+                    if dim_path not in del_dims:
+                        if ext in ['.nc', '.cdf']:
+                            new_file.add_dim(dim_path, size)
+                        else:
+                            dim_list.append(dim_path)
+                            add_egads_dim(new_file, dim_path, f.read_variable(dim_path), self.storage)
 
                 # variables
+                del_vars = []
+                for var in f.get_variable_list(group_walk=True, details=True):
+                    for item in targeted_variable:
+                        if var.find(item) == 0:
+                            del_vars.append(var)
                 for var_path in f.get_variable_list(group_walk=True, details=True):
-                    if var_path not in dim_list:
-                        var_data = f.read_variable(var_path)
-                        dim_tuple = tuple([key for key in f.get_dimension_list(var_path)])
-                        try:
-                            var_format = format_dict[str(var_data.value.dtype)]
-                        except KeyError:
-                            var_format = 'double'
-                        new_file.write_variable(var_data, var_path, dim_tuple, var_format)
-            except Exception:
-                logging.exception('gui - file_functions.py - BatchProcessingThread - delete_metadata - an exception '
-                                  'occurred during concatenation - stop_processing ' + str(stop_processing))
-
-                etype, evalue, _ = sys.exc_info()
-
-                if stop_processing == 0:
-                    f.close()
-                    continue
-                else:
-                    f.close()
-                    error = True
-                    break
-        if not error:
-            self.finished.emit()
-        else:
-            self.error.emit([etype.__name__, str(evalue)])
-
-    def file_conversion(self):
-        if self.batch_dict['processing_options'] == 'HDF5 -> NASA Ames':
-            self.h5_to_na()
-        elif self.batch_dict['processing_options'] == 'HDF5 -> NetCDF':
-            self.h5_to_nc()
-        elif self.batch_dict['processing_options'] == 'NASA Ames -> HDF5':
-            self.na_to_h5()
-        elif self.batch_dict['processing_options'] == 'NASA Ames -> NetCDF':
-            self.na_to_nc()
-        elif self.batch_dict['processing_options'] == 'NetCDF -> HDF5':
-            self.nc_to_h5()
-        elif self.batch_dict['processing_options'] == 'NetCDF -> NASA Ames':
-            self.nc_to_na()
-
-    def h5_to_na(self):
-        logging.debug('gui - file_functions.py - BatchProcessingThread - h5_to_na')
-        self.progress.emit(['Standby...', 0])
-        stop_processing = self.batch_dict['stop_processing']
-        dest_folder = self.batch_dict['destination_folder']
-        error = False
-        f = None
-        filename_base, start_nbr, digit_nbr = self.set_filename_base()
-        etype, evalue = None, None
-        for i, file_path in enumerate(self.batch_dict['file_list']):
-            try:
-                self.progress.emit([os.path.split(file_path)[1],
-                                    math.floor(100 * float(i) / float(len(self.batch_dict['file_list'])))])
-                filename = self.set_filename(file_path, '.na', filename_base, start_nbr, digit_nbr)
-                f = egads.input.EgadsHdf(file_path, 'r')
-                f.convert_to_nasa_ames(na_file=os.path.join(dest_folder, filename))
-                f.close()
-            except Exception:
-                logging.exception('gui - file_functions.py - BatchProcessingThread - h5_to_na - an exception '
-                                  'occurred during concatenation - stop_processing ' + str(stop_processing))
-
-                etype, evalue, _ = sys.exc_info()
-
-                if stop_processing == 0:
-                    f.close()
-                    continue
-                else:
-                    f.close()
-                    error = True
-                    break
-        if not error:
-            self.finished.emit()
-        else:
-            self.error.emit([etype.__name__, str(evalue)])
-
-    def h5_to_nc(self):
-        logging.debug('gui - file_functions.py - BatchProcessingThread - h5_to_nc')
-        self.progress.emit(['Standby...', 0])
-        stop_processing = self.batch_dict['stop_processing']
-        dest_folder = self.batch_dict['destination_folder']
-        error = False
-        f = None
-        filename_base, start_nbr, digit_nbr = self.set_filename_base()
-        etype, evalue = None, None
-        for i, file_path in enumerate(self.batch_dict['file_list']):
-            try:
-                self.progress.emit([os.path.split(file_path)[1],
-                                    math.floor(100 * float(i) / float(len(self.batch_dict['file_list'])))])
-                filename = self.set_filename(file_path, '.nc', filename_base, start_nbr, digit_nbr)
-                f = egads.input.EgadsHdf(file_path, 'r')
-                f.convert_to_netcdf(os.path.join(dest_folder, filename))
-                f.close()
-            except Exception:
-                logging.exception('gui - file_functions.py - BatchProcessingThread - h5_to_nc - an exception '
-                                  'occurred during concatenation - stop_processing ' + str(stop_processing))
-
-                etype, evalue, _ = sys.exc_info()
-
-                if stop_processing == 0:
-                    f.close()
-                    continue
-                else:
-                    f.close()
-                    error = True
-                    break
-        if not error:
-            self.finished.emit()
-        else:
-            self.error.emit([etype.__name__, str(evalue)])
-
-    def nc_to_h5(self):
-        logging.debug('gui - file_functions.py - BatchProcessingThread - nc_to_h5')
-        self.progress.emit(['Standby...', 0])
-        stop_processing = self.batch_dict['stop_processing']
-        dest_folder = self.batch_dict['destination_folder']
-        error = False
-        f = None
-        filename_base, start_nbr, digit_nbr = self.set_filename_base()
-        etype, evalue = None, None
-        for i, file_path in enumerate(self.batch_dict['file_list']):
-            try:
-                self.progress.emit([os.path.split(file_path)[1],
-                                    math.floor(100 * float(i) / float(len(self.batch_dict['file_list'])))])
-                filename = self.set_filename(file_path, '.h5', filename_base, start_nbr, digit_nbr)
+                    if var_path not in del_vars and var_path not in dim_list:
+                        var_data = source.read_metadata(var_path)
+                        dim_tuple = tuple([os.path.basename(key) for key in
+                                           dimension_index.variable_dimensions(var_path, details=False)])
+                        write_egads_variable(new_file, var_data, var_path, dim_tuple, self.var_format(var_data.dtype),
+                                             self.storage)
+        finally:
+            close_files(f, new_file)
+        return os.path.split(file_path)[1]
+
+    def delete_metadata(self, file_path, new_path):
+        targeted_metadata = [metadata[1] for metadata in self.batch_dict['processing_options']]
+        ext = pathlib.Path(file_path).suffix
+        f, new_file = None, None
+        try:
+            if ext in ['.nc', '.cdf']:
                 f = egads.input.EgadsNetCdf(file_path, 'r')
-                f.convert_to_hdf(hdf_file=os.path.join(dest_folder, filename))
-                f.close()
-            except Exception:
-                logging.exception('gui - file_functions.py - BatchProcessingThread - nc_to_h5 - an exception '
-                                  'occurred during concatenation - stop_processing ' + str(stop_processing))
-
-                etype, evalue, _ = sys.exc_info()
-
-                if stop_processing == 0:
-                    f.close()
-                    continue
+                new_file = egads.input.EgadsNetCdf(new_path, 'w')
+            else:
+                f = egads.input.EgadsHdf(file_path, 'r')
+                new_file = egads.input.EgadsHdf(new_path, 'w')
+            add_write_types(new_file)
+            source = raw_file_source(f, file_path, self.config_dict)
+
+            # global metadata
+            for key, value in f.get_attribute_list().items():
+                if key not in targeted_metadata:
+                    new_file.add_attribute(key, value)
+
+            # groups and attributes
+            for group in f.get_group_list(details=True):
+                new_file.add_group(group)
+                for key, value in f.get_attribute_list(group).items():
+                    new_file.add_attribute(key, value, group)
+
+            # dimensions
+            dimension_index = DimensionIndex(f)
+            dim_list = []
+            for dim_path, size in dimension_index.dimensions().items():
+                if ext in ['.nc', '.cdf']:
+                    new_file.add_dim(dim_path, size)
                 else:
-                    f.close()
-                    error = True
-                    break
-        if not error:
-            self.finished.emit()
-        else:
-            self.error.emit([etype.__name__, str(evalue)])
-
-    def nc_to_na(self):
-        logging.debug('gui - file_functions.py - BatchProcessingThread - nc_to_na')
-        self.progress.emit(['Standby...', 0])
-        stop_processing = self.batch_dict['stop_processing']
-        dest_folder = self.batch_dict['destination_folder']
-        error = False
-        f = None
-        filename_base, start_nbr, digit_nbr = self.set_filename_base()
-        etype, evalue = None, None
-        for i, file_path in enumerate(self.batch_dict['file_list']):
-            try:
-                self.progress.emit([os.path.split(file_path)[1],
-                                    math.floor(100 * float(i) / float(len(self.batch_dict['file_list'])))])
-                filename = self.set_filename(file_path, '.na', filename_base, start_nbr, digit_nbr)
-                f = egads.input.EgadsNetCdf(file_path, 'r')
-                f.convert_to_nasa_ames(na_file=os.path.join(dest_folder, filename))
-                f.close()
-            except Exception:
-                logging.exception('gui - file_functions.py - BatchProcessingThread - nc_to_na - an exception '
-                                  'occurred during concatenation - stop_processing ' + str(stop_processing))
+                    dim_list.append(dim_path)
+                    add_egads_dim(new_file, dim_path, f.read_variable(dim_path), self.storage)
+
+            # variables
+            for var_path in f.get_variable_list(group_walk=True, details=True):
+                if var_path not in dim_list:
+                    var_data = source.read_metadata(var_path)
+                    dim_tuple = tuple([key for key in dimension_index.variable_dimensions(var_path, details=False)])
+                    write_egads_variable(new_file, var_data, var_path, dim_tuple, self.var_format(var_data.dtype),
+                                         self.storage)
+        finally:
+            close_files(f, new_file)
+        return os.path.split(file_path)[1]
+
+    def h5_to_na(self, file_path, new_path):
+        start_time = time.perf_counter()
+        f = egads.input.EgadsHdf(file_path, 'r')
+        try:
+            f.convert_to_nasa_ames(na_file=new_path)
+        finally:
+            f.close()
+        return conversion_message(file_path, os.path.getsize(file_path), start_time)
+
+    def h5_to_nc(self, file_path, new_path):
+        start_time = time.perf_counter()
+        copied = hdf_to_netcdf(file_path, new_path, 'converted to NetCdf by EGADS, ' + str(datetime.datetime.now()),
+                               self.storage)
+        return conversion_message(file_path, copied, start_time)
+
+    def nc_to_h5(self, file_path, new_path):
+        start_time = time.perf_counter()
+        copied = netcdf_to_hdf(file_path, new_path, 'converted to Hdf by EGADS, ' + str(datetime.datetime.now()),
+                               self.storage)
+        return conversion_message(file_path, copied, start_time)
+
+    def nc_to_na(self, file_path, new_path):
+        start_time = time.perf_counter()
+        f = egads.input.EgadsNetCdf(file_path, 'r')
+        try:
+            f.convert_to_nasa_ames(na_file=new_path)
+        finally:
+            f.close()
+        return conversion_message(file_path, os.path.getsize(file_path), start_time)
+
+    def na_to_h5(self, file_path, new_path):
+        start_time = time.perf_counter()
+        f = EgadsNasaAmesReader(file_path, 'r')
+        try:
+            f.convert_to_hdf(hdf_file=new_path)
+        finally:
+            f.close()
+        return conversion_message(file_path, os.path.getsize(file_path), start_time)
+
+    def na_to_nc(self, file_path, new_path):
+        start_time = time.perf_counter()
+        f = EgadsNasaAmesReader(file_path, 'r')
+        try:
+            f.convert_to_netcdf(nc_file=new_path)
+        finally:
+            f.close()
+        return conversion_message(file_path, os.path.getsize(file_path), start_time)
+
+
+batch_methods = {3: 'delete_metadata', 4: 'delete_variable', 5: 'algorithm_processing'}
+conversion_methods = {'HDF5 -> NASA Ames': ('h5_to_na', '.na'), 'HDF5 -> NetCDF': ('h5_to_nc', '.nc'),
+                      'NASA Ames -> HDF5': ('na_to_h5', '.h5'), 'NASA Ames -> NetCDF': ('na_to_nc', '.nc'),
+                      'NetCDF -> HDF5': ('nc_to_h5', '.h5'), 'NetCDF -> NASA Ames': ('nc_to_na', '.na')}
+
+
+def batch_method(batch_dict):
+    # method of BatchFileProcessor and extension of the new files of the processes run file by file, None keeps the
+    # extension of the original files
+    if batch_dict['process'] == 2:
+        return conversion_methods[batch_dict['processing_options']]
+    return batch_methods[batch_dict['process']], None
+
+
+def algorithm_steps(batch_dict):
+    # a single algorithm or a chain of algorithms, in which an input can be the output of another step, steps are
+    # sorted to be run after the steps creating their inputs
+    steps = batch_dict.get('steps')
+    if not steps:
+        return [{'algorithm': batch_dict['algorithm'], 'inputs': batch_dict['processing_options']['inputs'],
+                 'outputs': batch_dict['processing_options']['outputs']}]
+    producers = {}
+    for index, step in enumerate(steps):
+        for name in step['outputs']:
+            if name in producers:
+                raise Exception('the output ' + name + ' is created by several algorithms')
+            producers[name] = index
+    dependencies = []
+    for step in steps:
+        dependencies.append({producers[item.rsplit('/', 1)[-1]] for item in step['inputs']
+                             if isinstance(item, str) and item.rsplit('/', 1)[-1] in producers})
+    ordered = []
+    while len(ordered) < len(steps):
+        ready = [index for index in range(len(steps)) if index not in ordered and dependencies[index] <= set(ordered)]
+        if not ready:
+            raise Exception('the algorithms of the chain depend on each other in a loop')
+        ordered.append(ready[0])
+    return [steps[index] for index in ordered]
+
+
+def output_path(path_out, name):
+    # outputs are written in the group of the first variable of the inputs, NASA Ames variables have no group
+    if not path_out:
+        return name
+    return path_out.rstrip('/') + '/' + name
+
+
+def step_input_path(item, outputs, output_names, var_list):
+    # an input of a step is the output of a previous step, given by its path or its name, or a variable of the file,
+    # returns the path of the variable and if it is an output, None for the other inputs
+    if not isinstance(item, str):
+        return None, False
+    if item in outputs or item in output_names:
+        return (item if item in outputs else output_names[item]), True
+    if item in var_list:
+        return item, False
+    return None, False
+
+
+def close_files(*files):
+    for f in files:
+        if f is not None:
+            f.close()
+
+
+def conversion_message(file_path, copied, start_time):
+    rate = conversion_rate(copied, start_time)
+    return (os.path.split(file_path)[1] + ': ' + str(round(copied / 1e6, 1)) + ' MB, ' + str(round(rate, 1))
+            + ' MB/s')
 
-                etype, evalue, _ = sys.exc_info()
 
-                if stop_processing == 0:
-                    f.close()
-                    continue
-                else:
-                    f.close()
-                    error = True
-                    break
-        if not error:
-            self.finished.emit()
-        else:
-            self.error.emit([etype.__name__, str(evalue)])
-
-    def na_to_h5(self):
-        logging.debug('gui - file_functions.py - BatchProcessingThread - na_to_h5')
-        self.progress.emit(['Standby...', 0])
-        stop_processing = self.batch_dict['stop_processing']
-        dest_folder = self.batch_dict['destination_folder']
-        error = False
-        f = None
-        filename_base, start_nbr, digit_nbr = self.set_filename_base()
-        etype, evalue = None, None
-        for i, file_path in enumerate(self.batch_dict['file_list']):
-            try:
-                self.progress.emit([os.path.split(file_path)[1],
-                                    math.floor(100 * float(i) / float(len(self.batch_dict['file_list'])))])
-                filename = self.set_filename(file_path, '.h5', filename_base, start_nbr, digit_nbr)
-                f = egads.input.EgadsNasaAmes(file_path, 'r')
-                f.convert_to_hdf(hdf_file=os.path.join(dest_folder, filename))
-                f.close()
-            except Exception:
-                logging.exception('gui - file_functions.py - BatchProcessingThread - na_to_h5 - an exception '
-                                  'occurred during concatenation - stop_processing ' + str(stop_processing))
+class BatchProcessingThread(QtCore.QThread):
+    progress = QtCore.pyqtSignal(list)
+    error = QtCore.pyqtSignal(list)
+    finished = QtCore.pyqtSignal()
 
-                etype, evalue, _ = sys.exc_info()
+    def __init__(self, batch_dict, config_dict):
+        QtCore.QThread.__init__(self)
+        logging.debug('gui - file_functions.py - BatchProcessingThread - __init__')
+        self.batch_dict = batch_dict
+        self.config_dict = config_dict
+        self.storage = read_storage_options(config_dict, batch_dict.get('storage'))
+        self.processor = BatchFileProcessor(batch_dict, config_dict, self.storage)
+        self.pool = None
+        self.failed_files = []
+        # maximum number of processes, given by the job queue of the gui
+        self.processes = None
+        self.paused = False
+        self.resume_event = None
 
-                if stop_processing == 0:
-                    f.close()
-                    continue
-                else:
-                    f.close()
-                    error = True
-                    break
-        if not error:
-            self.finished.emit()
+    def run(self):
+        logging.debug('gui - file_functions.py - BatchProcessingThread - run')
+        if self.batch_dict['process'] == 1:
+            # files are concatenated one after the other in this thread, a paused job waits before the next file
+            self.resume_event = threading.Event()
+            if not self.paused:
+                self.resume_event.set()
+            self.concatenate_files()
         else:
-            self.error.emit([etype.__name__, str(evalue)])
+            method, out_ext = batch_method(self.batch_dict)
+            self.process_files(method, out_ext)
 
-    def na_to_nc(self):
-        logging.debug('gui - file_functions.py - BatchProcessingThread - na_to_nc')
+    def process_files(self, method, out_ext=None):
+        # each file is processed on its own, in this thread or by a pool of processes, without out_ext the new file
+        # keeps the extension of the original file, files done by a previous run of the same job are skipped
+        logging.debug('gui - file_functions.py - BatchProcessingThread - process_files - method ' + method)
         self.progress.emit(['Standby...', 0])
         stop_processing = self.batch_dict['stop_processing']
         dest_folder = self.batch_dict['destination_folder']
-        error = False
-        f = None
+        file_list = self.batch_dict['file_list']
         filename_base, start_nbr, digit_nbr = self.set_filename_base()
-        etype, evalue = None, None
-        for i, file_path in enumerate(self.batch_dict['file_list']):
-            try:
-                self.progress.emit([os.path.split(file_path)[1],
-                                    math.floor(100 * float(i) / float(len(self.batch_dict['file_list'])))])
-                # ext = pathlib.Path(file_path).suffix
-                filename = self.set_filename(file_path, '.nc', filename_base, start_nbr, digit_nbr)
-                f = egads.input.EgadsNasaAmes(file_path, 'r')
-                f.convert_to_netcdf(nc_file=os.path.join(dest_folder, filename))
-                f.close()
-            except Exception:
-                logging.exception('gui - file_functions.py - BatchProcessingThread - na_to_nc - an exception '
-                                  'occurred during concatenation - stop_processing ' + str(stop_processing))
-
-                etype, evalue, _ = sys.exc_info()
-
-                if stop_processing == 0:
-                    f.close()
+        error = None
+        done = 0
+        manifest = None
+        try:
+            manifest = BatchManifest(dest_folder, batch_job(self.batch_dict, self.config_dict))
+            tasks = []
+            for i, file_path in enumerate(file_list):
+                if manifest.completed(file_path):
+                    done += 1
                     continue
+                ext = out_ext if out_ext is not None else pathlib.Path(file_path).suffix
+                tasks.append((method, i, file_path, self.set_filename(file_path, ext, filename_base, start_nbr,
+                                                                      digit_nbr, i)))
+            processes = batch_process_number(self.config_dict, len(tasks), self.processes)
+            logging.info('gui - file_functions.py - BatchProcessingThread - process_files - files '
+                         + str(len(file_list)) + ', already done ' + str(done) + ', processes ' + str(processes))
+            if done:
+                self.progress.emit([str(done) + ' files already done',
+                                    math.floor(100 * float(done) / float(len(file_list)))])
+            filenames = {task[1]: task[3] for task in tasks}
+            if processes > 1:
+                context = multiprocessing.get_context('spawn')
+                stop_event = context.Event()
+                self.resume_event = context.Event()
+                if not self.paused:
+                    self.resume_event.set()
+                self.pool = context.Pool(processes, initializer=init_batch_worker,
+                                         initargs=(self.processor, stop_event, self.resume_event))
+                results = self.pool.imap_unordered(run_batch_task, tasks)
+            else:
+                stop_event = threading.Event()
+                self.resume_event = threading.Event()
+                if not self.paused:
+                    self.resume_event.set()
+                init_batch_worker(self.processor, stop_event, self.resume_event)
+                results = map(run_batch_task, tasks)
+            for file_nbr, file_path, message, file_error, duration in results:
+                done += 1
+                if file_error is not None:
+                    status = 'failed'
+                    self.failed_files.append(file_path)
+                    logging.error('gui - file_functions.py - BatchProcessingThread - process_files - an exception '
+                                  'occurred with ' + str(file_path) + ' - stop_processing ' + str(stop_processing)
+                                  + '\n' + file_error[2])
+                    if stop_processing and error is None:
+                        # the files already being processed are finished, the other ones are skipped
+                        error = file_error[:2]
+                        stop_event.set()
+                    message = os.path.split(file_path)[1] + ': ' + file_error[0]
+                    file_error = file_error[:2]
+                elif message is None:
+                    status = 'skipped'
+                    message = os.path.split(file_path)[1] + ': skipped'
                 else:
-                    f.close()
-                    error = True
-                    break
-        if not error:
+                    status = 'done'
+                    logging.info('gui - file_functions.py - BatchProcessingThread - process_files - ' + message)
+                manifest.add(file_path, status, os.path.join(dest_folder, filenames[file_nbr]), duration, file_error)
+                self.progress.emit([str(done) + '/' + str(len(file_list)) + ' - ' + message,
+                                    math.floor(100 * float(done) / float(len(file_list)))])
+        except Exception:
+            logging.exception('gui - file_functions.py - BatchProcessingThread - process_files - an exception '
+                              'occurred')
+            etype, evalue, _ = sys.exc_info()
+            error = [etype.__name__, str(evalue)]
+        finally:
+            pool, self.pool = self.pool, None
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+            if manifest is not None:
+                manifest.close()
+        if error is None:
             self.finished.emit()
         else:
-            self.error.emit([etype.__name__, str(evalue)])
+            self.error.emit(error)
 
     def concatenate_files(self):
         logging.debug('gui - file_functions.py - BatchProcessingThread - concatenate_files')
         self.progress.emit(['Standby...', 0])
         format_dict = {'int32': 'int', 'float64': 'double', 'float32': 'float', 'int16': 'short',
-                       'int8': 'byte', 'str': 'char', 'unicode': 'char', 'str_': 'char', 'unicode_': 'char'}
+                       'int8': 'byte', 'str': 'char', 'unicode': 'char', 'str_': 'char', 'unicode_': 'char',
+                       **native_write_formats}
         stop_processing = self.batch_dict['stop_processing']
         processing_options = self.batch_dict['processing_options']
-        dest_folder = self.batch_dict['destination_folder']
         out_format = self.batch_dict['out_format']
         error = False
         f = None
         etype, evalue = None, None
-        if self.batch_dict['filename_options'] is None:
-            if out_format == 'NetCDF':
-                ext = '.nc'
-            elif out_format == 'HDF5':
-                ext = '.h5'
-            else:
-                ext = '.na'
-            date_time = datetime.datetime.now().strftime('%Y%m%dT%H%M%S')
-            final_filename = pathlib.Path(dest_folder).joinpath('concatenated_file_EGADS_' + date_time + ext)
-        else:
-            filename = ''
-            for option in self.batch_dict['filename_options']:
-                if option != '':
-                    if option == 'original_filename':
-                        _, file = os.path.split(self.batch_dict['file_list'][0])
-                        filename += str(file)
-                    elif 'date' in option:
-                        filename += datetime.datetime.now().strftime(option[4:])
-                    elif 'ndigit' in option:
-                        filename += option[6:]
-                    else:
-                        filename += option
-            final_filename = pathlib.Path(dest_folder).joinpath(filename)
-        if out_format == 'NetCDF' or out_format == 'HDF5':
+        final_filename = self.concatenation_filename()
+        if self.batch_dict.get('concatenation') == 'time':
+            self.concatenate_time(final_filename)
+        elif out_format == 'NetCDF' or out_format == 'HDF5':
             if out_format == 'NetCDF':
                 final_file = egads.input.EgadsNetCdf(final_filename, 'w')
+                add_write_types(final_file)
             else:
                 final_file = egads.input.EgadsHdf(final_filename, 'w')
+                add_write_types(final_file)
             global_attributes = {}
             for i, file_path in enumerate(self.batch_dict['file_list']):
+                self.resume_event.wait()
                 try:
                     self.progress.emit([os.path.split(file_path)[1],
                                         math.floor(100 * float(i) / float(len(self.batch_dict['file_list'])))])
@@ -719,6 +648,7 @@ class BatchProcessingThread(QtCore.QThread):
                         f = egads.input.EgadsNetCdf(pathlib.Path(file_path), 'r')
                     else:
                         f = egads.input.EgadsHdf(pathlib.Path(file_path), 'r')
+                    source = raw_file_source(f, file_path, self.config_dict)
 
                     # global attributes
                     if i == 0 and processing_options != 2:
@@ -736,14 +666,15 @@ class BatchProcessingThread(QtCore.QThread):
                                                 '- group already in file, skipping group')
 
                     # dimensions
+                    dimension_index = DimensionIndex(f)
                     dim_list = []
-                    for dim_path, size in f.get_dimension_list(group_walk=True, details=True).items():
+                    for dim_path, size in dimension_index.dimensions().items():
                         try:
                             if out_format == 'NetCDF':
                                 final_file.add_dim(dim_path, size)
                             else:
                                 dim_list.append(dim_path)
-                                final_file.add_dim(dim_path, f.read_variable(dim_path))
+                                add_egads_dim(final_file, dim_path, f.read_variable(dim_path), self.storage)
                         except (RuntimeError, OSError) as e:
                             if 'String match to name in use' in str(e) or 'name already exists' in str(e):
                                 logging.warning('gui - file_functions.py - BatchProcessingThread - concatenate_files '
@@ -752,13 +683,14 @@ class BatchProcessingThread(QtCore.QThread):
                     # variables
                     for var_path in f.get_variable_list(group_walk=True, details=True):
                         if var_path not in dim_list:
-                            egads_instance = f.read_variable(var_path)
-                            dim_tuple = tuple([key for key, _ in f.get_dimension_list(str(var_path)).items()])
+                            egads_instance = source.read_metadata(var_path)
+                            dim_tuple = tuple(dimension_index.variable_dimensions(str(var_path), details=False).keys())
                             try:
-                                var_format = format_dict[str(egads_instance.value.dtype)]
+                                var_format = format_dict[str(egads_instance.dtype)]
                             except KeyError:
                                 var_format = 'double'
-                            final_file.write_variable(egads_instance, var_path, dim_tuple, var_format)
+                            write_egads_variable(final_file, egads_instance, var_path, dim_tuple, var_format,
+                                                 self.storage)
                     f.close()
                 except Exception:
                     logging.exception('gui - file_functions.py - BatchProcessingThread - concatenate_files - an '
@@ -766,6 +698,7 @@ class BatchProcessingThread(QtCore.QThread):
                                       + str(stop_processing))
 
                     etype, evalue, _ = sys.exc_info()
+                    self.failed_files.append(file_path)
 
                     if stop_processing == 0:
                         f.close()
@@ -791,10 +724,11 @@ class BatchProcessingThread(QtCore.QThread):
             na_dict = final_file.create_na_dict()
             global_attributes = None
             for i, file_path in enumerate(self.batch_dict['file_list']):
+                self.resume_event.wait()
                 try:
                     self.progress.emit([os.path.split(file_path)[1],
                                         math.floor(100 * float(i) / float(len(self.batch_dict['file_list'])))])
-                    f = egads.input.NasaAmes(str(pathlib.Path(file_path)), 'r')
+                    f = NasaAmesReader(str(pathlib.Path(file_path)), 'r')
                     if i == 0:
                         if processing_options != 2:
                             global_attributes = {'ONAME': f.get_attribute_value('ONAME'),
@@ -831,6 +765,7 @@ class BatchProcessingThread(QtCore.QThread):
                                       + str(stop_processing))
 
                     etype, evalue, _ = sys.exc_info()
+                    self.failed_files.append(file_path)
 
                     if stop_processing == 0:
                         f.close()
@@ -856,19 +791,101 @@ class BatchProcessingThread(QtCore.QThread):
                     final_file.write_attribute_value('NNCOML', len(global_attributes['NCOM']), na_dict=na_dict)
                     final_file.write_attribute_value('SCOM', global_attributes['SCOM'], na_dict=na_dict)
                     final_file.write_attribute_value('NCOM', global_attributes['NCOM'], na_dict=na_dict)
-                final_file.save_na_file(final_filename, na_dict, no_header=no_header)
+                save_ffi1001_file(final_file, final_filename, na_dict, no_header=no_header)
                 final_file.close()
                 self.finished.emit()
             else:
                 final_file.close()
                 self.error.emit([etype.__name__, str(evalue)])
 
+    def concatenate_time(self, final_filename):
+        # segments are ordered by their first time and appended along the time dimension, one after the other
+        logging.debug('gui - file_functions.py - BatchProcessingThread - concatenate_time')
+        stop_processing = self.batch_dict['stop_processing']
+        out_format = self.batch_dict['out_format']
+        if out_format == 'NetCDF':
+            concatenation = NetcdfTimeConcatenation(str(final_filename), self.storage)
+        elif out_format == 'HDF5':
+            concatenation = HdfTimeConcatenation(str(final_filename), self.storage)
+        else:
+            self.error.emit(['Exception', 'NASA Ames files can\'t be concatenated along the time dimension'])
+            return
+        file_list = sort_time_segments(self.batch_dict['file_list'], out_format == 'NetCDF')
+        error = False
+        etype, evalue = None, None
+        for i, file_path in enumerate(file_list):
+            self.resume_event.wait()
+            try:
+                self.progress.emit([os.path.split(file_path)[1], math.floor(100 * float(i) / float(len(file_list)))])
+                concatenation.append(file_path, self.batch_dict['processing_options'])
+            except Exception:
+                logging.exception('gui - file_functions.py - BatchProcessingThread - concatenate_time - an exception '
+                                  'occurred during concatenation - stop_processing ' + str(stop_processing))
+
+                etype, evalue, _ = sys.exc_info()
+                self.failed_files.append(file_path)
+
+                # a segment which can't be appended is skipped only if nothing has been written
+                if stop_processing == 0 and not concatenation.broken:
+                    continue
+                else:
+                    error = True
+                    break
+        concatenation.close('concatenated along time by EGADS, ' + str(datetime.datetime.now()))
+        if not error:
+            self.finished.emit()
+        else:
+            self.error.emit([etype.__name__, str(evalue)])
+
+    def concatenation_filename(self):
+        dest_folder = self.batch_dict['destination_folder']
+        out_format = self.batch_dict['out_format']
+        if self.batch_dict['filename_options'] is None:
+            if out_format == 'NetCDF':
+                ext = '.nc'
+            elif out_format == 'HDF5':
+                ext = '.h5'
+            else:
+                ext = '.na'
+            date_time = datetime.datetime.now().strftime('%Y%m%dT%H%M%S')
+            return pathlib.Path(dest_folder).joinpath('concatenated_file_EGADS_' + date_time + ext)
+        filename = ''
+        for option in self.batch_dict['filename_options']:
+            if option != '':
+                if option == 'original_filename':
+                    _, file = os.path.split(self.batch_dict['file_list'][0])
+                    filename += str(file)
+                elif 'date' in option:
+                    filename += datetime.datetime.now().strftime(option[4:])
+                elif 'ndigit' in option:
+                    filename += option[6:]
+                else:
+                    filename += option
+        return pathlib.Path(dest_folder).joinpath(filename)
+
+    def pause(self):
+        # the files already started are finished, the next ones wait until the job is resumed, the concatenation
+        # waits between two files
+        logging.debug('gui - file_functions.py - BatchProcessingThread - pause')
+        self.paused = True
+        if self.resume_event is not None:
+            self.resume_event.clear()
+
+    def resume(self):
+        logging.debug('gui - file_functions.py - BatchProcessingThread - resume')
+        self.paused = False
+        if self.resume_event is not None:
+            self.resume_event.set()
+
     def stop(self):
         logging.debug('gui - file_functions.py - BatchProcessingThread - stop')
+        pool = self.pool
+        if pool is not None:
+            pool.terminate()
         self.terminate()
 
     @staticmethod
-    def set_filename(file_path, out_ext, filename_base, start_nbr, digit_nbr):
+    def set_filename(file_path, out_ext, filename_base, start_nbr, digit_nbr, file_nbr=0):
         if filename_base is not None:
             filename = filename_base
             if 'original_filename' in filename:
@@ -876,8 +893,8 @@ class BatchProcessingThread(QtCore.QThread):
                 original_filename = original_filename[: original_filename.find(pathlib.Path(file_path).suffix)]
                 filename = filename.replace('original_filename', original_filename)
             if 'ndigit' in filename:
-                file_nbr = str(start_nbr + i)
-                file_nbr_str = '0' * (digit_nbr - len(file_nbr)) + file_nbr
+                file_nbr_str = str(start_nbr + file_nbr)
+                file_nbr_str = '0' * (digit_nbr - len(file_nbr_str)) + file_nbr_str
                 filename = filename.replace('ndigit', file_nbr_str)
         else:
             filename = pathlib.Path(file_path).name
@@ -0,0 +1,181 @@
+import logging
+import math
+from PyQt5 import QtCore
+from functions.thread_functions.processing_functions import BatchProcessingThread
+from functions.thread_functions.pool_functions import batch_process_budget
+
+
+process_titles = {1: 'Concatenation', 2: 'Conversion', 3: 'Deletion of metadata', 4: 'Deletion of variables',
+                  5: 'Algorithm'}
+# a job is running or waiting for its turn until it is finished, it can be removed from the queue once finished
+finished_status = ['done', 'failed', 'stopped', 'cancelled']
+
+
+def job_name(batch_dict):
+    name = process_titles[batch_dict['process']]
+    if batch_dict['process'] == 2:
+        name += ' ' + str(batch_dict['processing_options'])
+    elif batch_dict['process'] == 5:
+        if batch_dict.get('steps'):
+            name = 'Chain of ' + str(len(batch_dict['steps'])) + ' algorithms'
+        else:
+            name += ' ' + batch_dict['algorithm'].__name__
+    return name + ', ' + str(len(batch_dict['file_list'])) + ' files'
+
+
+class BatchJobQueue(QtCore.QObject):
+    # batch jobs of the gui, run in their order in the queue while the processes of the batch_processes option are
+    # not all used, each job gets its share of the free processes when it starts
+    job_changed = QtCore.pyqtSignal(int)
+    queue_changed = QtCore.pyqtSignal()
+
+    def __init__(self, config_dict):
+        QtCore.QObject.__init__(self)
+        logging.debug('gui - queue_functions.py - BatchJobQueue - __init__')
+        self.config_dict = config_dict
+        self.jobs = []
+        self.job_nbr = 0
+
+    def add_job(self, batch_dict):
+        logging.debug('gui - queue_functions.py - BatchJobQueue - add_job')
+        self.job_nbr += 1
+        self.jobs.append({'id': self.job_nbr, 'name': job_name(batch_dict), 'batch_dict': batch_dict,
+                          'status': 'queued', 'progress': 0, 'message': 'Waiting for free processes...',
+                          'processes': 0, 'thread': None})
+        self.queue_changed.emit()
+        self.schedule()
+        return self.job_nbr
+
+    def job(self, job_id):
+        for job in self.jobs:
+            if job['id'] == job_id:
+                return job
+        return None
+
+    def thread_job(self, thread):
+        for job in self.jobs:
+            if job['thread'] is thread:
+                return job
+        return None
+
+    def used_processes(self):
+        return sum(job['processes'] for job in self.jobs)
+
+    def running_jobs(self):
+        return [job for job in self.jobs if job['thread'] is not None and job['status'] not in finished_status]
+
+    def schedule(self):
+        budget = batch_process_budget(self.config_dict)
+        waiting = [job for job in self.jobs if job['status'] == 'queued']
+        for index, job in enumerate(waiting):
+            free = budget - self.used_processes()
+            if free < 1:
+                break
+            # the free processes are shared between the jobs waiting
+            share = math.ceil(free / (len(waiting) - index))
+            self.start_job(job, max(1, min(share, len(job['batch_dict']['file_list']))))
+
+    def start_job(self, job, processes):
+        logging.debug('gui - queue_functions.py - BatchJobQueue - start_job - job ' + str(job['id']) + ', processes '
+                      + str(processes))
+        thread = BatchProcessingThread(job['batch_dict'], self.config_dict)
+        # the concatenation writes a single file, in the thread of the job
+        if job['batch_dict']['process'] == 1:
+            processes = 1
+        thread.processes = processes
+        thread.progress.connect(self.job_progress)
+        thread.finished.connect(self.job_finished)
+        thread.error.connect(self.job_failed)
+        job.update(thread=thread, processes=processes, status='running', message='Standby...')
+        thread.start()
+        self.job_changed.emit(job['id'])
+
+    def job_progress(self, val):
+        job = self.thread_job(self.sender())
+        if job is not None:
+            job['message'], job['progress'] = val[0], val[1]
+            self.job_changed.emit(job['id'])
+
+    def job_finished(self):
+        job = self.thread_job(self.sender())
+        if job is None:
+            return
+        logging.debug('gui - queue_functions.py - BatchJobQueue - job_finished - job ' + str(job['id']))
+        failed_files = job['thread'].failed_files
+        job.update(status='done', progress=100, processes=0)
+        if failed_files:
+            job['message'] = str(len(failed_files)) + ' files failed, please read the log file'
+        else:
+            job['message'] = 'The batch processing has been well executed.'
+        self.job_changed.emit(job['id'])
+        self.schedule()
+
+    def job_failed(self, val):
+        job = self.thread_job(self.sender())
+        if job is None:
+            return
+        logging.debug('gui - queue_functions.py - BatchJobQueue - job_failed - job ' + str(job['id']))
+        job.update(status='failed', processes=0, message=val[0] + ': ' + val[1])
+        self.job_changed.emit(job['id'])
+        self.schedule()
+
+    def pause_job(self, job_id):
+        job = self.job(job_id)
+        if job is None or job['status'] not in ['queued', 'running']:
+            return
+        if job['thread'] is not None:
+            job['thread'].pause()
+        job['status'] = 'paused'
+        self.job_changed.emit(job_id)
+
+    def resume_job(self, job_id):
+        job = self.job(job_id)
+        if job is None or job['status'] != 'paused':
+            return
+        if job['thread'] is not None:
+            job['thread'].resume()
+            job['status'] = 'running'
+            self.job_changed.emit(job_id)
+        else:
+            job['status'] = 'queued'
+            self.job_changed.emit(job_id)
+            self.schedule()
+
+    def stop_job(self, job_id):
+        job = self.job(job_id)
+        if job is None or job['status'] in finished_status:
+            return
+        logging.debug('gui - queue_functions.py - BatchJobQueue - stop_job - job ' + str(job_id))
+        if job['thread'] is not None:
+            job['thread'].stop()
+            job['thread'].wait()
+            job.update(status='stopped', processes=0, message='Stopped by the user')
+        else:
+            job.update(status='cancelled', message='Cancelled by the user')
+        self.job_changed.emit(job_id)
+        self.schedule()
+
+    def move_job(self, job_id, offset):
+        # jobs waiting are started in their order in the queue
+        job = self.job(job_id)
+        index = self.jobs.index(job)
+        if 0 <= index + offset < len(self.jobs):
+            self.jobs.insert(index + offset, self.jobs.pop(index))
+            self.queue_changed.emit()
+
+    def clear_finished_jobs(self):
+        for job in self.jobs:
+            if job['status'] in finished_status and job['thread'] is not None:
+                job['thread'].wait()
+        self.jobs = [job for job in self.jobs if job['status'] not in finished_status]
+        self.queue_changed.emit()
+
+    def stop_all_jobs(self):
+        logging.debug('gui - queue_functions.py - BatchJobQueue - stop_all_jobs')
+        # jobs waiting are cancelled first to not be started when a running job stops
+        for job in self.jobs:
+            if job['thread'] is None and job['status'] in ['queued', 'paused']:
+                job.update(status='cancelled', message='Cancelled by the user')
+                self.job_changed.emit(job['id'])
+        for job in self.running_jobs():
+            self.stop_job(job['id'])
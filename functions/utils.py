@@ -31,9 +31,16 @@ def create_option_file(user_path):
     config_dict.add_section('GENERAL')
     config_dict.set('LOG', 'level', 'DEBUG')
     config_dict.set('LOG', 'path', str(user_path))
-    config_dict.set('SYSTEM', 'read_as_float', 'False')
+    config_dict.set('SYSTEM', 'read_dtype', 'native')
     config_dict.set('SYSTEM', 'replace_fill_value', 'False')
     config_dict.set('SYSTEM', 'switch_fill_value', 'False')
+    config_dict.set('SYSTEM', 'lazy_loading', 'False')
+    config_dict.set('SYSTEM', 'memory_mapping', 'False')
+    config_dict.set('SYSTEM', 'reading_threads', '4')
+    config_dict.set('SYSTEM', 'storage_preset', 'default')
+    config_dict.set('SYSTEM', 'chunk_length', 'auto')
+    config_dict.set('SYSTEM', 'write_memory', '256')
+    config_dict.set('SYSTEM', 'batch_processes', '1')
     config_dict.set('PLOTS', 'same_unit_plot', '2')
     config_dict.set('PLOTS', 'subplot_disposition', '0')
     config_dict.set('PLOTS', 'x_info_disabled', 'False')
@@ -80,6 +87,34 @@ def update_config_file(user_path):
     if config_dict['GENERAL'].getboolean('dimension_warning') is None:
         option_missing = True
         config_dict.set('GENERAL', 'dimension_warning', 'True')
+    if config_dict['SYSTEM'].getboolean('lazy_loading') is None:
+        option_missing = True
+        config_dict.set('SYSTEM', 'lazy_loading', 'False')
+    if config_dict['SYSTEM'].getboolean('memory_mapping') is None:
+        option_missing = True
+        config_dict.set('SYSTEM', 'memory_mapping', 'False')
+    if config_dict['SYSTEM'].get('reading_threads') is None:
+        option_missing = True
+        config_dict.set('SYSTEM', 'reading_threads', '4')
+    if config_dict['SYSTEM'].get('read_dtype') is None:
+        option_missing = True
+        if config_dict['SYSTEM'].getboolean('read_as_float'):
+            config_dict.set('SYSTEM', 'read_dtype', 'float64')
+        else:
+            config_dict.set('SYSTEM', 'read_dtype', 'native')
+        config_dict.remove_option('SYSTEM', 'read_as_float')
+    if config_dict['SYSTEM'].get('storage_preset') is None:
+        option_missing = True
+        config_dict.set('SYSTEM', 'storage_preset', 'default')
+    if config_dict['SYSTEM'].get('chunk_length') is None:
+        option_missing = True
+        config_dict.set('SYSTEM', 'chunk_length', 'auto')
+    if config_dict['SYSTEM'].get('write_memory') is None:
+        option_missing = True
+        config_dict.set('SYSTEM', 'write_memory', '256')
+    if config_dict['SYSTEM'].get('batch_processes') is None:
+        option_missing = True
+        config_dict.set('SYSTEM', 'batch_processes', '1')
     if option_missing:
         ini_file = open(str(pathlib.Path(user_path, 'egads_gui.ini')), 'w')
         config_dict.write(ini_file)
@@ -12,6 +12,7 @@ from functions.window_functions.other_windows_functions import (MyInfo, MyFill,
                                                                 MyOverwriteFilename, MyWait, MyCoeff,
                                                                 MyExistingVariable)
 from functions.thread_functions.processing_functions import VariableProcessingThread
+from functions.file_functions.lazy_loading_functions import is_variable
 from functions.help_functions import algorithm_creation_information_text
 
 
@@ -717,7 +718,7 @@ class MyProcessing(QtWidgets.QDialog, Ui_processingWindow):
     def prepare_variable_dict(var_dict):
         new_dict = {}
         for key, value in var_dict.items():
-            if isinstance(value[0], egads.EgadsData):
+            if is_variable(value[0]):
                 new_dict[key] = value
         return new_dict
 
@@ -5,19 +5,26 @@ import pathlib
 import egads
 from PyQt5 import QtCore, QtGui, QtWidgets
 from ui.Ui_batchprocessingwindow import Ui_batchProcessingWindow
-from ui.Ui_waitbatchwindow import Ui_waitBatchWindow
 from ui.Ui_batchinfowindow import Ui_batchInfoWindow
-from functions.window_functions.other_windows_functions import MyInfo, MyCoeff
-from functions.gui_functions.gui_widgets import QtWaitingSpinner
-from functions.thread_functions.processing_functions import BatchProcessingThread
+from ui.Ui_batchqueuewindow import Ui_batchQueueWindow
+from functions.window_functions.other_windows_functions import MyInfo, MyCoeff, MyWait
+from functions.thread_functions.processing_functions import output_path
+from functions.thread_functions.pool_functions import batch_process_budget
+from functions.thread_functions.estimate_functions import BatchEstimationThread, report_lines
+from functions.thread_functions.file_functions import CatalogScanThread
+from functions.file_functions.catalog_functions import catalog_date, filter_entries
+from functions.gui_functions.gui_widgets import FileListModel
+from functions.file_functions.nasa_ames_functions import NasaAmesReader
+from functions.file_functions.dimension_index_functions import DimensionIndex
 from functions.help_functions import batch_processing_information_text
+from functions.file_functions.storage_functions import storage_presets
 from functions.utils import (humansize, clear_layout, font_creation_function, stylesheet_creation_function,
                              icon_creation_function, multi_full_path_name_from_treewidget,
                              full_path_name_from_treewidget)
 
 
 class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
-    def __init__(self, list_of_algorithms, config_dict):
+    def __init__(self, list_of_algorithms, config_dict, batch_queue, file_catalog):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - __init__')
         QtWidgets.QWidget.__init__(self)
         self.setupUi(self)
@@ -25,6 +32,14 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
         self.listWidget.setFocusPolicy(QtCore.Qt.NoFocus)
         self.list_of_algorithms = list_of_algorithms
         self.config_dict = config_dict
+        self.batch_queue = batch_queue
+        self.file_catalog = file_catalog
+        self.catalog_thread = None
+        self.catalog_folder = None
+        self.file_model = FileListModel(self)
+        self.listWidget.setModel(self.file_model)
+        self.estimation_thread = None
+        self.wait_window = None
         self.bw_label_10.setText('')
         self.options_layout.setAlignment(QtCore.Qt.AlignTop)
         self.processing_layout.setAlignment(QtCore.Qt.AlignTop)
@@ -35,6 +50,7 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
         self.bw_combobox_7.setItemDelegate(QtWidgets.QStyledItemDelegate())
         self.bw_combobox_8.setItemDelegate(QtWidgets.QStyledItemDelegate())
         self.bw_combobox_9.setItemDelegate(QtWidgets.QStyledItemDelegate())
+        self.bw_combobox_10.setItemDelegate(QtWidgets.QStyledItemDelegate())
         self.bw_checkbox_1.stateChanged.connect(self.activate_filename_creation)
         self.bw_checkbox_1.stateChanged.connect(self.activate_launch_processing_button)
         self.bw_button_cancel.clicked.connect(self.closeWindow)
@@ -63,6 +79,13 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
         self.bw_edit_8.textChanged.connect(self.activate_launch_processing_button)
         self.bw_edit_9.textChanged.connect(self.activate_launch_processing_button)
         self.bw_edit_2.textChanged.connect(self.update_infolder_file_list)
+        self.bw_checkbox_2.toggled.connect(self.update_infolder_file_list)
+        self.bw_edit_10.textChanged.connect(self.populate_file_list_widget)
+        self.bw_edit_11.textChanged.connect(self.populate_file_list_widget)
+        self.bw_edit_12.textChanged.connect(self.populate_file_list_widget)
+        self.bw_edit_10.textChanged.connect(self.activate_launch_processing_button)
+        self.bw_edit_11.textChanged.connect(self.activate_launch_processing_button)
+        self.bw_edit_12.textChanged.connect(self.activate_launch_processing_button)
         self.bw_edit_2.textChanged.connect(self.activate_launch_processing_button)
         self.bw_edit_3.textChanged.connect(self.activate_launch_processing_button)
         self.bw_radiobox_1.toggled.connect(self.populate_file_list_widget_from_radiobuttons)
@@ -75,7 +98,7 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
         self.button_format_text = {'NetCDF': ('*.nc', '*.cdf'), 'NASA Ames': ('*.na',),
                                    'HDF5': ('*.h5', '*.hdf5', '*.he5'),
                                    'no button': ('*.nc', '*.cdf', '*.na', '*.h5', '*.hdf5', '*.he5')}
-        self.listWidget.itemSelectionChanged.connect(self.activate_list_item_buttons)
+        self.listWidget.selectionModel().selectionChanged.connect(self.activate_list_item_buttons)
         self.bw_up_button.clicked.connect(self.move_up_item)
         self.bw_down_button.clicked.connect(self.move_down_item)
         self.bw_plus_button.clicked.connect(self.add_new_item)
@@ -88,8 +111,10 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
 
         self.bw_file_info.clicked.connect(self.info_item)
         self.bw_button_ok.clicked.connect(self.launch_processing)
+        self.bw_button_dry.clicked.connect(self.launch_dry_run)
         self.bw_info_1.clicked.connect(self.batch_button_info)
         self.bw_info_3.clicked.connect(self.batch_button_info)
+        self.bw_info_12.clicked.connect(self.batch_button_info)
         self.bw_info_4.clicked.connect(self.batch_button_info)
         self.bw_info_5.clicked.connect(self.batch_button_info)
         self.bw_info_6.clicked.connect(self.batch_button_info)
@@ -111,6 +136,9 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
         self.options_label_1 = None
         self.options_label_2 = None
         self.options_combobox_1 = None
+        self.options_hl_5 = None
+        self.options_label_4 = None
+        self.options_combobox_3 = None
         self.options_list = None
         self.options_gl_1 = None
         self.options_hl_4 = None
@@ -121,6 +149,17 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
         self.grid_layout_input_1 = None
         self.grid_layout_input_2 = None
         self.options_line_1 = None
+        self.options_line_2 = None
+        self.options_hl_6 = None
+        self.options_label_5 = None
+        self.options_info_1 = None
+        self.options_hl_7 = None
+        self.options_list_2 = None
+        self.options_button_2 = None
+        self.options_button_3 = None
+        self.options_hl_8 = None
+        self.options_checkbox_1 = None
+        self.algorithm_steps = []
         self.input_activate = 0
         self.list_of_inputs = []
         self.list_label_input = []
@@ -141,6 +180,7 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
     def process_selection(self, val):
         clear_layout(self.processing_layout)
         self.clear_option_layout()
+        self.algorithm_steps = []
         self.bw_radiobox_2.setEnabled(True)
         self.set_default_radiobutton()
         if val == 1 or val == 3 or val == 4:
@@ -153,6 +193,43 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
 
     def launch_processing(self):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - launch_processing')
+        # the job is run by the queue of the main window, the window of the batch jobs displays its progress
+        self.batch_queue.add_job(self.create_batch_dict())
+        self.close()
+
+    def launch_dry_run(self):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - launch_dry_run')
+        # the headers of the files are read and a sample file is processed in a temporary folder, nothing is written
+        # in the destination folder
+        self.estimation_thread = BatchEstimationThread(self.create_batch_dict(), self.config_dict)
+        self.estimation_thread.started.connect(self.launch_wait_window)
+        self.estimation_thread.finished.connect(self.dry_run_finished)
+        self.estimation_thread.error.connect(self.dry_run_error)
+        self.estimation_thread.start()
+
+    def launch_wait_window(self):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - launch_wait_window')
+        self.wait_window = MyWait('Reading the files and processing a sample, please wait...')
+        self.wait_window.exec_()
+
+    def dry_run_finished(self, report):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - dry_run_finished')
+        self.wait_window.close()
+        lines = [line.replace('    ', '&nbsp;' * 4) for line in report_lines(report, humansize)]
+        info_window = MyInfo('<b>Dry run of the batch processing</b><br><br>' + '<br>'.join(lines))
+        info_window.resize(650, 450)
+        info_window.exec_()
+
+    def dry_run_error(self, val):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - dry_run_error')
+        self.wait_window.close()
+        info_window = MyInfo('An exception occurred during the dry run of the batch processing. Please check the log '
+                             'file for details about the exception.<br><br>Exception type: ' + val[0] +
+                             '<br><br>Exception value: ' + val[1])
+        info_window.exec_()
+
+    def create_batch_dict(self):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - create_batch_dict')
         filename_options = None
         if not self.bw_checkbox_1.isChecked():
             filename_options = []
@@ -172,52 +249,38 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
                 elif combobox.currentIndex() == 4:
                     filename_options.append(str(line.text()))
         processing_options = None
+        concatenation = None
+        steps = None
+        drop_intermediate = False
         if self.bw_combobox_1.currentIndex() == 1:
             processing_options = int(self.options_combobox_1.currentIndex())
+            concatenation = ['merge', 'time'][self.options_combobox_3.currentIndex()]
         elif self.bw_combobox_1.currentIndex() == 2:
             processing_options = self.bw_proc_combobox_1.currentText()
         elif self.bw_combobox_1.currentIndex() == 3 or self.bw_combobox_1.currentIndex() == 4:
             processing_options = multi_full_path_name_from_treewidget(self.options_list)
         elif self.bw_combobox_1.currentIndex() == 5:
-            input_list, output_list = [], []
-            for widget in self.list_combobox_input:
-                if isinstance(widget, QtWidgets.QComboBox):
-                    input_list.append(str(widget.currentText()))
-                elif isinstance(widget, QtWidgets.QLineEdit):
-                    try:
-                        input_list.append(float(widget.text()))
-                    except ValueError:
-                        input_list.append(str(widget.text()))
-                elif isinstance(widget, QtWidgets.QHBoxLayout):
-                    input_list.append(self.coefficient_matrix_values[widget.itemAt(0).widget().objectName()])
-            for widget in self.list_edit_output:
-                output_list.append(str(widget.text()))
-            processing_options = {'inputs': input_list, 'outputs': output_list}
+            processing_options = self.algorithm_input_output()
+            if self.algorithm_steps:
+                # the algorithm displayed is the last step of the chain, unless it has just been added to it
+                steps = list(self.algorithm_steps)
+                if steps[-1] != {'algorithm': self.algorithm, **processing_options}:
+                    steps.append({'algorithm': self.algorithm, **processing_options})
+                drop_intermediate = self.options_checkbox_1.isChecked()
         if self.bw_combobox_4.currentIndex() == 0:
             stop_processing = True
         else:
             stop_processing = False
+        storage = None
+        if self.bw_combobox_10.currentIndex() > 0:
+            storage = storage_presets[self.bw_combobox_10.currentIndex() - 1]
         batch_dict = {'process': int(self.bw_combobox_1.currentIndex()), 'algorithm': self.algorithm,
-                      'file_list': self.infolder_file_list, 'destination_folder': str(self.bw_edit_3.text()),
+                      'file_list': self.file_model.file_paths(), 'destination_folder': str(self.bw_edit_3.text()),
                       'filename_options': filename_options, 'processing_options': processing_options,
-                      'stop_processing': stop_processing, 'out_format': str(self.buttonGroup.checkedButton().text())}
-
-        processing_window = MyWaitProcessing(batch_dict, self.config_dict)
-        processing_window.exec_()
-        error_occurred = processing_window.error_occurred
-        success = processing_window.success
-        if error_occurred:
-            exc_type = processing_window.error_message[0]
-            exc_value = processing_window.error_message[1]
-            info_str = ('An important exception occurred during the batch processing. The GUI decided to stop the '
-                        'processing based on the choice of the user (cf. first tab and error option). Please read the '
-                        'log file to check details about the exception. Contact the developer if the same exception '
-                        'occurs again.<br><br>Exception type: ' + exc_type + '<br><br>Exception value: ' + exc_value)
-            info_indow = MyInfo(info_str)
-            info_indow.exec_()
-        if success:
-            info_indow = MyInfo('The batch processing has been well executed.')
-            info_indow.exec_()
+                      'stop_processing': stop_processing, 'out_format': str(self.buttonGroup.checkedButton().text()),
+                      'storage': storage, 'concatenation': concatenation, 'steps': steps,
+                      'drop_intermediate': drop_intermediate}
+        return batch_dict
 
     def set_other_processing(self, val):
         font1 = font_creation_function('normal')
@@ -258,7 +321,10 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
                                    'course, it is not possible to concatenate NetCDF files AND HDF5 files AND NASA '
                                    'Ames file '
                                    'into the same file.</li><li>do not forget that EGADS only handles NASA Ames '
-                                   'file with an FFI equal to 1001.</li></ul></p>')
+                                   'file with an FFI equal to 1001.</li></ul>NetCDF and HDF5 files, segments of '
+                                   'the same flight, can also be joined along their time dimension: segments are '
+                                   'ordered by time, each variable along time is appended segment after segment and '
+                                   'the time must be strictly increasing.</p>')
             self.set_concatenation_options()
         elif val == 3:
             bw_proc_edit_1.setText('<p align="justify">Use this function to delete global metadata from a '
@@ -677,6 +743,177 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
                                              self.output_num, 5, 1, 1)
             self.output_num += 1
             self.populate_algorithm_input_combobox()
+        self.set_algorithm_chain_options()
+
+    def set_algorithm_chain_options(self):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - set_algorithm_chain_options')
+        font1 = font_creation_function('big')
+        font2 = font_creation_function('normal')
+        font3 = font_creation_function('small')
+        icon1 = icon_creation_function('info_icon.svg')
+        self.options_layout.addItem(QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum,
+                                                          QtWidgets.QSizePolicy.Fixed))
+        self.options_line_2 = QtWidgets.QFrame()
+        self.options_line_2.setFrameShape(QtWidgets.QFrame.HLine)
+        self.options_line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.options_line_2.setObjectName("options_line_2")
+        self.options_line_2.setStyleSheet(stylesheet_creation_function('qframe_algo'))
+        self.options_layout.addWidget(self.options_line_2)
+        self.options_layout.addItem(QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum,
+                                                          QtWidgets.QSizePolicy.Fixed))
+        self.options_hl_6 = QtWidgets.QHBoxLayout()
+        self.options_hl_6.setObjectName("options_hl_6")
+        self.options_label_5 = QtWidgets.QLabel()
+        self.options_label_5.setEnabled(True)
+        self.options_label_5.setMinimumSize(QtCore.QSize(0, 27))
+        self.options_label_5.setMaximumSize(QtCore.QSize(16777215, 27))
+        self.options_label_5.setFont(font1)
+        self.options_label_5.setStyleSheet(stylesheet_creation_function('qlabel'))
+        self.options_label_5.setAlignment(QtCore.Qt.AlignLeading | QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+        self.options_label_5.setObjectName("options_label_5")
+        self.options_hl_6.addWidget(self.options_label_5)
+        self.options_hl_6.addItem(QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed,
+                                                        QtWidgets.QSizePolicy.Minimum))
+        self.options_info_1 = QtWidgets.QToolButton()
+        self.options_info_1.setMinimumSize(QtCore.QSize(27, 27))
+        self.options_info_1.setMaximumSize(QtCore.QSize(27, 27))
+        self.options_info_1.setStyleSheet(stylesheet_creation_function('qtoolbutton'))
+        self.options_info_1.setIcon(icon1)
+        self.options_info_1.setIconSize(QtCore.QSize(23, 23))
+        self.options_info_1.setObjectName("options_info_1")
+        self.options_hl_6.addWidget(self.options_info_1)
+        self.options_hl_6.addItem(QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding,
+                                                        QtWidgets.QSizePolicy.Minimum))
+        self.options_layout.addLayout(self.options_hl_6)
+        self.options_hl_7 = QtWidgets.QHBoxLayout()
+        self.options_hl_7.setObjectName("options_hl_7")
+        self.options_hl_7.addItem(QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Fixed,
+                                                        QtWidgets.QSizePolicy.Minimum))
+        self.options_list_2 = QtWidgets.QListWidget()
+        self.options_list_2.setMinimumSize(QtCore.QSize(400, 100))
+        self.options_list_2.setMaximumSize(QtCore.QSize(400, 100))
+        self.options_list_2.setFont(font3)
+        self.options_list_2.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.options_list_2.setStyleSheet(stylesheet_creation_function('qlistwidget'))
+        self.options_list_2.setObjectName("options_list_2")
+        self.options_hl_7.addWidget(self.options_list_2)
+        self.options_hl_7.addItem(QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed,
+                                                        QtWidgets.QSizePolicy.Minimum))
+        options_vl_1 = QtWidgets.QVBoxLayout()
+        options_vl_1.setObjectName("options_vl_1")
+        self.options_button_2 = QtWidgets.QToolButton()
+        self.options_button_2.setMinimumSize(QtCore.QSize(150, 27))
+        self.options_button_2.setMaximumSize(QtCore.QSize(150, 27))
+        self.options_button_2.setFont(font2)
+        self.options_button_2.setStyleSheet(stylesheet_creation_function('qtoolbutton_win'))
+        self.options_button_2.setObjectName("options_button_2")
+        options_vl_1.addWidget(self.options_button_2)
+        self.options_button_3 = QtWidgets.QToolButton()
+        self.options_button_3.setMinimumSize(QtCore.QSize(150, 27))
+        self.options_button_3.setMaximumSize(QtCore.QSize(150, 27))
+        self.options_button_3.setFont(font2)
+        self.options_button_3.setStyleSheet(stylesheet_creation_function('qtoolbutton_win'))
+        self.options_button_3.setObjectName("options_button_3")
+        options_vl_1.addWidget(self.options_button_3)
+        options_vl_1.addItem(QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum,
+                                                   QtWidgets.QSizePolicy.Expanding))
+        self.options_hl_7.addLayout(options_vl_1)
+        self.options_hl_7.addItem(QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding,
+                                                        QtWidgets.QSizePolicy.Minimum))
+        self.options_layout.addLayout(self.options_hl_7)
+        self.options_hl_8 = QtWidgets.QHBoxLayout()
+        self.options_hl_8.setObjectName("options_hl_8")
+        self.options_hl_8.addItem(QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Fixed,
+                                                        QtWidgets.QSizePolicy.Minimum))
+        self.options_checkbox_1 = QtWidgets.QCheckBox()
+        self.options_checkbox_1.setMinimumSize(QtCore.QSize(0, 27))
+        self.options_checkbox_1.setMaximumSize(QtCore.QSize(16777215, 27))
+        self.options_checkbox_1.setFont(font2)
+        self.options_checkbox_1.setStyleSheet(stylesheet_creation_function('qcheckbox'))
+        self.options_checkbox_1.setObjectName("options_checkbox_1")
+        self.options_hl_8.addWidget(self.options_checkbox_1)
+        self.options_hl_8.addItem(QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding,
+                                                        QtWidgets.QSizePolicy.Minimum))
+        self.options_layout.addLayout(self.options_hl_8)
+        self.options_label_5.setText("Chain of algorithms")
+        self.options_button_2.setText("Add to the chain")
+        self.options_button_3.setText("Clear the chain")
+        self.options_checkbox_1.setText("Don't write outputs used by other algorithms")
+        self.options_info_1.clicked.connect(self.batch_button_info)
+        self.options_button_2.clicked.connect(self.add_algorithm_step)
+        self.options_button_3.clicked.connect(self.clear_algorithm_steps)
+        self.populate_algorithm_steps_list()
+
+    def algorithm_input_output(self):
+        input_list, output_list = [], []
+        for widget in self.list_combobox_input:
+            if isinstance(widget, QtWidgets.QComboBox):
+                input_list.append(str(widget.currentText()))
+            elif isinstance(widget, QtWidgets.QLineEdit):
+                try:
+                    input_list.append(float(widget.text()))
+                except ValueError:
+                    input_list.append(str(widget.text()))
+            elif isinstance(widget, QtWidgets.QHBoxLayout):
+                input_list.append(self.coefficient_matrix_values[widget.itemAt(0).widget().objectName()])
+        for widget in self.list_edit_output:
+            output_list.append(str(widget.text()))
+        return {'inputs': input_list, 'outputs': output_list}
+
+    def algorithm_options_set(self):
+        for widget in self.list_combobox_input:
+            if 'optional' not in widget.objectName():
+                if isinstance(widget, QtWidgets.QComboBox):
+                    if widget.currentIndex() == 0:
+                        return False
+                elif isinstance(widget, QtWidgets.QLineEdit):
+                    if not widget.text():
+                        return False
+                elif isinstance(widget, QtWidgets.QHBoxLayout):
+                    if widget.itemAt(0).widget().objectName() not in self.coefficient_matrix_values:
+                        return False
+        for widget in self.list_edit_output:
+            if not widget.text():
+                return False
+        return True
+
+    def add_algorithm_step(self):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - add_algorithm_step')
+        if not self.algorithm_options_set():
+            info_window = MyInfo('All inputs and outputs of the algorithm have to be set before adding it to the '
+                                 'chain.')
+            info_window.exec_()
+            return
+        step = {'algorithm': self.algorithm, **self.algorithm_input_output()}
+        if self.algorithm_steps and self.algorithm_steps[-1] == step:
+            return
+        self.algorithm_steps.append(step)
+        self.populate_algorithm_steps_list()
+        self.populate_algorithm_input_combobox()
+
+    def clear_algorithm_steps(self):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - clear_algorithm_steps')
+        self.algorithm_steps = []
+        self.populate_algorithm_steps_list()
+        self.populate_algorithm_input_combobox()
+        self.activate_launch_processing_button()
+
+    def populate_algorithm_steps_list(self):
+        self.options_list_2.clear()
+        for index, step in enumerate(self.algorithm_steps):
+            self.options_list_2.addItem(str(index + 1) + '. ' + step['algorithm'].__name__ + ' -> '
+                                        + ', '.join(self.algorithm_step_outputs(step)))
+        self.options_checkbox_1.setEnabled(bool(self.algorithm_steps))
+
+    @staticmethod
+    def algorithm_step_outputs(step):
+        # outputs are written in the group of the first variable of the inputs
+        path_out = ''
+        for item in step['inputs']:
+            if isinstance(item, str) and item:
+                path_out = os.path.dirname(item)
+                break
+        return [output_path(path_out, name) for name in step['outputs']]
 
     def set_delete_var_met_options(self, purpose):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - set_delete_metadata_options')
@@ -820,43 +1057,81 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
         self.options_hl_2.addItem(QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding,
                                                         QtWidgets.QSizePolicy.Minimum))
         self.options_layout.addLayout(self.options_hl_2)
+        self.options_hl_5 = QtWidgets.QHBoxLayout()
+        self.options_hl_5.setObjectName("options_hl_5")
+        self.options_label_4 = QtWidgets.QLabel()
+        self.options_label_4.setEnabled(True)
+        self.options_label_4.setMinimumSize(QtCore.QSize(0, 27))
+        self.options_label_4.setMaximumSize(QtCore.QSize(16777215, 27))
+        self.options_label_4.setFont(font2)
+        self.options_label_4.setStyleSheet(stylesheet_creation_function('qlabel'))
+        self.options_label_4.setAlignment(QtCore.Qt.AlignLeading | QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+        self.options_label_4.setIndent(20)
+        self.options_label_4.setObjectName("options_label_4")
+        self.options_hl_5.addWidget(self.options_label_4)
+        self.options_combobox_3 = QtWidgets.QComboBox()
+        self.options_combobox_3.setMinimumSize(QtCore.QSize(250, 27))
+        self.options_combobox_3.setMaximumSize(QtCore.QSize(250, 27))
+        self.options_combobox_3.setFont(font3)
+        self.options_combobox_3.setStyleSheet(stylesheet_creation_function('qcombobox'))
+        self.options_combobox_3.setFrame(False)
+        self.options_combobox_3.setObjectName("options_combobox_3")
+        self.options_combobox_3.addItem("")
+        self.options_combobox_3.addItem("")
+        self.options_combobox_3.setItemDelegate(QtWidgets.QStyledItemDelegate())
+        self.options_hl_5.addWidget(self.options_combobox_3)
+        self.options_hl_5.addItem(QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding,
+                                                        QtWidgets.QSizePolicy.Minimum))
+        self.options_layout.addLayout(self.options_hl_5)
         self.options_label_1.setText("Global metadata")
         self.options_label_2.setText("Global metadata will be:")
         self.options_combobox_1.setItemText(0, "copied from the first file")
         self.options_combobox_1.setItemText(1, "concatenated from all files")
         self.options_combobox_1.setItemText(2, "deleted (no global metadata)")
+        self.options_label_4.setText("Files will be:")
+        self.options_combobox_3.setItemText(0, "merged, variables side by side")
+        self.options_combobox_3.setItemText(1, "joined along the time dimension")
 
     def populate_file_list_widget_from_radiobuttons(self):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - populate_file_list_widget')
         if self.sender().isChecked():
-            self.listWidget.clear()
-            try:
-                button_text = self.buttonGroup.checkedButton().text()
-            except AttributeError:
-                button_text = 'no button'
-            for file in self.infolder_file_list:
-                for ext in self.button_format_text[button_text]:
-                    if ext[1:] in file:
-                        item = QtWidgets.QListWidgetItem(pathlib.Path(file).name)
-                        item.setToolTip(str(file))
-                        self.listWidget.addItem(item)
-            self.populate_combobox_options()
+            self.populate_file_list_widget()
 
     def populate_file_list_widget(self):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - populate_file_list_widget')
-        self.listWidget.clear()
+        # the files of the folder are filtered with their entries in the catalog, without being opened
         try:
             button_text = self.buttonGroup.checkedButton().text()
+            formats = [button_text]
         except AttributeError:
-            button_text = 'no button'
-        for file in self.infolder_file_list:
-            for ext in self.button_format_text[button_text]:
-                if ext[1:] in file:
-                    item = QtWidgets.QListWidgetItem(pathlib.Path(file).name)
-                    item.setToolTip(str(file))
-                    self.listWidget.addItem(item)
+            formats = None
+        start, end = None, None
+        try:
+            start = catalog_date(self.bw_edit_11.text())
+        except ValueError:
+            pass
+        try:
+            end = catalog_date(self.bw_edit_12.text(), end=True)
+        except ValueError:
+            pass
+        entries = [self.file_catalog.entry(file_path) for file_path in self.infolder_file_list]
+        self.file_model.set_entries(filter_entries(entries, formats, self.bw_edit_10.text(), start, end))
+        self.set_catalog_status()
+        self.activate_list_item_buttons()
         self.populate_combobox_options()
 
+    def set_catalog_status(self, text=None):
+        if text is None:
+            text = (str(self.file_model.rowCount()) + ' files displayed, ' + str(len(self.infolder_file_list))
+                    + ' files in the folder')
+        self.bw_label_14.setText(text)
+
+    def file_list_names(self):
+        return [pathlib.Path(file_path).name for file_path in self.file_model.file_paths()]
+
+    def file_list_path(self, name):
+        return self.file_model.file_paths()[self.file_list_names().index(name)]
+
     def populate_combobox_category(self):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - populate_combobox_1')
         self.bw_proc_combobox_1.addItem("Make a choice...")
@@ -890,12 +1165,10 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
         if self.tabWidget.count() > 3:
             if self.bw_combobox_1.currentText() == 'Delete one or more global metadata':
                 self.options_combobox_2.clear()
-                for i in range(self.listWidget.count()):
-                    self.options_combobox_2.addItem(self.listWidget.item(i).text())
+                self.options_combobox_2.addItems(self.file_list_names())
             elif self.bw_combobox_1.currentText() == 'Delete one or more variables':
                 self.options_combobox_2.clear()
-                for i in range(self.listWidget.count()):
-                    self.options_combobox_2.addItem(self.listWidget.item(i).text())
+                self.options_combobox_2.addItems(self.file_list_names())
             elif self.bw_combobox_1.currentText() == 'Execute an algorithm':
                 self.populate_algorithm_input_combobox()
 
@@ -905,29 +1178,29 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
         self.options_list.clear()
         if (self.bw_combobox_1.currentText() == 'Delete one or more global metadata' and
                 self.options_combobox_2.currentText() != ''):
-            item = self.listWidget.findItems(self.options_combobox_2.currentText(), QtCore.Qt.MatchExactly)[0]
+            file_path = self.file_list_path(self.options_combobox_2.currentText())
             if self.bw_radiobox_1.isChecked():
-                f = egads.input.EgadsNetCdf(item.toolTip(), 'r')
+                f = egads.input.EgadsNetCdf(file_path, 'r')
             else:
-                f = egads.input.EgadsHdf(item.toolTip(), 'r')
+                f = egads.input.EgadsHdf(file_path, 'r')
             global_metadata = f.get_attribute_list()
             f.close()
             self.populate_tree_list(global_metadata, 'metadata')
         elif (self.bw_combobox_1.currentText() == 'Delete one or more variables' and
               self.options_combobox_2.currentText() != ''):
-            item = self.listWidget.findItems(self.options_combobox_2.currentText(), QtCore.Qt.MatchExactly)[0]
+            file_path = self.file_list_path(self.options_combobox_2.currentText())
             if self.bw_radiobox_1.isChecked() or self.bw_radiobox_3.isChecked():
                 if self.bw_radiobox_1.isChecked():
-                    f = egads.input.EgadsNetCdf(item.toolTip(), 'r')
+                    f = egads.input.EgadsNetCdf(file_path, 'r')
                 else:
-                    f = egads.input.EgadsHdf(item.toolTip(), 'r')
-                dim_list = list(f.get_dimension_list(group_walk=True, details=True).keys())
+                    f = egads.input.EgadsHdf(file_path, 'r')
+                dim_list = set(DimensionIndex(f).dimensions().keys())
                 var_list = {key: 'variable' for key in f.get_variable_list(group_walk=True, details=True) if key not
                             in dim_list}
                 for group in f.get_group_list(details=True):
                     var_list[group] = 'group'
             else:
-                f = egads.input.NasaAmes(item.toolTip(), 'r')
+                f = NasaAmesReader(file_path, 'r')
                 var_list = {var: 'variable' for var in f.get_variable_list()}
             f.close()
             self.populate_tree_list(var_list, 'variables')
@@ -937,22 +1210,29 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
                       'populate_algorithm_input_combobox')
         if self.bw_combobox_1.currentText() == 'Execute an algorithm':
             if self.algorithm is not None:
-                if self.listWidget.count() > 0:
+                if self.file_model.rowCount() > 0:
                     if self.bw_radiobox_1.isChecked() or self.bw_radiobox_3.isChecked():
                         if self.bw_radiobox_1.isChecked():
-                            f = egads.input.EgadsNetCdf(self.listWidget.item(0).toolTip(), 'r')
+                            f = egads.input.EgadsNetCdf(self.file_model.file_paths()[0], 'r')
                         else:
-                            f = egads.input.EgadsHdf(self.listWidget.item(0).toolTip(), 'r')
+                            f = egads.input.EgadsHdf(self.file_model.file_paths()[0], 'r')
                         variable_list = f.get_variable_list(group_walk=True, details=True)
                     else:
-                        f = egads.input.NasaAmes(self.listWidget.item(0).toolTip(), 'r')
+                        f = NasaAmesReader(self.file_model.file_paths()[0], 'r')
                         variable_list = f.get_variable_list()
                     f.close()
+                    # the outputs of the chain of algorithms can be inputs of the next one
+                    for step in self.algorithm_steps:
+                        variable_list += [var_path for var_path in self.algorithm_step_outputs(step)
+                                          if var_path not in variable_list]
                     for widget in self.list_combobox_input:
                         if isinstance(widget, QtWidgets.QComboBox):
+                            current_text = widget.currentText()
                             widget.clear()
                             widget.addItem('Make a choice...')
                             widget.addItems(sorted(variable_list))
+                            if widget.findText(current_text) > 0:
+                                widget.setCurrentIndex(widget.findText(current_text))
 
     def set_format_radiobutton(self, val):
         if val in [1, 2]:
@@ -995,11 +1275,55 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
                     self.tabWidget.setCurrentIndex(3)
 
     def update_infolder_file_list(self):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - update_infolder_file_list')
+        # the folder is scanned in a thread, a scan still running is stopped and the new folder scanned after it
+        self.catalog_folder = (str(self.bw_edit_2.text()), self.bw_checkbox_2.isChecked())
+        if self.catalog_thread is not None and self.catalog_thread.isRunning():
+            self.catalog_thread.stop()
+            return
         self.infolder_file_list.clear()
-        if pathlib.Path(str(self.bw_edit_2.text())).is_dir():
-            for file in pathlib.Path(str(self.bw_edit_2.text())).glob('*.*'):
-                self.infolder_file_list.append(str(file))
+        if not pathlib.Path(self.catalog_folder[0]).is_dir():
+            self.populate_file_list_widget()
+            return
+        self.set_catalog_status('Indexing the files of the folder...')
+        self.catalog_thread = CatalogScanThread(self.file_catalog, *self.catalog_folder)
+        self.catalog_thread.progress.connect(self.catalog_progress)
+        self.catalog_thread.finished.connect(self.catalog_finished)
+        self.catalog_thread.error.connect(self.catalog_error)
+        self.catalog_thread.interrupted.connect(self.catalog_stopped)
+        self.catalog_thread.start()
+
+    def catalog_progress(self, val):
+        self.set_catalog_status('Indexing the files of the folder: ' + str(val[0]) + '/' + str(val[1]))
+
+    def catalog_finished(self, entries):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - catalog_finished')
+        if self.sender() is not self.catalog_thread:
+            return
+        if (self.sender().folder, self.sender().recursive) != self.catalog_folder:
+            # the folder has been changed after the last check of the scan, the new folder is scanned
+            self.catalog_stopped()
+            return
+        self.infolder_file_list = [entry['path'] for entry in entries]
         self.populate_file_list_widget()
+        self.activate_launch_processing_button()
+
+    def catalog_error(self, val):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - catalog_error')
+        if self.sender() is not self.catalog_thread:
+            return
+        if (self.sender().folder, self.sender().recursive) != self.catalog_folder:
+            self.catalog_stopped()
+            return
+        self.set_catalog_status('The folder can\'t be indexed: ' + val[0] + ': ' + val[1])
+
+    def catalog_stopped(self):
+        # the folder has been changed during the scan, the window may have been closed, the thread has emitted its
+        # last signal and is waited for
+        self.catalog_thread.wait()
+        self.catalog_thread = None
+        if self.isVisible():
+            self.update_infolder_file_list()
 
     def clear_option_layout(self):
         clear_layout(self.options_layout)
@@ -1140,8 +1464,8 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
                     edit_str = ''
             elif combobox.currentIndex() == 2:
                 try:
-                    edit_str = self.listWidget.item(0).text()[:-3]
-                except AttributeError:
+                    edit_str = self.file_list_names()[0][:-3]
+                except IndexError:
                     edit_str = 'original_filename'
             elif combobox.currentIndex() == 3:
                 try:
@@ -1198,7 +1522,7 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
 
     def activate_list_item_buttons(self):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - activate_list_item_buttons')
-        current_items = self.listWidget.selectedItems()
+        current_items = self.listWidget.selectionModel().selectedRows()
         if current_items:
             if len(current_items) == 1:
                 self.bw_up_button.setEnabled(True)
@@ -1218,31 +1542,35 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
 
     def move_up_item(self):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - move_up_item')
-        current_row = self.listWidget.currentRow()
-        self.infolder_file_list.insert(current_row - 1, self.infolder_file_list.pop(current_row))
-        current_item = self.listWidget.takeItem(current_row)
-        self.listWidget.insertItem(current_row - 1, current_item)
-        self.listWidget.setCurrentItem(current_item)
-        if current_row - 1 == 0:
-            self.populate_combobox_options()
+        self.move_item(-1)
 
     def move_down_item(self):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - move_down_item')
-        current_row = self.listWidget.currentRow()
-        self.infolder_file_list.insert(current_row + 1, self.infolder_file_list.pop(current_row))
-        current_item = self.listWidget.takeItem(current_row)
-        self.listWidget.insertItem(current_row + 1, current_item)
-        self.listWidget.setCurrentItem(current_item)
-        if current_row == 0:
+        self.move_item(1)
+
+    def move_item(self, offset):
+        current_row = self.listWidget.currentIndex().row()
+        if not 0 <= current_row + offset < self.file_model.rowCount():
+            return
+        # the files of the folder keep the order of the list when the filters change
+        paths = self.file_model.file_paths()
+        index_1 = self.infolder_file_list.index(paths[current_row])
+        index_2 = self.infolder_file_list.index(paths[current_row + offset])
+        self.infolder_file_list[index_1], self.infolder_file_list[index_2] = (self.infolder_file_list[index_2],
+                                                                            self.infolder_file_list[index_1])
+        self.file_model.moveRow(QtCore.QModelIndex(), current_row, QtCore.QModelIndex(),
+                                current_row + offset + (1 if offset > 0 else 0))
+        self.listWidget.setCurrentIndex(self.file_model.index(current_row + offset))
+        if current_row == 0 or current_row + offset == 0:
             self.populate_combobox_options()
 
     def delete_item(self):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - delete_item')
-        current_items = self.listWidget.selectedItems()
-        for item in current_items:
-            index = self.listWidget.row(item)
-            self.infolder_file_list.pop(index)
-            self.listWidget.takeItem(index)
+        rows = [index.row() for index in self.listWidget.selectionModel().selectedRows()]
+        for row in rows:
+            self.infolder_file_list.remove(self.file_model.entries[row]['path'])
+        self.file_model.remove_rows(rows)
+        self.set_catalog_status()
         self.populate_combobox_options()
 
     def add_new_item(self):
@@ -1257,12 +1585,12 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
             filter_types = 'NetCDF Files (*.nc *.cdf);;NASA Ames Files (*.na);;Hdf Files (*.h5 *.hdf5 *.he5)'
         file_path, _ = QtWidgets.QFileDialog().getOpenFileName(self, 'Select file', '', filter_types)
         if file_path:
-            path, file = os.path.split(file_path)
-            item = QtWidgets.QListWidgetItem(file)
-            item.setToolTip(str(pathlib.Path(path).joinpath(file)))
-            self.infolder_file_list.append(str(pathlib.Path(path).joinpath(file)))
-            self.listWidget.addItem(item)
-            self.populate_combobox_options()
+            entry = self.file_catalog.entry(file_path)
+            if entry['path'] not in self.infolder_file_list:
+                self.infolder_file_list.append(entry['path'])
+                self.file_model.append_entry(entry)
+                self.set_catalog_status()
+                self.populate_combobox_options()
 
     def activate_launch_processing_button(self):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - '
@@ -1274,8 +1602,7 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
         opt_metvar_list = True
         opt_conversion = True
         algorithm_sel = True
-        opt_algorithm_inputs = True
-        opt_algorithm_outputs = True
+        opt_algorithm_options = True
         if self.bw_combobox_1.currentIndex() == 0:
             processing_sel = False
         if self.bw_combobox_1.currentIndex() == 2 and self.bw_proc_combobox_1.currentIndex() == 0:
@@ -1284,41 +1611,40 @@ class MyBatchProcessing(QtWidgets.QDialog, Ui_batchProcessingWindow):
             opt_metvar_list = False
         if self.bw_combobox_1.currentIndex() == 5 and self.bw_proc_combobox_2.count() == 0:
             algorithm_sel = False
-        if self.listWidget.count() == 0:
+        if self.file_model.rowCount() == 0:
             in_files = False
         if not self.bw_edit_3.text():
             out_folder = False
         if not self.bw_checkbox_1.isChecked() and not self.bw_label_10.text():
             file_naming = False
-        for widget in self.list_combobox_input:
-            if 'optional' not in widget.objectName():
-                if isinstance(widget, QtWidgets.QComboBox):
-                    if widget.currentIndex() == 0:
-                        opt_algorithm_inputs = False
-                elif isinstance(widget, QtWidgets.QLineEdit):
-                    if not widget.text():
-                        opt_algorithm_inputs = False
-                elif isinstance(widget, QtWidgets.QHBoxLayout):
-                    if widget.itemAt(0).widget().objectName() not in self.coefficient_matrix_values:
-                        opt_algorithm_inputs = False
-        for widget in self.list_edit_output:
-            if not widget.text():
-                opt_algorithm_outputs = False
+        if not self.algorithm_options_set():
+            opt_algorithm_options = False
         if (processing_sel and in_files and out_folder and file_naming and opt_metvar_list and opt_conversion and
-                algorithm_sel and opt_algorithm_inputs and opt_algorithm_outputs):
+                algorithm_sel and opt_algorithm_options):
             self.bw_button_ok.setEnabled(True)
+            self.bw_button_dry.setEnabled(True)
         else:
             self.bw_button_ok.setEnabled(False)
+            self.bw_button_dry.setEnabled(False)
 
     def info_item(self):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - info_item')
-        batch_info_window = MyBatchInfo(self.listWidget.currentItem().toolTip())
+        batch_info_window = MyBatchInfo(self.file_model.file_paths()[self.listWidget.currentIndex().row()])
         batch_info_window.exec_()
 
     def closeWindow(self):
         logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - closeWindow')
         self.close()
 
+    def done(self, result):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchProcessing - done')
+        # the window is closed by a button, escape or its title bar, the files already indexed are saved by the scan
+        # when it stops
+        if self.catalog_thread is not None and self.catalog_thread.isRunning():
+            self.catalog_thread.stop()
+            self.catalog_thread.wait()
+        QtWidgets.QDialog.done(self, result)
+
 
 class MyBatchInfo(QtWidgets.QDialog, Ui_batchInfoWindow):
     def __init__(self, file_path):
@@ -1351,7 +1677,7 @@ class MyBatchInfo(QtWidgets.QDialog, Ui_batchInfoWindow):
             else:
                 file = egads.input.EgadsHdf(self.file_path, 'r')
             var_list = {}
-            dim_list = [dim_path for dim_path in file.get_dimension_list(group_walk=True, details=True)]
+            dim_list = set(DimensionIndex(file).dimensions().keys())
 
             for var_path in file.get_variable_list(group_walk=True, details=True):
                 if var_path in dim_list:
@@ -1363,7 +1689,7 @@ class MyBatchInfo(QtWidgets.QDialog, Ui_batchInfoWindow):
                 var_list[group_dict['path']] = [file.get_attribute_list(group_dict['path']), 'group']
         else:
             self.file_dict['ext'] = 'nasaames'
-            file = egads.input.NasaAmes(self.file_path, 'r')
+            file = NasaAmesReader(self.file_path, 'r')
             var_list = file.get_variable_list()
             var_list += file.get_variable_list(vartype='independant')
         self.file_dict['variables'] = var_list
@@ -1522,63 +1848,92 @@ class MyBatchInfo(QtWidgets.QDialog, Ui_batchInfoWindow):
         self.close()
 
 
-class MyWaitProcessing(QtWidgets.QDialog, Ui_waitBatchWindow):
-    def __init__(self, batch_dict, config_dict):
-        logging.debug('gui - batch_processing_window_functions.py - MyWaitProcessing - __init__')
+class MyBatchQueue(QtWidgets.QWidget, Ui_batchQueueWindow):
+    # window of the batch jobs, it isn't modal, the main window can be used while jobs are running
+    def __init__(self, batch_queue):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchQueue - __init__')
         QtWidgets.QWidget.__init__(self)
         self.setupUi(self)
-        self.batch_dict = batch_dict
-        self.config_dict = config_dict
-        self.spinner = None
-        self.batch_thread = None
-        self.error_occurred = False
-        self.success = True
-        self.error_message = None
-        self.setup_spinner()
-        self.launch_processing_thread()
-        logging.info('gui - batch_processing_window_functions.py - MyWaitProcessing - ready')
-
-    def update_progress(self, val):
-        progress_str, progress_nbr = val[0], val[1]
-        if len(progress_str) > 65:
-            progress_str = progress_str[:32] + '...' + progress_str[-32:0]
-        self.progress_label.setText(progress_str)
-        self.progress_bar.setValue(progress_nbr)
-
-    def launch_processing_thread(self):
-        logging.debug('gui - batch_processing_window_functions.py - MyWaitProcessing - launch_processing_thread')
-        self.batch_thread = BatchProcessingThread(self.batch_dict, self.config_dict)
-        self.batch_thread.start()
-        self.batch_thread.progress.connect(self.update_progress)
-        self.batch_thread.finished.connect(self.processing_finished)
-        self.batch_thread.error.connect(self.processing_failed)
-
-    def processing_finished(self):
-        logging.debug('gui - batch_processing_window_functions.py - MyWaitProcessing - processing_finished')
-        self.close()
+        self.batch_queue = batch_queue
+        self.job_widgets = {}
+        self.bq_tree.setColumnWidth(0, 220)
+        self.bq_tree.setColumnWidth(1, 70)
+        self.bq_tree.setColumnWidth(2, 130)
+        self.bq_buttons = {'up': self.bq_button_up, 'down': self.bq_button_down, 'pause': self.bq_button_pause,
+                           'resume': self.bq_button_resume, 'stop': self.bq_button_stop, 'clear': self.bq_button_clear}
+        self.bq_button_up.clicked.connect(lambda: self.move_job(-1))
+        self.bq_button_down.clicked.connect(lambda: self.move_job(1))
+        self.bq_button_pause.clicked.connect(self.pause_job)
+        self.bq_button_resume.clicked.connect(self.resume_job)
+        self.bq_button_stop.clicked.connect(self.stop_job)
+        self.bq_button_clear.clicked.connect(self.batch_queue.clear_finished_jobs)
+        self.bq_tree.itemSelectionChanged.connect(self.activate_buttons)
+        self.batch_queue.queue_changed.connect(self.populate_job_tree)
+        self.batch_queue.job_changed.connect(self.update_job)
+        self.populate_job_tree()
+        logging.info('gui - batch_processing_window_functions.py - MyBatchQueue - ready')
 
-    def processing_failed(self, val):
-        logging.debug('gui - batch_processing_window_functions.py - MyWaitProcessing - processing_failed')
-        self.error_occurred = True
-        self.success = False
-        self.error_message = val
-        self.close()
+    def populate_job_tree(self):
+        logging.debug('gui - batch_processing_window_functions.py - MyBatchQueue - populate_job_tree')
+        selected_job = self.selected_job()
+        self.bq_tree.clear()
+        self.job_widgets = {}
+        for job in self.batch_queue.jobs:
+            item = QtWidgets.QTreeWidgetItem(self.bq_tree)
+            item.setData(0, QtCore.Qt.UserRole, job['id'])
+            progress_bar = QtWidgets.QProgressBar()
+            progress_bar.setMaximumSize(QtCore.QSize(16777215, 20))
+            progress_bar.setStyleSheet('QProgressBar {\n   border: 0px solid black;\n   border-radius: 3px;\n'
+                                       '   background: rgb(220,220,220);\n   color: rgb(45,45,45);\n'
+                                       '   text-align: center;\n}\n\nQProgressBar::chunk {\n'
+                                       '   border: 0px solid black;\n   border-radius: 3px;\n'
+                                       '   background: rgb(0,200,0);\n }')
+            self.bq_tree.setItemWidget(item, 2, progress_bar)
+            self.job_widgets[job['id']] = (item, progress_bar)
+            self.update_job(job['id'])
+            if job['id'] == selected_job:
+                item.setSelected(True)
+        self.activate_buttons()
 
-    def setup_spinner(self):
-        logging.debug('gui - batch_processing_window_functions.py - MyWaitProcessing - setup_spinner')
-        self.spinner = QtWaitingSpinner(self, centerOnParent=False)
-        self.spinner_layout.addWidget(self.spinner)
-        self.spinner.setRoundness(70.0)
-        self.spinner.setMinimumTrailOpacity(15.0)
-        self.spinner.setTrailFadePercentage(70.0)
-        self.spinner.setNumberOfLines(12)
-        self.spinner.setLineLength(10)
-        self.spinner.setLineWidth(5)
-        self.spinner.setInnerRadius(10)
-        self.spinner.setRevolutionsPerSecond(1)
-        self.spinner.setColor(QtGui.QColor(45, 45, 45))
-        self.spinner.start()
+    def update_job(self, job_id):
+        job = self.batch_queue.job(job_id)
+        if job is None or job_id not in self.job_widgets:
+            return
+        item, progress_bar = self.job_widgets[job_id]
+        item.setText(0, job['name'])
+        item.setToolTip(0, job['batch_dict']['destination_folder'])
+        item.setText(1, job['status'])
+        item.setText(3, job['message'])
+        item.setToolTip(3, job['message'])
+        progress_bar.setValue(job['progress'])
+        self.bq_label.setText('Processes used by the batch jobs: ' + str(self.batch_queue.used_processes()) + ' of '
+                              + str(batch_process_budget(self.batch_queue.config_dict)))
+        self.activate_buttons()
 
-    def closeWindow(self):
-        logging.debug('gui - batch_processing_window_functions.py - MyWaitProcessing - closeWindow')
-        self.close()
+    def selected_job(self):
+        items = self.bq_tree.selectedItems()
+        if items:
+            return items[0].data(0, QtCore.Qt.UserRole)
+        return None
+
+    def activate_buttons(self):
+        job = self.batch_queue.job(self.selected_job())
+        status = job['status'] if job is not None else None
+        self.bq_buttons['up'].setEnabled(job is not None)
+        self.bq_buttons['down'].setEnabled(job is not None)
+        self.bq_buttons['pause'].setEnabled(status in ['queued', 'running'])
+        self.bq_buttons['resume'].setEnabled(status == 'paused')
+        self.bq_buttons['stop'].setEnabled(status in ['queued', 'running', 'paused'])
+
+    def move_job(self, offset):
+        if self.selected_job() is not None:
+            self.batch_queue.move_job(self.selected_job(), offset)
+
+    def pause_job(self):
+        self.batch_queue.pause_job(self.selected_job())
+
+    def resume_job(self):
+        self.batch_queue.resume_job(self.selected_job())
+
+    def stop_job(self):
+        self.batch_queue.stop_job(self.selected_job())
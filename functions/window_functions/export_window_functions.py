@@ -1,5 +1,5 @@
 import logging
-from egads import EgadsData
+from functions.file_functions.lazy_loading_functions import is_variable
 from PyQt5 import QtCore, QtGui, QtWidgets
 from ui.Ui_exportwindow import Ui_exportWindow
 from ui.Ui_waitwindow import Ui_waitWindow
@@ -121,8 +121,8 @@ class MyExport(QtWidgets.QDialog, Ui_exportWindow):
         logging.debug('gui - export_window_functions.py - MyExport - prepare_var_list')
         if self.export_format == 'GE-TS':
             for key, val in self.var_dict.items():
-                if isinstance(val[0], EgadsData):
-                    if len(val[0].value.shape) == 1:
+                if is_variable(val[0]):
+                    if len(val[0].shape) == 1:
                         self.var_list.append(key)
         self.var_list = sorted(self.var_list)
 
@@ -10,6 +10,10 @@ from functions.help_functions import option_information_text
 from functions.window_functions.other_windows_functions import MyInfo, MyUpdateAvailable
 from functions.thread_functions.update_functions import CheckEGADSGuiUpdateOnline, CheckEGADSUpdateOnline
 from functions.utils import add_element, get_element_value, icon_creation_function
+from functions.file_functions.dtype_functions import read_dtypes, read_dtype
+from functions.file_functions.storage_functions import (storage_presets, chunk_lengths, write_memory_sizes,
+                                                        read_storage_preset, read_chunk_length, read_write_memory)
+from functions.thread_functions.pool_functions import batch_process_counts, read_batch_processes
 from ui._version import _gui_version
 
 
@@ -45,6 +49,12 @@ class MyOptions(QtWidgets.QDialog, Ui_optionWindow):
         self.ow_combobox_5.setItemDelegate(QtWidgets.QStyledItemDelegate())
         self.ow_combobox_6.setItemDelegate(QtWidgets.QStyledItemDelegate())
         self.ow_combobox_7.setItemDelegate(QtWidgets.QStyledItemDelegate())
+        self.ow_combobox_8.setItemDelegate(QtWidgets.QStyledItemDelegate())
+        self.ow_combobox_9.setItemDelegate(QtWidgets.QStyledItemDelegate())
+        self.ow_combobox_10.setItemDelegate(QtWidgets.QStyledItemDelegate())
+        self.ow_combobox_11.setItemDelegate(QtWidgets.QStyledItemDelegate())
+        self.ow_combobox_12.setItemDelegate(QtWidgets.QStyledItemDelegate())
+        self.ow_combobox_13.setItemDelegate(QtWidgets.QStyledItemDelegate())
         self.ow_ok_button.clicked.connect(self.save_config_dict)
         self.ow_cancel_button.clicked.connect(self.closeWindow)
         self.ow_section_list.currentRowChanged.connect(self.display_options)
@@ -75,6 +85,13 @@ class MyOptions(QtWidgets.QDialog, Ui_optionWindow):
         self.info_button_15.clicked.connect(self.button_info)
         self.info_button_16.clicked.connect(self.button_info)
         self.info_button_17.clicked.connect(self.button_info)
+        self.info_button_18.clicked.connect(self.button_info)
+        self.info_button_19.clicked.connect(self.button_info)
+        self.info_button_20.clicked.connect(self.button_info)
+        self.info_button_21.clicked.connect(self.button_info)
+        self.info_button_22.clicked.connect(self.button_info)
+        self.info_button_23.clicked.connect(self.button_info)
+        self.info_button_24.clicked.connect(self.button_info)
         if self.frozen:
             self.ow_checkbox_5.setEnabled(False)
             self.ow_checkbox_5.setVisible(False)
@@ -168,10 +185,18 @@ class MyOptions(QtWidgets.QDialog, Ui_optionWindow):
 
     def read_config_dict(self):
         logging.debug('gui - option_window_functions.py - MyOptions - read_config_dict')
-        self.ow_checkbox_1.setChecked(self.config_dict.getboolean('SYSTEM', 'read_as_float'))
+        self.ow_combobox_9.setCurrentIndex(read_dtypes.index(read_dtype(self.config_dict)))
         self.ow_checkbox_2.setChecked(self.config_dict.getboolean('SYSTEM', 'replace_fill_value'))
         self.ow_checkbox_3.setChecked(self.config_dict.getboolean('SYSTEM', 'switch_fill_value'))
         self.activate_checkbox_3()
+        self.ow_checkbox_12.setChecked(self.config_dict.getboolean('SYSTEM', 'lazy_loading'))
+        self.ow_checkbox_13.setChecked(self.config_dict.getboolean('SYSTEM', 'memory_mapping'))
+        self.ow_combobox_8.setCurrentIndex(self.ow_combobox_8.findText(self.config_dict.get('SYSTEM',
+                                                                                            'reading_threads')))
+        self.ow_combobox_10.setCurrentIndex(storage_presets.index(read_storage_preset(self.config_dict)))
+        self.ow_combobox_11.setCurrentIndex(chunk_lengths.index(read_chunk_length(self.config_dict)))
+        self.ow_combobox_12.setCurrentIndex(write_memory_sizes.index(read_write_memory(self.config_dict)))
+        self.ow_combobox_13.setCurrentIndex(batch_process_counts.index(read_batch_processes(self.config_dict)))
         self.ow_combobox_1.setCurrentIndex(self.ow_combobox_1.findText(self.config_dict.get('LOG', 'level')))
         self.ow_line_1.setText(self.config_dict.get('LOG', 'path'))
         self.ow_combobox_2.setCurrentIndex(self.ow_combobox_1.findText(self.egads_config_dict.get('LOG', 'level')))
@@ -280,9 +305,17 @@ class MyOptions(QtWidgets.QDialog, Ui_optionWindow):
                 self.config_dict.set('PLOTS', 'second_dimension_axis', str(self.ow_combobox_6.currentIndex()))
                 self.config_dict.set('PLOTS', 'third_dimension_axis', str(self.ow_combobox_7.currentIndex()))
                 self.config_dict.set('PLOTS', 'geo_as_standard', str(self.ow_checkbox_10.isChecked()))
-                self.config_dict.set('SYSTEM', 'read_as_float', str(self.ow_checkbox_1.isChecked()))
+                self.config_dict.set('SYSTEM', 'read_dtype', read_dtypes[self.ow_combobox_9.currentIndex()])
                 self.config_dict.set('SYSTEM', 'replace_fill_value', str(self.ow_checkbox_2.isChecked()))
                 self.config_dict.set('SYSTEM', 'switch_fill_value', str(self.ow_checkbox_3.isChecked()))
+                self.config_dict.set('SYSTEM', 'lazy_loading', str(self.ow_checkbox_12.isChecked()))
+                self.config_dict.set('SYSTEM', 'memory_mapping', str(self.ow_checkbox_13.isChecked()))
+                self.config_dict.set('SYSTEM', 'reading_threads', str(self.ow_combobox_8.currentText()))
+                self.config_dict.set('SYSTEM', 'storage_preset', storage_presets[self.ow_combobox_10.currentIndex()])
+                self.config_dict.set('SYSTEM', 'chunk_length', chunk_lengths[self.ow_combobox_11.currentIndex()])
+                self.config_dict.set('SYSTEM', 'write_memory', write_memory_sizes[self.ow_combobox_12.currentIndex()])
+                self.config_dict.set('SYSTEM', 'batch_processes',
+                                     batch_process_counts[self.ow_combobox_13.currentIndex()])
                 self.config_dict.set('FILES_FOLDERS', 'keep_opened_files', str(self.ow_checkbox_7.isChecked()))
                 self.config_dict.set('FILES_FOLDERS', 'enable_user_folders', str(self.ow_checkbox_8.isChecked()))
                 self.config_dict.set('GENERAL', 'dimension_warning', str(self.ow_checkbox_11.isChecked()))
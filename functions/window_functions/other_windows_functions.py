@@ -34,10 +34,13 @@ from ui.Ui_layerorderwindow import Ui_layerorderWindow
 from ui.Ui_dimensionselectionwindow import Ui_dimensionselectionWindow
 from ui.Ui_deletingdimensionwindow import Ui_deletingdimensionWindow
 from ui.Ui_dimensionsavewindow import Ui_dimensionsaveWindow
+from ui.Ui_subsetwindow import Ui_subsetWindow
 from functions.gui_functions.gui_widgets import QtWaitingSpinner
 from functions.utils import font_creation_function, icon_creation_function, stylesheet_creation_function
 from functions.thread_functions.update_functions import DownloadFile
 from functions.material_functions import grid_projection_option_help
+from functions.file_functions.subset_functions import (read_file_dimensions, read_coordinate_bounds,
+                                                       coordinate_index_range)
 
 
 class MyExistingVariable(QtWidgets.QDialog, Ui_existingvarWindow):
@@ -1670,3 +1673,115 @@ class MyDimensionSave(QtWidgets.QDialog, Ui_dimensionsaveWindow):
     def close_window(self):
         logging.debug('gui - other_windows_functions.py - MyDimensionSave - close_window')
         self.close()
+
+
+class MySubset(QtWidgets.QDialog, Ui_subsetWindow):
+    def __init__(self, file_name, file_ext):
+        logging.debug('gui - other_windows_functions.py - MySubset - __init__')
+        QtWidgets.QWidget.__init__(self)
+        self.setupUi(self)
+        self.file_name = file_name
+        self.file_ext = file_ext
+        self.subset = None
+        self.cancel = True
+        self.var_list, self.var_dim_dict, self.dim_dict, self.coordinate_dict = read_file_dimensions(file_name,
+                                                                                                     file_ext)
+        self.sw_combobox_1.setItemDelegate(QtWidgets.QStyledItemDelegate())
+        self.sw_combobox_2.setItemDelegate(QtWidgets.QStyledItemDelegate())
+        self.sw_combobox_1.addItems(list(self.dim_dict.keys()))
+        for var in self.var_list:
+            item = QtWidgets.QListWidgetItem(var)
+            item.setFlags(item.flags() | QtCore.Qt.ItemIsUserCheckable)
+            item.setCheckState(QtCore.Qt.Checked)
+            self.sw_list_widget.addItem(item)
+        self.sw_combobox_1.currentIndexChanged.connect(self.set_selection_types)
+        self.sw_combobox_2.currentIndexChanged.connect(self.set_range)
+        self.ok_button.clicked.connect(self.confirm_subset)
+        self.cancel_button.clicked.connect(self.close_window)
+        self.info_button.clicked.connect(self.display_information)
+        self.set_selection_types()
+        logging.info('gui - other_windows_functions.py - MySubset - ready')
+
+    def set_selection_types(self):
+        logging.debug('gui - other_windows_functions.py - MySubset - set_selection_types')
+        dim = str(self.sw_combobox_1.currentText())
+        self.sw_combobox_2.blockSignals(True)
+        self.sw_combobox_2.clear()
+        self.sw_combobox_2.addItem('Index')
+        if dim in self.coordinate_dict:
+            self.sw_combobox_2.addItem('Coordinate value')
+        self.sw_combobox_2.blockSignals(False)
+        self.set_range()
+
+    def set_range(self):
+        logging.debug('gui - other_windows_functions.py - MySubset - set_range')
+        dim = str(self.sw_combobox_1.currentText())
+        if not dim:
+            self.sw_label_5.setText('No dimension has been found in the file, it can\'t be opened partially.')
+            self.ok_button.setEnabled(False)
+            return
+        if self.sw_combobox_2.currentText() == 'Coordinate value':
+            first_value, last_value = read_coordinate_bounds(self.file_name, self.file_ext, dim)
+            self.sw_line_edit_1.setText(str(first_value))
+            self.sw_line_edit_2.setText(str(last_value))
+            self.sw_label_5.setText('Values of ' + os.path.basename(dim) + ' go from ' + str(first_value) + ' to '
+                                    + str(last_value) + ' ' + str(self.coordinate_dict[dim]) + '.')
+        else:
+            self.sw_line_edit_1.setText('0')
+            self.sw_line_edit_2.setText(str(self.dim_dict[dim] - 1))
+            self.sw_label_5.setText('Indexes of ' + os.path.basename(dim) + ' go from 0 to '
+                                    + str(self.dim_dict[dim] - 1) + '.')
+
+    def confirm_subset(self):
+        logging.debug('gui - other_windows_functions.py - MySubset - confirm_subset')
+        dim = str(self.sw_combobox_1.currentText())
+        try:
+            if self.sw_combobox_2.currentText() == 'Coordinate value':
+                start, stop = coordinate_index_range(self.file_name, self.file_ext, dim,
+                                                     float(self.sw_line_edit_1.text()),
+                                                     float(self.sw_line_edit_2.text()))
+            else:
+                start, stop = int(self.sw_line_edit_1.text()), int(self.sw_line_edit_2.text()) + 1
+        except ValueError:
+            info_window = MyInfo('The limits of the subset must be numbers.')
+            info_window.exec_()
+            return
+        if start < 0 or stop > self.dim_dict[dim] or start >= stop:
+            info_window = MyInfo('The subset is empty or outside of the dimension, please check its limits.')
+            info_window.exec_()
+            return
+        selected_list = []
+        for i in range(self.sw_list_widget.count()):
+            if self.sw_list_widget.item(i).checkState() == QtCore.Qt.Checked:
+                selected_list.append(str(self.sw_list_widget.item(i).text()))
+        if not selected_list:
+            info_window = MyInfo('At least one variable must be selected.')
+            info_window.exec_()
+            return
+        if len(selected_list) == len(self.var_list):
+            variables = None
+        else:
+            # dimensions of the selected variables are always read
+            variables = list(selected_list)
+            for var in selected_list:
+                for var_dim in self.var_dim_dict.get(var, {}).keys():
+                    if var_dim in self.var_list and var_dim not in variables:
+                        variables.append(var_dim)
+        self.subset = {'dimension': dim, 'start': start, 'stop': stop, 'variables': variables}
+        self.cancel = False
+        self.close_window()
+
+    @staticmethod
+    def display_information():
+        text = ('From this window, it is possible to open only a part of a NetCDF or Hdf file. The subset is '
+                'defined along one dimension, by indexes or, if the dimension has a coordinate variable (ex: time), '
+                'by a window of coordinate values. Values of the coordinate must be sorted in increasing order. '
+                'Variables depending on the dimension are read only between the limits of the subset, other '
+                'variables are read entirely. Unselected variables are not read, except if they are a dimension '
+                'of a selected variable.')
+        info_window = MyInfo(text)
+        info_window.exec_()
+
+    def close_window(self):
+        logging.debug('gui - other_windows_functions.py - MySubset - close_window')
+        self.close()
@@ -397,6 +397,130 @@ class Ui_batchProcessingWindow(object):
         self.horizontalLayout_5.addItem(spacerItem8)
         self.horizontalLayout_4.addLayout(self.horizontalLayout_5)
         self.verticalLayout.addLayout(self.horizontalLayout_4)
+        self.horizontalLayout_18 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_18.setObjectName("horizontalLayout_18")
+        self.bw_label_12 = QtWidgets.QLabel(self.tab_1)
+        self.bw_label_12.setMinimumSize(QtCore.QSize(0, 27))
+        self.bw_label_12.setMaximumSize(QtCore.QSize(16777215, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bw_label_12.setFont(font)
+        self.bw_label_12.setStyleSheet("QLabel {\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.bw_label_12.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.bw_label_12.setObjectName("bw_label_12")
+        self.horizontalLayout_18.addWidget(self.bw_label_12)
+        self.horizontalLayout_19 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_19.setObjectName("horizontalLayout_19")
+        self.bw_combobox_10 = QtWidgets.QComboBox(self.tab_1)
+        self.bw_combobox_10.setMinimumSize(QtCore.QSize(370, 27))
+        self.bw_combobox_10.setMaximumSize(QtCore.QSize(370, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(10)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bw_combobox_10.setFont(font)
+        self.bw_combobox_10.setStyleSheet("QComboBox {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    padding-left: 5px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f0f0f0, stop: 1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QComboBox:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QComboBox:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #ecf4fc, stop: 1 #dcecfc);\n"
+"}\n"
+"\n"
+"QComboBox::drop-down {\n"
+"    subcontrol-origin: padding;\n"
+"    subcontrol-position: top right;\n"
+"    width: 27px;\n"
+"    border-left-width: 1px;\n"
+"    border-left-color: darkgray;\n"
+"    border-left-style: solid;\n"
+"    border-top-right-radius: 3px;\n"
+"    border-bottom-right-radius: 3px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow {\n"
+"    image: url(icons/down_arrow_icon.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow:disabled {\n"
+"    image: url(icons/down_arrow_icon_deactivated.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"    background: #f0f0f0;\n"
+"    border: 0px solid #f0f0f0;\n"
+"    outline: 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:hover {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:selected {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"\n"
+"QComboBox QAbstractItemView::item {\n"
+"    margin: 3px 5px 3px 5px;\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.bw_combobox_10.setFrame(False)
+        self.bw_combobox_10.setObjectName("bw_combobox_10")
+        self.bw_combobox_10.addItem("")
+        self.bw_combobox_10.addItem("")
+        self.bw_combobox_10.addItem("")
+        self.bw_combobox_10.addItem("")
+        self.bw_combobox_10.addItem("")
+        self.horizontalLayout_19.addWidget(self.bw_combobox_10)
+        spacerItem46 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_19.addItem(spacerItem46)
+        self.bw_info_12 = QtWidgets.QToolButton(self.tab_1)
+        self.bw_info_12.setMinimumSize(QtCore.QSize(27, 27))
+        self.bw_info_12.setMaximumSize(QtCore.QSize(27, 27))
+        self.bw_info_12.setStyleSheet("QToolButton {\n"
+"    border: 1px solid transparent;\n"
+"    background-color: transparent;\n"
+"    width: 27px;\n"
+"    height: 27px;\n"
+"}\n"
+"\n"
+"QToolButton:flat {\n"
+"    border: none;\n"
+"}")
+        self.bw_info_12.setIcon(icon1)
+        self.bw_info_12.setIconSize(QtCore.QSize(23, 23))
+        self.bw_info_12.setObjectName("bw_info_12")
+        self.horizontalLayout_19.addWidget(self.bw_info_12)
+        spacerItem47 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_19.addItem(spacerItem47)
+        self.horizontalLayout_18.addLayout(self.horizontalLayout_19)
+        self.verticalLayout.addLayout(self.horizontalLayout_18)
         self.gridLayout.addLayout(self.verticalLayout, 1, 1, 2, 2)
         spacerItem9 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
         self.gridLayout.addItem(spacerItem9, 1, 3, 1, 1)
@@ -553,7 +677,7 @@ class Ui_batchProcessingWindow(object):
         self.gridLayout_3.addItem(spacerItem15, 3, 0, 1, 2)
         self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_6.setObjectName("horizontalLayout_6")
-        self.listWidget = QtWidgets.QListWidget(self.tab_2)
+        self.listWidget = QtWidgets.QListView(self.tab_2)
         self.listWidget.setEnabled(True)
         font = QtGui.QFont()
         font.setFamily("Source Sans Pro")
@@ -562,13 +686,13 @@ class Ui_batchProcessingWindow(object):
         font.setStyleStrategy(QtGui.QFont.PreferAntialias)
         self.listWidget.setFont(font)
         self.listWidget.setFocusPolicy(QtCore.Qt.NoFocus)
-        self.listWidget.setStyleSheet("QListWidget {\n"
+        self.listWidget.setStyleSheet("QListView {\n"
 "    border-radius: 3px;\n"
 "    background-color: rgb(240,240,240);\n"
 "    color: rgb(45,45,45);\n"
 "}\n"
 "\n"
-"QListWidget:disabled {\n"
+"QListView:disabled {\n"
 "    background-color:  rgb(200,200,200);\n"
 "    color: rgb(45,45,45);\n"
 "}\n"
@@ -1011,6 +1135,129 @@ class Ui_batchProcessingWindow(object):
         spacerItem20 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
         self.horizontalLayout_17.addItem(spacerItem20)
         self.gridLayout_3.addLayout(self.horizontalLayout_17, 1, 1, 1, 1)
+        self.bw_label_13 = QtWidgets.QLabel(self.tab_2)
+        self.bw_label_13.setMinimumSize(QtCore.QSize(0, 27))
+        self.bw_label_13.setMaximumSize(QtCore.QSize(16777215, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bw_label_13.setFont(font)
+        self.bw_label_13.setStyleSheet("QLabel {\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.bw_label_13.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.bw_label_13.setObjectName("bw_label_13")
+        self.gridLayout_3.addWidget(self.bw_label_13, 2, 0, 1, 1)
+        self.horizontalLayout_20 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_20.setObjectName("horizontalLayout_20")
+        spacerItem49 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_20.addItem(spacerItem49)
+        self.bw_checkbox_2 = QtWidgets.QCheckBox(self.tab_2)
+        self.bw_checkbox_2.setMinimumSize(QtCore.QSize(0, 27))
+        self.bw_checkbox_2.setMaximumSize(QtCore.QSize(16777215, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bw_checkbox_2.setFont(font)
+        self.bw_checkbox_2.setStyleSheet("QCheckBox {\n"
+"   color: rgb(45,45,45);\n"
+"}")
+        self.bw_checkbox_2.setChecked(False)
+        self.bw_checkbox_2.setObjectName("bw_checkbox_2")
+        self.horizontalLayout_20.addWidget(self.bw_checkbox_2)
+        spacerItem50 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_20.addItem(spacerItem50)
+        self.bw_edit_10 = QtWidgets.QLineEdit(self.tab_2)
+        self.bw_edit_10.setMinimumSize(QtCore.QSize(150, 27))
+        self.bw_edit_10.setMaximumSize(QtCore.QSize(150, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bw_edit_10.setFont(font)
+        self.bw_edit_10.setStyleSheet("QLineEdit {\n"
+"   border-radius: 3px;\n"
+"   padding: 1px 4px 1px 4px;\n"
+"   background-color: rgb(240, 240, 240);\n"
+"   color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QLineEdit:disabled {\n"
+"   background-color: rgb(200,200,200);\n"
+"}")
+        self.bw_edit_10.setFrame(False)
+        self.bw_edit_10.setObjectName("bw_edit_10")
+        self.horizontalLayout_20.addWidget(self.bw_edit_10)
+        spacerItem51 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_20.addItem(spacerItem51)
+        self.bw_edit_11 = QtWidgets.QLineEdit(self.tab_2)
+        self.bw_edit_11.setMinimumSize(QtCore.QSize(150, 27))
+        self.bw_edit_11.setMaximumSize(QtCore.QSize(150, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bw_edit_11.setFont(font)
+        self.bw_edit_11.setStyleSheet("QLineEdit {\n"
+"   border-radius: 3px;\n"
+"   padding: 1px 4px 1px 4px;\n"
+"   background-color: rgb(240, 240, 240);\n"
+"   color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QLineEdit:disabled {\n"
+"   background-color: rgb(200,200,200);\n"
+"}")
+        self.bw_edit_11.setFrame(False)
+        self.bw_edit_11.setObjectName("bw_edit_11")
+        self.horizontalLayout_20.addWidget(self.bw_edit_11)
+        spacerItem52 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_20.addItem(spacerItem52)
+        self.bw_edit_12 = QtWidgets.QLineEdit(self.tab_2)
+        self.bw_edit_12.setMinimumSize(QtCore.QSize(150, 27))
+        self.bw_edit_12.setMaximumSize(QtCore.QSize(150, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bw_edit_12.setFont(font)
+        self.bw_edit_12.setStyleSheet("QLineEdit {\n"
+"   border-radius: 3px;\n"
+"   padding: 1px 4px 1px 4px;\n"
+"   background-color: rgb(240, 240, 240);\n"
+"   color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QLineEdit:disabled {\n"
+"   background-color: rgb(200,200,200);\n"
+"}")
+        self.bw_edit_12.setFrame(False)
+        self.bw_edit_12.setObjectName("bw_edit_12")
+        self.horizontalLayout_20.addWidget(self.bw_edit_12)
+        spacerItem53 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_20.addItem(spacerItem53)
+        self.gridLayout_3.addLayout(self.horizontalLayout_20, 2, 1, 1, 1)
+        self.bw_label_14 = QtWidgets.QLabel(self.tab_2)
+        self.bw_label_14.setMinimumSize(QtCore.QSize(0, 27))
+        self.bw_label_14.setMaximumSize(QtCore.QSize(16777215, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bw_label_14.setFont(font)
+        self.bw_label_14.setStyleSheet("QLabel {\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.bw_label_14.setObjectName("bw_label_14")
+        self.gridLayout_3.addWidget(self.bw_label_14, 5, 1, 1, 1)
         self.gridLayout_4.addLayout(self.gridLayout_3, 1, 1, 1, 1)
         spacerItem21 = QtWidgets.QSpacerItem(10, 38, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
         self.gridLayout_4.addItem(spacerItem21, 1, 2, 1, 1)
@@ -2514,6 +2761,44 @@ class Ui_batchProcessingWindow(object):
 "}")
         self.bw_button_ok.setObjectName("bw_button_ok")
         self.horizontalLayout_2.addWidget(self.bw_button_ok)
+        spacerItem48 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem48)
+        self.bw_button_dry = QtWidgets.QToolButton(batchProcessingWindow)
+        self.bw_button_dry.setEnabled(False)
+        self.bw_button_dry.setMinimumSize(QtCore.QSize(100, 27))
+        self.bw_button_dry.setMaximumSize(QtCore.QSize(100, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bw_button_dry.setFont(font)
+        self.bw_button_dry.setStyleSheet("QToolButton {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f0f0f0, stop: 1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QToolButton:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QToolButton:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #ecf4fc, stop: 1 #dcecfc);\n"
+"}\n"
+"\n"
+"\n"
+"QToolButton:pressed {\n"
+"    border: 1px solid #579de5;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #daecfc, stop: 1 #c4e0fc);\n"
+"}")
+        self.bw_button_dry.setObjectName("bw_button_dry")
+        self.horizontalLayout_2.addWidget(self.bw_button_dry)
         spacerItem44 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
         self.horizontalLayout_2.addItem(spacerItem44)
         self.bw_button_cancel = QtWidgets.QToolButton(batchProcessingWindow)
@@ -2570,10 +2855,21 @@ class Ui_batchProcessingWindow(object):
         self.bw_label_5.setText(_translate("batchProcessingWindow", "Errors:"))
         self.bw_combobox_4.setItemText(0, _translate("batchProcessingWindow", "Stop processing if an error occurs"))
         self.bw_combobox_4.setItemText(1, _translate("batchProcessingWindow", "Continue processing and display errors at the end"))
+        self.bw_label_12.setText(_translate("batchProcessingWindow", "Storage:"))
+        self.bw_combobox_10.setItemText(0, _translate("batchProcessingWindow", "Use the compression of the options"))
+        self.bw_combobox_10.setItemText(1, _translate("batchProcessingWindow", "No compression"))
+        self.bw_combobox_10.setItemText(2, _translate("batchProcessingWindow", "Fast compression"))
+        self.bw_combobox_10.setItemText(3, _translate("batchProcessingWindow", "Compact compression"))
+        self.bw_combobox_10.setItemText(4, _translate("batchProcessingWindow", "Archive compression"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_1), _translate("batchProcessingWindow", "Processing"))
         self.bw_label_11.setText(_translate("batchProcessingWindow", "Format:"))
         self.bw_label_6.setText(_translate("batchProcessingWindow", "Folder:"))
         self.bw_label_7.setText(_translate("batchProcessingWindow", "Files:"))
+        self.bw_label_13.setText(_translate("batchProcessingWindow", "Filter:"))
+        self.bw_checkbox_2.setText(_translate("batchProcessingWindow", "Subfolders"))
+        self.bw_edit_10.setPlaceholderText(_translate("batchProcessingWindow", "Variable"))
+        self.bw_edit_11.setPlaceholderText(_translate("batchProcessingWindow", "From (YYYY-MM-DD)"))
+        self.bw_edit_12.setPlaceholderText(_translate("batchProcessingWindow", "To (YYYY-MM-DD)"))
         self.bw_radiobox_1.setText(_translate("batchProcessingWindow", "NetCDF"))
         self.bw_radiobox_2.setText(_translate("batchProcessingWindow", "NASA Ames"))
         self.bw_radiobox_3.setText(_translate("batchProcessingWindow", "HDF5"))
@@ -2610,5 +2906,6 @@ class Ui_batchProcessingWindow(object):
         self.bw_combobox_9.setItemText(4, _translate("batchProcessingWindow", "Text"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_4), _translate("batchProcessingWindow", "Destination"))
         self.bw_button_ok.setText(_translate("batchProcessingWindow", "Launch processing"))
+        self.bw_button_dry.setText(_translate("batchProcessingWindow", "Dry run"))
         self.bw_button_cancel.setText(_translate("batchProcessingWindow", "Cancel"))
 
@@ -0,0 +1,490 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'batchqueuewindow.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_batchQueueWindow(object):
+    def setupUi(self, batchQueueWindow):
+        batchQueueWindow.setObjectName("batchQueueWindow")
+        batchQueueWindow.resize(800, 350)
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        batchQueueWindow.setFont(font)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("icons/batch_icon.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        batchQueueWindow.setWindowIcon(icon)
+        batchQueueWindow.setStyleSheet("QWidget {\n"
+"    background-color: rgb(230,230,230);\n"
+"}")
+        self.verticalLayout = QtWidgets.QVBoxLayout(batchQueueWindow)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.bq_tree = QtWidgets.QTreeWidget(batchQueueWindow)
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(10)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bq_tree.setFont(font)
+        self.bq_tree.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.bq_tree.setStyleSheet("QTreeWidget {\n"
+"    border-bottom-left-radius: 3px;\n"
+"    border-top-left-radius: 3px;\n"
+"    background-color:  rgb(240, 240, 240);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QTreeWidget:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QTreeWidget::item {\n"
+"    border: 0px solid rgb(240,240,240);\n"
+"    border-radius: 3px;\n"
+"    padding: 1px 1px 1px 1px;\n"
+"    margin: 3px 3px 3px 3px;\n"
+"}\n"
+"\n"
+"QTreeWidget::item:selected {\n"
+"    border: 0px solid rgb(240,240,240);\n"
+"    border-radius: 3px;\n"
+"}\n"
+"\n"
+"QTreeWidget::item:selected:!active {\n"
+"    background: rgb(200,200,200);\n"
+"}\n"
+"\n"
+"QTreeWidget::item:selected:active {\n"
+"    background: rgb(200,200,200);\n"
+"}\n"
+"\n"
+"QTreeWidget::item:hover {\n"
+"    background: rgb(230,230,230);\n"
+"    border-radius: 3px;\n"
+"}\n"
+"\n"
+"QScrollBar:vertical {\n"
+"  border: 0px solid white;\n"
+"  background-color: rgb(240, 240, 240);\n"
+"  width: 20px;\n"
+"  margin: 21px 0px 21px 0px;\n"
+"}\n"
+"\n"
+"QScrollBar:horizontal {\n"
+"  border: 0px solid white;\n"
+"  background-color: rgb(240, 240, 240);\n"
+"  height: 20px;\n"
+"  margin: 0px 21px 0px 21px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:vertical {\n"
+"  background-color: rgb(205, 205, 205);\n"
+"  min-height: 25px;\n"
+"}\n"
+"\n"
+"QScrollBar:handle:vertical:hover {\n"
+"  background-color: rgb(166, 166, 166);\n"
+"}\n"
+"\n"
+"QScrollBar:handle:vertical:pressed {\n"
+"  background-color: rgb(96, 96, 96);\n"
+"}\n"
+"\n"
+"QScrollBar::handle:horizontal {\n"
+"  background-color: rgb(205, 205, 205);\n"
+"  min-width: 25px;\n"
+"}\n"
+"\n"
+"QScrollBar:handle:horizontal:hover {\n"
+"  background-color: rgb(166, 166, 166);\n"
+"}\n"
+"\n"
+"QScrollBar:handle:horizontal:pressed {\n"
+"  background-color: rgb(96, 96, 96);\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:vertical {\n"
+"  border-top: 0px solid rgb(240,240,240);\n"
+"  border-left: 0px solid white;\n"
+"  border-right: 0px solid white;\n"
+"  border-bottom: 0px solid white;\n"
+"  background-color: rgb(240, 240, 240);\n"
+"  height: 20px;\n"
+"  subcontrol-position: bottom;\n"
+"  subcontrol-origin: margin;\n"
+"  border-top-right-radius: 0px;\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:vertical:hover {\n"
+"  background-color: rgb(218, 218, 218);\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:vertical:pressed {\n"
+"  background-color: rgb(96, 96, 96);\n"
+"}\n"
+"\n"
+"QScrollBar::sub-line:vertical {\n"
+"  border-top: 0px solid white;\n"
+"  border-left: 0px solid white;\n"
+"  border-right: 0px solid white;\n"
+"  border-bottom: 0px solid rgb(240,240,240);\n"
+"  background-color: rgb(240, 240, 240);\n"
+"  height: 20px;\n"
+"  subcontrol-position: top;\n"
+"  subcontrol-origin: margin;\n"
+"  border-bottom-right-radius: 0px;\n"
+"}\n"
+"\n"
+"QScrollBar::sub-line:vertical:hover {\n"
+"  background-color: rgb(218, 218, 218);\n"
+"}\n"
+"\n"
+"QScrollBar::sub-line:vertical:pressed {\n"
+"  background-color: rgb(96, 96, 96);\n"
+"}\n"
+"\n"
+"QScrollBar::up-arrow:vertical {\n"
+"  image: url(icons/up_arrow_icon.svg); \n"
+"  width: 16px;\n"
+"  height: 16px;\n"
+"}\n"
+"\n"
+"QScrollBar::up-arrow:vertical:pressed {\n"
+"  right: -1px;\n"
+"  bottom: -1px;\n"
+"}\n"
+"\n"
+"QScrollBar::down-arrow:vertical {\n"
+"  image: url(icons/down_arrow_icon.svg); \n"
+"  width: 16px;\n"
+"  height: 16px;\n"
+"}\n"
+"\n"
+"QScrollBar::down-arrow:vertical:pressed {\n"
+"  right: -1px;\n"
+"  bottom: -1px;\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:horizontal {\n"
+"  border-top: 0px solid white;\n"
+"  border-left: 0px solid rgb(240,240,240);\n"
+"  border-right: 0px solid white;\n"
+"  border-bottom: 0px solid white;\n"
+"  background-color: rgb(240, 240, 240);\n"
+"  width: 20px;\n"
+"  subcontrol-position: right;\n"
+"  subcontrol-origin: margin;\n"
+"  border-bottom-right-radius: 0px;\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:horizontal:hover {\n"
+"  background-color: rgb(218, 218, 218);\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:horizontal:pressed {\n"
+"  background-color: rgb(96, 96, 96);\n"
+"}\n"
+"\n"
+"QScrollBar::sub-line:horizontal {\n"
+"  border-top: 0px solid white;\n"
+"  border-left: 0px solid white;\n"
+"  border-right: 0px solid rgb(240,240,240);\n"
+"  border-bottom: 0px solid white;\n"
+"  background-color: rgb(240, 240, 240);\n"
+"  width: 20px;\n"
+"  subcontrol-position: left;\n"
+"  subcontrol-origin: margin;\n"
+"  border-bottom-left-radius: 3px;\n"
+"}\n"
+"\n"
+"QScrollBar::sub-line:horizontal:hover {\n"
+"  background-color: rgb(218, 218, 218);\n"
+"}\n"
+"\n"
+"QScrollBar::sub-line:horizontal:pressed {\n"
+"  background-color: rgb(96, 96, 96);\n"
+"}\n"
+"\n"
+"QScrollBar::left-arrow:horizontal {\n"
+"  image: url(icons/left_arrow_icon.svg); \n"
+"  width: 16px;\n"
+"  height: 16px;\n"
+"}\n"
+"\n"
+"QScrollBar::left-arrow:horizontal:pressed {\n"
+"  right: -1px;\n"
+"  bottom: -1px;\n"
+"}\n"
+"\n"
+"QScrollBar::right-arrow:horizontal {\n"
+"  image: url(icons/right_arrow_icon.svg); \n"
+"  width: 16px;\n"
+"  height: 16px;\n"
+"}\n"
+"\n"
+"QScrollBar::right-arrow:horizontal:pressed {\n"
+"  right: -1px;\n"
+"  bottom: -1px;\n"
+"}")
+        self.bq_tree.setRootIsDecorated(False)
+        self.bq_tree.setObjectName("bq_tree")
+        self.horizontalLayout.addWidget(self.bq_tree)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.bq_button_up = QtWidgets.QToolButton(batchQueueWindow)
+        self.bq_button_up.setMinimumSize(QtCore.QSize(110, 27))
+        self.bq_button_up.setMaximumSize(QtCore.QSize(110, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bq_button_up.setFont(font)
+        self.bq_button_up.setStyleSheet("QToolButton {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #f0f0f0, stop:1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QToolButton:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QToolButton:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ecf4fc, stop:1 #dcecfc);\n"
+"}\n"
+"\n"
+"QToolButton:pressed {\n"
+"    border: 1px solid #579de5;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #daecfc, stop:1 #c4e0fc);\n"
+"}")
+        self.bq_button_up.setObjectName("bq_button_up")
+        self.verticalLayout_2.addWidget(self.bq_button_up)
+        self.bq_button_down = QtWidgets.QToolButton(batchQueueWindow)
+        self.bq_button_down.setMinimumSize(QtCore.QSize(110, 27))
+        self.bq_button_down.setMaximumSize(QtCore.QSize(110, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bq_button_down.setFont(font)
+        self.bq_button_down.setStyleSheet("QToolButton {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #f0f0f0, stop:1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QToolButton:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QToolButton:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ecf4fc, stop:1 #dcecfc);\n"
+"}\n"
+"\n"
+"QToolButton:pressed {\n"
+"    border: 1px solid #579de5;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #daecfc, stop:1 #c4e0fc);\n"
+"}")
+        self.bq_button_down.setObjectName("bq_button_down")
+        self.verticalLayout_2.addWidget(self.bq_button_down)
+        self.bq_button_pause = QtWidgets.QToolButton(batchQueueWindow)
+        self.bq_button_pause.setMinimumSize(QtCore.QSize(110, 27))
+        self.bq_button_pause.setMaximumSize(QtCore.QSize(110, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bq_button_pause.setFont(font)
+        self.bq_button_pause.setStyleSheet("QToolButton {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #f0f0f0, stop:1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QToolButton:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QToolButton:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ecf4fc, stop:1 #dcecfc);\n"
+"}\n"
+"\n"
+"QToolButton:pressed {\n"
+"    border: 1px solid #579de5;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #daecfc, stop:1 #c4e0fc);\n"
+"}")
+        self.bq_button_pause.setObjectName("bq_button_pause")
+        self.verticalLayout_2.addWidget(self.bq_button_pause)
+        self.bq_button_resume = QtWidgets.QToolButton(batchQueueWindow)
+        self.bq_button_resume.setMinimumSize(QtCore.QSize(110, 27))
+        self.bq_button_resume.setMaximumSize(QtCore.QSize(110, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bq_button_resume.setFont(font)
+        self.bq_button_resume.setStyleSheet("QToolButton {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #f0f0f0, stop:1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QToolButton:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QToolButton:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ecf4fc, stop:1 #dcecfc);\n"
+"}\n"
+"\n"
+"QToolButton:pressed {\n"
+"    border: 1px solid #579de5;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #daecfc, stop:1 #c4e0fc);\n"
+"}")
+        self.bq_button_resume.setObjectName("bq_button_resume")
+        self.verticalLayout_2.addWidget(self.bq_button_resume)
+        self.bq_button_stop = QtWidgets.QToolButton(batchQueueWindow)
+        self.bq_button_stop.setMinimumSize(QtCore.QSize(110, 27))
+        self.bq_button_stop.setMaximumSize(QtCore.QSize(110, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bq_button_stop.setFont(font)
+        self.bq_button_stop.setStyleSheet("QToolButton {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #f0f0f0, stop:1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QToolButton:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QToolButton:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ecf4fc, stop:1 #dcecfc);\n"
+"}\n"
+"\n"
+"QToolButton:pressed {\n"
+"    border: 1px solid #579de5;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #daecfc, stop:1 #c4e0fc);\n"
+"}")
+        self.bq_button_stop.setObjectName("bq_button_stop")
+        self.verticalLayout_2.addWidget(self.bq_button_stop)
+        self.bq_button_clear = QtWidgets.QToolButton(batchQueueWindow)
+        self.bq_button_clear.setMinimumSize(QtCore.QSize(110, 27))
+        self.bq_button_clear.setMaximumSize(QtCore.QSize(110, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bq_button_clear.setFont(font)
+        self.bq_button_clear.setStyleSheet("QToolButton {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #f0f0f0, stop:1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QToolButton:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QToolButton:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ecf4fc, stop:1 #dcecfc);\n"
+"}\n"
+"\n"
+"QToolButton:pressed {\n"
+"    border: 1px solid #579de5;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #daecfc, stop:1 #c4e0fc);\n"
+"}")
+        self.bq_button_clear.setObjectName("bq_button_clear")
+        self.verticalLayout_2.addWidget(self.bq_button_clear)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem)
+        self.horizontalLayout.addLayout(self.verticalLayout_2)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.bq_label = QtWidgets.QLabel(batchQueueWindow)
+        self.bq_label.setMinimumSize(QtCore.QSize(0, 27))
+        self.bq_label.setMaximumSize(QtCore.QSize(16777215, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.bq_label.setFont(font)
+        self.bq_label.setStyleSheet("QLabel {\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QLabel:disabled {\n"
+"    color: rgb(145,145,145);\n"
+"}")
+        self.bq_label.setText("")
+        self.bq_label.setObjectName("bq_label")
+        self.verticalLayout.addWidget(self.bq_label)
+
+        self.retranslateUi(batchQueueWindow)
+        QtCore.QMetaObject.connectSlotsByName(batchQueueWindow)
+
+    def retranslateUi(self, batchQueueWindow):
+        _translate = QtCore.QCoreApplication.translate
+        batchQueueWindow.setWindowTitle(_translate("batchQueueWindow", "Batch jobs"))
+        self.bq_tree.headerItem().setText(0, _translate("batchQueueWindow", "Job"))
+        self.bq_tree.headerItem().setText(1, _translate("batchQueueWindow", "Status"))
+        self.bq_tree.headerItem().setText(2, _translate("batchQueueWindow", "Progress"))
+        self.bq_tree.headerItem().setText(3, _translate("batchQueueWindow", "Message"))
+        self.bq_button_up.setText(_translate("batchQueueWindow", "Move up"))
+        self.bq_button_down.setText(_translate("batchQueueWindow", "Move down"))
+        self.bq_button_pause.setText(_translate("batchQueueWindow", "Pause"))
+        self.bq_button_resume.setText(_translate("batchQueueWindow", "Resume"))
+        self.bq_button_stop.setText(_translate("batchQueueWindow", "Stop"))
+        self.bq_button_clear.setText(_translate("batchQueueWindow", "Clear finished"))
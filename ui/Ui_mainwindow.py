@@ -688,6 +688,33 @@ class Ui_MainWindow(object):
         font.setStyleStrategy(QtGui.QFont.PreferAntialias)
         self.actionOpenBar.setFont(font)
         self.actionOpenBar.setObjectName("actionOpenBar")
+        self.actionOpenSubset = QtWidgets.QAction(MainWindow)
+        self.actionOpenSubset.setIcon(icon1)
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.actionOpenSubset.setFont(font)
+        self.actionOpenSubset.setObjectName("actionOpenSubset")
+        self.actionOpenSegments = QtWidgets.QAction(MainWindow)
+        self.actionOpenSegments.setIcon(icon1)
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.actionOpenSegments.setFont(font)
+        self.actionOpenSegments.setObjectName("actionOpenSegments")
+        self.actionRestoreSession = QtWidgets.QAction(MainWindow)
+        self.actionRestoreSession.setIcon(icon1)
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.actionRestoreSession.setFont(font)
+        self.actionRestoreSession.setObjectName("actionRestoreSession")
         self.actionCloseBar = QtWidgets.QAction(MainWindow)
         self.actionCloseBar.setEnabled(False)
         icon5 = QtGui.QIcon()
@@ -790,6 +817,15 @@ class Ui_MainWindow(object):
         font.setStyleStrategy(QtGui.QFont.PreferAntialias)
         self.actionBatch_processing.setFont(font)
         self.actionBatch_processing.setObjectName("actionBatch_processing")
+        self.actionBatch_jobs = QtWidgets.QAction(MainWindow)
+        self.actionBatch_jobs.setIcon(icon11)
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.actionBatch_jobs.setFont(font)
+        self.actionBatch_jobs.setObjectName("actionBatch_jobs")
         self.actionExit = QtWidgets.QAction(MainWindow)
         icon12 = QtGui.QIcon()
         icon12.addPixmap(QtGui.QPixmap("icons/exit_icon.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
@@ -856,6 +892,16 @@ class Ui_MainWindow(object):
         font.setStyleStrategy(QtGui.QFont.PreferAntialias)
         self.actionSaveAsBar.setFont(font)
         self.actionSaveAsBar.setObjectName("actionSaveAsBar")
+        self.actionSaveSession = QtWidgets.QAction(MainWindow)
+        self.actionSaveSession.setEnabled(False)
+        self.actionSaveSession.setIcon(icon16)
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.actionSaveSession.setFont(font)
+        self.actionSaveSession.setObjectName("actionSaveSession")
         self.actionDisplayBar = QtWidgets.QAction(MainWindow)
         self.actionDisplayBar.setEnabled(False)
         icon17 = QtGui.QIcon()
@@ -931,14 +977,20 @@ class Ui_MainWindow(object):
         self.actionCreate_group.setObjectName("actionCreate_group")
         self.menuOpen_recent.addSeparator()
         self.menuFile.addAction(self.actionOpenBar)
+        self.menuFile.addAction(self.actionOpenSubset)
+        self.menuFile.addAction(self.actionOpenSegments)
         self.menuFile.addAction(self.menuOpen_recent.menuAction())
         self.menuFile.addAction(self.menuQuick_access.menuAction())
         self.menuFile.addAction(self.actionSaveAsBar)
         self.menuFile.addAction(self.actionCloseBar)
         self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionSaveSession)
+        self.menuFile.addAction(self.actionRestoreSession)
+        self.menuFile.addSeparator()
         self.menuFile.addAction(self.actionExport)
         self.menuFile.addSeparator()
         self.menuFile.addAction(self.actionBatch_processing)
+        self.menuFile.addAction(self.actionBatch_jobs)
         self.menuFile.addSeparator()
         self.menuFile.addAction(self.actionExit)
         self.menuProcessings.addAction(self.menuEmbedded_algorithms.menuAction())
@@ -987,6 +1039,10 @@ class Ui_MainWindow(object):
         self.toolBar.setWindowTitle(_translate("MainWindow", "toolBar"))
         self.actionOpenBar.setText(_translate("MainWindow", "Open..."))
         self.actionOpenBar.setToolTip(_translate("MainWindow", "Open a file"))
+        self.actionOpenSubset.setText(_translate("MainWindow", "Open subset..."))
+        self.actionOpenSubset.setToolTip(_translate("MainWindow", "Open a part of a file"))
+        self.actionOpenSegments.setText(_translate("MainWindow", "Open segments..."))
+        self.actionOpenSegments.setToolTip(_translate("MainWindow", "Open several files as one dataset"))
         self.actionCloseBar.setText(_translate("MainWindow", "Close..."))
         self.actionCloseBar.setToolTip(_translate("MainWindow", "Close the current file"))
         self.actionAlgorithmsBar.setText(_translate("MainWindow", "Algorithms"))
@@ -1004,6 +1060,8 @@ class Ui_MainWindow(object):
         self.actionPlotBar.setText(_translate("MainWindow", "Plot"))
         self.actionPlotBar.setToolTip(_translate("MainWindow", "Display a graph of the selected variable"))
         self.actionBatch_processing.setText(_translate("MainWindow", "Batch processing..."))
+        self.actionBatch_jobs.setText(_translate("MainWindow", "Batch jobs..."))
+        self.actionBatch_jobs.setToolTip(_translate("MainWindow", "Display the queue of the batch jobs"))
         self.actionExit.setText(_translate("MainWindow", "Exit..."))
         self.actionHelp.setText(_translate("MainWindow", "Help..."))
         self.actionAbout_EGADS.setText(_translate("MainWindow", "About EGADS..."))
@@ -1013,6 +1071,10 @@ class Ui_MainWindow(object):
         self.actionSeparator4.setText(_translate("MainWindow", "separator4"))
         self.actionSaveAsBar.setText(_translate("MainWindow", "Save as..."))
         self.actionSaveAsBar.setToolTip(_translate("MainWindow", "Save to a new file"))
+        self.actionSaveSession.setText(_translate("MainWindow", "Save session..."))
+        self.actionSaveSession.setToolTip(_translate("MainWindow", "Save the workspace to a session file"))
+        self.actionRestoreSession.setText(_translate("MainWindow", "Restore session..."))
+        self.actionRestoreSession.setToolTip(_translate("MainWindow", "Restore a workspace from a session file"))
         self.actionDisplayBar.setText(_translate("MainWindow", "Display"))
         self.actionDisplayBar.setToolTip(_translate("MainWindow", "Display the selected variable"))
         self.actionOptions.setText(_translate("MainWindow", "Options..."))
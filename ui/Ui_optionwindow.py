@@ -743,20 +743,103 @@ class Ui_optionWindow(object):
         self.ow_vertical_layout_2.setObjectName("ow_vertical_layout_2")
         self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_8.setObjectName("horizontalLayout_8")
-        self.ow_checkbox_1 = QtWidgets.QCheckBox(self.scrollAreaWidgetContents_2)
-        self.ow_checkbox_1.setMinimumSize(QtCore.QSize(0, 27))
-        self.ow_checkbox_1.setMaximumSize(QtCore.QSize(16777215, 27))
+        self.ow_label_16 = QtWidgets.QLabel(self.scrollAreaWidgetContents_2)
+        self.ow_label_16.setMinimumSize(QtCore.QSize(0, 27))
+        self.ow_label_16.setMaximumSize(QtCore.QSize(16777215, 27))
         font = QtGui.QFont()
         font.setFamily("Source Sans Pro")
         font.setPointSize(11)
         font.setKerning(True)
         font.setStyleStrategy(QtGui.QFont.PreferAntialias)
-        self.ow_checkbox_1.setFont(font)
-        self.ow_checkbox_1.setStyleSheet("QCheckBox {\n"
-"   color: rgb(45,45,45);\n"
+        self.ow_label_16.setFont(font)
+        self.ow_label_16.setStyleSheet("QLabel {\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.ow_label_16.setObjectName("ow_label_16")
+        self.horizontalLayout_8.addWidget(self.ow_label_16)
+        spacerItem56 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_8.addItem(spacerItem56)
+        self.ow_combobox_9 = QtWidgets.QComboBox(self.scrollAreaWidgetContents_2)
+        self.ow_combobox_9.setMinimumSize(QtCore.QSize(190, 27))
+        self.ow_combobox_9.setMaximumSize(QtCore.QSize(190, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_combobox_9.setFont(font)
+        self.ow_combobox_9.setStyleSheet("QComboBox {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    padding-left: 5px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f0f0f0, stop: 1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QComboBox:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QComboBox:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #ecf4fc, stop: 1 #dcecfc);\n"
+"}\n"
+"\n"
+"QComboBox::drop-down {\n"
+"    subcontrol-origin: padding;\n"
+"    subcontrol-position: top right;\n"
+"    width: 27px;\n"
+"    border-left-width: 1px;\n"
+"    border-left-color: darkgray;\n"
+"    border-left-style: solid;\n"
+"    border-top-right-radius: 3px;\n"
+"    border-bottom-right-radius: 3px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow {\n"
+"    image: url(icons/down_arrow_icon.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow:disabled {\n"
+"    image: url(icons/down_arrow_icon_deactivated.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"    background: #f0f0f0;\n"
+"    border: 0px solid #f0f0f0;\n"
+"    outline: 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:hover {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:selected {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"\n"
+"QComboBox QAbstractItemView::item {\n"
+"    margin: 3px 5px 3px 5px;\n"
+"    color: rgb(45,45,45);\n"
 "}")
-        self.ow_checkbox_1.setObjectName("ow_checkbox_1")
-        self.horizontalLayout_8.addWidget(self.ow_checkbox_1)
+        self.ow_combobox_9.setObjectName("ow_combobox_9")
+        self.ow_combobox_9.addItem("")
+        self.ow_combobox_9.addItem("")
+        self.ow_combobox_9.addItem("")
+        self.horizontalLayout_8.addWidget(self.ow_combobox_9)
         spacerItem3 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
         self.horizontalLayout_8.addItem(spacerItem3)
         self.info_button_1 = QtWidgets.QToolButton(self.scrollAreaWidgetContents_2)
@@ -867,6 +950,712 @@ class Ui_optionWindow(object):
         spacerItem9 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
         self.horizontalLayout_11.addItem(spacerItem9)
         self.ow_vertical_layout_2.addLayout(self.horizontalLayout_11)
+        self.horizontalLayout_29 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_29.setObjectName("horizontalLayout_29")
+        self.ow_checkbox_12 = QtWidgets.QCheckBox(self.scrollAreaWidgetContents_2)
+        self.ow_checkbox_12.setMinimumSize(QtCore.QSize(0, 27))
+        self.ow_checkbox_12.setMaximumSize(QtCore.QSize(16777215, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_checkbox_12.setFont(font)
+        self.ow_checkbox_12.setStyleSheet("QCheckBox {\n"
+"   color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QCheckBox:disabled {\n"
+"    color: rgb(145,145,145);\n"
+"}")
+        self.ow_checkbox_12.setObjectName("ow_checkbox_12")
+        self.horizontalLayout_29.addWidget(self.ow_checkbox_12)
+        spacerItem49 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_29.addItem(spacerItem49)
+        self.info_button_18 = QtWidgets.QToolButton(self.scrollAreaWidgetContents_2)
+        self.info_button_18.setMaximumSize(QtCore.QSize(27, 27))
+        self.info_button_18.setStyleSheet("QToolButton {\n"
+"    border: 1px solid transparent;\n"
+"    background-color: transparent;\n"
+"    width: 27px;\n"
+"    height: 27px;\n"
+"}\n"
+"\n"
+"QToolButton:flat {\n"
+"    border: none;\n"
+"}")
+        self.info_button_18.setText("")
+        self.info_button_18.setIcon(icon1)
+        self.info_button_18.setIconSize(QtCore.QSize(23, 23))
+        self.info_button_18.setAutoRaise(False)
+        self.info_button_18.setObjectName("info_button_18")
+        self.horizontalLayout_29.addWidget(self.info_button_18)
+        spacerItem50 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_29.addItem(spacerItem50)
+        self.ow_vertical_layout_2.addLayout(self.horizontalLayout_29)
+        self.horizontalLayout_30 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_30.setObjectName("horizontalLayout_30")
+        self.ow_checkbox_13 = QtWidgets.QCheckBox(self.scrollAreaWidgetContents_2)
+        self.ow_checkbox_13.setMinimumSize(QtCore.QSize(0, 27))
+        self.ow_checkbox_13.setMaximumSize(QtCore.QSize(16777215, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_checkbox_13.setFont(font)
+        self.ow_checkbox_13.setStyleSheet("QCheckBox {\n"
+"   color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QCheckBox:disabled {\n"
+"    color: rgb(145,145,145);\n"
+"}")
+        self.ow_checkbox_13.setObjectName("ow_checkbox_13")
+        self.horizontalLayout_30.addWidget(self.ow_checkbox_13)
+        spacerItem51 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_30.addItem(spacerItem51)
+        self.info_button_19 = QtWidgets.QToolButton(self.scrollAreaWidgetContents_2)
+        self.info_button_19.setMaximumSize(QtCore.QSize(27, 27))
+        self.info_button_19.setStyleSheet("QToolButton {\n"
+"    border: 1px solid transparent;\n"
+"    background-color: transparent;\n"
+"    width: 27px;\n"
+"    height: 27px;\n"
+"}\n"
+"\n"
+"QToolButton:flat {\n"
+"    border: none;\n"
+"}")
+        self.info_button_19.setText("")
+        self.info_button_19.setIcon(icon1)
+        self.info_button_19.setIconSize(QtCore.QSize(23, 23))
+        self.info_button_19.setAutoRaise(False)
+        self.info_button_19.setObjectName("info_button_19")
+        self.horizontalLayout_30.addWidget(self.info_button_19)
+        spacerItem52 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_30.addItem(spacerItem52)
+        self.ow_vertical_layout_2.addLayout(self.horizontalLayout_30)
+        self.horizontalLayout_31 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_31.setObjectName("horizontalLayout_31")
+        self.ow_label_15 = QtWidgets.QLabel(self.scrollAreaWidgetContents_2)
+        self.ow_label_15.setMinimumSize(QtCore.QSize(0, 27))
+        self.ow_label_15.setMaximumSize(QtCore.QSize(16777215, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_label_15.setFont(font)
+        self.ow_label_15.setStyleSheet("QLabel {\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.ow_label_15.setObjectName("ow_label_15")
+        self.horizontalLayout_31.addWidget(self.ow_label_15)
+        spacerItem53 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_31.addItem(spacerItem53)
+        self.ow_combobox_8 = QtWidgets.QComboBox(self.scrollAreaWidgetContents_2)
+        self.ow_combobox_8.setMinimumSize(QtCore.QSize(190, 27))
+        self.ow_combobox_8.setMaximumSize(QtCore.QSize(190, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_combobox_8.setFont(font)
+        self.ow_combobox_8.setStyleSheet("QComboBox {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    padding-left: 5px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f0f0f0, stop: 1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QComboBox:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QComboBox:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #ecf4fc, stop: 1 #dcecfc);\n"
+"}\n"
+"\n"
+"QComboBox::drop-down {\n"
+"    subcontrol-origin: padding;\n"
+"    subcontrol-position: top right;\n"
+"    width: 27px;\n"
+"    border-left-width: 1px;\n"
+"    border-left-color: darkgray;\n"
+"    border-left-style: solid;\n"
+"    border-top-right-radius: 3px;\n"
+"    border-bottom-right-radius: 3px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow {\n"
+"    image: url(icons/down_arrow_icon.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow:disabled {\n"
+"    image: url(icons/down_arrow_icon_deactivated.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"    background: #f0f0f0;\n"
+"    border: 0px solid #f0f0f0;\n"
+"    outline: 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:hover {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:selected {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"\n"
+"QComboBox QAbstractItemView::item {\n"
+"    margin: 3px 5px 3px 5px;\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.ow_combobox_8.setObjectName("ow_combobox_8")
+        self.ow_combobox_8.addItem("")
+        self.ow_combobox_8.addItem("")
+        self.ow_combobox_8.addItem("")
+        self.ow_combobox_8.addItem("")
+        self.ow_combobox_8.addItem("")
+        self.horizontalLayout_31.addWidget(self.ow_combobox_8)
+        spacerItem54 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_31.addItem(spacerItem54)
+        self.info_button_20 = QtWidgets.QToolButton(self.scrollAreaWidgetContents_2)
+        self.info_button_20.setMaximumSize(QtCore.QSize(27, 27))
+        self.info_button_20.setStyleSheet("QToolButton {\n"
+"    border: 1px solid transparent;\n"
+"    background-color: transparent;\n"
+"    width: 27px;\n"
+"    height: 27px;\n"
+"}\n"
+"\n"
+"QToolButton:flat {\n"
+"    border: none;\n"
+"}")
+        self.info_button_20.setText("")
+        self.info_button_20.setIcon(icon1)
+        self.info_button_20.setIconSize(QtCore.QSize(23, 23))
+        self.info_button_20.setAutoRaise(False)
+        self.info_button_20.setObjectName("info_button_20")
+        self.horizontalLayout_31.addWidget(self.info_button_20)
+        spacerItem55 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_31.addItem(spacerItem55)
+        self.ow_vertical_layout_2.addLayout(self.horizontalLayout_31)
+        self.horizontalLayout_32 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_32.setObjectName("horizontalLayout_32")
+        self.ow_label_17 = QtWidgets.QLabel(self.scrollAreaWidgetContents_2)
+        self.ow_label_17.setMinimumSize(QtCore.QSize(0, 27))
+        self.ow_label_17.setMaximumSize(QtCore.QSize(16777215, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_label_17.setFont(font)
+        self.ow_label_17.setStyleSheet("QLabel {\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.ow_label_17.setObjectName("ow_label_17")
+        self.horizontalLayout_32.addWidget(self.ow_label_17)
+        spacerItem57 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_32.addItem(spacerItem57)
+        self.ow_combobox_10 = QtWidgets.QComboBox(self.scrollAreaWidgetContents_2)
+        self.ow_combobox_10.setMinimumSize(QtCore.QSize(190, 27))
+        self.ow_combobox_10.setMaximumSize(QtCore.QSize(190, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_combobox_10.setFont(font)
+        self.ow_combobox_10.setStyleSheet("QComboBox {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    padding-left: 5px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f0f0f0, stop: 1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QComboBox:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QComboBox:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #ecf4fc, stop: 1 #dcecfc);\n"
+"}\n"
+"\n"
+"QComboBox::drop-down {\n"
+"    subcontrol-origin: padding;\n"
+"    subcontrol-position: top right;\n"
+"    width: 27px;\n"
+"    border-left-width: 1px;\n"
+"    border-left-color: darkgray;\n"
+"    border-left-style: solid;\n"
+"    border-top-right-radius: 3px;\n"
+"    border-bottom-right-radius: 3px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow {\n"
+"    image: url(icons/down_arrow_icon.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow:disabled {\n"
+"    image: url(icons/down_arrow_icon_deactivated.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"    background: #f0f0f0;\n"
+"    border: 0px solid #f0f0f0;\n"
+"    outline: 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:hover {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:selected {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"\n"
+"QComboBox QAbstractItemView::item {\n"
+"    margin: 3px 5px 3px 5px;\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.ow_combobox_10.setObjectName("ow_combobox_10")
+        self.ow_combobox_10.addItem("")
+        self.ow_combobox_10.addItem("")
+        self.ow_combobox_10.addItem("")
+        self.ow_combobox_10.addItem("")
+        self.horizontalLayout_32.addWidget(self.ow_combobox_10)
+        spacerItem58 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_32.addItem(spacerItem58)
+        self.info_button_21 = QtWidgets.QToolButton(self.scrollAreaWidgetContents_2)
+        self.info_button_21.setMaximumSize(QtCore.QSize(27, 27))
+        self.info_button_21.setStyleSheet("QToolButton {\n"
+"    border: 1px solid transparent;\n"
+"    background-color: transparent;\n"
+"    width: 27px;\n"
+"    height: 27px;\n"
+"}\n"
+"\n"
+"QToolButton:flat {\n"
+"    border: none;\n"
+"}")
+        self.info_button_21.setText("")
+        self.info_button_21.setIcon(icon1)
+        self.info_button_21.setIconSize(QtCore.QSize(23, 23))
+        self.info_button_21.setAutoRaise(False)
+        self.info_button_21.setObjectName("info_button_21")
+        self.horizontalLayout_32.addWidget(self.info_button_21)
+        spacerItem59 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_32.addItem(spacerItem59)
+        self.ow_vertical_layout_2.addLayout(self.horizontalLayout_32)
+        self.horizontalLayout_33 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_33.setObjectName("horizontalLayout_33")
+        self.ow_label_18 = QtWidgets.QLabel(self.scrollAreaWidgetContents_2)
+        self.ow_label_18.setMinimumSize(QtCore.QSize(0, 27))
+        self.ow_label_18.setMaximumSize(QtCore.QSize(16777215, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_label_18.setFont(font)
+        self.ow_label_18.setStyleSheet("QLabel {\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.ow_label_18.setObjectName("ow_label_18")
+        self.horizontalLayout_33.addWidget(self.ow_label_18)
+        spacerItem60 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_33.addItem(spacerItem60)
+        self.ow_combobox_11 = QtWidgets.QComboBox(self.scrollAreaWidgetContents_2)
+        self.ow_combobox_11.setMinimumSize(QtCore.QSize(190, 27))
+        self.ow_combobox_11.setMaximumSize(QtCore.QSize(190, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_combobox_11.setFont(font)
+        self.ow_combobox_11.setStyleSheet("QComboBox {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    padding-left: 5px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f0f0f0, stop: 1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QComboBox:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QComboBox:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #ecf4fc, stop: 1 #dcecfc);\n"
+"}\n"
+"\n"
+"QComboBox::drop-down {\n"
+"    subcontrol-origin: padding;\n"
+"    subcontrol-position: top right;\n"
+"    width: 27px;\n"
+"    border-left-width: 1px;\n"
+"    border-left-color: darkgray;\n"
+"    border-left-style: solid;\n"
+"    border-top-right-radius: 3px;\n"
+"    border-bottom-right-radius: 3px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow {\n"
+"    image: url(icons/down_arrow_icon.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow:disabled {\n"
+"    image: url(icons/down_arrow_icon_deactivated.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"    background: #f0f0f0;\n"
+"    border: 0px solid #f0f0f0;\n"
+"    outline: 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:hover {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:selected {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"\n"
+"QComboBox QAbstractItemView::item {\n"
+"    margin: 3px 5px 3px 5px;\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.ow_combobox_11.setObjectName("ow_combobox_11")
+        self.ow_combobox_11.addItem("")
+        self.ow_combobox_11.addItem("")
+        self.ow_combobox_11.addItem("")
+        self.ow_combobox_11.addItem("")
+        self.ow_combobox_11.addItem("")
+        self.horizontalLayout_33.addWidget(self.ow_combobox_11)
+        spacerItem61 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_33.addItem(spacerItem61)
+        self.info_button_22 = QtWidgets.QToolButton(self.scrollAreaWidgetContents_2)
+        self.info_button_22.setMaximumSize(QtCore.QSize(27, 27))
+        self.info_button_22.setStyleSheet("QToolButton {\n"
+"    border: 1px solid transparent;\n"
+"    background-color: transparent;\n"
+"    width: 27px;\n"
+"    height: 27px;\n"
+"}\n"
+"\n"
+"QToolButton:flat {\n"
+"    border: none;\n"
+"}")
+        self.info_button_22.setText("")
+        self.info_button_22.setIcon(icon1)
+        self.info_button_22.setIconSize(QtCore.QSize(23, 23))
+        self.info_button_22.setAutoRaise(False)
+        self.info_button_22.setObjectName("info_button_22")
+        self.horizontalLayout_33.addWidget(self.info_button_22)
+        spacerItem62 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_33.addItem(spacerItem62)
+        self.ow_vertical_layout_2.addLayout(self.horizontalLayout_33)
+        self.horizontalLayout_34 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_34.setObjectName("horizontalLayout_34")
+        self.ow_label_19 = QtWidgets.QLabel(self.scrollAreaWidgetContents_2)
+        self.ow_label_19.setMinimumSize(QtCore.QSize(0, 27))
+        self.ow_label_19.setMaximumSize(QtCore.QSize(16777215, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_label_19.setFont(font)
+        self.ow_label_19.setStyleSheet("QLabel {\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.ow_label_19.setObjectName("ow_label_19")
+        self.horizontalLayout_34.addWidget(self.ow_label_19)
+        spacerItem63 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_34.addItem(spacerItem63)
+        self.ow_combobox_12 = QtWidgets.QComboBox(self.scrollAreaWidgetContents_2)
+        self.ow_combobox_12.setMinimumSize(QtCore.QSize(190, 27))
+        self.ow_combobox_12.setMaximumSize(QtCore.QSize(190, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_combobox_12.setFont(font)
+        self.ow_combobox_12.setStyleSheet("QComboBox {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    padding-left: 5px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f0f0f0, stop: 1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QComboBox:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QComboBox:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #ecf4fc, stop: 1 #dcecfc);\n"
+"}\n"
+"\n"
+"QComboBox::drop-down {\n"
+"    subcontrol-origin: padding;\n"
+"    subcontrol-position: top right;\n"
+"    width: 27px;\n"
+"    border-left-width: 1px;\n"
+"    border-left-color: darkgray;\n"
+"    border-left-style: solid;\n"
+"    border-top-right-radius: 3px;\n"
+"    border-bottom-right-radius: 3px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow {\n"
+"    image: url(icons/down_arrow_icon.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow:disabled {\n"
+"    image: url(icons/down_arrow_icon_deactivated.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"    background: #f0f0f0;\n"
+"    border: 0px solid #f0f0f0;\n"
+"    outline: 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:hover {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:selected {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"\n"
+"QComboBox QAbstractItemView::item {\n"
+"    margin: 3px 5px 3px 5px;\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.ow_combobox_12.setObjectName("ow_combobox_12")
+        self.ow_combobox_12.addItem("")
+        self.ow_combobox_12.addItem("")
+        self.ow_combobox_12.addItem("")
+        self.ow_combobox_12.addItem("")
+        self.horizontalLayout_34.addWidget(self.ow_combobox_12)
+        spacerItem64 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_34.addItem(spacerItem64)
+        self.info_button_23 = QtWidgets.QToolButton(self.scrollAreaWidgetContents_2)
+        self.info_button_23.setMaximumSize(QtCore.QSize(27, 27))
+        self.info_button_23.setStyleSheet("QToolButton {\n"
+"    border: 1px solid transparent;\n"
+"    background-color: transparent;\n"
+"    width: 27px;\n"
+"    height: 27px;\n"
+"}\n"
+"\n"
+"QToolButton:flat {\n"
+"    border: none;\n"
+"}")
+        self.info_button_23.setText("")
+        self.info_button_23.setIcon(icon1)
+        self.info_button_23.setIconSize(QtCore.QSize(23, 23))
+        self.info_button_23.setAutoRaise(False)
+        self.info_button_23.setObjectName("info_button_23")
+        self.horizontalLayout_34.addWidget(self.info_button_23)
+        spacerItem65 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_34.addItem(spacerItem65)
+        self.ow_vertical_layout_2.addLayout(self.horizontalLayout_34)
+        self.horizontalLayout_35 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_35.setObjectName("horizontalLayout_35")
+        self.ow_label_20 = QtWidgets.QLabel(self.scrollAreaWidgetContents_2)
+        self.ow_label_20.setMinimumSize(QtCore.QSize(0, 27))
+        self.ow_label_20.setMaximumSize(QtCore.QSize(16777215, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(11)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_label_20.setFont(font)
+        self.ow_label_20.setStyleSheet("QLabel {\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.ow_label_20.setObjectName("ow_label_20")
+        self.horizontalLayout_35.addWidget(self.ow_label_20)
+        spacerItem66 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_35.addItem(spacerItem66)
+        self.ow_combobox_13 = QtWidgets.QComboBox(self.scrollAreaWidgetContents_2)
+        self.ow_combobox_13.setMinimumSize(QtCore.QSize(190, 27))
+        self.ow_combobox_13.setMaximumSize(QtCore.QSize(190, 27))
+        font = QtGui.QFont()
+        font.setFamily("Source Sans Pro")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self.ow_combobox_13.setFont(font)
+        self.ow_combobox_13.setStyleSheet("QComboBox {\n"
+"    border: 1px solid #acacac;\n"
+"    border-radius: 1px;\n"
+"    padding-left: 5px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f0f0f0, stop: 1 #e5e5e5);\n"
+"    color: rgb(45,45,45);\n"
+"}\n"
+"\n"
+"QComboBox:disabled {\n"
+"    background-color:  rgb(200,200,200);\n"
+"    color: rgb(145,145,145);\n"
+"}\n"
+"\n"
+"QComboBox:hover {\n"
+"    border: 1px solid #7eb4ea;\n"
+"    border-radius: 1px;\n"
+"    background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #ecf4fc, stop: 1 #dcecfc);\n"
+"}\n"
+"\n"
+"QComboBox::drop-down {\n"
+"    subcontrol-origin: padding;\n"
+"    subcontrol-position: top right;\n"
+"    width: 27px;\n"
+"    border-left-width: 1px;\n"
+"    border-left-color: darkgray;\n"
+"    border-left-style: solid;\n"
+"    border-top-right-radius: 3px;\n"
+"    border-bottom-right-radius: 3px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow {\n"
+"    image: url(icons/down_arrow_icon.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow:disabled {\n"
+"    image: url(icons/down_arrow_icon_deactivated.svg); \n"
+"    width: 16px;\n"
+"    height: 16px\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"    background: #f0f0f0;\n"
+"    border: 0px solid #f0f0f0;\n"
+"    outline: 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:hover {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView::item:selected {\n"
+"    background-color: rgb(200,200,200);\n"
+"    color: rgb(45,45,45);\n"
+"    margin: 0px 0px 0px 0px;\n"
+"}\n"
+"\n"
+"\n"
+"QComboBox QAbstractItemView::item {\n"
+"    margin: 3px 5px 3px 5px;\n"
+"    color: rgb(45,45,45);\n"
+"}")
+        self.ow_combobox_13.setObjectName("ow_combobox_13")
+        self.ow_combobox_13.addItem("")
+        self.ow_combobox_13.addItem("")
+        self.ow_combobox_13.addItem("")
+        self.ow_combobox_13.addItem("")
+        self.ow_combobox_13.addItem("")
+        self.ow_combobox_13.addItem("")
+        self.ow_combobox_13.addItem("")
+        self.horizontalLayout_35.addWidget(self.ow_combobox_13)
+        spacerItem67 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_35.addItem(spacerItem67)
+        self.info_button_24 = QtWidgets.QToolButton(self.scrollAreaWidgetContents_2)
+        self.info_button_24.setMaximumSize(QtCore.QSize(27, 27))
+        self.info_button_24.setStyleSheet("QToolButton {\n"
+"    border: 1px solid transparent;\n"
+"    background-color: transparent;\n"
+"    width: 27px;\n"
+"    height: 27px;\n"
+"}\n"
+"\n"
+"QToolButton:flat {\n"
+"    border: none;\n"
+"}")
+        self.info_button_24.setText("")
+        self.info_button_24.setIcon(icon1)
+        self.info_button_24.setIconSize(QtCore.QSize(23, 23))
+        self.info_button_24.setAutoRaise(False)
+        self.info_button_24.setObjectName("info_button_24")
+        self.horizontalLayout_35.addWidget(self.info_button_24)
+        spacerItem68 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_35.addItem(spacerItem68)
+        self.ow_vertical_layout_2.addLayout(self.horizontalLayout_35)
         self.gridLayout_2.addLayout(self.ow_vertical_layout_2, 0, 0, 1, 1)
         self.ow_scroll_area_1.setWidget(self.scrollAreaWidgetContents_2)
         self.gridLayout.addWidget(self.ow_scroll_area_1, 0, 0, 1, 1)
@@ -3551,9 +4340,44 @@ class Ui_optionWindow(object):
         item = self.ow_section_list.item(5)
         item.setText(_translate("optionWindow", "Update"))
         self.ow_section_list.setSortingEnabled(__sortingEnabled)
-        self.ow_checkbox_1.setText(_translate("optionWindow", "Read variables as float"))
+        self.ow_label_16.setText(_translate("optionWindow", "Read variables as:"))
+        self.ow_combobox_9.setItemText(0, _translate("optionWindow", "Native type"))
+        self.ow_combobox_9.setItemText(1, _translate("optionWindow", "Float 32 bits"))
+        self.ow_combobox_9.setItemText(2, _translate("optionWindow", "Float 64 bits"))
         self.ow_checkbox_2.setText(_translate("optionWindow", "Replace automatically missing values in variables by NaN"))
         self.ow_checkbox_3.setText(_translate("optionWindow", "Do not replace missing values if a variable can\'t be read."))
+        self.ow_checkbox_12.setText(_translate("optionWindow", "Load variable values only when they are used"))
+        self.ow_checkbox_13.setText(_translate("optionWindow", "Map uncompressed variables from the file instead of copying them in memory"))
+        self.ow_label_15.setText(_translate("optionWindow", "Threads used to read variables:"))
+        self.ow_combobox_8.setItemText(0, _translate("optionWindow", "1"))
+        self.ow_combobox_8.setItemText(1, _translate("optionWindow", "2"))
+        self.ow_combobox_8.setItemText(2, _translate("optionWindow", "4"))
+        self.ow_combobox_8.setItemText(3, _translate("optionWindow", "8"))
+        self.ow_combobox_8.setItemText(4, _translate("optionWindow", "16"))
+        self.ow_label_17.setText(_translate("optionWindow", "Compression of NetCDF and Hdf files:"))
+        self.ow_combobox_10.setItemText(0, _translate("optionWindow", "None"))
+        self.ow_combobox_10.setItemText(1, _translate("optionWindow", "Fast"))
+        self.ow_combobox_10.setItemText(2, _translate("optionWindow", "Compact"))
+        self.ow_combobox_10.setItemText(3, _translate("optionWindow", "Archive"))
+        self.ow_label_18.setText(_translate("optionWindow", "Length of chunks along the first dimension:"))
+        self.ow_combobox_11.setItemText(0, _translate("optionWindow", "Automatic"))
+        self.ow_combobox_11.setItemText(1, _translate("optionWindow", "1024"))
+        self.ow_combobox_11.setItemText(2, _translate("optionWindow", "4096"))
+        self.ow_combobox_11.setItemText(3, _translate("optionWindow", "16384"))
+        self.ow_combobox_11.setItemText(4, _translate("optionWindow", "65536"))
+        self.ow_label_19.setText(_translate("optionWindow", "Memory used to write a variable:"))
+        self.ow_combobox_12.setItemText(0, _translate("optionWindow", "64 MB"))
+        self.ow_combobox_12.setItemText(1, _translate("optionWindow", "256 MB"))
+        self.ow_combobox_12.setItemText(2, _translate("optionWindow", "1024 MB"))
+        self.ow_combobox_12.setItemText(3, _translate("optionWindow", "4096 MB"))
+        self.ow_label_20.setText(_translate("optionWindow", "Processes used by batch processing:"))
+        self.ow_combobox_13.setItemText(0, _translate("optionWindow", "1"))
+        self.ow_combobox_13.setItemText(1, _translate("optionWindow", "2"))
+        self.ow_combobox_13.setItemText(2, _translate("optionWindow", "4"))
+        self.ow_combobox_13.setItemText(3, _translate("optionWindow", "8"))
+        self.ow_combobox_13.setItemText(4, _translate("optionWindow", "16"))
+        self.ow_combobox_13.setItemText(5, _translate("optionWindow", "32"))
+        self.ow_combobox_13.setItemText(6, _translate("optionWindow", "All processors"))
         self.ow_checkbox_7.setText(_translate("optionWindow", "Keep a list of files opened by the user"))
         self.ow_checkbox_8.setText(_translate("optionWindow", "Enable the registration of folders for quick access"))
         self.ow_label_9.setText(_translate("optionWindow", "Folder path:"))
@@ -3,6 +3,7 @@ import time
 import os
 import pathlib
 import io
+import sys
 import configparser
 import numpy
 import webbrowser
@@ -19,22 +20,26 @@ from ui.Ui_mainwindow import Ui_MainWindow
 from functions.window_functions.option_window_functions import MyOptions
 from functions.window_functions.plot_window_functions import PlotWindow
 from functions.window_functions.algorithm_windows_functions import MyProcessing, MyAlgorithm
-from functions.window_functions.batch_processing_window_functions import MyBatchProcessing
+from functions.window_functions.batch_processing_window_functions import MyBatchProcessing, MyBatchQueue
 from functions.window_functions.export_window_functions import MyExport
 from functions.window_functions.other_windows_functions import MyDimensionSave
 from functions.window_functions.other_windows_functions import (MyAbout, MyDisplay, MyInfo, MyUpdate, MyAsk,
                                                                 MyUpdateAvailable, MyExistingVariable,
-                                                                MyWarningUpdate, MyDeletingDimension)
+                                                                MyWarningUpdate, MyDeletingDimension, MySubset)
 from functions.window_functions.metadata_windows_functions import (MyGlobalAttributes, MyVariableAttributes,
                                                                    MyNAVariableAttributes, MyGroupAttributes,
                                                                    MyNAGlobalAttributes)
-from functions.file_functions.reading_file_functions import reading_file
+from functions.file_functions.reading_file_functions import reading_file, restoring_session
 from functions.material_functions import setup_fonts, extension_filetype_dict_function
 from functions.thread_functions.other_functions import StatusbarMsgThread
+from functions.thread_functions.queue_functions import BatchJobQueue
+from functions.file_functions.catalog_functions import FileCatalog
 from functions.thread_functions.update_functions import CheckEGADSGuiUpdateOnline, CheckEGADSVersion
 from functions.gui_functions.gui_menu_functions import algorithm_menu_initialization
 from functions.gui_functions.gui_support_functions import add_variable_to_widget_tree
-from functions.file_functions.saving_file_functions import saving_file
+from functions.file_functions.saving_file_functions import saving_file, saving_session
+from functions.file_functions.session_functions import session_ext
+from functions.file_functions.lazy_loading_functions import is_variable, load_egads_data
 from functions.gui_functions.gui_global_functions import (gui_reset_function, file_drop_layout, status_bar_update,
                                                           clear_var_metadata_layout, update_icons_state,
                                                           create_quick_access_menu, create_recent_file_menu,
@@ -71,6 +76,9 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.opened_file = None
         self.file_name = ''
         self.file_ext = ''
+        self.file_subset = None
+        self.file_segments = None
+        self.workspace_snapshot = None
         self.default_message = ''
         self.file_is_opened = False
         gui_reset_function(self)
@@ -89,6 +97,10 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.check_gui_update_thread = None
         self.copied_object = []
         self.opened_file_list = []
+        self.batch_queue = BatchJobQueue(self.config_dict)
+        self.batch_processing_window = None
+        self.batch_queue_window = None
+        self.file_catalog = FileCatalog(self.user_path)
         self.make_window_title()
         self.create_quick_access()
         self.create_recent_access()
@@ -122,10 +134,26 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
     def on_actionOpenBar_triggered(self):
         self.open_file()
 
+    @QtCore.pyqtSlot()
+    def on_actionOpenSubset_triggered(self):
+        self.open_file(subset=True)
+
+    @QtCore.pyqtSlot()
+    def on_actionOpenSegments_triggered(self):
+        self.open_file(segments=True)
+
     @QtCore.pyqtSlot()
     def on_actionSaveAsBar_triggered(self):
         self.save_file()
 
+    @QtCore.pyqtSlot()
+    def on_actionSaveSession_triggered(self):
+        self.save_session()
+
+    @QtCore.pyqtSlot()
+    def on_actionRestoreSession_triggered(self):
+        self.restore_session()
+
     @QtCore.pyqtSlot()
     def on_actionExport_triggered(self):
         self.export_variables()
@@ -134,6 +162,10 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
     def on_actionBatch_processing_triggered(self):
         self.batch_processing()
 
+    @QtCore.pyqtSlot()
+    def on_actionBatch_jobs_triggered(self):
+        self.show_batch_queue()
+
     @QtCore.pyqtSlot()
     def on_actionCloseBar_triggered(self):
         self.before_close_file()
@@ -232,15 +264,32 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         parent_position = self.variable_list.mapToGlobal(QtCore.QPoint(0, 0))
         self.variable_menu.popup(parent_position + relative_position)
 
-    def open_file(self, file_path=None):
+    def open_file(self, file_path=None, subset=False, segments=False):
         logging.debug('gui - mainwindow.py - MainWindow - open_file')
         if file_path is None:
-            file_name, file_ext = self.get_file_name('open')
+            file_segments = None
+            if segments:
+                file_segments, file_ext = self.get_file_name('open_segments')
+                file_name = ''
+                if file_segments:
+                    if not self.check_segments(file_segments, file_ext):
+                        return
+                    file_segments = sorted(file_segments)
+                    file_name = file_segments[0]
+            else:
+                file_name, file_ext = self.get_file_name('open')
             if file_name:
+                file_subset = None
+                if subset:
+                    file_subset = self.select_subset(file_name, file_ext)
+                    if file_subset is None:
+                        return
                 if self.file_name:
                     self.before_close_file()
                 self.file_name = file_name
                 self.file_ext = file_ext
+                self.file_subset = file_subset
+                self.file_segments = file_segments
             else:
                 return
         else:
@@ -249,6 +298,8 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
                     self.before_close_file()
                 self.file_name = file_path
                 self.file_ext = extension_filetype_dict_function()[os.path.splitext(file_path)[1]]
+                self.file_subset = None
+                self.file_segments = None
             else:
                 text = ('EGADS can\'t find the following file:\n\n\t\t\t' + file_path + '\n\nPlease check that the file'
                         + ' exists before trying to open it.')
@@ -256,7 +307,8 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
                 info_window.exec_()
                 return
         if self.file_name:
-            self.add_file_to_opened_file_list()
+            if self.file_segments is None:
+                self.add_file_to_opened_file_list()
             if self.file_ext in ['NetCDF Files (*.nc *.cdf)', 'NASA Ames Files (*.na)',
                                  'Hdf Files (*.h5 *.hdf5 *.he5)']:
                 reading_file(self)
@@ -271,6 +323,39 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
                 info_window = MyInfo(info_text)
                 info_window.exec_()
 
+    def check_segments(self, file_segments, file_ext):
+        logging.debug('gui - mainwindow.py - MainWindow - check_segments')
+        if file_ext not in ['NetCDF Files (*.nc *.cdf)', 'Hdf Files (*.h5 *.hdf5 *.he5)']:
+            info_window = MyInfo('Only NetCDF and Hdf files can be opened as segments of a dataset.')
+            info_window.exec_()
+            return False
+        if len(file_segments) < 2:
+            info_window = MyInfo('At least two files have to be selected to open them as segments of a dataset.')
+            info_window.exec_()
+            return False
+        return True
+
+    def select_subset(self, file_name, file_ext):
+        logging.debug('gui - mainwindow.py - MainWindow - select_subset')
+        if file_ext not in ['NetCDF Files (*.nc *.cdf)', 'Hdf Files (*.h5 *.hdf5 *.he5)']:
+            info_window = MyInfo('Only NetCDF and Hdf files can be opened partially.')
+            info_window.exec_()
+            return None
+        try:
+            subset_window = MySubset(file_name, file_ext)
+        except Exception:
+            logging.exception('gui - mainwindow.py - MainWindow - select_subset : an exception occurred during the '
+                              'reading of the dimensions of the file')
+            etype, evalue, _ = sys.exc_info()
+            info_window = MyInfo('An exception occurred during the reading of the dimensions of the file.<br><br>'
+                                 'Exception type: ' + etype.__name__ + '<br><br>Exception value: ' + str(evalue))
+            info_window.exec_()
+            return None
+        subset_window.exec_()
+        if subset_window.cancel:
+            return None
+        return subset_window.subset
+
     def save_file(self):
         logging.debug('gui - mainwindow.py - MainWindow - save_file')
         if self.check_variable_dimension():
@@ -293,12 +378,30 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
                     info_window = MyInfo('This format ' + save_file_ext + ' is not supported actually.')
                     info_window.exec_()
 
+    def save_session(self):
+        logging.debug('gui - mainwindow.py - MainWindow - save_session')
+        session_name, _ = self.get_file_name('save_session')
+        if session_name:
+            if not session_name.endswith('.egs'):
+                session_name += '.egs'
+            saving_session(self, session_name)
+
+    def restore_session(self):
+        logging.debug('gui - mainwindow.py - MainWindow - restore_session')
+        session_name, _ = self.get_file_name('open_session')
+        if session_name:
+            if self.file_name:
+                self.before_close_file()
+                if self.file_is_opened:
+                    return
+            restoring_session(self, session_name)
+
     def check_nasaames_compatibility(self):
         na_pass = True
         dim_nbr = 0
         groups = False
         for key, val in self.list_of_variables_and_attributes.items():
-            if not isinstance(val[0], egads.EgadsData):
+            if not is_variable(val[0]):
                 groups = True
             if val[2]:
                 dim_nbr += 1
@@ -311,7 +414,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         var_with_wrgpath_dim = []
         result = True
         for var_name, var_dict in self.list_of_variables_and_attributes.items():
-            if not var_dict[2] and isinstance(var_dict[0], egads.EgadsData):
+            if not var_dict[2] and is_variable(var_dict[0]):
                 if var_dict[1] is None:
                     if var_name not in var_with_missing_dim:
                         var_with_missing_dim.append(var_name)
@@ -374,14 +477,14 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
     def variable_attributes(self):
         logging.debug('gui - mainwindow.py - MainWindow - variable_attributes')
         path, name = full_path_name_from_treewidget(self.variable_list)
-        if isinstance(self.list_of_variables_and_attributes[path][0], egads.EgadsData):
+        if is_variable(self.list_of_variables_and_attributes[path][0]):
             variable_attributes = self.list_of_variables_and_attributes[path][0].metadata
         else:
             variable_attributes = self.list_of_variables_and_attributes[path][0]
         if self.file_ext == 'NASA Ames Files (*.na)':
             var_attr_window = MyNAVariableAttributes(path, variable_attributes)
         else:
-            if isinstance(self.list_of_variables_and_attributes[path][0], egads.EgadsData):
+            if is_variable(self.list_of_variables_and_attributes[path][0]):
                 var_attr_window = MyVariableAttributes(path, variable_attributes)
             else:
                 var_attr_window = MyGroupAttributes(path, variable_attributes)
@@ -399,6 +502,8 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         logging.debug('gui - mainwindow.py - MainWindow - display_variable')
         var_path, var_name = full_path_name_from_treewidget(self.variable_list)
         var_object = self.list_of_variables_and_attributes[var_path]
+        if not self.load_variables([var_path] + list(var_object[1] or [])):
+            return
         var_units = var_object[0].metadata['units']
         fill_value = None
         try:
@@ -438,9 +543,34 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         display_window = MyDisplay(var_path, var_units, fill_value, var_values, dimensions)
         display_window.exec_()
 
+    def load_variables(self, var_paths):
+        logging.debug('gui - mainwindow.py - MainWindow - load_variables')
+        # variables opened without their values are read the first time they are used, a variable which can't be
+        # read is reported like the variables which couldn't be read when the file was opened
+        for var_path in var_paths:
+            if 'no dimension' in var_path or var_path not in self.list_of_variables_and_attributes:
+                continue
+            try:
+                load_egads_data(self.list_of_variables_and_attributes[var_path][0])
+            except Exception:
+                logging.exception('gui - mainwindow.py - MainWindow - load_variables : an exception occurred during '
+                                  'the reading of the variable ' + var_path)
+                etype, evalue, _ = sys.exc_info()
+                info_window = MyInfo('The following variable couldn\'t be loaded:<ul><li><b>' + var_path
+                                     + '</b> &rarr; ' + etype.__name__ + ': ' + str(evalue) + '</li></ul><p>Please '
+                                     'read the GUI log file to have more details on previous issues.')
+                info_window.exec_()
+                return False
+        return True
+
     def plot_variable(self):
         logging.debug('gui - mainwindow.py - MainWindow - plot_variable')
         variable_list = multi_full_path_name_from_treewidget(self.variable_list)
+        var_paths = []
+        for sublist in variable_list:
+            var_paths += [sublist[0]] + list(self.list_of_variables_and_attributes[sublist[0]][1] or [])
+        if not self.load_variables(var_paths):
+            return
         variables = collections.OrderedDict()
         dimensions = {}
         no_dim = False
@@ -657,7 +787,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         logging.debug('gui - mainwindow.py - MainWindow - paste_variable')
         object_path, var_name = full_path_name_from_treewidget(self.variable_list)
         var_path = self.copied_object[0]
-        if isinstance(self.list_of_variables_and_attributes[object_path][0], egads.EgadsData):
+        if is_variable(self.list_of_variables_and_attributes[object_path][0]):
             path = os.path.dirname(object_path)
         else:
             path = object_path
@@ -860,8 +990,28 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
     def batch_processing(self):
         logging.debug('gui - mainwindow.py - Mainwindow - batch_processing')
-        batch_processing_window = MyBatchProcessing(self.list_of_algorithms, self.config_dict)
-        batch_processing_window.exec_()
+        # the window isn't modal, the batch jobs can be followed while a new job is prepared
+        if self.batch_processing_window is None:
+            self.batch_processing_window = MyBatchProcessing(self.list_of_algorithms, self.config_dict,
+                                                             self.batch_queue, self.file_catalog)
+            self.batch_processing_window.finished.connect(self.batch_processing_closed)
+        self.batch_processing_window.show()
+        self.batch_processing_window.raise_()
+        self.batch_processing_window.activateWindow()
+
+    def batch_processing_closed(self):
+        logging.debug('gui - mainwindow.py - Mainwindow - batch_processing_closed')
+        self.batch_processing_window = None
+        if self.batch_queue.jobs:
+            self.show_batch_queue()
+
+    def show_batch_queue(self):
+        logging.debug('gui - mainwindow.py - Mainwindow - show_batch_queue')
+        if self.batch_queue_window is None:
+            self.batch_queue_window = MyBatchQueue(self.batch_queue)
+        self.batch_queue_window.show()
+        self.batch_queue_window.raise_()
+        self.batch_queue_window.activateWindow()
 
     def get_file_name(self, action, folder=None):
         logging.debug('gui - mainwindow.py - MainWindow - get_file_name : action ' + str(action))
@@ -875,6 +1025,13 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
             out_file_name, out_file_ext = file_dialog.getSaveFileName(self, 'Save File', '', filter_types)
         elif action == 'open':
             out_file_name, out_file_ext = file_dialog.getOpenFileName(self, 'Open File', '', filter_types)
+        elif action == 'save_session':
+            out_file_name, out_file_ext = file_dialog.getSaveFileName(self, 'Save Session', '', session_ext)
+        elif action == 'open_session':
+            out_file_name, out_file_ext = file_dialog.getOpenFileName(self, 'Restore Session', '', session_ext)
+        elif action == 'open_segments':
+            out_file_list, out_file_ext = file_dialog.getOpenFileNames(self, 'Open Segments', '', filter_types)
+            return [str(file_name) for file_name in out_file_list], str(out_file_ext)
         return str(out_file_name), str(out_file_ext)
     
     def before_close_file(self):
@@ -900,6 +1057,9 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.opened_file = None
         self.file_name = ''
         self.file_ext = ''
+        self.file_subset = None
+        self.file_segments = None
+        self.workspace_snapshot = None
         self.default_message = ''
         self.file_is_opened = False
         self.list_of_global_attributes = {}
@@ -1029,3 +1189,10 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
             logging.info('**********************************')
             logging.info('EGADS GUI ' + _gui_version + ' is closing ...')
             logging.info('**********************************')
+        if event.isAccepted():
+            # batch jobs still running are stopped, they can be resumed later with their manifest
+            self.batch_queue.stop_all_jobs()
+            if self.batch_processing_window is not None:
+                self.batch_processing_window.close()
+            if self.batch_queue_window is not None:
+                self.batch_queue_window.close()